@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface._datainput.eclipse_init_io.pvt_common import (
+    EclPropertyTableRawData,
+    PVDx,
+    PVTx,
+)
+from webviz_subsurface._datainput.eclipse_unit import ConvertUnits
+from webviz_subsurface._datainput.pvt_data import calculate_densities
+
+
+def _identity(value: float) -> float:
+    return value
+
+
+def _raw_data(
+    keys: list, num_rows: int, columns: np.ndarray
+) -> EclPropertyTableRawData:
+    raw = EclPropertyTableRawData()
+    raw.num_primary = len(keys)
+    raw.num_rows = num_rows
+    raw.num_cols = columns.shape[0]
+    raw.num_tables = 1
+    raw.primary_key = keys
+    raw.data = columns.ravel()
+    return raw
+
+
+def test_pvdx_evaluation() -> None:
+    pressure = np.linspace(50.0, 300.0, 6)
+    recip_fvf = 1.0 / (1.0 + 0.001 * pressure)
+    recip_fvf_visc = recip_fvf / (0.4 + 0.001 * pressure)
+    raw = _raw_data([0], 6, np.array([pressure, recip_fvf, recip_fvf_visc]))
+
+    pvdx = PVDx(0, raw, ConvertUnits(_identity, [_identity] * 4))
+
+    assert np.allclose(pvdx.formation_volume_factor(pressure), 1.0 + 0.001 * pressure)
+    assert np.allclose(pvdx.viscosity(pressure), 0.4 + 0.001 * pressure)
+
+
+def test_pvtx_evaluation() -> None:
+    keys = [10.0, 50.0, 100.0, 150.0]
+    num_rows = 4
+    columns = np.full((5, len(keys), num_rows), 2.0e20)
+    for index_key, key in enumerate(keys):
+        pressure = np.linspace(50.0 + key, 300.0 + key, num_rows)
+        columns[0, index_key] = pressure
+        columns[1, index_key] = 1.0 / (1.1 + 0.001 * key + 0.0005 * pressure)
+        columns[2, index_key] = columns[1, index_key] / (0.5 + 0.002 * pressure)
+        columns[3:, index_key] = 0.0
+    raw = _raw_data(keys, num_rows, columns)
+
+    pvtx = PVTx(0, raw, (_identity, ConvertUnits(_identity, [_identity] * 4)))
+
+    # The table values are reproduced at the table nodes
+    ratio, pressure = pvtx.get_keys(), pvtx.get_independents()
+    assert np.allclose(
+        pvtx.formation_volume_factor(ratio, pressure), 1.0 / columns[1].ravel()
+    )
+    assert np.allclose(
+        pvtx.viscosity(ratio, pressure), (columns[1] / columns[2]).ravel()
+    )
+
+
+def test_pvtx_evaluation_between_nodes() -> None:
+    # Rectangular table where the reciprocal columns are bilinear in (ratio, pressure)
+    # fmt:off
+    keys = [10.0, 50.0]
+    pressure = [100.0, 200.0, 300.0]
+    recip_fvf = [[0.90, 0.85, 0.80],
+                 [0.86, 0.80, 0.74]]
+    recip_fvf_visc = [[0.50, 0.40, 0.30],
+                      [0.46, 0.38, 0.30]]
+    # fmt:on
+    columns = np.zeros((5, len(keys), len(pressure)))
+    columns[0] = pressure
+    columns[1] = recip_fvf
+    columns[2] = recip_fvf_visc
+    raw = _raw_data(keys, len(pressure), columns)
+
+    pvtx = PVTx(0, raw, (_identity, ConvertUnits(_identity, [_identity] * 4)))
+
+    # Midpoints of the two table cells, where bilinear interpolation is the average
+    # of the four corner values
+    ratio = np.array([30.0, 30.0])
+    midpoint_pressure = np.array([150.0, 250.0])
+    recip_fvf_mid = np.array(
+        [
+            (0.90 + 0.85 + 0.86 + 0.80) / 4,
+            (0.85 + 0.80 + 0.80 + 0.74) / 4,
+        ]
+    )
+    recip_fvf_visc_mid = np.array(
+        [
+            (0.50 + 0.40 + 0.46 + 0.38) / 4,
+            (0.40 + 0.30 + 0.38 + 0.30) / 4,
+        ]
+    )
+
+    assert np.allclose(
+        pvtx.formation_volume_factor(ratio, midpoint_pressure), 1.0 / recip_fvf_mid
+    )
+    assert np.allclose(
+        pvtx.viscosity(ratio, midpoint_pressure), recip_fvf_mid / recip_fvf_visc_mid
+    )
+
+
+def test_calculate_densities() -> None:
+    data_frame = pd.DataFrame(
+        {
+            "KEYWORD": ["DENSITY", "PVTO", "PVDO", "PVTG", "PVDG", "PVCDO", "PVTW"],
+            "OILDENSITY": [800.0, 0, 0, 0, 0, 0, 0],
+            "GASDENSITY": [1.0, 0, 0, 0, 0, 0, 0],
+            "WATERDENSITY": [1000.0, 0, 0, 0, 0, 0, 0],
+            "RATIO": [0.0, 100.0, 0.0, 0.01, 0.0, 0.0, 0.0],
+            "VOLUMEFACTOR": [0.0, 1.2, 1.1, 0.005, 0.004, 1.05, 1.01],
+        }
+    )
+
+    densities = calculate_densities(data_frame)["DENSITY"]
+
+    assert np.allclose(
+        densities,
+        [
+            0.0,
+            (800.0 + 100.0 * 1.0) / 1.2,
+            800.0 / 1.1,
+            (1.0 + 0.01 * 800.0) / 0.005,
+            1.0 / 0.004,
+            800.0 / 1.05,
+            1000.0 / 1.01,
+        ],
+    )
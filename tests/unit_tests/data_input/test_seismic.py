@@ -0,0 +1,94 @@
+# pylint: disable=protected-access
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._datainput import seismic
+from webviz_subsurface._datainput.seismic import LazySeismicCube
+
+
+def test_lazy_seismic_cube(tmp_path: Path) -> None:
+    values = np.random.default_rng(0).normal(size=(20, 15, 30)).astype(np.float32)
+    cube = xtgeo.Cube(
+        ncol=20,
+        nrow=15,
+        nlay=30,
+        xinc=12.5,
+        yinc=25.0,
+        zinc=4.0,
+        xori=1000.0,
+        yori=2000.0,
+        zori=1500.0,
+        rotation=30.0,
+        ilines=np.arange(100, 120),
+        xlines=np.arange(300, 330, 2),
+        values=values,
+    )
+    cube_path = tmp_path / "cube.segy"
+    cube.to_file(cube_path)
+
+    lazy_cube = LazySeismicCube(str(cube_path), slice_cache_size=2)
+
+    assert np.array_equal(lazy_cube.ilines, cube.ilines)
+    assert np.array_equal(lazy_cube.xlines, cube.xlines)
+    assert np.allclose(lazy_cube.zslices, 1500.0 + 4.0 * np.arange(30))
+    assert lazy_cube.value_range == (values.min(), values.max())
+
+    assert np.array_equal(lazy_cube.get_iline(105), values[5, :, :].T)
+    assert np.array_equal(lazy_cube.get_xline(310), values[:, 5, :].T)
+    assert np.array_equal(lazy_cube.get_zslice(1520.0), values[:, :, 5].T)
+    # Served from the slice cache
+    assert np.array_equal(lazy_cube.get_iline(105), values[5, :, :].T)
+
+    # Concurrent reads share the slice cache
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ilines = list(executor.map(lazy_cube.get_iline, [100, 101, 102, 103] * 10))
+    for iline, iline_values in zip([0, 1, 2, 3] * 10, ilines):
+        assert np.array_equal(iline_values, values[iline, :, :].T)
+    assert len(lazy_cube._slice_cache) == 2
+
+    fence = xtgeo.Polygons([[1050, 2050, 0, 1], [1200, 2400, 0, 1]]).get_fence(
+        asnumpy=True
+    )
+    expected = cube.get_randomline(fence)
+    randomline = lazy_cube.get_randomline(fence)
+    assert np.allclose(randomline[:4], expected[:4])
+    assert np.allclose(randomline[4], expected[4], equal_nan=True)
+
+    # Reopened on demand after being closed
+    lazy_cube.close()
+    assert np.array_equal(lazy_cube.get_xline(312), values[:, 6, :].T)
+    lazy_cube.close()
+
+
+def test_load_lazy_cube_closes_evicted_cubes(tmp_path: Path) -> None:
+    values = np.arange(4 * 3 * 5, dtype=np.float32).reshape((4, 3, 5))
+    cube_paths = []
+    for index in range(seismic.MAX_OPEN_LAZY_CUBES + 1):
+        cube_path = tmp_path / f"cube_{index}.segy"
+        xtgeo.Cube(
+            ncol=4,
+            nrow=3,
+            nlay=5,
+            xinc=25.0,
+            yinc=25.0,
+            zinc=4.0,
+            values=values + index,
+        ).to_file(cube_path)
+        cube_paths.append(str(cube_path))
+
+    first_cube = seismic.load_lazy_cube(cube_paths[0])
+    assert seismic.load_lazy_cube(cube_paths[0]) is first_cube
+    assert first_cube.value_range == (0.0, 59.0)
+
+    for cube_path in cube_paths[1:]:
+        seismic.load_lazy_cube(cube_path)
+    assert cube_paths[0] not in seismic._LAZY_CUBES
+    assert len(seismic._LAZY_CUBES) == seismic.MAX_OPEN_LAZY_CUBES
+    assert first_cube._segyfile is None
+
+    for cube in list(seismic._LAZY_CUBES.values()):
+        cube.close()
+    seismic._LAZY_CUBES.clear()
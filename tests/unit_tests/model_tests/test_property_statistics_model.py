@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from webviz_config.themes import default_theme
 
@@ -40,3 +41,62 @@ def test_init(testdata_folder: Path) -> None:
             "label",
         ]
     )
+
+
+def _create_model() -> PropertyStatisticsModel:
+    rows = [
+        (ens, real, prop, zone, region, 10.0 * real + zone_index)
+        for ens in ["iter-0", "iter-1"]
+        for real in range(4)
+        for prop in ["PORO", "PERMX"]
+        for zone_index, zone in enumerate(["UPPER", "LOWER"])
+        for region in [1, 2]
+        # Realization 3 of iter-1 is missing in region 2
+        if not (ens == "iter-1" and real == 3 and region == 2)
+    ]
+    data_df = pd.DataFrame(
+        rows, columns=["ENSEMBLE", "REAL", "PROPERTY", "ZONE", "REGION", "Avg"]
+    )
+    for column in ["Avg_Weighted", "Max", "Min", "P10", "P90", "Stddev"]:
+        data_df[column] = data_df["Avg"]
+    data_df["SOURCE"] = "geogrid"
+    data_df["ID"] = "grid"
+    return PropertyStatisticsModel(dataframe=data_df, theme=default_theme)
+
+
+def test_labels_and_statistics() -> None:
+    model = _create_model()
+    assert model.selectors == ["ZONE", "REGION"]
+    assert model.dataframe["label"].iloc[0] == "PORO | UPPER | 1"
+
+    statframe = model.statframe
+    assert len(statframe) == 16
+    row = statframe[
+        (statframe["ENSEMBLE"] == "iter-1")
+        & (statframe["label"] == "PERMX | LOWER | 2")
+    ].iloc[0]
+    assert (row["PROPERTY"], row["ZONE"], row["REGION"]) == ("PERMX", "LOWER", 2)
+    assert row["Avg_Avg"] == 11.0
+    assert row["Avg_P10"] == np.percentile([1.0, 11.0, 21.0], 10)
+    assert row["Avg_Stddev"] == 10.0
+
+    df = model.get_ensemble_properties("iter-1", [["LOWER"], [1, 2]])
+    assert list(df.columns) == [
+        "REAL",
+        "PERMX | LOWER | 1",
+        "PERMX | LOWER | 2",
+        "PORO | LOWER | 1",
+        "PORO | LOWER | 2",
+    ]
+    assert list(df["REAL"]) == [0, 1, 2, 3]
+    assert df["PORO | LOWER | 2"].isna().tolist() == [False, False, False, True]
+    assert model.get_ensemble_properties("iter-1", [["MIDDLE"], [1]]).empty
+
+    df = model.delta_statistics("PORO", "iter-0", "iter-1", [["UPPER"], [1, 2]])
+    assert set(df["label"]) == {"UPPER | 1", "UPPER | 2"}
+    assert list(model.filter_on_label("iter-0", "PORO | UPPER | 2")) == [
+        0.0,
+        10.0,
+        20.0,
+        30.0,
+    ]
@@ -10,8 +10,10 @@ from webviz_subsurface._providers import EnsembleSummaryProvider
 from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow_presampled import (
     ProviderImplArrowPresampled,
 )
+from webviz_subsurface.plugins._group_tree._types import DataType, EdgeOrNode
 from webviz_subsurface.plugins._group_tree._utils._ensemble_group_tree_data import (
     add_nodetype,
+    create_dataset,
 )
 
 ADD_NODETYPE_CASES = [
@@ -173,3 +175,68 @@ def test_add_nodetype(
     pd.testing.assert_frame_equal(
         output[columns_to_check], expected_df[columns_to_check]
     )
+
+
+def test_create_dataset() -> None:
+    """Test that the tree and summary data of each gruptree date are put together"""
+    gruptree_df = pd.DataFrame(
+        columns=["DATE", "CHILD", "KEYWORD", "PARENT", "EDGE_LABEL"],
+        data=[
+            [datetime.datetime(2000, 1, 1), "FIELD", "GRUPTREE", None, ""],
+            [datetime.datetime(2000, 1, 1), "TMPL", "GRUPTREE", "FIELD", "VFP 1"],
+            [datetime.datetime(2000, 1, 1), "WELL1", "WELSPECS", "TMPL", ""],
+            [datetime.datetime(2000, 3, 1), "FIELD", "GRUPTREE", None, ""],
+            [datetime.datetime(2000, 3, 1), "TMPL", "GRUPTREE", "FIELD", "VFP 1"],
+            [datetime.datetime(2000, 3, 1), "WELL2", "WELSPECS", "TMPL", ""],
+            [datetime.datetime(2000, 3, 1), "WELL1", "WELSPECS", "TMPL", ""],
+        ],
+    )
+    sumvecs_df = pd.DataFrame(
+        columns=["NODENAME", "DATATYPE", "EDGE_NODE", "SUMVEC"],
+        data=[
+            ["FIELD", DataType.PRESSURE, EdgeOrNode.NODE, "GPR:FIELD"],
+            ["TMPL", DataType.OILRATE, EdgeOrNode.EDGE, "GOPR:TMPL"],
+            ["WELL1", DataType.OILRATE, EdgeOrNode.EDGE, "WOPR:WELL1"],
+            ["WELL1", DataType.BHP, EdgeOrNode.NODE, "WBHP:WELL1"],
+            ["WELL2", DataType.OILRATE, EdgeOrNode.EDGE, "WOPR:WELL2"],
+        ],
+    )
+    smry = pd.DataFrame(
+        {
+            "DATE": pd.to_datetime(
+                ["2000-03-01", "2000-01-01", "2000-02-01", "2000-04-01"]
+            ),
+            "REAL": 0,
+            "GOPR:TMPL": [3.0, 1.0, 2.0, 4.0],
+            "WOPR:WELL1": [1.5, 0.5, 1.0, 2.0],
+            "WOPR:WELL2": [1.5, 0.5, 1.0, 2.0],
+            "WBHP:WELL1": [100.123, 102.0, 101.0, 99.0],
+        }
+    )
+
+    dataset = create_dataset(smry, gruptree_df, sumvecs_df, "FIELD")
+
+    # The last summary date is not included
+    assert [tree["dates"] for tree in dataset] == [
+        ["2000-01-01", "2000-02-01"],
+        ["2000-03-01"],
+    ]
+    tree = dataset[0]["tree"]
+    assert tree["node_label"] == "FIELD"
+    assert tree["node_data"]["pressure"] == pytest.approx(
+        [float("nan")] * 2, nan_ok=True
+    )
+    tmpl = tree["children"][0]
+    assert tmpl["edge_label"] == "VFP 1"
+    assert tmpl["edge_data"] == {"oilrate": [1.0, 2.0]}
+    assert [child["node_label"] for child in tmpl["children"]] == ["WELL1"]
+
+    well_nodes = dataset[1]["tree"]["children"][0]["children"]
+    assert [child["node_label"] for child in well_nodes] == ["WELL2", "WELL1"]
+    assert well_nodes[1] == {
+        "node_label": "WELL1",
+        "node_type": "Well",
+        "edge_label": "",
+        "edge_data": {"oilrate": [1.5]},
+        "node_data": {"bhp": [100.12]},
+    }
@@ -0,0 +1,63 @@
+import datetime
+import math
+
+import pandas as pd
+
+from webviz_subsurface.plugins._prod_misfit.utils.make_dataframes import (
+    get_df_diff_stat,
+)
+
+DATE_1 = datetime.datetime(2020, 1, 1)
+DATE_2 = datetime.datetime(2020, 2, 1)
+
+
+def test_get_df_diff_stat() -> None:
+    df_diff = pd.DataFrame(
+        columns=[
+            "ENSEMBLE",
+            "DATE",
+            "REAL",
+            "WOPT:OP1",
+            "DIFF_WOPT:OP1",
+            "DIFF_WWPT:OP1",
+        ],
+        data=[
+            ["iter-0", DATE_1, 0, 100.0, 1.0, 0.0],
+            ["iter-0", DATE_1, 1, 200.0, 2.0, 0.0],
+            ["iter-0", DATE_1, 2, 300.0, 6.0, 3.0],
+            ["iter-0", DATE_2, 0, 100.0, -2.0, 5.0],
+            ["iter-0", DATE_2, 1, 200.0, 0.0, 5.0],
+            ["iter-0", DATE_2, 2, 300.0, 2.0, 5.0],
+            ["iter-1", DATE_1, 0, 100.0, 10.0, 1.0],
+            ["iter-1", DATE_1, 1, 200.0, 20.0, 3.0],
+        ],
+    )
+
+    # Sample standard deviation, and P10/P90 as the 90th/10th percentile with linear
+    # interpolation between the sorted realization values
+    expected_df = pd.DataFrame(
+        columns=[
+            "ENSEMBLE",
+            "WELL",
+            "VECTOR",
+            "DATE",
+            "DIFF_MEAN",
+            "DIFF_STD",
+            "DIFF_P10",
+            "DIFF_P90",
+        ],
+        data=[
+            ["iter-0", "OP1", "DIFF_WOPT", DATE_1, 3.0, math.sqrt(7), 5.2, 1.2],
+            ["iter-0", "OP1", "DIFF_WWPT", DATE_1, 1.0, math.sqrt(3), 2.4, 0.0],
+            ["iter-0", "OP1", "DIFF_WOPT", DATE_2, 0.0, 2.0, 1.6, -1.6],
+            ["iter-0", "OP1", "DIFF_WWPT", DATE_2, 5.0, 0.0, 5.0, 5.0],
+            ["iter-1", "OP1", "DIFF_WOPT", DATE_1, 15.0, math.sqrt(50), 19.0, 11.0],
+            ["iter-1", "OP1", "DIFF_WWPT", DATE_1, 2.0, math.sqrt(2), 2.8, 1.2],
+        ],
+    )
+
+    pd.testing.assert_frame_equal(get_df_diff_stat(df_diff), expected_df)
+
+
+def test_get_df_diff_stat_empty() -> None:
+    assert get_df_diff_stat(pd.DataFrame()).empty
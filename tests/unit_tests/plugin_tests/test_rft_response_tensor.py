@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface.plugins._rft_plotter._utils._rft_response_tensor import (
+    RftResponseTensor,
+    non_constant_columns,
+)
+
+RFT_KEYS = ["W1 2020-01-01 A", "W1 2020-01-01 B", "W2 2021-01-01 A"]
+PARAMETERS = ["P1", "P2", "P3"]
+
+
+def _create_tensor() -> RftResponseTensor:
+    rng = np.random.default_rng(seed=1)
+    rft_df = pd.DataFrame(
+        [
+            (real, key, rng.random(), 100.0 + point, 1.0)
+            for real in range(10)
+            for key in RFT_KEYS
+            for point in range(2)
+            # Realization 3 is missing in well W2
+            if not (real == 3 and key.startswith("W2"))
+        ],
+        columns=["REAL", "RFT_KEY", "SIMULATED", "OBSERVED", "OBSERVED_ERR"],
+    )
+    parameter_df = pd.DataFrame(
+        {
+            "REAL": range(1, 11),
+            "P1": rng.random(10),
+            "P2": rng.random(10),
+            "P3": [np.nan] + list(rng.random(9)),
+        }
+    )
+    return RftResponseTensor(rft_df, parameter_df, PARAMETERS)
+
+
+def test_pivot_table() -> None:
+    tensor = _create_tensor()
+    assert tensor.rft_keys == RFT_KEYS
+    assert tensor.observation(RFT_KEYS[0], [0, 1]) == (100.5, 1.0)
+    assert np.isnan(tensor.observation("W3 2020-01-01 A", [0, 1])[0])
+
+    pivot = tensor.pivot_table(list(range(10)))
+    assert pivot is not None
+    df, ens_params, rfts = pivot
+    # Realization 0 has no parameters, and P3 is missing in realization 1
+    assert list(df["REAL"]) == list(range(1, 10))
+    assert ens_params == ["P1", "P2"]
+    assert rfts == RFT_KEYS
+    assert list(df.columns) == ["REAL"] + RFT_KEYS + ["P1", "P2"]
+    assert df[RFT_KEYS[2]].isna().tolist() == [False] * 2 + [True] + [False] * 6
+
+    pivot = tensor.pivot_table([2, 3, 4], rft_key=RFT_KEYS[2])
+    assert pivot is not None
+    df, ens_params, rfts = pivot
+    assert rfts == [RFT_KEYS[2]]
+    assert ens_params == PARAMETERS
+    assert list(df["REAL"]) == [2, 4]
+
+    assert tensor.pivot_table([3], rft_key=RFT_KEYS[2]) is None
+    assert tensor.pivot_table([20]) is None
+
+
+@pytest.mark.parametrize("reals", [list(range(10)), [2, 3, 4, 5, 6]])
+def test_correlations_equal_pandas(reals: list) -> None:
+    tensor = _create_tensor()
+    pivot = tensor.pivot_table(reals)
+    assert pivot is not None
+    df, ens_params, rfts = pivot
+
+    correlations = tensor.correlations(reals)
+    assert list(correlations.index) == rfts
+    assert list(correlations.columns) == ens_params
+    for rft in rfts:
+        np.testing.assert_allclose(
+            correlations.loc[rft].to_numpy(),
+            df[ens_params].corrwith(df[rft]).to_numpy(),
+            atol=1e-12,
+        )
+
+
+def test_non_constant_columns() -> None:
+    df = pd.DataFrame(
+        {"A": [1.0, 2.0, np.nan], "B": [1.0, 1.0, np.nan], "C": [np.nan] * 3}
+    )
+    assert non_constant_columns(df, ["A", "B", "C"]) == ["A"]
+    assert non_constant_columns(df.iloc[:0], ["A"]) == []
@@ -0,0 +1,108 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from webviz_subsurface.plugins._running_time_analysis_fmu import (
+    find_realization_files,
+    load_realization_parameters,
+    load_status_files,
+    load_status_table,
+)
+
+
+def _write_status_file(path: Path, end_time: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "start_time": 0.0,
+                "end_time": end_time,
+                "jobs": [
+                    {
+                        "name": "RMS",
+                        "status": "Success",
+                        "start_time": 0.0,
+                        "end_time": end_time,
+                    }
+                ],
+            }
+        )
+    )
+
+
+def test_load_status_files_keeps_order(tmp_path: Path) -> None:
+    paths = []
+    for real in range(50):
+        path = tmp_path / f"realization-{real}" / "status.json"
+        path.parent.mkdir()
+        path.write_text(
+            json.dumps({"start_time": real, "end_time": real + 1, "jobs": []})
+        )
+        paths.append(str(path))
+
+    status_dicts = load_status_files(paths)
+    assert [status["start_time"] for status in status_dicts] == list(range(50))
+    assert not load_status_files([])
+
+
+def test_find_realization_files(tmp_path: Path) -> None:
+    for real in [10, 2, 1]:
+        _write_status_file(
+            tmp_path / f"realization-{real}" / "iter-0" / "status.json", 1
+        )
+    (tmp_path / "realization-3" / "iter-0").mkdir(parents=True)
+
+    files = find_realization_files(
+        {"iter-0": str(tmp_path / "realization-*" / "iter-0")}, "status.json"
+    )
+    assert files["ENSEMBLE"].tolist() == ["iter-0"] * 3
+    assert files["REAL"].tolist() == [1, 2, 10]
+    assert files["FULLPATH"].tolist() == [
+        str(tmp_path / f"realization-{real}" / "iter-0" / "status.json")
+        for real in [1, 2, 10]
+    ]
+
+
+def test_load_status_table_is_stored_until_status_files_change(tmp_path: Path) -> None:
+    status_path = tmp_path / "realization-0" / "status.json"
+    _write_status_file(status_path, 10)
+    status_files = find_realization_files(
+        {"iter-0": str(tmp_path / "realization-*")}, "status.json"
+    )
+    cache_dir = tmp_path / "storage"
+
+    table = load_status_table(status_files, cache_dir)
+    assert table["END_TIME"].tolist() == [10.0]
+    pd.testing.assert_frame_equal(table, load_status_table(status_files))
+    assert len(list(cache_dir.glob("*.arrow"))) == 1
+
+    # The stored table is used as long as the status files have not been modified
+    stored_file = next(cache_dir.glob("*.arrow"))
+    stored_mtime = stored_file.stat().st_mtime_ns
+    pd.testing.assert_frame_equal(table, load_status_table(status_files, cache_dir))
+    assert stored_file.stat().st_mtime_ns == stored_mtime
+
+    _write_status_file(status_path, 20)
+    os.utime(status_path, ns=(0, status_path.stat().st_mtime_ns + 1))
+    assert load_status_table(status_files, cache_dir)["END_TIME"].tolist() == [20.0]
+    assert len(list(cache_dir.glob("*.arrow"))) == 2
+
+
+def test_load_realization_parameters(tmp_path: Path) -> None:
+    for real in [0, 1]:
+        path = tmp_path / f"realization-{real}" / "iter-0" / "parameters.txt"
+        path.parent.mkdir(parents=True)
+        path.write_text(f"FWL {1700 + real}\nMULT 0.{real + 5}\nNAME case{real}\n")
+    (tmp_path / "realization-2" / "iter-0").mkdir(parents=True)
+    (tmp_path / "realization-2" / "iter-0" / "parameters.txt").write_text("")
+
+    parameters = load_realization_parameters.__wrapped__(
+        {"iter-0": str(tmp_path / "realization-*" / "iter-0")}
+    )
+    assert parameters["REAL"].tolist() == [0, 1, 2]
+    assert parameters["FWL"].tolist()[:2] == [1700, 1701]
+    assert parameters["MULT"].tolist()[:2] == [0.5, 0.6]
+    assert parameters["NAME"].tolist()[:2] == ["case0", "case1"]
+    assert parameters.iloc[2, 2:].isna().all()
@@ -7,6 +7,7 @@ import pytest
 
 from webviz_subsurface._providers import Frequency
 from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
+from webviz_subsurface._utils.typed_arrays import decode_typed_array
 from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._types import (
     FanchartOptions,
     StatisticsOptions,
@@ -168,6 +169,128 @@ def test_create_vector_realization_traces() -> None:
     assert expected_traces == created_traces
 
 
+def test_create_vector_realization_traces_with_max_points_per_trace() -> None:
+    dates = [
+        datetime.datetime(2020, 1, 1) + datetime.timedelta(days=i) for i in range(50)
+    ]
+    vector_df = pd.DataFrame(
+        {
+            "DATE": dates * 2 + dates[:10],
+            "REAL": [1] * 50 + [2] * 50 + [3] * 10,
+            "A": np.concatenate([np.sin(np.arange(50)), np.arange(50), np.ones(10)]),
+        }
+    )
+    make_date_column_datetime_object(vector_df)
+
+    created_traces = create_vector_realization_traces(
+        vector_df=vector_df,
+        ensemble="Test ensemble",
+        color="red",
+        legend_group="Test group",
+        line_shape="linear",
+        hovertemplate="Test hovertemplate ",
+        max_points_per_trace=20,
+    )
+
+    assert [len(trace["x"]) for trace in created_traces] == [20, 20, 10]
+    for trace in created_traces[:2]:
+        assert len(trace["y"]) == 20
+        assert trace["x"][0] == dates[0]
+        assert trace["x"][-1] == dates[-1]
+    assert created_traces[0]["y"][0] == np.sin(0)
+    assert created_traces[1]["y"][-1] == 49.0
+
+
+def test_create_vector_realization_traces_with_typed_arrays() -> None:
+    vector_df = pd.DataFrame(
+        columns=["DATE", "REAL", "A"],
+        data=[
+            [datetime.datetime(2020, 1, 1), 1, 1.0],
+            [datetime.datetime(2020, 2, 1), 1, 2.0],
+            [datetime.datetime(2031, 5, 10), 2, 5.0],
+        ],
+    )
+    make_date_column_datetime_object(vector_df)
+
+    created_traces = create_vector_realization_traces(
+        vector_df=vector_df,
+        ensemble="Test ensemble",
+        color="red",
+        legend_group="Test group",
+        line_shape="linear",
+        hovertemplate="Test hovertemplate ",
+        use_typed_arrays=True,
+    )
+
+    assert len(created_traces) == 2
+    assert created_traces[0]["x"]["dtype"] == "f8"
+    assert list(
+        pd.to_datetime(decode_typed_array(created_traces[0]["x"]), unit="ms")
+    ) == [datetime.datetime(2020, 1, 1), datetime.datetime(2020, 2, 1)]
+    assert list(decode_typed_array(created_traces[0]["y"])) == [1.0, 2.0]
+    assert list(
+        pd.to_datetime(decode_typed_array(created_traces[1]["x"]), unit="ms")
+    ) == [datetime.datetime(2031, 5, 10)]
+    assert list(decode_typed_array(created_traces[1]["y"])) == [5.0]
+
+
+def test_create_vector_realization_traces_with_single_trace() -> None:
+    vector_df = pd.DataFrame(
+        columns=["DATE", "REAL", "A"],
+        data=[
+            [datetime.datetime(2031, 5, 10), 2, 5.0],
+            [datetime.datetime(2031, 6, 10), 2, 6.0],
+            [datetime.datetime(2020, 1, 1), 1, 1.0],
+            [datetime.datetime(2020, 2, 1), 1, 2.0],
+            [datetime.datetime(2020, 3, 1), 1, 3.0],
+        ],
+    )
+    make_date_column_datetime_object(vector_df)
+
+    created_traces = create_vector_realization_traces(
+        vector_df=vector_df,
+        ensemble="Test ensemble",
+        color="red",
+        legend_group="Test group",
+        line_shape="hv",
+        hovertemplate="Test hovertemplate ",
+        show_legend=True,
+        single_trace=True,
+    )
+
+    assert len(created_traces) == 1
+    trace = created_traces[0]
+    assert trace["type"] == "scattergl"
+    assert trace["x"] == [
+        datetime.datetime(2020, 1, 1),
+        datetime.datetime(2020, 2, 1),
+        datetime.datetime(2020, 3, 1),
+        datetime.datetime(2020, 3, 1),
+        datetime.datetime(2031, 5, 10),
+        datetime.datetime(2031, 6, 10),
+    ]
+    np.testing.assert_equal(trace["y"], [1.0, 2.0, 3.0, np.nan, 5.0, 6.0])
+    assert trace["customdata"] == [1, 1, 1, 1, 2, 2]
+    assert (
+        trace["hovertemplate"]
+        == "Test hovertemplate Realization: %{customdata}, Ensemble: Test ensemble"
+    )
+    assert trace["showlegend"] is True
+
+    spline_traces = create_vector_realization_traces(
+        vector_df=vector_df,
+        ensemble="Test ensemble",
+        color="red",
+        legend_group="Test group",
+        line_shape="spline",
+        hovertemplate="Test hovertemplate ",
+        max_points_per_trace=3,
+        single_trace=True,
+    )
+    assert spline_traces[0]["type"] == "scatter"
+    assert spline_traces[0]["x"] == trace["x"]
+
+
 def test_create_vector_realization_traces_raise_error() -> None:
     multiple_vectors_df = pd.DataFrame(columns=["DATE", "REAL", "A", "B"])
 
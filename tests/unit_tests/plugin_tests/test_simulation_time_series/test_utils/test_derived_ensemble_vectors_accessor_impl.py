@@ -8,6 +8,7 @@ from webviz_subsurface_components.VectorCalculatorWrapper import (
     VariableVectorMapInfo,
 )
 
+from webviz_subsurface._providers import compute_vectors_statistics_df
 from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
 
 # pylint: disable = line-too-long
@@ -130,6 +131,15 @@ TEST_AFTER_2262_ACCESSOR = DerivedEnsembleVectorsAccessorImpl(
     resampling_frequency=None,
 )
 
+TEST_RELATIVE_DATE_ACCESSOR = DerivedEnsembleVectorsAccessorImpl(
+    name="Test relative date accessor",
+    provider=EnsembleSummaryProviderMock(INPUT_DF),
+    vectors=["A", "B"],
+    expressions=None,
+    resampling_frequency=None,
+    relative_date=datetime.datetime(2000, 2, 1),
+)
+
 TEST_EMPTY_ACCESSOR = DerivedEnsembleVectorsAccessorImpl(
     name="Empty provider accessor",
     provider=EnsembleSummaryProviderMock(pd.DataFrame()),
@@ -187,6 +197,30 @@ def test_has_vector_calculator_expressions(
     assert test_accessor.has_vector_calculator_expressions() == expected_state
 
 
+@pytest.mark.parametrize(
+    "test_accessor, expected_state",
+    TEST_STATUS_CASES + [pytest.param(TEST_RELATIVE_DATE_ACCESSOR, False)],
+)
+def test_has_provider_vectors_statistics(
+    test_accessor: DerivedEnsembleVectorsAccessorImpl, expected_state: bool
+) -> None:
+    assert test_accessor.has_provider_vectors_statistics() == expected_state
+
+
+def test_get_provider_vectors_statistics_df() -> None:
+    expected_df = compute_vectors_statistics_df(
+        INPUT_DF.loc[INPUT_DF["REAL"].isin([1, 4])]
+    )
+
+    test_df = TEST_ACCESSOR.get_provider_vectors_statistics_df(realizations=[1, 4])
+
+    assert_frame_equal(expected_df, test_df)
+    assert test_df[("A", "Mean")].tolist() == [6.0, 7.0, 8.0]
+
+    with pytest.raises(ValueError):
+        TEST_RELATIVE_DATE_ACCESSOR.get_provider_vectors_statistics_df()
+
+
 @pytest.mark.parametrize("test_accessor, expected_df", TEST_GET_VECTOR_CASES)
 def test_get_provider_vectors(
     test_accessor: DerivedEnsembleVectorsAccessorImpl, expected_df: pd.DataFrame
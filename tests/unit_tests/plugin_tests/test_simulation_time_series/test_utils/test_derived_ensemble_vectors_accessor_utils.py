@@ -1,3 +1,4 @@
+import datetime
 from typing import Dict, List
 
 import pandas as pd
@@ -12,6 +13,7 @@ from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._typ
 # pylint: disable = line-too-long
 from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._utils.derived_ensemble_vectors_accessor_utils import (
     create_derived_vectors_accessor_dict,
+    get_derived_vectors_dfs,
 )
 
 # pylint: disable = line-too-long
@@ -76,3 +78,32 @@ def test_create_derived_vectors_accessor_dict() -> None:
     assert isinstance(
         created_result["(ensC)-(ensA)"], DerivedDeltaEnsembleVectorsAccessorImpl
     )
+
+
+def test_get_derived_vectors_dfs() -> None:
+    vectors_df = pd.DataFrame(
+        {
+            "DATE": [datetime.datetime(2000, 1, 1), datetime.datetime(2000, 1, 1)],
+            "REAL": [0, 1],
+            "vector_1": [1.0, 3.0],
+        }
+    )
+    accessor = DerivedEnsembleVectorsAccessorImpl(
+        name="ensA",
+        provider=EnsembleSummaryProviderMock(vectors_df),
+        vectors=["vector_1"],
+    )
+
+    vectors_df_list, vectors_statistics_df_list = get_derived_vectors_dfs(
+        accessor, None, use_provider_statistics=False
+    )
+    assert len(vectors_df_list) == 1 and not vectors_statistics_df_list
+    pd.testing.assert_frame_equal(vectors_df_list[0], vectors_df)
+
+    vectors_df_list, vectors_statistics_df_list = get_derived_vectors_dfs(
+        accessor, None, use_provider_statistics=True
+    )
+    assert not vectors_df_list and len(vectors_statistics_df_list) == 1
+    statistics_df = vectors_statistics_df_list[0]
+    assert statistics_df[("vector_1", "Mean")].tolist() == [2.0]
+    assert statistics_df[("vector_1", "Max")].tolist() == [3.0]
@@ -24,11 +24,19 @@ class DerivedVectorsAccessorMock(DerivedVectorsAccessor):
     def has_vector_calculator_expressions(self) -> bool:
         raise NotImplementedError("Method not implemented for mock!")
 
+    def has_provider_vectors_statistics(self) -> bool:
+        raise NotImplementedError("Method not implemented for mock!")
+
     def get_provider_vectors_df(
         self, realizations: Optional[Sequence[int]] = None
     ) -> pd.DataFrame:
         raise NotImplementedError("Method not implemented for mock!")
 
+    def get_provider_vectors_statistics_df(
+        self, realizations: Optional[Sequence[int]] = None
+    ) -> pd.DataFrame:
+        raise NotImplementedError("Method not implemented for mock!")
+
     def create_per_interval_and_per_day_vectors_df(
         self, realizations: Optional[Sequence[int]] = None
     ) -> pd.DataFrame:
@@ -4,7 +4,7 @@ import pandas as pd
 import pytest
 from pandas._testing import assert_frame_equal
 
-from webviz_subsurface._providers import Frequency
+from webviz_subsurface._providers import Frequency, get_cumulative_vector_name
 from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
 
 # pylint: disable=line-too-long
@@ -13,7 +13,6 @@ from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._uti
     create_per_day_vector_name,
     create_per_interval_vector_name,
     datetime_to_intervalstr,
-    get_cumulative_vector_name,
     is_per_interval_or_per_day_vector,
 )
 
@@ -128,3 +128,59 @@ def test_tornado_data_init():
             "senstype": SensitivityType.MONTE_CARLO,
         },
     ]
+
+
+def test_tornado_data_from_groups():
+    # fmt: off
+    input_data = [
+        ["ZONE", "REAL",  "SENSNAME",   "SENSCASE",  "SENSTYPE", "VALUE" ],
+        [   "X",      0,         "A",    "p10_p90", "mc"       ,     10.0],
+        [   "X",      1,         "A",    "p10_p90", "mc"       ,     20.0],
+        [   "X",      2,         "B",       "deep", "scalar"   ,     5.0],
+        [   "X",      3,         "B",       "deep", "scalar"   ,     6.0],
+        [   "X",      4,         "C",    "shallow", "scalar"   ,     25.0],
+        [   "X",      5,         "C",    "shallow", "scalar"   ,     26.0],
+        [   "Y",      0,         "A",    "p10_p90", "mc"       ,     1.0],
+        [   "Y",      1,         "A",    "p10_p90", "mc"       ,     3.0],
+        [   "Y",      4,         "C",    "shallow", "scalar"   ,     7.0],
+        [   "Y",      5,         "C",    "shallow", "scalar"   ,     9.0],
+        [   "Z",      4,         "C",    "shallow", "scalar"   ,     7.0],
+    ]
+    # fmt: on
+    input_df = pd.DataFrame(input_data[1:], columns=input_data[0])
+
+    tornados = TornadoData.from_groups(
+        dframe=input_df, group_by=["ZONE"], reference="A", scale="Absolute"
+    )
+    # Zone Z has no reference sensitivity
+    assert list(tornados) == ["X", "Y"]
+
+    for zone, tornado_data in tornados.items():
+        zone_df = input_df[input_df["ZONE"] == zone].drop(columns="ZONE")
+        expected = TornadoData(dframe=zone_df, reference="A", scale="Absolute")
+        assert tornado_data.reference_average == expected.reference_average
+        pd.testing.assert_frame_equal(
+            tornado_data.tornadotable.reset_index(drop=True),
+            expected.tornadotable.reset_index(drop=True),
+        )
+        pd.testing.assert_frame_equal(
+            tornado_data.real_df.reset_index(drop=True),
+            expected.real_df.reset_index(drop=True),
+        )
+
+
+@pytest.mark.parametrize(
+    "low, high, expected",
+    [
+        (-2.0, 3.0, (0.0, 0.0, 3.0, -2.0)),
+        (-2.0, -1.0, (-1.0, -1.0, 0.0, -1.0)),
+        (1.0, 3.0, (1.0, 1.0, 2.0, 0.0)),
+    ],
+)
+def test_tornado_bar_geometry(low: float, high: float, expected: tuple) -> None:
+    assert (
+        TornadoData.calc_low_base(low, high),
+        TornadoData.calc_high_base(low, high),
+        TornadoData.calc_high_x(low, high),
+        TornadoData.calc_low_x(low, high),
+    ) == expected
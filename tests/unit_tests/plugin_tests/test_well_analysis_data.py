@@ -0,0 +1,107 @@
+import datetime
+from typing import List, Optional, Sequence, cast
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._models import GruptreeModel, WellAttributesModel
+from webviz_subsurface._providers import Frequency
+from webviz_subsurface.plugins._well_analysis._utils import EnsembleWellAnalysisData
+
+from ..mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
+
+DATES = [datetime.datetime(2020, month, 1) for month in range(1, 5)]
+
+
+class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
+    def __init__(self, vectors_df: pd.DataFrame) -> None:
+        self._vectors_df = vectors_df
+        self.requested_vectors: List[List[str]] = []
+
+    def vector_names(self) -> List[str]:
+        return [col for col in self._vectors_df.columns if col not in ["DATE", "REAL"]]
+
+    def realizations(self) -> List[int]:
+        return list(self._vectors_df["REAL"].unique())
+
+    def get_vectors_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        self.requested_vectors.append(list(vector_names))
+        return self._vectors_df[["DATE", "REAL"] + list(vector_names)]
+
+
+@pytest.fixture(name="provider")
+def fixture_provider() -> EnsembleSummaryProviderMock:
+    return EnsembleSummaryProviderMock(
+        pd.DataFrame(
+            {
+                "DATE": DATES * 2,
+                "REAL": [0] * 4 + [1] * 4,
+                "WOPT:OP_1": [0.0, 1.0, 2.0, 3.0, 0.0, 2.0, 4.0, 6.0],
+                "WOPT:OP_2": [0.0, 0.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0],
+                "WTHP:OP_1": [10.0] * 8,
+                "GPR:FIELD": [5.0] * 8,
+            }
+        )
+    )
+
+
+def _create_data(provider: EnsembleSummaryProviderMock) -> EnsembleWellAnalysisData:
+    # The gruptree and well attributes models are not used in these tests
+    return EnsembleWellAnalysisData(
+        "iter-0",
+        provider,
+        cast(GruptreeModel, None),
+        cast(WellAttributesModel, None),
+    )
+
+
+def test_vectors_are_loaded_on_demand(provider: EnsembleSummaryProviderMock) -> None:
+    data = _create_data(provider)
+    assert not provider.requested_vectors
+    assert data.wells == ["OP_1", "OP_2"]
+
+    df = data.get_summary_data("WOPT", None, DATES[2])
+    assert list(df.columns) == ["REAL", "DATE", "WOPT:OP_1", "WOPT:OP_2"]
+    assert list(df["WOPT:OP_1"]) == [0.0, 1.0, 2.0, 0.0, 2.0, 4.0]
+
+    # The vectors are cached
+    data.get_summary_data("WOPT", None, None)
+    data.get_dataframe_melted("WOPT", None, None)
+    assert provider.requested_vectors == [["GPR:FIELD"], ["WOPT:OP_1", "WOPT:OP_2"]]
+
+
+def test_get_dataframe_melted(provider: EnsembleSummaryProviderMock) -> None:
+    data = _create_data(provider)
+
+    df = data.get_dataframe_melted("WOPT", None, None)
+    assert list(df.columns) == ["WELL", "WOPT", "ENSEMBLE"]
+    assert list(df["WELL"]) == ["OP_1", "OP_1", "OP_2", "OP_2"]
+    assert list(df["WOPT"]) == [3.0, 6.0, 1.0, 1.0]
+
+    # Production from the second date until a date after the last date
+    df = data.get_dataframe_melted("WOPT", DATES[1], datetime.datetime(2021, 1, 1))
+    assert list(df["WOPT"]) == [2.0, 4.0, 1.0, 0.0]
+
+    # Production until a date that is not in the ensemble
+    df = data.get_dataframe_melted("WOPT", None, datetime.datetime(2020, 2, 15))
+    assert df.empty
+
+
+def test_cache_is_bounded(
+    provider: EnsembleSummaryProviderMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = _create_data(provider)
+    monkeypatch.setattr(EnsembleWellAnalysisData, "CACHE_SIZE_BYTES", 8 * 8)
+
+    df = data.get_summary_data("WOPT", None, None)
+    np.testing.assert_equal(
+        data.get_summary_data("WOPT", None, None).to_numpy(), df.to_numpy()
+    )
+    # Only one vector fits in the cache, so the first vector is loaded again
+    assert provider.requested_vectors[1:] == [["WOPT:OP_1", "WOPT:OP_2"], ["WOPT:OP_1"]]
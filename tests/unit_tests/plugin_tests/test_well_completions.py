@@ -6,6 +6,8 @@ from pandas._testing import assert_frame_equal
 from webviz_subsurface._datainput.well_completions import remove_invalid_colors
 from webviz_subsurface.plugins._well_completions._business_logic import (
     extract_stratigraphy,
+    extract_wells,
+    get_completion_events_and_kh,
     merge_compdat_and_connstatus,
 )
 
@@ -156,3 +158,68 @@ def test_merge_compdat_and_connstatus():
     assert_frame_equal(
         df_result, df_output, check_like=True
     )  # Ignore order of rows and columns
+
+
+def test_get_completion_events_and_kh():
+    """Checks the completion event and kh tensors:
+    * a zone is open if minimum one of the connections is open
+    * kh is summed over the open connections
+    * time steps without data keep the value from the previous time step
+    * zones without data for a realization have no events
+    """
+    df = pd.DataFrame(
+        data={
+            "REAL": [0, 0, 0, 0, 1],
+            "DATE": [
+                "2021-01-01",
+                "2021-01-01",
+                "2021-03-01",
+                "2021-01-01",
+                "2021-02-01",
+            ],
+            "WELL": ["A1", "A1", "A1", "A1", "A1"],
+            "ZONE": ["ZoneA", "ZoneA", "ZoneA", "ZoneB", "ZoneA"],
+            "OP/SH": ["OPEN", "SHUT", "SHUT", "OPEN", "OPEN"],
+            "KH": [100.0, 10.0, 100.0, 5.0, 50.0],
+        }
+    )
+    time_steps = ["2021-01-01", "2021-02-01", "2021-03-01"]
+    pairs_df, real_has_well, events, kh_values = get_completion_events_and_kh(
+        df, ["ZoneA", "ZoneB"], time_steps
+    )
+    assert pairs_df.to_dict("records") == [
+        {"WELL": "A1", "ZONE": "ZoneA"},
+        {"WELL": "A1", "ZONE": "ZoneB"},
+    ]
+    assert real_has_well.tolist() == [[True, True], [True, True]]
+    assert events.tolist() == [[[1, 1, -1], [1, 1, 1]], [[0, 1, 1], [0, 0, 0]]]
+    assert kh_values.tolist() == [
+        [[100.0, 100.0, 0.0], [5.0, 5.0, 5.0]],
+        [[0.0, 50.0, 50.0], [0.0, 0.0, 0.0]],
+    ]
+
+    wells = extract_wells(df, ["ZoneA", "ZoneB"], time_steps, [0, 1], None)
+    assert wells == [
+        {
+            "name": "A1",
+            "completions": {
+                "ZoneA": {
+                    "t": [0, 1, 2],
+                    "open": [0.5, 1.0, 0.5],
+                    "shut": [0.0, 0.0, 0.5],
+                    "khMean": [50.0, 75.0, 25.0],
+                    "khMin": [0.0, 50.0, 0.0],
+                    "khMax": [100.0, 100.0, 50.0],
+                },
+                "ZoneB": {
+                    "t": [0],
+                    "open": [0.5],
+                    "shut": [0.0],
+                    "khMean": [2.5],
+                    "khMin": [0.0],
+                    "khMax": [5.0],
+                },
+            },
+            "attributes": {},
+        }
+    ]
@@ -0,0 +1,119 @@
+# pylint: disable=protected-access
+import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas._testing import assert_frame_equal
+
+from webviz_subsurface._providers import Frequency, get_delta_ensemble_vectors_df
+from webviz_subsurface._providers.ensemble_summary_provider import _delta_ensemble
+
+from ..mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
+
+
+class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
+    def __init__(
+        self, df: pd.DataFrame, yearly_df: Optional[pd.DataFrame] = None
+    ) -> None:
+        super().__init__()
+        self._df = df
+        self._yearly_df = yearly_df
+
+    def get_vectors_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        df = self._df
+        if resampling_frequency == Frequency.YEARLY and self._yearly_df is not None:
+            df = self._yearly_df
+        df = df[["DATE", "REAL"] + list(vector_names)]
+        if realizations is not None:
+            df = df.loc[df["REAL"].isin(realizations)].reset_index(drop=True)
+        return df
+
+
+def _create_vectors_df(
+    reals: Sequence[int], dates: Sequence[datetime.datetime]
+) -> pd.DataFrame:
+    rng = np.random.default_rng(len(reals))
+    return pd.DataFrame(
+        {
+            "DATE": pd.Series(list(dates) * len(reals), dtype="object"),
+            "REAL": np.repeat(reals, len(dates)),
+            "A": rng.normal(size=len(reals) * len(dates)),
+            "B": rng.normal(size=len(reals) * len(dates)),
+        }
+    )
+
+
+def _expected_delta_df(df_a: pd.DataFrame, df_b: pd.DataFrame) -> pd.DataFrame:
+    return (
+        df_a.set_index(["DATE", "REAL"])
+        .sub(df_b.set_index(["DATE", "REAL"]))
+        .dropna(axis=0, how="any")
+        .reset_index()
+        .sort_values(["REAL", "DATE"], ignore_index=True)
+    )
+
+
+def test_get_delta_ensemble_vectors_df() -> None:
+    dates = [datetime.datetime(2000 + year, 1, 1) for year in range(5)]
+    df_a = _create_vectors_df([3, 1, 2, 5], dates)
+    df_b = _create_vectors_df(
+        [0, 1, 2, 3, 4], dates[1:] + [datetime.datetime(2263, 1, 1)]
+    )
+    df_a.loc[3, "B"] = np.nan
+    provider_a = EnsembleSummaryProviderMock(df_a)
+    provider_b = EnsembleSummaryProviderMock(df_b)
+
+    delta_df = get_delta_ensemble_vectors_df(provider_a, provider_b, ["A", "B"], None)
+    assert_frame_equal(delta_df, _expected_delta_df(df_a, df_b), check_dtype=False)
+    assert delta_df["REAL"].tolist() == [1] * 4 + [2] * 4 + [3] * 3
+
+    # Alignment plan is cached per provider pair
+    assert len(_delta_ensemble._ALIGNMENT_PLAN_CACHE[provider_a]) == 1
+    delta_df = get_delta_ensemble_vectors_df(provider_a, provider_b, ["A"], None)
+    assert_frame_equal(
+        delta_df,
+        _expected_delta_df(df_a.drop(columns="B"), df_b.drop(columns="B")),
+        check_dtype=False,
+    )
+    assert len(_delta_ensemble._ALIGNMENT_PLAN_CACHE[provider_a]) == 1
+
+    delta_df = get_delta_ensemble_vectors_df(provider_a, provider_b, ["A"], None, [2])
+    assert delta_df["REAL"].tolist() == [2] * 4
+    assert len(_delta_ensemble._ALIGNMENT_PLAN_CACHE[provider_a]) == 2
+
+
+def test_get_delta_ensemble_vectors_df_per_resampling_frequency() -> None:
+    dates = [datetime.datetime(2000 + year, 1, 1) for year in range(3)]
+    df_a = _create_vectors_df([0, 1], dates)
+    df_b = _create_vectors_df([0, 1], dates)
+    # Same number of rows, but other dates and realizations for the yearly frequency
+    yearly_df_b = _create_vectors_df(
+        [1, 2], dates[1:] + [datetime.datetime(2010, 1, 1)]
+    )
+    provider_a = EnsembleSummaryProviderMock(df_a)
+    provider_b = EnsembleSummaryProviderMock(df_b, yearly_df_b)
+
+    delta_df = get_delta_ensemble_vectors_df(provider_a, provider_b, ["A"], None)
+    assert_frame_equal(
+        delta_df,
+        _expected_delta_df(df_a.drop(columns="B"), df_b.drop(columns="B")),
+        check_dtype=False,
+    )
+
+    # Another resampling frequency must not reuse the cached alignment plan
+    delta_df = get_delta_ensemble_vectors_df(
+        provider_a, provider_b, ["A"], Frequency.YEARLY
+    )
+    assert_frame_equal(
+        delta_df,
+        _expected_delta_df(df_a.drop(columns="B"), yearly_df_b.drop(columns="B")),
+        check_dtype=False,
+    )
+    assert delta_df["REAL"].tolist() == [1, 1]
+    assert len(_delta_ensemble._ALIGNMENT_PLAN_CACHE[provider_a]) == 2
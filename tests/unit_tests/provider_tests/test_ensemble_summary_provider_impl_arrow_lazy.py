@@ -7,14 +7,26 @@ import pyarrow as pa
 import pyarrow.compute as pc
 import pytest
 
+from webviz_subsurface._providers.ensemble_summary_provider._precision import (
+    compare_providers_per_vector,
+)
 from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow_lazy import (
     Frequency,
     ProviderImplArrowLazy,
     _find_first_non_increasing_date_pair,
     _is_date_column_monotonically_increasing,
 )
+from webviz_subsurface._providers.ensemble_summary_provider._vector_statistics import (
+    VectorStatistic,
+)
 from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider import (
     EnsembleSummaryProvider,
+    StoragePrecision,
+)
+
+# pylint: disable=line-too-long
+from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._utils.from_timeseries_cumulatives import (
+    calculate_from_resampled_cumulative_vectors_df,
 )
 
 
@@ -59,6 +71,7 @@ def _split_into_per_realization_tables(table: pa.Table) -> Dict[int, pa.Table]:
 def _create_provider_obj_with_data(
     input_data: list,
     storage_dir: Path,
+    storage_precision: StoragePrecision = StoragePrecision.FLOAT64,
 ) -> EnsembleSummaryProvider:
     # Turn rows into columns
     columns_with_header = list(zip(*input_data))
@@ -75,10 +88,11 @@ def _create_provider_obj_with_data(
     # Split into per realization tables
     per_real_tables = _split_into_per_realization_tables(input_table)
 
+    storage_key = f"dummy_key_{storage_precision.value}"
     ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
-        storage_dir, "dummy_key", per_real_tables
+        storage_dir, storage_key, per_real_tables, storage_precision
     )
-    new_provider = ProviderImplArrowLazy.from_backing_store(storage_dir, "dummy_key")
+    new_provider = ProviderImplArrowLazy.from_backing_store(storage_dir, storage_key)
 
     if not new_provider:
         raise ValueError("Failed to create EnsembleSummaryProvider")
@@ -340,6 +354,148 @@ def test_get_vectors_for_date_with_resampling(tmp_path: Path) -> None:
     assert df["RATE_r"][0] == 4.0
 
 
+def test_get_per_interval_and_per_day_vectors(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A_t",  "B"],
+        [np.datetime64("2023-01-01", "ms"),  0,      10.0,   1.0],
+        [np.datetime64("2023-01-03", "ms"),  0,      14.0,   2.0],
+        [np.datetime64("2023-01-07", "ms"),  0,      22.0,   3.0],
+        [np.datetime64("2023-01-01", "ms"),  1,      20.0,   4.0],
+        [np.datetime64("2023-01-02", "ms"),  1,      30.0,   5.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+    assert provider.supports_per_interval_and_per_day_vectors()
+
+    vecnames = ["PER_INTVL_A_t", "B", "PER_DAY_A_t"]
+    df = provider.get_vectors_df(vecnames, None)
+    assert df.columns.tolist() == ["DATE", "REAL", *vecnames]
+    assert df["REAL"].tolist() == [0, 0, 0, 1, 1]
+    assert df["B"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert df["PER_INTVL_A_t"].tolist() == [4.0, 8.0, 0.0, 10.0, 0.0]
+    assert df["PER_DAY_A_t"].tolist() == [2.0, 2.0, 0.0, 10.0, 0.0]
+
+    # Cached result is equal
+    assert df.equals(provider.get_vectors_df(vecnames, None))
+
+    df = provider.get_vectors_df(["PER_DAY_A_t"], Frequency.DAILY, [1])
+    assert df["DATE"].tolist() == [datetime(2023, 1, 1), datetime(2023, 1, 2)]
+    assert df["PER_DAY_A_t"].tolist() == [10.0, 0.0]
+
+
+def test_per_interval_and_per_day_vectors_with_missing_cumulative_values(
+    tmp_path: Path,
+) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A_t"],
+        [np.datetime64("2023-01-01", "ms"),  0,      10.0],
+        [np.datetime64("2023-01-03", "ms"),  0,      np.nan],
+        [np.datetime64("2023-01-07", "ms"),  0,      22.0],
+        [np.datetime64("2023-01-08", "ms"),  0,      24.0],
+        [np.datetime64("2023-01-01", "ms"),  1,      20.0],
+        [np.datetime64("2023-01-02", "ms"),  1,      30.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+
+    # Intervals starting or ending at a missing value are 0, as in the pandas
+    # calculation for providers without native support
+    df = provider.get_vectors_df(["PER_INTVL_A_t", "PER_DAY_A_t"], None)
+    assert df["PER_INTVL_A_t"].tolist() == [0.0, 0.0, 2.0, 0.0, 10.0, 0.0]
+    assert df["PER_DAY_A_t"].tolist() == [0.0, 0.0, 2.0, 0.0, 10.0, 0.0]
+
+    cumulative_df = provider.get_vectors_df(["A_t"], None)
+    for as_per_day, vector_name in [(False, "PER_INTVL_A_t"), (True, "PER_DAY_A_t")]:
+        expected_df = calculate_from_resampled_cumulative_vectors_df(
+            cumulative_df, as_per_day
+        )
+        assert df[vector_name].tolist() == expected_df[vector_name].tolist()
+
+
+def test_get_vectors_statistics(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A",   "B"],
+        [np.datetime64("2023-12-20", "ms"),  0,      10.0,  1.0],
+        [np.datetime64("2023-12-21", "ms"),  0,      11.0,  2.0],
+        [np.datetime64("2023-12-20", "ms"),  1,      20.0,  3.0],
+        [np.datetime64("2023-12-21", "ms"),  1,      21.0,  4.0],
+        [np.datetime64("2023-12-20", "ms"),  2,      30.0,  5.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+
+    stat_df = provider.get_vectors_statistics_df(["A", "B"], None)
+    assert stat_df.shape == (2, 13)
+    assert list(stat_df.columns[:4]) == [
+        ("DATE", ""),
+        ("A", VectorStatistic.MEAN),
+        ("A", VectorStatistic.MIN),
+        ("A", VectorStatistic.MAX),
+    ]
+    assert stat_df["DATE"].tolist() == [datetime(2023, 12, 20), datetime(2023, 12, 21)]
+
+    # Realization 2 is missing at the last date and is ignored
+    vectors_df = provider.get_vectors_df(["A", "B"], None)
+    for vector in ["A", "B"]:
+        per_date = vectors_df.groupby("DATE")[vector]
+        assert np.allclose(stat_df[(vector, VectorStatistic.MEAN)], per_date.mean())
+        assert np.allclose(stat_df[(vector, VectorStatistic.MIN)], per_date.min())
+        assert np.allclose(stat_df[(vector, VectorStatistic.MAX)], per_date.max())
+        for statistic, percentile in [
+            (VectorStatistic.P10, 90),
+            (VectorStatistic.P90, 10),
+            (VectorStatistic.P50, 50),
+        ]:
+            assert np.allclose(
+                stat_df[(vector, statistic)],
+                per_date.agg(lambda x, q=percentile: np.nanpercentile(x, q)),
+            )
+
+    stat_df = provider.get_vectors_statistics_df(["A"], Frequency.DAILY, [0, 1])
+    assert stat_df[("A", VectorStatistic.MEAN)].tolist() == [15.0, 16.0]
+
+    # Cached result is returned as a copy
+    stat_df[("A", VectorStatistic.MEAN)] = 0.0
+    stat_df = provider.get_vectors_statistics_df(["A"], Frequency.DAILY, [1, 0])
+    assert stat_df[("A", VectorStatistic.MEAN)].tolist() == [15.0, 16.0]
+
+
+def test_float32_storage_precision(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A",         "B_r"],
+        [np.datetime64("2023-01-01", "ms"),  0,      10.1,        1.0 / 3],
+        [np.datetime64("2023-03-01", "ms"),  0,      1234567.89,  2.0 / 3],
+        [np.datetime64("2023-01-01", "ms"),  1,      0.0,         1e-9],
+        [np.datetime64("2023-02-15", "ms"),  1,      -20.7,       7.0],
+    ]
+    # fmt:on
+    provider64 = _create_provider_obj_with_data(input_data, tmp_path)
+    provider32 = _create_provider_obj_with_data(
+        input_data, tmp_path, StoragePrecision.FLOAT32
+    )
+
+    stored_schema = pa.ipc.open_file(tmp_path / "dummy_key_float32.arrow").schema
+    assert stored_schema.field("A").type == pa.float32()
+    assert stored_schema.field("B_r").metadata[b"is_rate"] == b"True"
+
+    assert provider32.vector_names() == provider64.vector_names()
+    assert provider32.vector_metadata("B_r") == provider64.vector_metadata("B_r")
+
+    for frequency in [None, Frequency.MONTHLY]:
+        df32 = provider32.get_vectors_df(["A", "B_r"], frequency)
+        df64 = provider64.get_vectors_df(["A", "B_r"], frequency)
+        assert df32["A"].dtype == np.float64
+        assert np.allclose(df32["A"], df64["A"], rtol=1e-7, atol=0)
+
+        errors_df = compare_providers_per_vector(provider64, provider32, frequency)
+        assert set(errors_df["VECTOR"]) == {"A", "B_r"}
+        assert 0 < errors_df["MAX_REL_ERROR"].max() < 1e-7
+
+
 def test_monotonically_increasing_date_util_functions() -> None:
     table_with_duplicate = pa.Table.from_pydict(
         {
@@ -0,0 +1,99 @@
+import fnmatch
+import re
+from typing import List
+
+from webviz_subsurface._providers import VectorCatalog
+from webviz_subsurface._providers.ensemble_summary_provider._vector_catalog import (
+    parse_vector_name,
+)
+
+from ..mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
+
+VECTOR_NAMES = [
+    "FOPT",
+    "WOPT:OP_2",
+    "WOPT:OP_1",
+    "WWPT:OP_1",
+    "WOPTH:OP_1",
+    "GPR:NODE_A",
+    "ROIP:3",
+    "COPR:OP_1:12",
+    "WBHP:101",
+    "FGPT",
+]
+
+
+def test_parse_vector_name() -> None:
+    assert parse_vector_name("FOPT") == ("FOPT", None, None)
+    assert parse_vector_name("WOPT:OP_1") == ("WOPT", "OP_1", None)
+    assert parse_vector_name("WBHP:101") == ("WBHP", "101", None)
+    assert parse_vector_name("ROIP:3") == ("ROIP", None, 3)
+    assert parse_vector_name("COPR:OP_1:12") == ("COPR", "OP_1", 12)
+
+
+def test_vector_catalog_queries() -> None:
+    catalog = VectorCatalog(VECTOR_NAMES)
+
+    assert len(catalog) == len(VECTOR_NAMES)
+    assert "WOPT:OP_1" in catalog
+    assert "WOPT:OP_3" not in catalog
+
+    assert catalog.names_with_prefix("WOPT") == ["WOPT:OP_2", "WOPT:OP_1", "WOPTH:OP_1"]
+    assert catalog.names_with_prefix("WOPT:") == ["WOPT:OP_2", "WOPT:OP_1"]
+    assert catalog.names_with_prefix("wopt") == []
+    assert catalog.names_with_prefix("") == VECTOR_NAMES
+
+    assert catalog.names_for_keyword("WOPT") == ["WOPT:OP_2", "WOPT:OP_1"]
+    assert catalog.names_for_keywords(["WWPT", "WOPT"]) == [
+        "WOPT:OP_2",
+        "WOPT:OP_1",
+        "WWPT:OP_1",
+    ]
+    assert catalog.wgnames("WOPT") == ["OP_2", "OP_1"]
+    assert catalog.wgnames() == ["OP_2", "OP_1", "NODE_A", "101"]
+    assert catalog.names_for_wgname("OP_1") == [
+        "WOPT:OP_1",
+        "WWPT:OP_1",
+        "WOPTH:OP_1",
+        "COPR:OP_1:12",
+    ]
+
+
+def test_vector_catalog_match_equals_regex_filter() -> None:
+    catalog = VectorCatalog(VECTOR_NAMES)
+
+    for patterns in [
+        ["FOPT"],
+        ["fopt", "WOPT:OP_1"],
+        ["W*"],
+        ["*:OP_1"],
+        ["WOP?:*", "F?PT"],
+        ["[FG]*"],
+        ["*"],
+        ["NONE*"],
+    ]:
+        regex = re.compile(
+            "|".join([fnmatch.translate(pattern) for pattern in patterns]),
+            flags=re.IGNORECASE,
+        )
+        expected = [name for name in VECTOR_NAMES if regex.fullmatch(name)]
+        assert catalog.match(patterns) == expected
+
+
+class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
+    def __init__(self) -> None:
+        super().__init__()
+        self.vector_names_call_count = 0
+
+    def vector_names(self) -> List[str]:
+        self.vector_names_call_count += 1
+        return VECTOR_NAMES
+
+
+def test_provider_vector_catalog_is_created_once() -> None:
+    provider = EnsembleSummaryProviderMock()
+    catalog = provider.vector_catalog()
+
+    assert catalog.vector_names() == VECTOR_NAMES
+    assert provider.vector_catalog() is catalog
+    assert provider.vector_names_call_count == 1
@@ -0,0 +1,106 @@
+import gc
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface._utils import content_memoize as content_memoize_module
+from webviz_subsurface._utils.content_memoize import (
+    content_memoize,
+    fingerprint,
+    register_immutable,
+)
+
+
+def test_fingerprint() -> None:
+    dframe = pd.DataFrame(
+        {
+            "DATE": pd.to_datetime(["2020-01-01", "2021-01-01"]),
+            "ENSEMBLE": ["iter-0", "iter-1"],
+            "FOPT": [1.0, 2.0],
+        }
+    )
+    assert fingerprint(dframe) == fingerprint(dframe.copy())
+    assert fingerprint(dframe) != fingerprint(dframe.assign(FOPT=[1.0, 3.0]))
+    assert fingerprint(dframe) != fingerprint(dframe.assign(ENSEMBLE=["a", "b"]))
+    assert fingerprint(dframe) != fingerprint(dframe.rename(columns={"FOPT": "FGPT"}))
+    assert fingerprint(dframe) != fingerprint(dframe.set_index("DATE"))
+    assert fingerprint(dframe) != fingerprint(dframe.astype({"FOPT": np.float32}))
+
+    # Large frames with a change in a row hidden from repr()
+    large_dframe = pd.DataFrame({"A": np.arange(10000.0)})
+    changed_dframe = large_dframe.copy()
+    changed_dframe.loc[5000, "A"] = -1.0
+    assert repr(large_dframe) == repr(changed_dframe)
+    assert fingerprint(large_dframe) != fingerprint(changed_dframe)
+
+    assert fingerprint(np.arange(3)) != fingerprint(np.arange(3.0))
+    assert fingerprint(np.zeros((2, 3))) != fingerprint(np.zeros((3, 2)))
+    assert fingerprint([1, "a", {"b": None}]) == fingerprint([1, "a", {"b": None}])
+    assert fingerprint(1) != fingerprint(True)
+
+
+def test_content_memoize() -> None:
+    calls: List[int] = []
+
+    @content_memoize
+    def sum_column(dframe: pd.DataFrame, column: str = "A") -> float:
+        calls.append(1)
+        return float(dframe[column].sum())
+
+    dframe = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]})
+    assert sum_column(dframe) == 3.0
+    assert len(calls) == 1
+
+    # Equal content, also with keyword and default arguments, hits the cache
+    assert sum_column(dframe.copy()) == 3.0
+    assert sum_column(dframe=dframe, column="A") == 3.0
+    assert len(calls) == 1
+
+    # Changed content misses the cache
+    assert sum_column(dframe.assign(A=[1.0, 3.0])) == 4.0
+    assert sum_column(dframe, "B") == 7.0
+    assert len(calls) == 3
+
+    sum_column.cache_clear()
+    assert sum_column(dframe) == 3.0
+    assert len(calls) == 4
+
+
+def test_content_memoize_evicts_least_recently_used() -> None:
+    @content_memoize(max_bytes=2000)
+    def make_array(size: int) -> np.ndarray:
+        return np.zeros(size)
+
+    make_array(100)
+    make_array(101)
+    make_array(100)
+    make_array(102)
+
+    # 3 arrays of about 800 bytes, where the least recently used is evicted
+    assert len(make_array.cache) == 2
+    assert make_array.cache.total_bytes <= 2000
+    assert make_array.cache.get(fingerprint({"size": 100}))[0]
+    assert not make_array.cache.get(fingerprint({"size": 101}))[0]
+
+    # Results larger than the budget are not cached
+    make_array(1000)
+    assert len(make_array.cache) == 2
+
+
+def test_register_immutable() -> None:
+    dframe = register_immutable(pd.DataFrame({"A": np.arange(1000.0)}))
+    key = fingerprint(dframe)
+
+    # The content of the registered object is not hashed again, which is why it must
+    # not be modified
+    dframe.loc[0, "A"] = -1.0
+    assert fingerprint(dframe) == key
+    assert fingerprint(dframe.copy()) != key
+
+    # The registration is removed with the object
+    dframe_id = id(dframe)
+    del dframe
+    gc.collect()
+    # pylint: disable=protected-access
+    assert dframe_id not in content_memoize_module._IMMUTABLE_FINGERPRINTS
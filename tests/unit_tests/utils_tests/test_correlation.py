@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._utils.correlation import (
+    CorrelationCubeCache,
+    correlate_against,
+    create_correlation_cube,
+    sort_by_absolute_value,
+)
+
+DATES = pd.date_range("2020-01-01", periods=4, freq="MS")
+PARAMETERS = ["PERM", "PORO", "FWL", "CONST"]
+
+
+def _create_data() -> tuple:
+    rng = np.random.default_rng(seed=1)
+    response_df = pd.DataFrame(
+        [(real, date, rng.random()) for real in range(20) for date in DATES],
+        columns=["REAL", "DATE", "FOPT"],
+    )
+    response_df.loc[5, "FOPT"] = np.nan
+    # Constant response at one date
+    response_df.loc[response_df["DATE"] == DATES[2], "FOPT"] = 1.0
+    parameter_df = pd.DataFrame(
+        {
+            "REAL": range(20),
+            "PERM": rng.random(20),
+            "PORO": rng.integers(0, 4, 20).astype(float),
+            "FWL": rng.random(20),
+            "CONST": 1.0,
+        }
+    )
+    parameter_df.loc[3, "FWL"] = np.nan
+    # Realization without response
+    parameter_df.loc[20] = [20, 0.5, 1.0, 0.5, 1.0]
+    return response_df, parameter_df
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_create_correlation_cube_equals_pandas(method: str) -> None:
+    response_df, parameter_df = _create_data()
+    cube = create_correlation_cube(
+        response_df, parameter_df, "FOPT", PARAMETERS, method=method
+    )
+    assert list(cube.index) == list(DATES)
+    assert list(cube.columns) == PARAMETERS
+
+    for date in DATES:
+        df = pd.merge(
+            response_df.loc[response_df["DATE"] == date, ["REAL", "FOPT"]],
+            parameter_df,
+            on="REAL",
+        )
+        df = df.rank() if method == "spearman" else df
+        expected = df.corr()["FOPT"][PARAMETERS]
+        np.testing.assert_allclose(
+            cube.loc[date].to_numpy(), expected.to_numpy(), atol=1e-12
+        )
+    assert cube["CONST"].isna().all()
+    assert cube.loc[DATES[2]].isna().all()
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_correlate_against_equals_pandas(method: str, with_nan: bool) -> None:
+    _, parameter_df = _create_data()
+    matrix = parameter_df.set_index("REAL")
+    if not with_nan:
+        matrix = matrix.fillna(0.5)
+    rng = np.random.default_rng(seed=2)
+    # Responses of another set of realizations, in another order
+    responses = pd.DataFrame(
+        {"FOPT": rng.random(20), "FGPT": rng.random(20), "CONST": 2.0},
+        index=range(21, 1, -1),
+    )
+    expected_df = matrix.join(responses, how="inner", rsuffix="_RESPONSE")
+    expected_df = expected_df.rank() if method == "spearman" else expected_df
+    expected = expected_df.corr().loc[["FOPT", "FGPT", "CONST_RESPONSE"], PARAMETERS]
+
+    correlations = correlate_against(matrix, responses, method=method)
+    assert list(correlations.index) == ["FOPT", "FGPT", "CONST"]
+    assert list(correlations.columns) == PARAMETERS
+    np.testing.assert_allclose(correlations.to_numpy(), expected.to_numpy(), atol=1e-12)
+
+    series = correlate_against(matrix, responses["FGPT"], method=method)
+    assert series.name == "FGPT"
+    pd.testing.assert_series_equal(series, correlations.loc["FGPT"])
+
+
+def test_create_correlation_cube_invalid_method() -> None:
+    response_df, parameter_df = _create_data()
+    with pytest.raises(ValueError):
+        create_correlation_cube(
+            response_df, parameter_df, "FOPT", PARAMETERS, method="kendall"
+        )
+
+
+def test_sort_by_absolute_value() -> None:
+    correlations = pd.Series({"A": -0.9, "B": 0.1, "C": 0.5})
+    assert list(sort_by_absolute_value(correlations).index) == ["B", "C", "A"]
+
+
+def test_correlation_cube_cache() -> None:
+    cache = CorrelationCubeCache(max_entries=1)
+    cube = pd.DataFrame({"A": [0.5]})
+    assert cache.get_or_create("key", lambda: cube) is cube
+    assert cache.get_or_create("key", pd.DataFrame) is cube
+
+    cache.get_or_create("other key", pd.DataFrame)
+    assert cache.get_or_create("key", pd.DataFrame).empty
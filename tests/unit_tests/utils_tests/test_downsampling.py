@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from webviz_subsurface._utils.downsampling import lttb_downsample_indices
+
+
+def test_lttb_downsample_indices() -> None:
+    x = np.arange(1000, dtype=float)
+    y = np.vstack([np.sin(x / 50.0), np.cos(x / 50.0), np.zeros(1000)])
+    y[0, 500] = 10.0
+
+    indices = lttb_downsample_indices(x, y, 100)
+
+    assert indices.shape == (3, 100)
+    assert (indices[:, 0] == 0).all()
+    assert (indices[:, -1] == 999).all()
+    assert (np.diff(indices, axis=1) > 0).all()
+
+    # The spike is kept, and each line is downsampled independently
+    assert 500 in indices[0]
+    assert 500 not in indices[1]
+
+
+def test_lttb_downsample_indices_with_few_points_or_nan() -> None:
+    x = np.arange(10, dtype=float)
+    y = np.arange(20, dtype=float).reshape(2, 10)
+    assert (lttb_downsample_indices(x, y, 10) == np.tile(np.arange(10), (2, 1))).all()
+
+    y[0, 3:8] = np.nan
+    indices = lttb_downsample_indices(x, y, 5)
+    assert indices.shape == (2, 5)
+    assert indices[0, 0] == 0 and indices[0, -1] == 9
+
+    with pytest.raises(ValueError):
+        lttb_downsample_indices(x, y, 2)
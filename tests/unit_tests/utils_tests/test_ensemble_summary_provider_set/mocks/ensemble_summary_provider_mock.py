@@ -1,6 +1,9 @@
-from typing import Dict, List, Optional
+import datetime
+from typing import Dict, List, Optional, Sequence
 
-from webviz_subsurface._providers import VectorMetadata
+import pandas as pd
+
+from webviz_subsurface._providers import Frequency, VectorMetadata
 
 from ....mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
 
@@ -288,3 +291,26 @@ class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
 
     def vector_metadata(self, vector_name: str) -> Optional[VectorMetadata]:
         return self._vector_metadata_dict.get(vector_name, None)
+
+    def dates(
+        self,
+        __resampling_frequency: Optional[Frequency],
+        __realizations: Optional[Sequence[int]] = None,
+    ) -> List[datetime.datetime]:
+        # One date per realization of the mock dataset
+        return [datetime.datetime(2000 + real, 1, 1) for real in self._realizations]
+
+    def get_vectors_df(
+        self,
+        vector_names: Sequence[str],
+        __resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        reals = self._realizations if realizations is None else list(realizations)
+        return pd.DataFrame(
+            {
+                "DATE": [datetime.datetime(2000, 1, 1)] * len(reals),
+                "REAL": reals,
+                **{vector: [float(real) for real in reals] for vector in vector_names},
+            }
+        )
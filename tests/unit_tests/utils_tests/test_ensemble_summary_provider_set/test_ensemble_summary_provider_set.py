@@ -8,6 +8,7 @@ from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_pro
 )
 from webviz_subsurface._utils.ensemble_summary_provider_set import (
     EnsembleSummaryProviderSet,
+    map_concurrently,
 )
 
 from .mocks.ensemble_summary_provider_mock import EnsembleSummaryProviderMock
@@ -304,3 +305,53 @@ def test_vector_metadata_order() -> None:
     assert (
         second_provider_set.vector_metadata("WGOR:A2") == inconsistent_ensemble_wgor_a2
     )
+
+
+def test_all_dates_and_dates_per_provider() -> None:
+    provider_set = EnsembleSummaryProviderSet(TEST_PROVIDER_DICT)
+
+    dates_per_provider = provider_set.dates_per_provider(None)
+    assert list(dates_per_provider.keys()) == provider_set.provider_names()
+    for name, dates in dates_per_provider.items():
+        assert dates == provider_set.provider(name).dates(None)
+
+    expected_dates = sorted(
+        {date for dates in dates_per_provider.values() for date in dates}
+    )
+    assert provider_set.all_dates(None) == expected_dates
+
+    dates_per_provider = provider_set.dates_per_provider(
+        None, ["Third provider", "First provider"]
+    )
+    assert list(dates_per_provider.keys()) == ["Third provider", "First provider"]
+
+
+def test_get_vectors_dfs() -> None:
+    provider_set = EnsembleSummaryProviderSet(TEST_PROVIDER_DICT)
+
+    vectors_dfs = provider_set.get_vectors_dfs(["WWCT:A1", "Unknown"], None, [1, 2])
+    expected_names = [
+        name
+        for name in provider_set.provider_names()
+        if "WWCT:A1" in provider_set.provider(name).vector_names()
+    ]
+    assert list(vectors_dfs.keys()) == expected_names
+    for vectors_df in vectors_dfs.values():
+        assert list(vectors_df.columns) == ["DATE", "REAL", "WWCT:A1"]
+        assert vectors_df["REAL"].tolist() == [1, 2]
+
+    assert not provider_set.get_vectors_dfs(["Unknown"], None)
+
+
+def test_map_concurrently() -> None:
+    assert map_concurrently(lambda item: item * 2, []) == []
+    assert map_concurrently(lambda item: item * 2, [3]) == [6]
+    assert map_concurrently(lambda item: item * 2, list(range(20))) == [
+        item * 2 for item in range(20)
+    ]
+
+    # Nested calls from within the pool are run in the calling worker thread
+    assert map_concurrently(
+        lambda item: sum(map_concurrently(lambda x: x + item, list(range(3)))),
+        list(range(20)),
+    ) == [3 * item + 3 for item in range(20)]
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from webviz_subsurface._utils.realization_plotting import concatenate_realization_lines
+
+
+def test_concatenate_realization_lines() -> None:
+    samples, values, realizations = concatenate_realization_lines(
+        np.array([10, 20, 10, 20, 30, 10]),
+        np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        np.array([3, 3, 1, 1, 1, 2]),
+    )
+
+    np.testing.assert_equal(samples, [10, 20, 30, 30, 10, 10, 10, 20])
+    np.testing.assert_equal(values, [3.0, 4.0, 5.0, np.nan, 6.0, np.nan, 1.0, 2.0])
+    np.testing.assert_equal(realizations, [1, 1, 1, 1, 2, 2, 3, 3])
+
+    with pytest.raises(ValueError):
+        concatenate_realization_lines(np.array([1]), np.array([1.0]), np.array([]))
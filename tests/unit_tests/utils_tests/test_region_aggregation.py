@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._utils.region_aggregation import (
+    RegionVectorAggregator,
+    create_membership_matrix,
+)
+
+REGION_VECTORS = [f"ROIP:{region}" for region in range(1, 7)]
+
+
+def _create_smry() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=1)
+    smry = pd.DataFrame(
+        {
+            "ENSEMBLE": ["iter-0"] * 6 + ["iter-1"] * 6,
+            "REAL": [0, 0, 0, 1, 1, 1] * 2,
+            "DATE": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01"] * 4),
+        }
+    )
+    for vector in REGION_VECTORS:
+        smry[vector] = rng.random(len(smry))
+    smry.loc[2, "ROIP:2"] = np.nan
+    smry.loc[3, ["ROIP:5", "ROIP:6"]] = np.nan
+    # Rows in a non-default order and index, to test that both are kept
+    return smry.iloc[::-1].set_index(np.arange(100, 112))
+
+
+def _dense_aggregate(
+    smry: pd.DataFrame, ensembles: list, group_vectors: dict
+) -> pd.DataFrame:
+    """Aggregation by summing the columns of each group with pandas"""
+    df = smry[smry["ENSEMBLE"].isin(ensembles)]
+    return pd.concat(
+        [df[["ENSEMBLE", "REAL", "DATE"]]]
+        + [
+            df[vectors].sum(axis=1).to_frame(f"AGG_ROIP_filtered_on_{group}")
+            for group, vectors in group_vectors.items()
+        ],
+        axis=1,
+    )
+
+
+def test_create_membership_matrix() -> None:
+    vectors, membership = create_membership_matrix(
+        {"A": ["ROIP:1", "ROIP:2"], "B": ["ROIP:2", "ROIP:3"], "C": []}
+    )
+    assert vectors == ["ROIP:1", "ROIP:2", "ROIP:3"]
+    assert membership.shape == (3, 3)
+    assert membership.toarray().tolist() == [[1, 1, 0], [0, 1, 1], [0, 0, 0]]
+
+
+@pytest.mark.parametrize(
+    "ensembles, group_vectors",
+    [
+        (["iter-0"], {"UpperReek": ["ROIP:1", "ROIP:2"], "LowerReek": ["ROIP:5"]}),
+        (["iter-0", "iter-1"], {"ENSEMBLE": REGION_VECTORS}),
+        (["iter-1"], {"1": ["ROIP:1"], "5": ["ROIP:5", "ROIP:6"], "empty": []}),
+    ],
+)
+def test_aggregate_equals_dense_aggregation(
+    ensembles: list, group_vectors: dict
+) -> None:
+    smry = _create_smry()
+    aggregator = RegionVectorAggregator()
+    group_columns = {group: f"AGG_ROIP_filtered_on_{group}" for group in group_vectors}
+
+    expected = _dense_aggregate(smry, ensembles, group_vectors)
+    aggregated = aggregator.aggregate(smry, ensembles, group_vectors, group_columns)
+    pd.testing.assert_frame_equal(aggregated, expected)
+
+    # Cached result
+    aggregated = aggregator.aggregate(smry, ensembles, group_vectors, group_columns)
+    pd.testing.assert_frame_equal(aggregated, expected)
+
+
+def test_aggregate_missing_vector() -> None:
+    with pytest.raises(KeyError):
+        RegionVectorAggregator().aggregate(
+            _create_smry(),
+            ["iter-0"],
+            {"A": ["ROIP:1", "ROIP:7"]},
+            {"A": "AGG_ROIP_filtered_on_A"},
+        )
@@ -0,0 +1,118 @@
+import datetime
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from webviz_subsurface._providers import (
+    EnsembleSummaryProvider,
+    Frequency,
+    VectorMetadata,
+)
+from webviz_subsurface._utils.ensemble_summary_provider_set import (
+    EnsembleSummaryProviderSet,
+)
+from webviz_subsurface._utils.smry_provider_adapter import SmryProviderAdapter
+
+from ..mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
+
+
+class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
+    def __init__(self, vectors_df: pd.DataFrame) -> None:
+        self._vectors_df = vectors_df
+
+    def vector_names(self) -> List[str]:
+        return [col for col in self._vectors_df.columns if col not in ["DATE", "REAL"]]
+
+    def realizations(self) -> List[int]:
+        return list(self._vectors_df["REAL"].unique())
+
+    def vector_metadata(self, vector_name: str) -> Optional[VectorMetadata]:
+        if not vector_name.endswith("T"):
+            return None
+        return VectorMetadata(
+            unit="SM3",
+            is_total=True,
+            is_rate=False,
+            is_historical=False,
+            keyword=vector_name.split(":")[0],
+            wgname=None,
+            get_num=None,
+        )
+
+    def dates(
+        self,
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> List[datetime.datetime]:
+        return sorted(self._vectors_df["DATE"].unique())
+
+    def get_vectors_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        return self._vectors_df[["DATE", "REAL"] + list(vector_names)]
+
+
+DATES = [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)]
+
+PROVIDER_DICT: Dict[str, EnsembleSummaryProvider] = {
+    "iter-0": EnsembleSummaryProviderMock(
+        pd.DataFrame(
+            {
+                "DATE": DATES * 2,
+                "REAL": [0, 0, 1, 1],
+                "FOPT": [0.0, 1.0, 0.0, 2.0],
+                "FOPR": [1.0, 1.0, 2.0, 2.0],
+            }
+        )
+    ),
+    "iter-1": EnsembleSummaryProviderMock(
+        pd.DataFrame(
+            {
+                "DATE": DATES,
+                "REAL": [0, 0],
+                "FOPT": [0.0, 3.0],
+                "FGPT": [0.0, 4.0],
+            }
+        )
+    ),
+}
+
+
+def test_get_smry_df() -> None:
+    adapter = SmryProviderAdapter(EnsembleSummaryProviderSet(PROVIDER_DICT), None)
+
+    assert adapter.ensemble_names() == ["iter-0", "iter-1"]
+    assert adapter.columns() == ["ENSEMBLE", "REAL", "DATE", "FGPT", "FOPR", "FOPT"]
+    assert adapter.dates() == DATES
+
+    smry_df = adapter.get_smry_df(["FOPT", "FOPR", "FOPT", "WOPT:OP_1"])
+    assert list(smry_df.columns) == ["ENSEMBLE", "REAL", "DATE", "FOPT", "FOPR"]
+    assert list(smry_df["ENSEMBLE"]) == ["iter-0"] * 4 + ["iter-1"] * 2
+    assert list(smry_df["FOPT"]) == [0.0, 1.0, 0.0, 2.0, 0.0, 3.0]
+    assert smry_df["FOPR"].isna().tolist() == [False] * 4 + [True] * 2
+
+    # Ensembles without any of the vectors are not included
+    smry_df = adapter.get_smry_df(["FGPT"])
+    assert list(smry_df["ENSEMBLE"]) == ["iter-1"] * 2
+
+    smry_df = adapter.get_smry_df(["FOPT"], ensembles=["iter-1"])
+    assert list(smry_df["FOPT"]) == [0.0, 3.0]
+
+    smry_df = adapter.get_smry_df(["WOPT:OP_1"])
+    assert smry_df.empty
+    assert list(smry_df.columns) == ["ENSEMBLE", "REAL", "DATE"]
+
+
+def test_column_keys_and_smry_meta() -> None:
+    adapter = SmryProviderAdapter(
+        EnsembleSummaryProviderSet(PROVIDER_DICT), None, column_keys=["F*PT"]
+    )
+    assert adapter.vector_names() == ["FGPT", "FOPT"]
+
+    smry_meta = adapter.load_smry_meta()
+    assert list(smry_meta.index) == ["FGPT", "FOPT"]
+    assert smry_meta.unit["FOPT"] == "SM3"
+    assert smry_meta.is_total["FGPT"]
@@ -0,0 +1,60 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from webviz_subsurface._utils.typed_arrays import (
+    decode_typed_array,
+    encode_dates_as_epoch_ms,
+    encode_typed_array,
+)
+
+
+def test_encode_typed_array_round_trip() -> None:
+    values = np.array([0.1, -2.5, np.nan, 1e300])
+    encoded = encode_typed_array(values)
+    assert encoded["dtype"] == "f8"
+    np.testing.assert_array_equal(decode_typed_array(encoded), values)
+
+    float32_values = np.array([1.5, 2.25], dtype=np.float32)
+    encoded = encode_typed_array(pd.Series(float32_values))
+    assert encoded["dtype"] == "f4"
+    np.testing.assert_array_equal(decode_typed_array(encoded), float32_values)
+
+    # 64 bit integers are not supported by plotly.js, and are sent as float64
+    encoded = encode_typed_array(np.array([1, 2, 3], dtype=np.int64))
+    assert encoded["dtype"] == "f8"
+    np.testing.assert_array_equal(decode_typed_array(encoded), [1.0, 2.0, 3.0])
+
+
+def test_encode_dates_as_epoch_ms_round_trip() -> None:
+    dates = pd.Series(
+        [
+            datetime.datetime(1970, 1, 1),
+            datetime.datetime(2020, 2, 29, 12, 30, 0, 1000),
+            datetime.datetime(2262, 1, 1),
+        ]
+    )
+    encoded = encode_dates_as_epoch_ms(dates)
+
+    epoch_ms = decode_typed_array(encoded).astype(np.int64)
+    assert epoch_ms[0] == 0
+    assert (pd.to_datetime(epoch_ms, unit="ms") == pd.DatetimeIndex(dates)).all()
+
+    # Dates as datetime objects give the same encoding
+    assert encode_dates_as_epoch_ms(dates.dt.to_pydatetime().tolist()) == encoded
+
+
+def test_typed_arrays_are_kept_by_plotly_figure() -> None:
+    x = encode_dates_as_epoch_ms([datetime.datetime(2020, 1, 1)])
+    y = encode_typed_array(np.array([1.0]))
+    figure = go.Figure({"x": x, "y": y, "mode": "lines"})
+
+    trace = figure.to_dict()["data"][0]
+    assert (
+        decode_typed_array(trace["x"])[0]
+        == datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc).timestamp()
+        * 1000
+    )
+    assert decode_typed_array(trace["y"])[0] == 1.0
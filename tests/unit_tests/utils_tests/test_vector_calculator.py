@@ -0,0 +1,88 @@
+import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from webviz_subsurface_components import ExpressionInfo, VectorCalculator
+
+from webviz_subsurface._providers import Frequency
+from webviz_subsurface._utils.vector_calculator import (
+    compile_expression,
+    create_calculated_vector_df,
+    evaluate_compiled_expression,
+)
+
+from ..mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
+
+
+class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
+    def __init__(self, df: pd.DataFrame) -> None:
+        super().__init__()
+        self._df = df
+        self.get_vectors_df_call_count = 0
+
+    def get_vectors_df(
+        self,
+        vector_names: Sequence[str],
+        __resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        self.get_vectors_df_call_count += 1
+        df = self._df[["DATE", "REAL"] + list(vector_names)]
+        if realizations is not None:
+            df = df.loc[df["REAL"].isin(realizations)]
+        return df
+
+
+def test_evaluate_compiled_expression() -> None:
+    values = {"x": np.array([1.0, 4.0, 9.0]), "y": np.array([2.0, 3.0, 4.0])}
+
+    for expression in ["x+y", "sqrt(x)*y^2", "-x/y + ln(y)", "abs(y-x) % 3"]:
+        assert np.allclose(
+            evaluate_compiled_expression(expression, values),
+            VectorCalculator.evaluate_expression(expression, values),
+        )
+    assert compile_expression("x+y") is compile_expression("x+y")
+
+    assert evaluate_compiled_expression("x+", values) is None
+    assert evaluate_compiled_expression("x+y+z", values) is None
+    assert evaluate_compiled_expression("2*x", values) is None
+
+
+def test_create_calculated_vector_df() -> None:
+    provider = EnsembleSummaryProviderMock(
+        pd.DataFrame(
+            {
+                "DATE": [datetime.datetime(2000, 1, 1), datetime.datetime(2000, 2, 1)]
+                * 2,
+                "REAL": [0, 0, 1, 1],
+                "A": [1.0, 2.0, 3.0, 4.0],
+                "B": [10.0, 20.0, 30.0, 40.0],
+            }
+        )
+    )
+    expression: ExpressionInfo = {
+        "name": "Sum",
+        "expression": "x+y",
+        "id": "1",
+        "variableVectorMap": [
+            {"variableName": "x", "vectorName": ["A"]},
+            {"variableName": "y", "vectorName": ["B"]},
+        ],
+        "isValid": True,
+        "isDeletable": False,
+    }
+
+    calculated_df = create_calculated_vector_df(expression, provider, [1], None)
+    assert calculated_df.columns.tolist() == ["DATE", "REAL", "Sum"]
+    assert calculated_df["Sum"].tolist() == [33.0, 44.0]
+
+    # Cached for the same expression and realizations, and returned as a copy
+    calculated_df["Sum"] = 0.0
+    calculated_df = create_calculated_vector_df(expression, provider, [1], None)
+    assert calculated_df["Sum"].tolist() == [33.0, 44.0]
+    assert provider.get_vectors_df_call_count == 1
+
+    calculated_df = create_calculated_vector_df(expression, provider, None, None)
+    assert calculated_df["Sum"].tolist() == [11.0, 22.0, 33.0, 44.0]
+    assert provider.get_vectors_df_call_count == 2
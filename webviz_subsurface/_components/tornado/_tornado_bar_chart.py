@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -90,28 +91,50 @@ class TornadoBarChart:
         if self._label_options not in ["simple", "detailed"]:
             return []
 
+        table = self._tornadotable
         barlabels = []
-        for _, row in self._tornadotable.iterrows():
+        for (
+            low_base,
+            high_base,
+            low_tooltip,
+            high_tooltip,
+            true_low,
+            true_high,
+            low_label,
+            high_label,
+            tooltip,
+            true_value,
+            label,
+        ) in zip(
+            table["low_base"],
+            table["high_base"],
+            table["low_tooltip"],
+            table["high_tooltip"],
+            table["true_low"],
+            table["true_high"],
+            table["low_label"],
+            table["high_label"],
+            table[f"{case}_tooltip"],
+            table[f"true_{case}"],
+            table[f"{case}_label"],
+        ):
             # combine label if both bars on same side of reference
-            comb_label = any((row["low_base"] > 0, row["high_base"] < 0))
+            comb_label = low_base > 0 or high_base < 0
             if comb_label:
                 xvals = "  |  ".join(
                     [
-                        self._set_si_prefix_relative(row["low_tooltip"]),
-                        self._set_si_prefix_relative(row["high_tooltip"]),
+                        self._set_si_prefix_relative(low_tooltip),
+                        self._set_si_prefix_relative(high_tooltip),
                     ]
                 )
                 truevals = "  |  ".join(
-                    [
-                        self._set_si_prefix(row["true_low"]),
-                        self._set_si_prefix(row["true_high"]),
-                    ]
+                    [self._set_si_prefix(true_low), self._set_si_prefix(true_high)]
                 )
-                casename = f"{row['low_label']}  |  {row['high_label']}"
+                casename = f"{low_label}  |  {high_label}"
             else:
-                xvals = self._set_si_prefix_relative(row[f"{case}_tooltip"])
-                truevals = self._set_si_prefix(row[f"true_{case}"])
-                casename = row[f"{case}_label"]
+                xvals = self._set_si_prefix_relative(tooltip)
+                truevals = self._set_si_prefix(true_value)
+                casename = label
 
             text = f"<b>{xvals}</b>, " + ("<br>" if comb_label else "")
             if self._label_options == "detailed":
@@ -120,19 +143,22 @@ class TornadoBarChart:
         return barlabels
 
     def hover_labels(self) -> List:
+        table = self._tornadotable
+        low_values = table["true_low" if self._use_true_base else "low_tooltip"]
+        high_values = table["true_high" if self._use_true_base else "high_tooltip"]
         hovertext = []
-        for _, row in self._tornadotable.iterrows():
-            text = f"<b>Sensname: {row['sensname']}</b><br>"
-            if row["low_label"] is not None:
-                val = row["true_low"] if self._use_true_base else row["low_tooltip"]
-                text += (
-                    f"{row['low_label']}: <b>{self._set_si_prefix_relative(val)}</b> "
-                )
-            if row["high_label"] is not None:
-                val = row["true_high"] if self._use_true_base else row["high_tooltip"]
-                text += (
-                    f"{row['high_label']}: <b>{self._set_si_prefix_relative(val)}</b>"
-                )
+        for sensname, low_label, low_val, high_label, high_val in zip(
+            table["sensname"],
+            table["low_label"],
+            low_values,
+            table["high_label"],
+            high_values,
+        ):
+            text = f"<b>Sensname: {sensname}</b><br>"
+            if not pd.isna(low_label):
+                text += f"{low_label}: <b>{self._set_si_prefix_relative(low_val)}</b> "
+            if not pd.isna(high_label):
+                text += f"{high_label}: <b>{self._set_si_prefix_relative(high_val)}</b>"
             hovertext.append(text)
         return hovertext
 
@@ -145,13 +171,13 @@ class TornadoBarChart:
         """
         if self._color_by_sens:
             return self.create_color_list(self._tornadotable["sensname"])
-        colors = []
-        for _, row in self._tornadotable.iterrows():
-            if row["senstype"] == SensitivityType.MONTE_CARLO or case == "low":
-                colors.append(self._plotly_theme["layout"]["colorway"][0])
-            else:
-                colors.append(self._plotly_theme["layout"]["colorway"][1])
-        return colors
+        colorway = self._plotly_theme["layout"]["colorway"]
+        return np.where(
+            (self._tornadotable["senstype"] == SensitivityType.MONTE_CARLO)
+            | (case == "low"),
+            colorway[0],
+            colorway[1],
+        ).tolist()
 
     @property
     def data(self) -> List:
@@ -0,0 +1,354 @@
+"""Vectorized calculations behind `TornadoData`.
+
+All functions work on a long frame with the columns REAL, SENSNAME, SENSCASE,
+SENSTYPE and VALUE. An optional list of `group_by` columns (e.g. a well name or
+a date) splits the frame into independent tornados, which are all computed in
+the same grouped pass. The reference average is given as a float when
+`group_by` is empty, and as a series indexed by the group keys otherwise.
+"""
+
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface._utils.enum_shim import StrEnum
+
+
+class SensitivityType(StrEnum):
+    """Sensitivity types used in Tornado analysis."""
+
+    SCALAR = "scalar"
+    MONTE_CARLO = "mc"
+
+
+ReferenceAverage = Union[float, pd.Series]
+
+
+def reference_averages(
+    dframe: pd.DataFrame, reference: str, group_by: List[str]
+) -> ReferenceAverage:
+    """Average response value of the reference sensitivity (per group)"""
+    if not group_by:
+        return dframe.loc[dframe["SENSNAME"] == reference, "VALUE"].mean()
+    return grouped_reference_averages(dframe, reference, group_by)
+
+
+def grouped_reference_averages(
+    dframe: pd.DataFrame, reference: str, group_by: List[str]
+) -> pd.Series:
+    """Average response value of the reference sensitivity per group"""
+    ref_df = dframe.loc[dframe["SENSNAME"] == reference]
+    return ref_df.groupby(group_by)["VALUE"].mean()
+
+
+def sensitivity_averages(
+    dframe: pd.DataFrame,
+    reference_average: ReferenceAverage,
+    scale: str,
+    group_by: List[str],
+) -> pd.DataFrame:
+    """Mean value per scalar sensitivity case, and P90/P10 per monte carlo
+    sensitivity, together with the realizations behind each value.
+    Returns one row per case, ordered by group and sensitivity name.
+    """
+    # pylint: disable=too-many-locals
+    keys = group_by + ["SENSNAME"]
+    dframe = _drop_single_realization_ref_sensitivities(dframe, keys)
+
+    # If `SENSTYPE` is scalar get the mean for each `SENSCASE`
+    scalar_df = dframe.loc[dframe["SENSTYPE"] == SensitivityType.SCALAR]
+    scalar_grouped = scalar_df.groupby(keys + ["SENSCASE"], sort=True)
+    scalar_codes = scalar_grouped.ngroup().to_numpy()
+    scalar_means = scalar_grouped["VALUE"].mean()
+    scalar_keys = scalar_means.index.to_frame(index=False)
+    scalar_avgs = _averages_frame(
+        scalar_keys,
+        values=scalar_means.to_numpy(),
+        reals=_realizations_per_group(scalar_df, scalar_codes, len(scalar_keys)),
+        senstype=SensitivityType.SCALAR,
+    )
+
+    # If `SENSTYPE` is monte carlo get p90 (low) and p10 (high), where the
+    # low/high realizations are the ones below/above the reference average
+    mc_df = dframe.loc[dframe["SENSTYPE"] == SensitivityType.MONTE_CARLO]
+    mc_grouped = mc_df.groupby(keys, sort=True)
+    mc_codes = mc_grouped.ngroup().to_numpy()
+    mc_keys = mc_grouped.size().index.to_frame(index=False)
+    mc_values = mc_df["VALUE"].to_numpy(dtype=float)
+    mc_ref_average = broadcast_reference_average(mc_df, reference_average, group_by)
+    mc_avgs = [
+        _averages_frame(
+            mc_keys.assign(SENSCASE=senscase),
+            values=grouped_quantile(mc_codes, mc_values, quantile, len(mc_keys)),
+            reals=_realizations_per_group(mc_df, mc_codes, len(mc_keys), mask),
+            senstype=SensitivityType.MONTE_CARLO,
+        )
+        for senscase, quantile, mask in [
+            ("P90", 0.10, mc_values <= mc_ref_average),
+            ("P10", 0.90, mc_values > mc_ref_average),
+        ]
+    ]
+
+    avgs = pd.concat([scalar_avgs, *mc_avgs], ignore_index=True)
+    avgs = avgs.sort_values(group_by + ["sensname"], kind="stable", ignore_index=True)
+    avgs["values_ref"] = scale_to_reference(
+        avgs["values"].to_numpy(dtype=float),
+        broadcast_reference_average(avgs, reference_average, group_by),
+        scale,
+    )
+    return avgs[
+        group_by + ["sensname", "senscase", "values", "values_ref", "reals", "senstype"]
+    ]
+
+
+def low_high_table(
+    avgs: pd.DataFrame, reference_average: ReferenceAverage, group_by: List[str]
+) -> pd.DataFrame:
+    """Picks the low and high case per sensitivity from the output of
+    `sensitivity_averages` and calculates the bar geometry of the tornado.
+    """
+    avgs = avgs.reset_index(drop=True)
+    grouped = avgs.groupby(group_by + ["sensname"], sort=True)
+    single_case = (grouped["senscase"].nunique() == 1).to_numpy()
+    low = avgs.loc[grouped["values_ref"].idxmin().to_numpy()].reset_index(drop=True)
+    high = avgs.loc[grouped["values_ref"].idxmax().to_numpy()].reset_index(drop=True)
+
+    # Single case sens, implies low == high, but testing just in case:
+    if (low["values_ref"] != high["values_ref"])[single_case].any():
+        raise ValueError(
+            "For a single sensitivity case, low and high cases should be equal."
+        )
+    ref_average = broadcast_reference_average(low, reference_average, group_by)
+    negative = (low["values_ref"] < 0).to_numpy()
+    _reset_to_reference(high, single_case & negative, ref_average)
+    _reset_to_reference(low, single_case & ~negative, ref_average)
+
+    low_ref = low["values_ref"].to_numpy(dtype=float)
+    high_ref = high["values_ref"].to_numpy(dtype=float)
+    table = low[group_by].copy()
+    table["low"] = low_length(low_ref, high_ref)
+    table["low_base"] = low_base(low_ref, high_ref)
+    table["low_label"] = low["senscase"]
+    table["low_tooltip"] = low_ref
+    table["true_low"] = low["values"]
+    table["low_reals"] = low["reals"]
+    table["sensname"] = low["sensname"]
+    table["senstype"] = low["senstype"]
+    table["high"] = high_length(low_ref, high_ref)
+    table["high_base"] = high_base(low_ref, high_ref)
+    table["high_label"] = high["senscase"]
+    table["high_tooltip"] = high_ref
+    table["true_high"] = high["values"]
+    table["high_reals"] = high["reals"]
+    return table
+
+
+def low_base(low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Base (starting x value) of the bars visualizing low values"""
+    return np.where(low < 0, np.minimum(0, high), low)
+
+
+def high_base(low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Base (starting x value) of the bars visualizing high values"""
+    return np.where(high > 0, np.maximum(0, low), high)
+
+
+def low_length(low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """X-value (length) of the bars visualizing low values"""
+    return np.where(low < 0, low - np.minimum(0, high), 0.0)
+
+
+def high_length(low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """X-value (length) of the bars visualizing high values"""
+    return np.where(high > 0, high - np.maximum(0, low), 0.0)
+
+
+def cut_by_reference(table: pd.DataFrame, reference: str) -> pd.DataFrame:
+    """Removes sensitivities smaller than reference sensitivity from table"""
+    return table.loc[
+        ((table["low"] - table["high"]) != 0) | (table["sensname"] == reference)
+    ]
+
+
+def sort_by_max(
+    table: pd.DataFrame, reference: str, group_by: List[str]
+) -> pd.DataFrame:
+    """Sorts table (per group) based on max(abs('low', 'high')),
+    with the reference sensitivity placed last"""
+    return (
+        table.assign(
+            _is_ref=table["sensname"] == reference,
+            _max=np.fmax(table["low"].abs(), table["high"].abs()),
+        )
+        .sort_values("_max")
+        .sort_values(group_by + ["_is_ref"], kind="stable")
+        .drop(columns=["_is_ref", "_max"])
+    )
+
+
+def realization_table(
+    dframe: pd.DataFrame, table: pd.DataFrame, group_by: List[str]
+) -> pd.DataFrame:
+    """Make dataframe with value and case info per realization"""
+    realdf = dframe[group_by + ["REAL", "SENSNAME", "SENSCASE", "SENSTYPE", "VALUE"]]
+    realdf = realdf.rename(
+        columns={"SENSNAME": "sensname", "SENSCASE": "senscase", "SENSTYPE": "senstype"}
+    )
+    sens_keys = group_by + ["sensname"]
+    realdf = realdf.loc[
+        _key_index(realdf, sens_keys).isin(_key_index(table, sens_keys))
+    ]
+
+    # Map each realization to the case it belongs to. If a realization is listed
+    # more than once, the last case in sensitivity name and high/low order wins.
+    real_cases = (
+        pd.concat(
+            [
+                table[group_by + ["sensname", f"{case}_reals"]]
+                .rename(columns={f"{case}_reals": "REAL"})
+                .assign(case=case, _order=order)
+                for order, case in enumerate(["high", "low"])
+            ],
+            ignore_index=True,
+        )
+        .sort_values(group_by + ["sensname", "_order"], kind="stable")
+        .explode("REAL")
+        .dropna(subset=["REAL"])
+        .drop_duplicates(group_by + ["REAL"], keep="last")
+    )
+    real_cases["REAL"] = real_cases["REAL"].astype(realdf["REAL"].dtype)
+    realdf = realdf.assign(
+        case=_lookup(
+            realdf,
+            group_by + ["REAL"],
+            real_cases.set_index(group_by + ["REAL"])["case"].astype(object),
+        ).to_numpy()
+    )
+
+    mc_mask = realdf["senstype"] == SensitivityType.MONTE_CARLO
+    realdf["casetype"] = np.where(mc_mask, "mc", realdf["case"])
+    realdf["sensname_case"] = np.where(
+        mc_mask,
+        realdf["sensname"],
+        realdf["sensname"].astype(str) + "--" + realdf["senscase"].astype(str),
+    )
+    return realdf
+
+
+def scale_to_reference(
+    values: np.ndarray, reference_average: np.ndarray, scale: str
+) -> np.ndarray:
+    values_ref = values - reference_average
+    if scale == "Percentage":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                reference_average != 0, 100 * (values_ref / reference_average), 0
+            )
+    return values_ref
+
+
+def broadcast_reference_average(
+    frame: pd.DataFrame, reference_average: ReferenceAverage, group_by: List[str]
+) -> np.ndarray:
+    """Reference average aligned with the rows of `frame`"""
+    if not group_by:
+        return np.full(len(frame), reference_average, dtype=float)
+    return _lookup(frame, group_by, reference_average).to_numpy(dtype=float)
+
+
+def grouped_quantile(
+    codes: np.ndarray, values: np.ndarray, quantile: float, ngroups: int
+) -> np.ndarray:
+    """Quantile with linear interpolation per group, ignoring NaN values.
+    Gives the same result as `pd.Series.quantile` applied on each group.
+    """
+    # pylint: disable=too-many-locals
+    valid = ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    values = values[np.lexsort((values, codes))]
+    counts = np.bincount(codes, minlength=ngroups)
+    starts = np.cumsum(counts) - counts
+
+    result = np.full(ngroups, np.nan)
+    has_values = counts > 0
+    counts, starts = counts[has_values], starts[has_values]
+    virtual_index = (counts - 1) * quantile
+    previous_index = np.floor(virtual_index).astype(int)
+    next_index = np.minimum(previous_index + 1, counts - 1)
+    gamma = virtual_index - previous_index
+    below = values[starts + previous_index]
+    above = values[starts + next_index]
+    diff = above - below
+    result[has_values] = np.where(
+        gamma >= 0.5, above - diff * (1 - gamma), below + diff * gamma
+    )
+    return result
+
+
+def _drop_single_realization_ref_sensitivities(
+    dframe: pd.DataFrame, keys: List[str]
+) -> pd.DataFrame:
+    """Excluding cases if `ref` is used as `SENSNAME`, and only one realization
+    is present for this `SENSNAME`"""
+    is_ref = dframe["SENSNAME"] == "ref"
+    if not is_ref.any():
+        return dframe
+    nreals = dframe.groupby(keys)["REAL"].transform("nunique")
+    return dframe.loc[~(is_ref & (nreals == 1))]
+
+
+def _realizations_per_group(
+    frame: pd.DataFrame,
+    codes: np.ndarray,
+    ngroups: int,
+    mask: Union[np.ndarray, None] = None,
+) -> List[List[int]]:
+    """List of realizations per group code, in input order"""
+    keep = codes >= 0 if mask is None else (codes >= 0) & mask
+    codes = codes[keep]
+    reals = frame["REAL"].to_numpy()[keep][np.argsort(codes, kind="stable")]
+    splits = np.cumsum(np.bincount(codes, minlength=ngroups))[:-1]
+    return [group_reals.tolist() for group_reals in np.split(reals.astype(int), splits)]
+
+
+def _averages_frame(
+    keys: pd.DataFrame,
+    values: np.ndarray,
+    reals: List[List[int]],
+    senstype: SensitivityType,
+) -> pd.DataFrame:
+    avgs = keys.rename(columns={"SENSNAME": "sensname", "SENSCASE": "senscase"})
+    avgs["senscase"] = avgs["senscase"].astype(object)
+    avgs["values"] = values
+    avgs["reals"] = pd.Series(reals, index=avgs.index, dtype=object)
+    avgs["senstype"] = pd.Series(senstype, index=avgs.index, dtype=object)
+    return avgs
+
+
+def _reset_to_reference(
+    case_df: pd.DataFrame, mask: np.ndarray, reference_average: np.ndarray
+) -> None:
+    """Replaces the masked cases with an empty case at the reference average"""
+    case_df["senscase"] = case_df["senscase"].astype(object)
+    if not mask.any():
+        return
+    case_df.loc[mask, "values_ref"] = 0
+    case_df.loc[mask, "reals"] = pd.Series(
+        [[] for _ in range(mask.sum())], index=case_df.index[mask], dtype=object
+    )
+    case_df.loc[mask, "senscase"] = None
+    case_df.loc[mask, "values"] = reference_average[mask]
+
+
+def _key_index(frame: pd.DataFrame, keys: List[str]) -> pd.Index:
+    return (
+        pd.MultiIndex.from_frame(frame[keys])
+        if len(keys) > 1
+        else pd.Index(frame[keys[0]])
+    )
+
+
+def _lookup(frame: pd.DataFrame, keys: List[str], series: pd.Series) -> pd.Series:
+    """Values of `series` (indexed by `keys`) for each row in `frame`"""
+    return series.reindex(_key_index(frame, keys))
@@ -40,7 +40,7 @@ import abc
 import sys
 import warnings
 from enum import Enum
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 from scipy import interpolate
@@ -274,7 +274,7 @@ class PVDx(PVxx):
 
         """
         # 1 / (1 / B)
-        return self.__compute_quantity(pressure, lambda p: 1.0 / self.__fvf_recip(p))
+        return 1.0 / self.__fvf_recip(pressure)
 
     def viscosity(self, pressure: np.ndarray) -> np.ndarray:
         """Computes all viscosity values for the given pressure values.
@@ -288,63 +288,39 @@ class PVDx(PVxx):
 
         """
         # (1 / B) / (1 / (B * mu)
-        return self.__compute_quantity(
-            pressure, lambda p: self.__fvf_recip(p) / self.__fvf_mu_recip(p)
-        )
-
-    @staticmethod
-    def __compute_quantity(
-        pressures: np.ndarray, evaluate: Callable[[Any], Any]
-    ) -> np.ndarray:
-        """Calls the given evaluate function with each of the
-        given pressure values and returns the results.
-
-        Args:
-            pressures: Pressure values
-            evaluate: Evaluation function
-
-        Returns:
-            Values resulting from evaluating the pressure values.
+        return self.__fvf_recip(pressure) / self.__fvf_mu_recip(pressure)
 
-        """
-        result = np.zeros(len(pressures))
-
-        for i, pressure in enumerate(pressures):
-            result[i] = float(evaluate(pressure))
-
-        return result
-
-    def __fvf_recip(self, point: float) -> float:
+    def __fvf_recip(self, points: np.ndarray) -> np.ndarray:
         """Computes (possibly inter-/extrapolates) the reciprocal of
-        the formation volume factor for the given point.
+        the formation volume factor for the given points.
 
         Args:
-            point:
-                The pressure point the formation volume factor
+            points:
+                The pressure points the formation volume factor
                 is requested for.
 
         Returns:
-            The requested reciprocal formation volume factor.
+            The requested reciprocal formation volume factors.
 
         """
-        return float(self.__interpolation(point)[0])
+        return self.__interpolation(np.asarray(points, dtype=float))[0]
 
-    def __fvf_mu_recip(self, point: float) -> float:
+    def __fvf_mu_recip(self, points: np.ndarray) -> np.ndarray:
         """Computes (possibly inter-/extrapolates) the reciprocal of
         the product of the formation volume factor and viscosity
-        for the given point.
+        for the given points.
 
         Args:
-            point:
-                The pressure point the formation volume factor
+            points:
+                The pressure points the formation volume factor
                 is requested for.
 
         Returns:
-            The requested reciprocal product of the formation volume factor
+            The requested reciprocal products of the formation volume factor
             and the viscosity.
 
         """
-        return float(self.__interpolation(point)[1])
+        return self.__interpolation(np.asarray(points, dtype=float))[1]
 
 
 class PVTx(PVxx):
@@ -419,7 +395,7 @@ class PVTx(PVxx):
             else:
                 break
 
-        # NOTE: If there is only one primary key, interp2d cannot be used.
+        # NOTE: If there is only one primary key, a 2D interpolant cannot be used.
         # As a fallback, use interp1d and make sure that the primary key asked for in
         # any of the methods of this instance is the one stored in self.keys[0].
         # Extrapolation is not possible.
@@ -435,16 +411,22 @@ class PVTx(PVxx):
 
         warnings.filterwarnings("ignore")
 
-        self.__interpolants: List[Union[interpolate.interp2d, interpolate.interp1d]] = [
-            (
-                interpolate.interp1d(self.x, self.y[index_column])
-                if self.__single_key
-                else interpolate.interp2d(
-                    x=self.keys, y=self.x, z=self.y[index_column], kind="linear"
+        # The scattered (key, x) data is fitted with a linear bivariate spline,
+        # which is what the (removed) scipy interp2d did for this kind of data.
+        # Only one of the lists is filled, depending on the number of primary keys.
+        self.__interpolants: List[interpolate.interp1d] = []
+        self.__spline_coefficients: List[Tuple] = []
+        for index_column in range(raw.num_cols - 1):
+            if self.__single_key:
+                self.__interpolants.append(
+                    interpolate.interp1d(self.x, self.y[index_column])
+                )
+            else:
+                self.__spline_coefficients.append(
+                    interpolate.bisplrep(
+                        self.keys, self.x, self.y[index_column], kx=1, ky=1, s=0.0
+                    )
                 )
-            )
-            for index_column in range(raw.num_cols - 1)
-        ]
 
         warnings.filterwarnings("default")
 
@@ -457,7 +439,7 @@ class PVTx(PVxx):
         return self.x
 
     def key_valid(self, key: np.ndarray) -> None:
-        if self.__single_key and not all(k == self.keys[0] for k in key):
+        if self.__single_key and not np.all(np.asarray(key) == self.keys[0]):
             raise ValueError(
                 "Impossible to perform requested inter-/extrapolation due to insufficient data."
             )
@@ -474,20 +456,11 @@ class PVTx(PVxx):
             Formation volume factor values corresponding
             to the given primary key and independent values.
 
-        Base implementation, raises a NotImplementedError.
-
         """
 
         self.key_valid(key)
 
-        return self.__compute_quantity(
-            key,
-            x,
-            lambda curve, point: self.__interpolants[0](point)
-            if self.__single_key
-            else self.__interpolants[0](curve, point),
-            lambda recip_fvf: 1.0 / recip_fvf,
-        )
+        return 1.0 / self.__evaluate(0, key, x)
 
     def viscosity(self, key: np.ndarray, x: np.ndarray) -> np.ndarray:
         """Computes viscosity values for the given ratio and pressure values.
@@ -500,63 +473,49 @@ class PVTx(PVxx):
             Viscosity values corresponding
             to the given primary key and independent values.
 
-        Base implementation, raises a NotImplementedError.
-
         """
 
         self.key_valid(key)
 
-        return self.__compute_quantity(
-            key,
-            x,
-            lambda curve, point: [
-                self.__interpolants[0](point),
-                self.__interpolants[1](point),
-            ]
-            if self.__single_key
-            else [
-                self.__interpolants[0](curve, point),
-                self.__interpolants[1](curve, point),
-            ],
-            lambda dense_vector: dense_vector[0] / dense_vector[1],
-        )
+        return self.__evaluate(0, key, x) / self.__evaluate(1, key, x)
 
-    @staticmethod
-    def __compute_quantity(
-        key: np.ndarray,
-        x: np.ndarray,
-        inner_function: Callable,
-        outer_function: Callable,
+    def __evaluate(
+        self, index_column: int, key: np.ndarray, x: np.ndarray
     ) -> np.ndarray:
-        """Calls the evaluate method with each of the values
-        in the given primary keys and the given inner_function
-        and returns the results after the outer_function
-        has been applied on each them.
+        """Evaluates the interpolant of the given column in all the
+        given (primary key, independent) points.
+
+        The spline is evaluated once per distinct primary key value,
+        for all the requested independents of that key at once.
 
         Args:
-            key: Primary key values the viscosity values are requested for.
-            x: Independents the viscosity values are requested for.
-            inner_function: Callable for extracting a dense vector.
-            outer_function:
-                Callable that uses the dense vector to compute
-                the requested quantity.
+            index_column: Index of the dependent column to evaluate
+            key: Primary key values the values are requested for.
+            x: Independents the values are requested for.
 
         Returns:
             Result values
 
         """
-
-        num_vals = len(key)
-        results = np.zeros(num_vals)
-        if len(x) != num_vals:
+        key = np.asarray(key, dtype=float)
+        x = np.asarray(x, dtype=float)
+        if len(x) != len(key):
             raise ValueError(
                 "Number of inner sampling points does not match number of outer sampling points."
             )
 
-        for i in range(0, num_vals):
-            quantity = inner_function(key[i], x[i])
-
-            results[i] = float(outer_function(quantity))
+        if self.__single_key:
+            return self.__interpolants[index_column](x)
+
+        spline_coefficients = self.__spline_coefficients[index_column]
+        results = np.zeros(len(key))
+        unique_keys, key_indices = np.unique(key, return_inverse=True)
+        for index_key, unique_key in enumerate(unique_keys):
+            mask = key_indices == index_key
+            unique_x, x_indices = np.unique(x[mask], return_inverse=True)
+            results[mask] = np.atleast_1d(
+                interpolate.bisplev(unique_key, unique_x, spline_coefficients)
+            )[x_indices]
 
         return results
 
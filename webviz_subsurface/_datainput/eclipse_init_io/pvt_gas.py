@@ -152,16 +152,10 @@ class WetGas(PvxOBase):
         """
         # rho_g = (rho_g,sc + Rv * rho_o,sc) / B_g
         fvf_gas = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                (
-                    self.__surface_mass_density_gas
-                    + ratio_sample * self.__surface_mass_density_oil
-                )
-                / fvf_gas_sample
-                for ratio_sample, fvf_gas_sample in zip(ratio, fvf_gas)
-            ]
-        )
+        return (
+            self.__surface_mass_density_gas
+            + np.asarray(ratio, dtype=float) * self.__surface_mass_density_oil
+        ) / fvf_gas
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary pressure values (Pg)"""
@@ -241,12 +235,7 @@ class DryGas(PvxOBase):
         """
         # rho_g = rho_g,sc / B_g
         fvf_gas = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_gas / fvf_gas_sample
-                for fvf_gas_sample in fvf_gas
-            ]
-        )
+        return self.__surface_mass_density_gas / fvf_gas
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
@@ -37,7 +37,7 @@
 ########################################
 
 import sys
-from typing import Any, Callable, Optional, Tuple, Union
+from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
 
@@ -140,16 +140,10 @@ class LiveOil(PvxOBase):
         """
         # rho_o = (rho_o,sc + Rs * rho_g,sc) / B_o
         fvf_oil = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                (
-                    self.__surface_mass_density_oil
-                    + ratio_sample * self.__surface_mass_density_gas
-                )
-                / fvf_oil_sample
-                for ratio_sample, fvf_oil_sample in zip(ratio, fvf_oil)
-            ]
-        )
+        return (
+            self.__surface_mass_density_oil
+            + np.asarray(ratio, dtype=float) * self.__surface_mass_density_gas
+        ) / fvf_oil
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary key values (Rs)"""
@@ -224,12 +218,7 @@ class DeadOil(PvxOBase):
         """
         # rho_o = rho_o,sc / B_o
         fvf_oil = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_oil / fvf_oil_sample
-                for fvf_oil_sample in fvf_oil
-            ]
-        )
+        return self.__surface_mass_density_oil / fvf_oil
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
@@ -308,7 +297,7 @@ class DeadOilConstCompr(PvxOBase):
             Formation volume factor values for the given pressure values.
 
         """
-        return self.__evaluate(pressure, lambda p: 1.0 / self.__recip_fvf(p))
+        return 1.0 / self.__recip_fvf(np.asarray(pressure, dtype=float))
 
     def viscosity(self, ratio: np.ndarray, pressure: np.ndarray) -> np.ndarray:
         """Computes viscosity values for the given pressure values.
@@ -322,15 +311,14 @@ class DeadOilConstCompr(PvxOBase):
             to the given pressure values.
 
         """
-        return self.__evaluate(
-            pressure, lambda p: self.__recip_fvf(p) / self.__recip_fvf_visc(p)
-        )
+        pressure = np.asarray(pressure, dtype=float)
+        return self.__recip_fvf(pressure) / self.__recip_fvf_visc(pressure)
 
-    def __recip_fvf(self, p_o: float) -> float:
+    def __recip_fvf(self, p_o: np.ndarray) -> np.ndarray:
         """Computes the reciprocal of the formation volume factor for the given oil pressure.
 
         Args:
-            p_o: Oil pressure
+            p_o: Oil pressure values
 
         Returns:
             Reciprocal of the formation volume factor
@@ -356,19 +344,14 @@ class DeadOilConstCompr(PvxOBase):
         """
         # rho_o = rho_o,sc / B_o
         fvf_oil = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_oil / fvf_oil_sample
-                for fvf_oil_sample in fvf_oil
-            ]
-        )
+        return self.__surface_mass_density_oil / fvf_oil
 
-    def __recip_fvf_visc(self, p_o: float) -> float:
+    def __recip_fvf_visc(self, p_o: np.ndarray) -> np.ndarray:
         """Computes the reciprocal of the product of formation volume factor
         and viscosity for the given oil pressure.
 
         Args:
-            p_o: Oil pressure
+            p_o: Oil pressure values
 
         Returns:
             Reciprocal of the product of formation volume factor and viscosity
@@ -383,7 +366,7 @@ class DeadOilConstCompr(PvxOBase):
         return self.__exp(y) / (self.__fvf_ref * self.__visc_ref)
 
     @staticmethod
-    def __exp(x: float) -> float:
+    def __exp(x: np.ndarray) -> np.ndarray:
         """Internal helper function.
 
         Computes an approximation to the exponential function by means
@@ -398,22 +381,6 @@ class DeadOilConstCompr(PvxOBase):
         """
         return 1.0 + x * (1.0 + x / 2.0)
 
-    @staticmethod
-    def __evaluate(
-        pressures: np.ndarray, calculate: Callable[[Any], Any]
-    ) -> np.ndarray:
-        """Calls the calculate method with each of pressure values and returns the results.
-
-        Args:
-            pressures: Pressure values
-            calculate: Method to be called with each of the pressure values
-
-        Returns:
-            Result values
-
-        """
-        return np.array([calculate(pressure) for pressure in pressures])
-
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
 
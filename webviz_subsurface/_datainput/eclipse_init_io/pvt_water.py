@@ -37,7 +37,7 @@
 ########################################
 
 import sys
-from typing import Any, Callable, List, Optional, Union
+from typing import List, Optional, Union
 
 import numpy as np
 
@@ -103,11 +103,11 @@ class WaterImpl(PvxOBase):
 
         self.__surface_mass_density_water = surface_mass_density_water
 
-    def __recip_fvf(self, p_w: float) -> float:
+    def __recip_fvf(self, p_w: np.ndarray) -> np.ndarray:
         """Computes the reciprocal of the formation volume factor for the given water pressure.
 
         Args:
-            p_w: Water pressure
+            p_w: Water pressure values
 
         Returns:
             Reciprocal of the formation volume factor
@@ -123,12 +123,12 @@ class WaterImpl(PvxOBase):
 
         return self.__recip_fvf_ref * self.__exp(x)
 
-    def __recip_fvf_visc(self, p_w: float) -> float:
+    def __recip_fvf_visc(self, p_w: np.ndarray) -> np.ndarray:
         """Computes the reciprocal of the product of formation volume factor
         and viscosity for the given water pressure.
 
         Args:
-            p_w: Water pressure
+            p_w: Water pressure values
 
         Returns:
             Reciprocal of the product of formation volume factor and viscosity
@@ -145,24 +145,7 @@ class WaterImpl(PvxOBase):
         return self.__recip_fvf_visc_ref * self.__exp(y)
 
     @staticmethod
-    def __evaluate(
-        pressures: np.ndarray, calculate: Callable[[Any], Any]
-    ) -> np.ndarray:
-        """Calls the calculate method with each of the pressure values
-        and returns the results.
-
-        Args:
-            pressures: Pressure values
-            calculate: Method to be called with each of the pressure values
-
-        Returns:
-            Result values
-
-        """
-        return np.array([calculate(pressure) for pressure in pressures])
-
-    @staticmethod
-    def __exp(x: float) -> float:
+    def __exp(x: np.ndarray) -> np.ndarray:
         """Internal helper function.
 
         Computes an approximation to the exponential function by means
@@ -191,7 +174,7 @@ class WaterImpl(PvxOBase):
             Formation volume factor values for the given pressure values.
 
         """
-        return self.__evaluate(pressure, lambda p: 1.0 / self.__recip_fvf(p))
+        return 1.0 / self.__recip_fvf(np.asarray(pressure, dtype=float))
 
     def viscosity(self, ratio: np.ndarray, pressure: np.ndarray) -> np.ndarray:
         """Computes viscosity values for the given pressure values.
@@ -204,9 +187,8 @@ class WaterImpl(PvxOBase):
             Viscosity values for the given pressure values.
 
         """
-        return self.__evaluate(
-            pressure, lambda p: self.__recip_fvf(p) / self.__recip_fvf_visc(p)
-        )
+        pressure = np.asarray(pressure, dtype=float)
+        return self.__recip_fvf(pressure) / self.__recip_fvf_visc(pressure)
 
     def density(self, ratio: np.ndarray, pressure: np.ndarray) -> np.ndarray:
         """Args:
@@ -219,12 +201,7 @@ class WaterImpl(PvxOBase):
         """
         # rho_w = rho_w,sc / B_w
         fvf_water = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_water / fvf_water_sample
-                for fvf_water_sample in fvf_water
-            ]
-        )
+        return self.__surface_mass_density_water / fvf_water
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
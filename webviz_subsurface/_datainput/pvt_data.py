@@ -154,28 +154,29 @@ def calculate_densities(data_frame: pd.DataFrame) -> pd.DataFrame:
         data_frame["KEYWORD"] == "DENSITY", "WATERDENSITY"
     ].values[0]
 
-    def calculate_density(keyword: str, ratio: float, volume_factor: float) -> float:
-        density = 0.0
-        if keyword == "PVTO":
-            density = (oil_density + ratio * gas_density) / volume_factor
-        elif keyword == "PVDO":
-            density = oil_density / volume_factor
-        elif keyword == "PVTG":
-            density = (gas_density + ratio * oil_density) / volume_factor
-        elif keyword == "PVDG":
-            density = gas_density / volume_factor
-        elif keyword == "PVCDO":
-            density = oil_density / volume_factor
-        elif keyword == "PVTW":
-            density = water_density / volume_factor
-        return density
-
-    data_frame["DENSITY"] = data_frame.apply(
-        lambda row: calculate_density(
-            row["KEYWORD"], row["RATIO"], row["VOLUMEFACTOR"]
-        ),
-        axis=1,
+    keyword = data_frame["KEYWORD"].to_numpy()
+    ratio = data_frame["RATIO"].to_numpy(dtype=float)
+    volume_factor = data_frame["VOLUMEFACTOR"].to_numpy(dtype=float)
+
+    # Surface density of each keyword, incl. the dissolved/vaporized phase
+    keyword_surface_densities = {
+        "PVTO": oil_density + ratio * gas_density,
+        "PVDO": oil_density,
+        "PVTG": gas_density + ratio * oil_density,
+        "PVDG": gas_density,
+        "PVCDO": oil_density,
+        "PVTW": water_density,
+    }
+    is_pvt_keyword = np.isin(keyword, list(keyword_surface_densities))
+    surface_density = np.select(
+        [keyword == kw for kw in keyword_surface_densities],
+        list(keyword_surface_densities.values()),
+        default=0.0,
     )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        data_frame["DENSITY"] = np.where(
+            is_pvt_keyword, surface_density / volume_factor, 0.0
+        )
     return data_frame
 
 
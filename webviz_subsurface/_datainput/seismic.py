@@ -1,4 +1,9 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
 import numpy as np
+import segyio
 import xtgeo
 from webviz_config.common_cache import CACHE
 
@@ -24,3 +29,231 @@ def get_iline(cube: xtgeo.Cube, iline: int) -> np.ndarray:
 def get_zslice(cube: xtgeo.Cube, zslice: float) -> np.ndarray:
     idx = np.where(cube.zslices == zslice)
     return cube.values[:, :, idx][:, :, 0, 0].T
+
+
+class LazySeismicCube:
+    """Read-only access to a SEG-Y cube without loading it into memory.
+
+    The trace headers are indexed once when the cube is opened, while the trace
+    data is memory mapped and only read when a slice or fence is requested.
+    Missing traces are returned as NaN. The file is reopened on demand if the
+    cube is used after `close()`.
+
+    The slices are oriented as the ones from `get_iline`, `get_xline` and
+    `get_zslice`, and the most recently used slices can optionally be kept in a
+    small in-memory cache (`slice_cache_size`).
+    """
+
+    # Number of traces read at a time when scanning the whole cube
+    TRACE_CHUNK_SIZE = 10000
+
+    def __init__(
+        self,
+        cube_path: str,
+        slice_cache_size: int = 0,
+        iline: int = segyio.TraceField.INLINE_3D,
+        xline: int = segyio.TraceField.CROSSLINE_3D,
+    ) -> None:
+        self._cube_path = cube_path
+        self._lock = threading.RLock()
+        self._segyfile: Optional[segyio.SegyFile] = None
+        self._slice_cache_size = slice_cache_size
+        self._slice_cache: OrderedDict = OrderedDict()
+        self._value_range: Optional[Tuple[float, float]] = None
+
+        trace_ilines = self._file().attributes(iline)[:]
+        trace_xlines = self._file().attributes(xline)[:]
+        self.ilines, iline_indices = np.unique(trace_ilines, return_inverse=True)
+        self.xlines, xline_indices = np.unique(trace_xlines, return_inverse=True)
+
+        # Trace number for each (inline, crossline), -1 for missing traces
+        self._trace_index = np.full((len(self.ilines), len(self.xlines)), -1)
+        self._trace_index[iline_indices, xline_indices] = np.arange(
+            self._file().tracecount
+        )
+
+        header = self._file().header[0]
+        self.zinc = header[segyio.TraceField.TRACE_SAMPLE_INTERVAL] / 1000.0
+        self.zori = float(header[segyio.TraceField.DelayRecordingTime])
+        self.zslices = self.zori + self.zinc * np.arange(len(self._file().samples))
+
+        self._ij_to_xy = self._fit_trace_coordinates(iline_indices, xline_indices)
+
+    def _file(self) -> segyio.SegyFile:
+        with self._lock:
+            if self._segyfile is None:
+                self._segyfile = segyio.open(self._cube_path, "r", ignore_geometry=True)
+                self._segyfile.mmap()
+            return self._segyfile
+
+    def close(self) -> None:
+        with self._lock:
+            if self._segyfile is not None:
+                self._segyfile.close()
+                self._segyfile = None
+
+    @property
+    def value_range(self) -> Tuple[float, float]:
+        """Min and max value of the cube. Computed with one pass over the traces on
+        first use, and thereafter kept on the cube."""
+        with self._lock:
+            if self._value_range is None:
+                minv, maxv = np.inf, -np.inf
+                segyfile = self._file()
+                for start in range(0, segyfile.tracecount, self.TRACE_CHUNK_SIZE):
+                    traces = segyfile.trace.raw[start : start + self.TRACE_CHUNK_SIZE]
+                    minv = min(minv, float(np.nanmin(traces)))
+                    maxv = max(maxv, float(np.nanmax(traces)))
+                self._value_range = (minv, maxv)
+            return self._value_range
+
+    def get_iline(self, iline: int) -> np.ndarray:
+        """Returns the inline as a (zslices, xlines) array"""
+        return self._cached_slice(
+            ("iline", iline),
+            lambda: self._read_traces(
+                self._trace_index[self._line_index(self.ilines, iline), :]
+            ).T,
+        )
+
+    def get_xline(self, xline: int) -> np.ndarray:
+        """Returns the crossline as a (zslices, ilines) array"""
+        return self._cached_slice(
+            ("xline", xline),
+            lambda: self._read_traces(
+                self._trace_index[:, self._line_index(self.xlines, xline)]
+            ).T,
+        )
+
+    def get_zslice(self, zslice: float) -> np.ndarray:
+        """Returns the z-slice as a (xlines, ilines) array"""
+
+        def _read_zslice() -> np.ndarray:
+            index = self._line_index(self.zslices, zslice)
+            with self._lock:
+                # One value per trace, in trace order
+                values = self._file().depth_slice[index]
+            return self._values_at_traces(values, self._trace_index).T
+
+        return self._cached_slice(("zslice", zslice), _read_zslice)
+
+    def get_randomline(
+        self, fencespec: np.ndarray
+    ) -> Tuple[float, float, float, float, np.ndarray]:
+        """Samples the cube along a fence, using the nearest trace and
+        a vertical sampling of half the cube z increment.
+
+        The fence specification and the returned tuple follow the conventions of
+        `xtgeo.Cube.get_randomline` for a numpy fence: a 2D array with X, Y, Z and
+        HLEN as columns, and (hmin, hmax, vmin, vmax, values) with values as a
+        (z, fence points) array. Fence points outside the cube are NaN.
+        """
+        # pylint: disable=too-many-locals
+        # Nearest (inline, crossline) index of each fence point
+        xy_to_ij = np.linalg.inv(self._ij_to_xy)
+        points = np.column_stack(
+            [fencespec[:, 0], fencespec[:, 1], np.ones(len(fencespec))]
+        )
+        i_frac, j_frac = (points @ xy_to_ij.T)[:, :2].T
+        inside = (
+            (i_frac >= 0)
+            & (i_frac <= len(self.ilines) - 1)
+            & (j_frac >= 0)
+            & (j_frac <= len(self.xlines) - 1)
+        )
+        i_index = np.floor(i_frac[inside] + 0.5).astype(int)
+        j_index = np.floor(j_frac[inside] + 0.5).astype(int)
+        trace_index = np.full(len(fencespec), -1)
+        trace_index[inside] = self._trace_index[i_index, j_index]
+
+        zmin, zmax = self.zslices[0], self.zslices[-1]
+        zincrement = self.zinc / 2.0
+        z_values = zmin + zincrement * np.arange(int((zmax - zmin) / zincrement) + 1)
+        z_index = np.floor((z_values - self.zori) / self.zinc + 0.5).astype(int)
+
+        values = self._read_traces(trace_index)[:, z_index].T
+        return (fencespec[0, 3], fencespec[-1, 3], zmin, zmax, values)
+
+    def _cached_slice(
+        self, key: Hashable, read_slice: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        if self._slice_cache_size <= 0:
+            return read_slice()
+        with self._lock:
+            if key in self._slice_cache:
+                self._slice_cache.move_to_end(key)
+                return self._slice_cache[key]
+        # Read outside the lock, such that cache hits are not blocked by the read.
+        # Concurrent misses for the same slice may read it twice.
+        values = read_slice()
+        with self._lock:
+            self._slice_cache[key] = values
+            if len(self._slice_cache) > self._slice_cache_size:
+                self._slice_cache.popitem(last=False)
+        return values
+
+    def _read_traces(self, trace_index: np.ndarray) -> np.ndarray:
+        """Reads the given traces into a (traces, zslices) array"""
+        values = np.full((len(trace_index), len(self.zslices)), np.nan, np.float32)
+        with self._lock:
+            traces = self._file().trace.raw
+            for row, index in enumerate(trace_index):
+                if index >= 0:
+                    values[row] = traces[int(index)]
+        return values
+
+    @staticmethod
+    def _values_at_traces(values: np.ndarray, trace_index: np.ndarray) -> np.ndarray:
+        return np.where(trace_index >= 0, values[trace_index], np.nan)
+
+    @staticmethod
+    def _line_index(lines: np.ndarray, line: float) -> int:
+        indices = np.flatnonzero(np.isclose(lines, line))
+        if indices.size == 0:
+            raise KeyError(f"{line} is not in the cube")
+        return int(indices[0])
+
+    def _fit_trace_coordinates(
+        self, iline_indices: np.ndarray, xline_indices: np.ndarray
+    ) -> np.ndarray:
+        """Least squares fit of the affine transform from (inline, crossline)
+        indices to the trace coordinates in the headers"""
+        trace_x = self._file().attributes(segyio.TraceField.CDP_X)[:].astype(float)
+        trace_y = self._file().attributes(segyio.TraceField.CDP_Y)[:].astype(float)
+        scalar = self._file().attributes(segyio.TraceField.SourceGroupScalar)[:]
+        scalar = np.where(scalar < 0, -1.0 / scalar, np.where(scalar == 0, 1, scalar))
+
+        ij_points = np.column_stack(
+            [iline_indices, xline_indices, np.ones(len(iline_indices))]
+        )
+        xy_points = np.column_stack(
+            [trace_x * scalar, trace_y * scalar, np.ones(len(iline_indices))]
+        )
+        coefficients, *_ = np.linalg.lstsq(ij_points, xy_points, rcond=None)
+        return coefficients.T
+
+
+# Max number of cubes kept open by load_lazy_cube()
+MAX_OPEN_LAZY_CUBES = 4
+
+_LAZY_CUBES: "OrderedDict[str, LazySeismicCube]" = OrderedDict()
+_LAZY_CUBES_LOCK = threading.Lock()
+
+
+def load_lazy_cube(cube_path: str, slice_cache_size: int = 10) -> LazySeismicCube:
+    """Returns a LazySeismicCube for the given path. The most recently used cubes
+    are kept open, so that the header index, value range and memory map are reused
+    between callbacks. Cubes beyond `MAX_OPEN_LAZY_CUBES` are closed.
+    """
+    with _LAZY_CUBES_LOCK:
+        cube = _LAZY_CUBES.get(cube_path)
+        if cube is not None:
+            _LAZY_CUBES.move_to_end(cube_path)
+            return cube
+
+        cube = LazySeismicCube(cube_path, slice_cache_size)
+        _LAZY_CUBES[cube_path] = cube
+        if len(_LAZY_CUBES) > MAX_OPEN_LAZY_CUBES:
+            _, evicted_cube = _LAZY_CUBES.popitem(last=False)
+            evicted_cube.close()
+        return cube
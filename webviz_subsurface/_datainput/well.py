@@ -5,6 +5,8 @@ import numpy as np
 import xtgeo
 from webviz_config.common_cache import CACHE
 
+from .._utils.content_memoize import content_memoize
+
 
 @CACHE.memoize()
 def load_well(
@@ -27,13 +29,13 @@ def load_well(
     return well
 
 
-@CACHE.memoize()
+@content_memoize
 def make_well_layer(
     well: xtgeo.Well, name: str = "well", zmin: float = 0
 ) -> Dict[str, Any]:
     """Make LayeredMap well polyline"""
-    well.dataframe = well.dataframe[well.dataframe["Z_TVDSS"] > zmin]
-    positions = well.dataframe[["X_UTME", "Y_UTMN"]].values
+    dataframe = well.dataframe
+    positions = dataframe.loc[dataframe["Z_TVDSS"] > zmin, ["X_UTME", "Y_UTMN"]].values
     return {
         "name": "Well",
         "id": "Well",
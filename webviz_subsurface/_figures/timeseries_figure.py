@@ -1,9 +1,9 @@
 import datetime
 from typing import Dict, List, Optional
 
-import numpy as np
 import pandas as pd
 
+from webviz_subsurface._providers import compute_vectors_statistics_df
 from webviz_subsurface._utils.colors import find_intermediate_color, rgba_to_str
 from webviz_subsurface._utils.enum_shim import StrEnum
 from webviz_subsurface._utils.simulation_timeseries import (
@@ -206,18 +206,13 @@ class TimeSeriesFigure:
         )
 
     def create_vectors_statistics_df(self) -> pd.DataFrame:
-        return (
-            self.dframe[["DATE", self.vector]]
-            .groupby(["DATE"])
-            .agg(
-                [
-                    ("Mean", "mean"),
-                    ("P10", lambda x: np.nanpercentile(x, q=90)),
-                    ("P90", lambda x: np.nanpercentile(x, q=10)),
-                ]
-            )
-            .reset_index()
+        # Each row of a date is one sample, i.e. a realization or a sensitivity mean
+        samples_df = self.dframe[["DATE", self.vector]].assign(
+            REAL=self.dframe.groupby("DATE").cumcount()
         )
+        return compute_vectors_statistics_df(samples_df)[
+            [("DATE", "")] + [(self.vector, stat) for stat in self.STAT_OPTIONS]
+        ]
 
     def create_vector_observation_traces(self) -> None:
         """Adds observations to the plot"""
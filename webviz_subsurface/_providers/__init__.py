@@ -5,9 +5,20 @@ from .ensemble_fault_polygons_provider import (
     FaultPolygonsServer,
     SimulatedFaultPolygonsAddress,
 )
+from .ensemble_summary_provider._delta_ensemble import (
+    create_delta_vectors_df,
+    get_delta_ensemble_vectors_df,
+)
+from .ensemble_summary_provider._derived_vectors import get_cumulative_vector_name
+from .ensemble_summary_provider._vector_catalog import VectorCatalog
+from .ensemble_summary_provider._vector_statistics import (
+    VectorStatistic,
+    compute_vectors_statistics_df,
+)
 from .ensemble_summary_provider.ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
+    StoragePrecision,
     VectorMetadata,
 )
 from .ensemble_summary_provider.ensemble_summary_provider_factory import (
@@ -0,0 +1,155 @@
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .ensemble_summary_provider import EnsembleSummaryProvider, Frequency
+
+# Max number of alignment plans kept per provider
+ALIGNMENT_PLAN_CACHE_SIZE = 32
+
+# Alignment plans per provider A, keyed on (provider B, resampling frequency,
+# realizations, row counts of the two vectors dataframes). The plans are released
+# together with provider A.
+_ALIGNMENT_PLAN_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_ALIGNMENT_PLAN_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class AlignmentPlan:
+    """Rows of two vectors dataframes with equal (DATE, REAL), ordered on REAL and
+    thereafter DATE.
+    """
+
+    rows_a: np.ndarray
+    rows_b: np.ndarray
+
+
+def create_alignment_plan(
+    vectors_df_a: pd.DataFrame, vectors_df_b: pd.DataFrame
+) -> AlignmentPlan:
+    """Find the rows of the two dataframes with matching "DATE" and "REAL".
+
+    The (DATE, REAL) pairs are encoded as integers, such that the intersection is
+    found with one integer array operation and is sorted on REAL and DATE. If a pair
+    occurs more than once in a dataframe, the first row is used.
+    """
+    date_codes, unique_dates = pd.factorize(
+        pd.concat([vectors_df_a["DATE"], vectors_df_b["DATE"]], ignore_index=True),
+        sort=True,
+    )
+    real_codes, _ = pd.factorize(
+        pd.concat([vectors_df_a["REAL"], vectors_df_b["REAL"]], ignore_index=True),
+        sort=True,
+    )
+    keys = real_codes.astype(np.int64) * len(unique_dates) + date_codes
+    row_count_a = vectors_df_a.shape[0]
+    _, rows_a, rows_b = np.intersect1d(
+        keys[:row_count_a], keys[row_count_a:], return_indices=True
+    )
+    return AlignmentPlan(rows_a, rows_b)
+
+
+def create_delta_vectors_df(
+    vectors_df_a: pd.DataFrame,
+    vectors_df_b: pd.DataFrame,
+    alignment_plan: Optional[AlignmentPlan] = None,
+) -> pd.DataFrame:
+    """Subtract the vectors in `vectors_df_b` from the vectors in `vectors_df_a`.
+
+    Both dataframes have columns ["DATE", "REAL", vector1, ..., vectorN]. Only the
+    rows with (DATE, REAL) in both dataframes are subtracted, and rows where any of the
+    delta values are NaN are dropped. The returned dataframe is sorted on REAL and
+    thereafter DATE, with the same columns as `vectors_df_a`.
+
+    A given `alignment_plan` must be created for dataframes with the same "DATE" and
+    "REAL" columns as `vectors_df_a` and `vectors_df_b`.
+    """
+    if alignment_plan is None:
+        alignment_plan = create_alignment_plan(vectors_df_a, vectors_df_b)
+
+    vector_names = [col for col in vectors_df_a.columns if col not in ["DATE", "REAL"]]
+    delta_values: Dict[str, np.ndarray] = {}
+    has_values = np.ones(len(alignment_plan.rows_a), dtype=bool)
+    for vector_name in vector_names:
+        delta_values[vector_name] = (
+            vectors_df_a[vector_name].to_numpy(float)[alignment_plan.rows_a]
+            - vectors_df_b[vector_name].to_numpy(float)[alignment_plan.rows_b]
+        )
+        has_values &= ~np.isnan(delta_values[vector_name])
+    rows_a = alignment_plan.rows_a[has_values]
+
+    delta_vectors_df = pd.DataFrame(
+        {
+            "DATE": vectors_df_a["DATE"].to_numpy()[rows_a],
+            "REAL": vectors_df_a["REAL"].to_numpy()[rows_a],
+            **{
+                vector_name: values[has_values]
+                for vector_name, values in delta_values.items()
+            },
+        }
+    )
+    return delta_vectors_df
+
+
+def _get_cached_alignment_plan(
+    provider_a: EnsembleSummaryProvider, key: Hashable
+) -> Optional[AlignmentPlan]:
+    with _ALIGNMENT_PLAN_CACHE_LOCK:
+        provider_plans = _ALIGNMENT_PLAN_CACHE.get(provider_a)
+        if provider_plans is None or key not in provider_plans:
+            return None
+        provider_plans.move_to_end(key)
+        return provider_plans[key]
+
+
+def _put_cached_alignment_plan(
+    provider_a: EnsembleSummaryProvider, key: Hashable, plan: AlignmentPlan
+) -> None:
+    with _ALIGNMENT_PLAN_CACHE_LOCK:
+        provider_plans = _ALIGNMENT_PLAN_CACHE.setdefault(provider_a, OrderedDict())
+        provider_plans[key] = plan
+        if len(provider_plans) > ALIGNMENT_PLAN_CACHE_SIZE:
+            provider_plans.popitem(last=False)
+
+
+def get_delta_ensemble_vectors_df(
+    provider_a: EnsembleSummaryProvider,
+    provider_b: EnsembleSummaryProvider,
+    vector_names: Sequence[str],
+    resampling_frequency: Optional[Frequency],
+    realizations: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+    """Returns a Pandas DataFrame with the vectors of provider A minus the vectors of
+    provider B, for the dates and realizations present in both providers.
+
+    The alignment of the rows of the two providers does not depend on the vectors, and
+    is cached per provider pair, resampling frequency and realizations. See
+    `create_delta_vectors_df()` for the content of the returned DataFrame.
+    """
+    vectors_df_a = provider_a.get_vectors_df(
+        vector_names, resampling_frequency, realizations
+    )
+    vectors_df_b = provider_b.get_vectors_df(
+        vector_names, resampling_frequency, realizations
+    )
+
+    # The rows of a provider do not depend on the requested vectors, and the row
+    # counts are a cheap guard against reusing a plan for other rows
+    key = (
+        provider_b,
+        resampling_frequency,
+        None if realizations is None else tuple(realizations),
+        vectors_df_a.shape[0],
+        vectors_df_b.shape[0],
+    )
+    alignment_plan = _get_cached_alignment_plan(provider_a, key)
+    if alignment_plan is None:
+        alignment_plan = create_alignment_plan(vectors_df_a, vectors_df_b)
+        _put_cached_alignment_plan(provider_a, key, alignment_plan)
+
+    return create_delta_vectors_df(vectors_df_a, vectors_df_b, alignment_plan)
@@ -0,0 +1,58 @@
+from typing import Dict, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+PER_INTERVAL_PREFIX = "PER_INTVL_"
+PER_DAY_PREFIX = "PER_DAY_"
+
+
+def get_cumulative_vector_name(vector_name: str) -> str:
+    """Returns name of the cumulative vector that a PER_INTVL_ or PER_DAY_ vector is
+    derived from. Raises ValueError if the vector name has neither of the prefixes.
+    """
+    for prefix in [PER_INTERVAL_PREFIX, PER_DAY_PREFIX]:
+        if vector_name.startswith(prefix):
+            return vector_name[len(prefix) :]
+    raise ValueError(
+        f'Expected "{vector_name}" to be a vector calculated from cumulative!'
+    )
+
+
+def compute_per_interval_and_per_day_vectors(
+    table: pa.Table, vector_names: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    """Compute PER_INTVL_ and PER_DAY_ vectors from the cumulative vectors in table.
+
+    The table must contain a DATE and a REAL column in addition to the cumulative
+    vectors, be segmented on REAL and within each REAL segment be sorted on DATE.
+
+    The value at a date is the change of the cumulative until the next date, and for
+    PER_DAY_ vectors this change is divided by the number of whole days in the interval.
+    The last date of each realization has no interval and gets the value 0, as do
+    intervals where the cumulative is missing (NaN) at either end.
+    """
+    real_np = table.column("REAL").to_numpy()
+    dates_np = table.column("DATE").to_numpy()
+
+    # Rows where the next row belongs to the same realization
+    has_next_in_real = np.zeros(len(real_np), dtype=bool)
+    has_next_in_real[:-1] = real_np[1:] == real_np[:-1]
+
+    interval_days = np.zeros(len(dates_np))
+    interval_days[:-1] = np.diff(dates_np) // np.timedelta64(1, "D")
+
+    derived_vectors: Dict[str, np.ndarray] = {}
+    for vector_name in vector_names:
+        cumulative_np = table.column(get_cumulative_vector_name(vector_name)).to_numpy()
+        interval_delta = np.zeros(len(cumulative_np))
+        interval_delta[:-1] = np.diff(cumulative_np)
+        # Intervals with a missing cumulative value get the value 0
+        interval_delta[np.isnan(interval_delta)] = 0.0
+        if vector_name.startswith(PER_DAY_PREFIX):
+            with np.errstate(invalid="ignore", divide="ignore"):
+                interval_delta /= interval_days
+
+        derived_vectors[vector_name] = np.where(has_next_in_real, interval_delta, 0.0)
+
+    return derived_vectors
@@ -0,0 +1,68 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .ensemble_summary_provider import EnsembleSummaryProvider, Frequency
+
+# Number of vectors to compare per call to get_vectors_df()
+VECTOR_BATCH_SIZE = 100
+
+
+def compute_max_error_per_vector(
+    reference_df: pd.DataFrame, df: pd.DataFrame
+) -> pd.DataFrame:
+    """Compute max absolute and max relative error per vector of `df` relative to
+    `reference_df`. Both dataframes must have the same rows, i.e. DATE and REAL.
+
+    The relative error is only computed where the reference value is non-zero. The
+    returned dataframe has columns VECTOR, MAX_ABS_ERROR and MAX_REL_ERROR.
+    """
+    if not reference_df[["DATE", "REAL"]].equals(df[["DATE", "REAL"]]):
+        raise ValueError("The dataframes must have equal DATE and REAL columns")
+
+    vector_names = [col for col in reference_df.columns if col not in ["DATE", "REAL"]]
+    max_abs_errors: List[float] = []
+    max_rel_errors: List[float] = []
+    for vector_name in vector_names:
+        reference_values = reference_df[vector_name].to_numpy(np.float64)
+        abs_errors = np.abs(df[vector_name].to_numpy(np.float64) - reference_values)
+        nonzero = reference_values != 0
+        rel_errors = abs_errors[nonzero] / np.abs(reference_values[nonzero])
+        max_abs_errors.append(float(np.nanmax(abs_errors, initial=0)))
+        max_rel_errors.append(float(np.nanmax(rel_errors, initial=0)))
+
+    return pd.DataFrame(
+        {
+            "VECTOR": vector_names,
+            "MAX_ABS_ERROR": max_abs_errors,
+            "MAX_REL_ERROR": max_rel_errors,
+        }
+    )
+
+
+def compare_providers_per_vector(
+    reference_provider: EnsembleSummaryProvider,
+    provider: EnsembleSummaryProvider,
+    resampling_frequency: Optional[Frequency],
+    vector_names: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Compute max absolute and max relative error per vector of `provider` relative to
+    `reference_provider`, sorted on descending relative error.
+    """
+    if vector_names is None:
+        vector_names = reference_provider.vector_names()
+
+    per_batch_errors: List[pd.DataFrame] = []
+    for start in range(0, len(vector_names), VECTOR_BATCH_SIZE):
+        batch = vector_names[start : start + VECTOR_BATCH_SIZE]
+        per_batch_errors.append(
+            compute_max_error_per_vector(
+                reference_provider.get_vectors_df(batch, resampling_frequency),
+                provider.get_vectors_df(batch, resampling_frequency),
+            )
+        )
+
+    return pd.concat(per_batch_errors, ignore_index=True).sort_values(
+        "MAX_REL_ERROR", ascending=False, ignore_index=True
+    )
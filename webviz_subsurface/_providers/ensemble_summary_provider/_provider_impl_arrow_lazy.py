@@ -1,8 +1,10 @@
 import datetime
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,6 +13,12 @@ import pyarrow.compute as pc
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ._derived_vectors import (
+    PER_DAY_PREFIX,
+    PER_INTERVAL_PREFIX,
+    compute_per_interval_and_per_day_vectors,
+    get_cumulative_vector_name,
+)
 from ._field_metadata import create_vector_metadata_from_field_meta
 from ._resampling import (
     generate_normalized_sample_dates,
@@ -19,13 +27,16 @@ from ._resampling import (
 )
 from ._table_utils import (
     add_per_vector_min_max_to_table_schema_metadata,
+    cast_float_columns,
     find_intersected_dates_between_realizations,
     find_min_max_for_numeric_table_columns,
     get_per_vector_min_max_from_schema_metadata,
 )
+from ._vector_catalog import VectorCatalog
 from .ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
+    StoragePrecision,
     VectorMetadata,
 )
 
@@ -62,11 +73,49 @@ def _find_first_non_increasing_date_pair(
     return (dates_np[offending_indices[0]], dates_np[offending_indices[0] + 1])
 
 
+def _make_result_cache_key(
+    vector_names: Sequence[str],
+    resampling_frequency: Optional[Frequency],
+    realizations: Optional[Sequence[int]],
+) -> Hashable:
+    return (
+        tuple(vector_names),
+        resampling_frequency,
+        tuple(sorted(realizations)) if realizations is not None else None,
+    )
+
+
+class _ResultCache:
+    """Thread safe least recently used cache for results computed by the provider"""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
 class ProviderImplArrowLazy(EnsembleSummaryProvider):
     """This class implements an EnsembleSummaryProvider with lazy (on-demand)
     resampling/interpolation.
     """
 
+    # Max number of results from get_vectors_statistics_df() and from get_vectors_df()
+    # with PER_INTVL_/PER_DAY_ vectors that are kept in memory
+    RESULT_CACHE_SIZE = 16
+
     def __init__(self, arrow_file_name: Path) -> None:
         self._arrow_file_name = str(arrow_file_name)
 
@@ -86,6 +135,7 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             for colname in column_names_on_file
             if colname not in ["DATE", "REAL", "ENSEMBLE"]
         ]
+        self._vector_catalog = VectorCatalog(self._vector_names)
         et_find_vec_names_ms = timer.lap_ms()
 
         unique_realizations_on_file = reader.read_all().column("REAL").unique()
@@ -101,6 +151,10 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         self._cached_full_table = None
         # self._cached_full_table = reader.read_all()
 
+        # Results keyed on (vector names, resampling frequency, realizations)
+        self._statistics_cache = _ResultCache(self.RESULT_CACHE_SIZE)
+        self._derived_vectors_cache = _ResultCache(self.RESULT_CACHE_SIZE)
+
         LOGGER.debug(
             f"init took: {timer.elapsed_s():.2f}s, "
             f"(open={et_open_ms}ms, create_reader={et_create_reader_ms}ms, "
@@ -116,8 +170,18 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
     @staticmethod
     def write_backing_store_from_per_realization_tables(
-        storage_dir: Path, storage_key: str, per_real_tables: Dict[int, pa.Table]
+        storage_dir: Path,
+        storage_key: str,
+        per_real_tables: Dict[int, pa.Table],
+        storage_precision: StoragePrecision = StoragePrecision.FLOAT64,
     ) -> None:
+        """Write the per realization tables to an arrow file in the backing store.
+
+        With `storage_precision` set to FLOAT32, the vector values are stored as float32,
+        halving the size of the file. The values are converted back to float64 when
+        read, so that resampling and the returned data are in float64.
+        """
+
         # pylint: disable=too-many-locals
         @dataclass
         class Elapsed:
@@ -125,6 +189,7 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             build_add_real_col_s: float = -1
             sorting_s: float = -1
             find_and_store_min_max_s: float = -1
+            convert_precision_s: float = -1
             write_s: float = -1
 
         elapsed = Elapsed()
@@ -186,6 +251,10 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         )
         elapsed.find_and_store_min_max_s = timer.lap_s()
 
+        if storage_precision == StoragePrecision.FLOAT32:
+            full_table = cast_float_columns(full_table, pa.float32())
+        elapsed.convert_precision_s = timer.lap_s()
+
         # feather.write_feather(full_table, dest=arrow_file_name)
         with pa.OSFile(str(arrow_file_name), "wb") as sink:
             with pa.RecordBatchFileWriter(sink, full_table.schema) as writer:
@@ -198,7 +267,8 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             f"build_add_real_col={elapsed.build_add_real_col_s:.2f}s, "
             f"sorting={elapsed.sorting_s:.2f}s, "
             f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
-            f"write={elapsed.write_s:.2f}s)"
+            f"convert_precision={elapsed.convert_precision_s:.2f}s, "
+            f"write={elapsed.write_s:.2f}s, precision={storage_precision.value})"
         )
 
     @staticmethod
@@ -221,18 +291,25 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         return pa.ipc.RecordBatchFileReader(source).schema
 
     def _get_or_read_table(self, columns: List[str]) -> pa.Table:
+        # Vectors stored as float32 are converted to float64 after selecting columns,
+        # so that only the requested vectors are held in float64
         if self._cached_full_table:
-            return self._cached_full_table.select(columns)
-        if self._cached_reader:
-            return self._cached_reader.read_all().select(columns)
+            table = self._cached_full_table.select(columns)
+        elif self._cached_reader:
+            table = self._cached_reader.read_all().select(columns)
+        else:
+            source = pa.memory_map(self._arrow_file_name, "r")
+            reader = pa.ipc.RecordBatchFileReader(source)
+            table = reader.read_all().select(columns)
 
-        source = pa.memory_map(self._arrow_file_name, "r")
-        reader = pa.ipc.RecordBatchFileReader(source)
-        return reader.read_all().select(columns)
+        return cast_float_columns(table, pa.float64())
 
     def vector_names(self) -> List[str]:
         return self._vector_names
 
+    def vector_catalog(self) -> VectorCatalog:
+        return self._vector_catalog
+
     def vector_names_filtered_by_value(
         self,
         exclude_all_values_zero: bool = False,
@@ -317,6 +394,10 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         return intersected_dates.astype(datetime.datetime).tolist()  # type: ignore
 
+    def supports_per_interval_and_per_day_vectors(self) -> bool:
+        return True
+
+    # pylint: disable=too-many-locals
     def get_vectors_df(
         self,
         vector_names: Sequence[str],
@@ -328,19 +409,55 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         timer = PerfTimer()
 
-        columns_to_get = ["DATE", "REAL"]
-        columns_to_get.extend(vector_names)
-        table = self._get_or_read_table(columns_to_get)
-        et_read_ms = timer.lap_ms()
-
-        if realizations is not None:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        et_filter_ms = timer.lap_ms()
-
-        if resampling_frequency is not None:
-            table = resample_segmented_multi_real_table(table, resampling_frequency)
-        et_resample_ms = timer.lap_ms()
+        derived_vector_names = [
+            vecname
+            for vecname in vector_names
+            if vecname not in self._vector_catalog
+            and vecname.startswith((PER_INTERVAL_PREFIX, PER_DAY_PREFIX))
+            and get_cumulative_vector_name(vecname) in self._vector_catalog
+        ]
+        cache_key = _make_result_cache_key(
+            vector_names, resampling_frequency, realizations
+        )
+        table = (
+            self._derived_vectors_cache.get(cache_key) if derived_vector_names else None
+        )
+        et_read_ms = et_filter_ms = et_resample_ms = et_derive_ms = 0
+
+        if table is None:
+            # The derived vectors are computed from their cumulative vectors
+            columns_to_get = ["DATE", "REAL"]
+            for vecname in vector_names:
+                if vecname in derived_vector_names:
+                    vecname = get_cumulative_vector_name(vecname)
+                if vecname not in columns_to_get:
+                    columns_to_get.append(vecname)
+            table = self._get_or_read_table(columns_to_get)
+            et_read_ms = timer.lap_ms()
+
+            if realizations is not None:
+                mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
+                table = table.filter(mask)
+            et_filter_ms = timer.lap_ms()
+
+            if resampling_frequency is not None:
+                table = resample_segmented_multi_real_table(table, resampling_frequency)
+            et_resample_ms = timer.lap_ms()
+
+            if derived_vector_names:
+                derived_vectors = compute_per_interval_and_per_day_vectors(
+                    table, derived_vector_names
+                )
+                table = pa.table(
+                    {
+                        colname: derived_vectors[colname]
+                        if colname in derived_vectors
+                        else table.column(colname)
+                        for colname in ["DATE", "REAL", *vector_names]
+                    }
+                )
+                self._derived_vectors_cache.put(cache_key, table)
+            et_derive_ms = timer.lap_ms()
 
         df = table.to_pandas(timestamp_as_object=True)
         et_to_pandas_ms = timer.lap_ms()
@@ -350,14 +467,41 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             f"read={et_read_ms}ms, "
             f"filter={et_filter_ms}ms, "
             f"resample={et_resample_ms}ms, "
+            f"derive={et_derive_ms}ms, "
             f"to_pandas={et_to_pandas_ms}ms), "
             f"#vecs={len(vector_names)}, "
+            f"#derived_vecs={len(derived_vector_names)}, "
             f"#real={len(realizations) if realizations is not None else 'all'}, "
             f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
         )
 
         return df
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        cache_key = _make_result_cache_key(
+            vector_names, resampling_frequency, realizations
+        )
+        statistics_df = self._statistics_cache.get(cache_key)
+        if statistics_df is None:
+            timer = PerfTimer()
+            statistics_df = super().get_vectors_statistics_df(
+                vector_names, resampling_frequency, realizations
+            )
+            LOGGER.debug(
+                f"get_vectors_statistics_df({resampling_frequency}) took: "
+                f"{timer.elapsed_ms()}ms, #vecs={len(vector_names)}, "
+                f"file={Path(self._arrow_file_name).name}"
+            )
+            self._statistics_cache.put(cache_key, statistics_df)
+
+        # Return a copy so that callers can't modify the cached dataframe
+        return statistics_df.copy()
+
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
@@ -20,6 +20,7 @@ from ._table_utils import (
     find_min_max_for_numeric_table_columns,
     get_per_vector_min_max_from_schema_metadata,
 )
+from ._vector_catalog import VectorCatalog
 from .ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
@@ -87,6 +88,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
             for colname in column_names_on_file
             if colname not in ["DATE", "REAL", "ENSEMBLE"]
         ]
+        self._vector_catalog = VectorCatalog(self._vector_names)
         et_find_vec_names_ms = timer.lap_ms()
 
         unique_realizations_on_file = reader.read_all().column("REAL").unique()
@@ -285,6 +287,9 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
     def vector_names(self) -> List[str]:
         return self._vector_names
 
+    def vector_catalog(self) -> VectorCatalog:
+        return self._vector_catalog
+
     def vector_names_filtered_by_value(
         self,
         exclude_all_values_zero: bool = False,
@@ -26,6 +26,19 @@ def find_min_max_for_numeric_table_columns(
     return ret_dict
 
 
+def cast_float_columns(table: pa.Table, float_type: pa.DataType) -> pa.Table:
+    """Cast all floating point columns to float_type, keeping field and schema metadata.
+    The table is returned as is if there are no columns to cast."""
+    schema = table.schema
+    for idx, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type) and field.type != float_type:
+            schema = schema.set(idx, field.with_type(float_type))
+
+    if schema is table.schema:
+        return table
+    return table.cast(schema)
+
+
 def add_per_vector_min_max_to_table_schema_metadata(
     table: pa.Table, per_vector_min_max: Dict[str, dict]
 ) -> pa.Table:
@@ -0,0 +1,145 @@
+import bisect
+import fnmatch
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# First letter of keywords with a well or group name, i.e. well, group, completion
+# and segment vectors
+_WGNAME_KEYWORD_TYPES = ("W", "G", "C", "S")
+
+_WILDCARD_CHARACTERS = re.compile(r"[*?\[]")
+
+
+def parse_vector_name(vector_name: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """Split summary vector name into (keyword, wgname, num).
+
+    E.g. "WOPT:OP_1" -> ("WOPT", "OP_1", None), "ROIP:3" -> ("ROIP", None, 3) and
+    "COPR:OP_1:123" -> ("COPR", "OP_1", 123).
+    """
+    keyword, *qualifiers = vector_name.split(":")
+    wgname: Optional[str] = None
+    if qualifiers and keyword.startswith(_WGNAME_KEYWORD_TYPES):
+        wgname = qualifiers.pop(0)
+    num: Optional[int] = None
+    if qualifiers and qualifiers[0].isdigit():
+        num = int(qualifiers[0])
+    return (keyword, wgname, num)
+
+
+def _prefix_range(sorted_names: List[str], prefix: str) -> Tuple[int, int]:
+    """Index range of the names starting with prefix in a sorted list"""
+    if not prefix:
+        return (0, len(sorted_names))
+    start = bisect.bisect_left(sorted_names, prefix)
+    end = bisect.bisect_left(
+        sorted_names, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo=start
+    )
+    return (start, end)
+
+
+class VectorCatalog:
+    """Index of the vector names of a summary provider.
+
+    The names are parsed into keyword, well/group name and number once, and kept in
+    sorted arrays and dictionaries, so that queries on prefixes, unix shell wildcards,
+    keywords and well/group names are answered without scanning all vector names.
+
+    All queries return the vector names in the order given to the catalog.
+    """
+
+    def __init__(self, vector_names: Sequence[str]) -> None:
+        self._vector_names = list(vector_names)
+        self._vector_name_set = set(self._vector_names)
+        self._position = {name: pos for pos, name in enumerate(self._vector_names)}
+
+        self._sorted_names = sorted(self._vector_names)
+
+        # Upper case names for case insensitive matching, with the position of each
+        # name in the original order
+        upper_names_and_positions = sorted(
+            (name.upper(), pos) for pos, name in enumerate(self._vector_names)
+        )
+        self._sorted_upper_names = [name for name, _ in upper_names_and_positions]
+        self._sorted_upper_name_positions = [
+            pos for _, pos in upper_names_and_positions
+        ]
+
+        self._names_by_keyword: Dict[str, List[str]] = {}
+        self._names_by_wgname: Dict[str, List[str]] = {}
+        self._wgnames_by_keyword: Dict[str, List[str]] = {}
+        for name in self._vector_names:
+            keyword, wgname, _num = parse_vector_name(name)
+            self._names_by_keyword.setdefault(keyword, []).append(name)
+            if wgname is not None:
+                self._names_by_wgname.setdefault(wgname, []).append(name)
+                self._wgnames_by_keyword.setdefault(keyword, []).append(wgname)
+
+    def __contains__(self, vector_name: object) -> bool:
+        return vector_name in self._vector_name_set
+
+    def __len__(self) -> int:
+        return len(self._vector_names)
+
+    def vector_names(self) -> List[str]:
+        return list(self._vector_names)
+
+    def _in_catalog_order(self, names: Sequence[str]) -> List[str]:
+        return sorted(names, key=self._position.__getitem__)
+
+    def names_with_prefix(self, prefix: str) -> List[str]:
+        """Vector names starting with prefix, e.g. "W" or "WOPT:" (case sensitive)"""
+        start, end = _prefix_range(self._sorted_names, prefix)
+        return self._in_catalog_order(self._sorted_names[start:end])
+
+    def match(self, patterns: Sequence[str]) -> List[str]:
+        """Vector names matching any of the unix shell wildcard patterns, e.g.
+        ["FOPT", "WOP*:OP_?"]. The matching is case insensitive.
+
+        Only the names starting with the literal part of a pattern, i.e. the part before
+        the first wildcard, are tested against the pattern.
+        """
+        positions: Set[int] = set()
+        for pattern in patterns:
+            upper_pattern = pattern.upper()
+            literal_prefix = _WILDCARD_CHARACTERS.split(upper_pattern, maxsplit=1)[0]
+            start, end = _prefix_range(self._sorted_upper_names, literal_prefix)
+            if literal_prefix == upper_pattern:
+                # No wildcards, match on the whole name
+                end = bisect.bisect_right(
+                    self._sorted_upper_names, upper_pattern, lo=start, hi=end
+                )
+                positions.update(self._sorted_upper_name_positions[start:end])
+                continue
+            for index in range(start, end):
+                if fnmatch.fnmatchcase(self._sorted_upper_names[index], upper_pattern):
+                    positions.add(self._sorted_upper_name_positions[index])
+        return [self._vector_names[pos] for pos in sorted(positions)]
+
+    def keywords(self) -> List[str]:
+        return list(self._names_by_keyword.keys())
+
+    def names_for_keyword(self, keyword: str) -> List[str]:
+        """Vector names of a keyword, e.g. all "WOPT:<well>" vectors for "WOPT" """
+        return list(self._names_by_keyword.get(keyword, []))
+
+    def names_for_keywords(self, keywords: Sequence[str]) -> List[str]:
+        """Vector names of a keyword family, e.g. ["WOPT", "WWPT", "WGPT"]"""
+        names: List[str] = []
+        for keyword in keywords:
+            names.extend(self._names_by_keyword.get(keyword, []))
+        return self._in_catalog_order(names)
+
+    def wgnames(self, keyword: Optional[str] = None) -> List[str]:
+        """Well and group names, optionally only for the given keyword, e.g. the wells
+        with a "WOPT" vector. In order of first occurrence.
+        """
+        wgnames = (
+            self._names_by_wgname.keys()
+            if keyword is None
+            else self._wgnames_by_keyword.get(keyword, [])
+        )
+        return list(dict.fromkeys(wgnames))
+
+    def names_for_wgname(self, wgname: str) -> List[str]:
+        """Vector names of a well or group"""
+        return list(self._names_by_wgname.get(wgname, []))
@@ -0,0 +1,90 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface._utils.enum_shim import StrEnum
+
+
+class VectorStatistic(StrEnum):
+    MEAN = "Mean"
+    MIN = "Min"
+    MAX = "Max"
+    P10 = "P10"
+    P90 = "P90"
+    P50 = "P50"
+
+
+def _percentile_of_sorted(
+    sorted_values: np.ndarray, valid_count: np.ndarray, percentile: float
+) -> np.ndarray:
+    """Linear interpolated percentile along the last axis of an array sorted along
+    that axis, where the `valid_count` first elements of each row are non-NaN.
+
+    Gives the same result as np.nanpercentile(), but reuses the sorted array for
+    several percentiles.
+    """
+    position = (valid_count - 1) * (percentile / 100.0)
+    lower = np.clip(np.floor(position).astype(int), 0, None)
+    upper = np.minimum(lower + 1, np.clip(valid_count - 1, 0, None))
+    lower_values = np.take_along_axis(sorted_values, lower[..., np.newaxis], axis=-1)
+    upper_values = np.take_along_axis(sorted_values, upper[..., np.newaxis], axis=-1)
+    fraction = (position - lower)[..., np.newaxis]
+    values = (lower_values + (upper_values - lower_values) * fraction)[..., 0]
+    return np.where(valid_count > 0, values, np.nan)
+
+
+def compute_vectors_statistics_df(vectors_df: pd.DataFrame) -> pd.DataFrame:
+    """Compute statistics across realizations for each date and vector in a vectors
+    dataframe with columns ["DATE", "REAL", vector1, ... , vectorN].
+
+    The values are arranged into a (vector, date, realization) array, which is sorted
+    once along the realization axis. All statistics are computed from the sorted array,
+    ignoring NaN values, i.e. missing realizations for a date.
+
+    The returned dataframe has a two level column index, with ("DATE", "") and
+    (vector, VectorStatistic) for each vector and statistic. The dates are sorted in
+    ascending order and the P10/P90 follows the oil industry convention, i.e. P10 is the
+    90th percentile and P90 is the 10th percentile.
+    """
+    vector_names: List[str] = [
+        col for col in vectors_df.columns if col not in ["DATE", "REAL"]
+    ]
+    columns = [("DATE", "")] + [
+        (vector, statistic) for vector in vector_names for statistic in VectorStatistic
+    ]
+    if vectors_df.empty:
+        return pd.DataFrame(columns=pd.MultiIndex.from_tuples(columns))
+
+    date_codes, unique_dates = pd.factorize(vectors_df["DATE"], sort=True)
+    real_codes, unique_reals = pd.factorize(vectors_df["REAL"], sort=True)
+
+    values = np.full((len(vector_names), len(unique_dates), len(unique_reals)), np.nan)
+    values[:, date_codes, real_codes] = vectors_df[vector_names].to_numpy(float).T
+
+    # NaN values are sorted to the end of each row
+    sorted_values = np.sort(values, axis=-1)
+    valid_count = np.count_nonzero(~np.isnan(values), axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(sorted_values, axis=-1) / valid_count
+    last_valid = np.clip(valid_count - 1, 0, None)[..., np.newaxis]
+
+    statistics = {
+        VectorStatistic.MEAN: np.where(valid_count > 0, mean, np.nan),
+        VectorStatistic.MIN: sorted_values[..., 0],
+        VectorStatistic.MAX: np.take_along_axis(sorted_values, last_valid, axis=-1)[
+            ..., 0
+        ],
+        # Invert p10 and p90 due to oil industry convention.
+        VectorStatistic.P10: _percentile_of_sorted(sorted_values, valid_count, 90),
+        VectorStatistic.P90: _percentile_of_sorted(sorted_values, valid_count, 10),
+        VectorStatistic.P50: _percentile_of_sorted(sorted_values, valid_count, 50),
+    }
+
+    data = [np.asarray(unique_dates)]
+    for index in range(len(vector_names)):
+        data.extend(statistics[statistic][index] for statistic in VectorStatistic)
+
+    statistics_df = pd.DataFrame(dict(zip(range(len(data)), data)))
+    statistics_df.columns = pd.MultiIndex.from_tuples(columns)
+    return statistics_df
@@ -0,0 +1,58 @@
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from ._precision import compare_providers_per_vector
+from .ensemble_summary_provider import Frequency, StoragePrecision
+from .ensemble_summary_provider_factory import EnsembleSummaryProviderFactory
+
+
+def main() -> None:
+    print()
+    print("## Running validation of FLOAT32 vs FLOAT64 lazy provider")
+    print("## =================================================")
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)-3s [%(name)s]: %(message)s",
+    )
+    logging.getLogger("webviz_subsurface").setLevel(level=logging.INFO)
+
+    root_storage_dir = Path("/home/sigurdp/buf/webviz_storage_dir")
+
+    ensemble_path = "../webviz-subsurface-testdata/01_drogon_ahm/realization-*/iter-0"
+    rel_file_pattern = "share/results/unsmry/*.arrow"
+
+    # frequency = None
+    frequency = Frequency.MONTHLY
+
+    print()
+    print("## root_storage_dir:", root_storage_dir)
+    print("## ensemble_path:", ensemble_path)
+    print("## frequency:", frequency)
+    print()
+
+    factory = EnsembleSummaryProviderFactory(
+        root_storage_dir, allow_storage_writes=True
+    )
+    reference_provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, rel_file_pattern, StoragePrecision.FLOAT64
+    )
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, rel_file_pattern, StoragePrecision.FLOAT32
+    )
+
+    errors_df = compare_providers_per_vector(reference_provider, provider, frequency)
+
+    with pd.option_context("display.max_rows", 50):
+        print(errors_df)
+    print()
+    print("## max relative error:", errors_df["MAX_REL_ERROR"].max())
+    print("## done")
+
+
+# Running:
+# python -m webviz_subsurface._providers.ensemble_summary_provider.dev_lazy_provider_precision
+if __name__ == "__main__":
+    main()
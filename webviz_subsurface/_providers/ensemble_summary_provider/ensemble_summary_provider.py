@@ -7,6 +7,9 @@ import pandas as pd
 
 from webviz_subsurface._utils.enum_shim import StrEnum
 
+from ._vector_catalog import VectorCatalog
+from ._vector_statistics import compute_vectors_statistics_df
+
 
 class Frequency(StrEnum):
     DAILY = "daily"
@@ -23,6 +26,13 @@ class Frequency(StrEnum):
             return None
 
 
+class StoragePrecision(StrEnum):
+    """Precision of the vector values in the backing store of a provider"""
+
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+
+
 @dataclass(frozen=True)
 class VectorMetadata:
     unit: str
@@ -40,6 +50,20 @@ class EnsembleSummaryProvider(abc.ABC):
     def vector_names(self) -> List[str]:
         """Returns list of all available vector names."""
 
+    def vector_catalog(self) -> VectorCatalog:
+        """Returns catalog of the available vector names, for queries on wildcards,
+        keywords and well/group names without scanning all the vector names.
+
+        The catalog is created on the first call and kept by the provider, as the
+        available vector names do not change.
+        """
+        catalog: Optional[VectorCatalog] = getattr(self, "_cached_vector_catalog", None)
+        if catalog is None:
+            catalog = VectorCatalog(self.vector_names())
+            # pylint: disable=attribute-defined-outside-init
+            self._cached_vector_catalog = catalog
+        return catalog
+
     @abc.abstractmethod
     def vector_names_filtered_by_value(
         self,
@@ -67,6 +91,15 @@ class EnsembleSummaryProvider(abc.ABC):
         the resampling_frequency parameter in `dates()` and `get_vectors_df()`.
         """
 
+    def supports_per_interval_and_per_day_vectors(self) -> bool:
+        """Returns True if this provider can compute PER_INTVL_ and PER_DAY_ vectors.
+        Such a provider accepts vector names prefixed with PER_INTVL_ or PER_DAY_ in
+        `get_vectors_df()`, when the remainder of the name is a cumulative vector. The
+        vectors are the change of the cumulative vector from each date to the next, and
+        for PER_DAY_ divided by the number of days in between.
+        """
+        return False
+
     @abc.abstractmethod
     def dates(
         self,
@@ -100,6 +133,25 @@ class EnsembleSummaryProvider(abc.ABC):
         to columns for all the requested vectors.
         """
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Returns a Pandas DataFrame with statistics across the realizations for the
+        vectors specified in `vector_names.`
+
+        The `resampling_frequency` and `realizations` parameters are treated as in
+        `get_vectors_df()`. The returned DataFrame has a two level column index, with a
+        ('DATE', '') column and a (vector, statistic) column for each of the requested
+        vectors and each `VectorStatistic`. Following the oil industry convention, P10 is
+        the 90th percentile and P90 is the 10th percentile.
+        """
+        return compute_vectors_statistics_df(
+            self.get_vectors_df(vector_names, resampling_frequency, realizations)
+        )
+
     @abc.abstractmethod
     def get_vectors_for_date_df(
         self,
@@ -16,7 +16,7 @@ from ._csv_import import load_ensemble_summary_csv_file
 from ._provider_impl_arrow_lazy import ProviderImplArrowLazy
 from ._provider_impl_arrow_presampled import ProviderImplArrowPresampled
 from ._resampling import Frequency, resample_single_real_table
-from .ensemble_summary_provider import EnsembleSummaryProvider
+from .ensemble_summary_provider import EnsembleSummaryProvider, StoragePrecision
 
 LOGGER = logging.getLogger(__name__)
 
@@ -184,7 +184,10 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         return provider
 
     def create_from_arrow_unsmry_lazy(
-        self, ens_path: str, rel_file_pattern: str
+        self,
+        ens_path: str,
+        rel_file_pattern: str,
+        storage_precision: StoragePrecision = StoragePrecision.FLOAT64,
     ) -> EnsembleSummaryProvider:
         """Create EnsembleSummaryProvider from per-realization unsmry data in .arrow format.
 
@@ -193,6 +196,10 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         pattern is relative to each realization's `runpath`.
         Typically the file pattern will be: "share/results/unsmry/*.arrow"
 
+        The `storage_precision` parameter controls the precision of the vector values in
+        the backing store. FLOAT32 halves the storage and memory footprint of the
+        provider, while the returned data are still float64.
+
         The returned summary provider supports lazy resampling.
         """
 
@@ -201,6 +208,8 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         storage_key = (
             f"arrow_unsmry_lazy__{_make_hash_string(ens_path + rel_file_pattern)}"
         )
+        if storage_precision != StoragePrecision.FLOAT64:
+            storage_key += f"__{storage_precision.value}"
         provider = ProviderImplArrowLazy.from_backing_store(
             self._storage_dir, storage_key
         )
@@ -229,7 +238,7 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
 
         try:
             ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
-                self._storage_dir, storage_key, per_real_tables
+                self._storage_dir, storage_key, per_real_tables, storage_precision
             )
         except ValueError as exc:
             raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
@@ -1,5 +1,3 @@
-import fnmatch
-import re
 from typing import List
 
 from .ensemble_summary_provider import EnsembleSummaryProvider
@@ -17,8 +15,4 @@ def get_matching_vector_names(
     df = provider.get_vectors_df(matching_vector_names, None)
 
     """
-    regex = re.compile(
-        "|".join([fnmatch.translate(col) for col in column_keys]),
-        flags=re.IGNORECASE,
-    )
-    return [vec for vec in provider.vector_names() if regex.fullmatch(vec)]
+    return provider.vector_catalog().match(column_keys)
@@ -0,0 +1,239 @@
+import enum
+import functools
+import inspect
+import pathlib
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar, cast
+
+import numpy as np
+import pandas as pd
+import xtgeo
+import xxhash
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Fingerprints of objects registered as immutable, keyed by the id of the object
+_IMMUTABLE_FINGERPRINTS: Dict[int, str] = {}
+
+
+def _update_with_array(hasher: Any, array: np.ndarray) -> None:
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    if array.dtype.hasobject:
+        array = pd.util.hash_array(array.ravel())
+    hasher.update(np.ascontiguousarray(array).view(np.uint8).data)
+
+
+def _update_with_series_values(hasher: Any, series: pd.Series) -> None:
+    values = series.to_numpy()
+    if not isinstance(values, np.ndarray) or values.dtype.hasobject:
+        # Object and extension dtypes, e.g. strings and categoricals
+        values = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    _update_with_array(hasher, values)
+
+
+def _update_with_index(hasher: Any, index: pd.Index) -> None:
+    if isinstance(index, pd.RangeIndex):
+        hasher.update(f"RangeIndex{index.start},{index.stop},{index.step}".encode())
+        return
+    hasher.update(repr(list(index.names)).encode())
+    _update_with_array(
+        hasher, pd.util.hash_pandas_object(index, index=False).to_numpy()
+    )
+
+
+# pylint: disable=too-many-branches
+def _update_fingerprint(hasher: Any, obj: Any) -> None:
+    """Update hasher with the type and content of obj"""
+    hasher.update(type(obj).__qualname__.encode())
+    immutable_fingerprint = _IMMUTABLE_FINGERPRINTS.get(id(obj))
+    if immutable_fingerprint is not None:
+        hasher.update(f"immutable{immutable_fingerprint}".encode())
+    elif obj is None or isinstance(
+        obj, (str, bytes, int, float, complex, enum.Enum, pathlib.PurePath)
+    ):
+        hasher.update(repr(obj).encode())
+    elif isinstance(obj, pd.DataFrame):
+        _update_with_index(hasher, obj.columns)
+        _update_with_index(hasher, obj.index)
+        for _, column in obj.items():
+            _update_with_series_values(hasher, column)
+    elif isinstance(obj, pd.Series):
+        hasher.update(repr(obj.name).encode())
+        _update_with_index(hasher, obj.index)
+        _update_with_series_values(hasher, obj)
+    elif isinstance(obj, pd.Index):
+        _update_with_index(hasher, obj)
+    elif isinstance(obj, np.ndarray):
+        _update_with_array(hasher, obj)
+    elif isinstance(obj, np.generic):
+        hasher.update(repr(obj.item()).encode())
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(str(len(obj)).encode())
+        for item in obj:
+            _update_fingerprint(hasher, item)
+    elif isinstance(obj, dict):
+        hasher.update(str(len(obj)).encode())
+        for key, value in obj.items():
+            _update_fingerprint(hasher, key)
+            _update_fingerprint(hasher, value)
+    elif isinstance(obj, (set, frozenset)):
+        hasher.update(repr(sorted(repr(item) for item in obj)).encode())
+    elif isinstance(obj, xtgeo.Well):
+        hasher.update(repr(obj.name).encode())
+        _update_fingerprint(hasher, obj.dataframe)
+    elif isinstance(obj, xtgeo.RegularSurface):
+        hasher.update(
+            repr(
+                (obj.ncol, obj.nrow, obj.xori, obj.yori, obj.xinc, obj.yinc)
+                + (obj.rotation, obj.yflip)
+            ).encode()
+        )
+        _update_with_array(hasher, np.ma.getdata(obj.values))
+        _update_with_array(hasher, np.ma.getmaskarray(obj.values))
+    else:
+        # Same as the key of flask_caching, e.g. for dataclasses and plain objects
+        hasher.update(repr(obj).encode())
+
+
+def fingerprint(*objs: Any) -> str:
+    """Hash of the content of the objects, e.g. DataFrames, numpy arrays, xtgeo wells and
+    surfaces and (nested) builtin containers of such objects.
+
+    Arrays and numeric columns are hashed from their memory buffers, with the dtype and
+    shape included. Objects not known by type are hashed by their repr().
+    """
+    hasher = xxhash.xxh3_128()
+    for obj in objs:
+        _update_fingerprint(hasher, obj)
+    return hasher.hexdigest()
+
+
+def register_immutable(obj: T) -> T:
+    """Fingerprint obj once, and reuse the fingerprint whenever this object is hashed,
+    e.g. as an argument of a `content_memoize` function, instead of hashing its content
+    again. Intended for large static data like the DataFrame of a plugin, which must not
+    be modified after it is registered.
+
+    The object must support weak references, e.g. DataFrames and numpy arrays. The
+    registration is removed when the object is garbage collected. Returns obj.
+    """
+    key = id(obj)
+    _IMMUTABLE_FINGERPRINTS[key] = fingerprint(obj)
+    weakref.finalize(obj, _IMMUTABLE_FINGERPRINTS.pop, key, None)
+    return obj
+
+
+def _estimate_nbytes(obj: Any) -> int:
+    """Estimate of the memory used by obj, counting the buffers of arrays and frames"""
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        memory_usage = obj.memory_usage(index=True, deep=False)
+        return int(np.sum(memory_usage))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(_estimate_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _estimate_nbytes(key) + _estimate_nbytes(value)
+            for key, value in obj.items()
+        )
+    return sys.getsizeof(obj)
+
+
+class _ByteSizeLruCache:
+    """Thread safe least recently used cache, with a budget on the total size of the
+    cached values in bytes.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return (False, None)
+            self._entries.move_to_end(key)
+            return (True, entry[0])
+
+    def put(self, key: Hashable, value: Any) -> None:
+        nbytes = _estimate_nbytes(value)
+        if nbytes > self._max_bytes:
+            return
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._total_bytes -= old_entry[1]
+            self._entries[key] = (value, nbytes)
+            self._total_bytes += nbytes
+            while self._total_bytes > self._max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def content_memoize(
+    func: Optional[F] = None, *, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Any:
+    """Memoize function in-process, with the arguments keyed on their content.
+
+    Alternative to `CACHE.memoize()` for functions with large arguments like DataFrames,
+    numpy arrays and xtgeo objects, which flask_caching keys on their repr(). The repr()
+    of such objects is slow, and truncated for large objects such that different
+    arguments can give the same key. The arguments are bound to the signature of the
+    function, such that positional and keyword arguments give the same key.
+
+    The results are kept in the process without pickling, and the least recently used
+    results are evicted when the size of the results exceeds `max_bytes`. As the results
+    are not copied, callers must not modify a returned result.
+
+    The decorated function has a `cache_clear()` function, and a `cache` attribute with
+    the cache of the results.
+
+    Usage: `@content_memoize` or `@content_memoize(max_bytes=2**30)`.
+    """
+
+    def decorator(function: F) -> F:
+        signature = inspect.signature(function)
+        cache = _ByteSizeLruCache(max_bytes)
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            key = fingerprint(bound_arguments.arguments)
+
+            found, result = cache.get(key)
+            if found:
+                return result
+            result = function(*args, **kwargs)
+            cache.put(key, result)
+            return result
+
+        setattr(wrapper, "cache", cache)
+        setattr(wrapper, "cache_clear", cache.clear)
+        return cast(F, wrapper)
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,178 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Union
+
+import numpy as np
+import pandas as pd
+
+
+# pylint: disable=too-many-locals
+def _pairwise_pearson(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pearson correlation of each column of y with each column of x, using the rows
+    where both values are valid for each pair of columns, as `pd.DataFrame.corr()`.
+
+    `Input:`
+    * x: np.ndarray - values of shape (n_rows, n_x)
+    * y: np.ndarray - values of shape (n_rows, n_y)
+
+    `Return:`
+    Correlations of shape (n_y, n_x). NaN for pairs with less than two valid rows or
+    with a constant column.
+    """
+    x_valid = ~np.isnan(x)
+    y_valid = ~np.isnan(y)
+
+    # Center the columns to reduce cancellation in the sums below. The correlation is
+    # not affected by the shift.
+    x = np.where(x_valid, x, 0.0)
+    y = np.where(y_valid, y, 0.0)
+    x = np.where(x_valid, x - x.sum(axis=0) / np.maximum(x_valid.sum(axis=0), 1), 0.0)
+    y = np.where(y_valid, y - y.sum(axis=0) / np.maximum(y_valid.sum(axis=0), 1), 0.0)
+
+    # Sums over the rows valid for each pair of columns, as matrix products
+    x_weights = x_valid.astype(np.float64)
+    y_weights = y_valid.astype(np.float64)
+    count = y_weights.T @ x_weights
+    sum_x = y_weights.T @ x
+    sum_y = y.T @ x_weights
+    sum_xx = y_weights.T @ (x * x)
+    sum_yy = (y * y).T @ x_weights
+    sum_xy = y.T @ x
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = sum_xy - sum_x * sum_y / count
+        variance_x = sum_xx - sum_x * sum_x / count
+        variance_y = sum_yy - sum_y * sum_y / count
+        correlation = covariance / np.sqrt(variance_x * variance_y)
+    correlation[(count < 2) | (variance_x <= 0) | (variance_y <= 0)] = np.nan
+    return np.clip(correlation, -1.0, 1.0)
+
+
+def _standardized(values: np.ndarray) -> np.ndarray:
+    """Columns centered and scaled to unit norm, NaN for constant columns"""
+    centered = values - values.mean(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return centered / np.sqrt((centered * centered).sum(axis=0))
+
+
+def correlate_against(
+    matrix: pd.DataFrame,
+    responses: Union[pd.Series, pd.DataFrame],
+    method: str = "pearson",
+) -> Union[pd.Series, pd.DataFrame]:
+    """Correlations of each column of `matrix`, e.g. parameters, with a response or with
+    each column of a batch of responses, without computing the full correlation matrix.
+
+    `Input:`
+    * matrix: pd.DataFrame - numeric columns to correlate against, e.g. one row per
+    realization
+    * responses: pd.Series or pd.DataFrame - response, or responses as columns, with
+    rows matched to the rows of `matrix` on the index
+    * method: str - "pearson", or "spearman" for Pearson correlation of the ranks
+
+    The rows in both `matrix` and `responses` are used. The matrix is standardized once,
+    and correlated with all responses with one matrix product. If there are NaN values,
+    they are excluded per pair of columns with masks, as for `pd.DataFrame.corr()`. For
+    "spearman", the values are ranked per column before excluding NaN values, as for
+    `pd.DataFrame.rank().corr()`.
+
+    `Return:`
+    Series of correlations with the columns of `matrix` as index for a Series response,
+    or DataFrame with the responses as index and the columns of `matrix` as columns.
+    NaN for pairs with less than two valid rows or with a constant column.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(
+            f"Correlation method {method} is invalid. "
+            "Available methods are 'pearson' and 'spearman'"
+        )
+    response_df = (
+        responses.to_frame() if isinstance(responses, pd.Series) else responses
+    )
+    matrix, response_df = matrix.align(response_df, join="inner", axis=0)
+    matrix = matrix.astype(np.float64)
+    response_df = response_df.astype(np.float64)
+    if method == "spearman":
+        matrix = matrix.rank()
+        response_df = response_df.rank()
+
+    x = matrix.to_numpy()
+    y = response_df.to_numpy()
+    if np.isnan(x).any() or np.isnan(y).any():
+        correlations = _pairwise_pearson(x, y)
+    else:
+        correlations = _standardized(y).T @ _standardized(x)
+        if len(x) < 2:
+            correlations[:] = np.nan
+        correlations = np.clip(correlations, -1.0, 1.0)
+
+    if isinstance(responses, pd.Series):
+        return pd.Series(correlations[0], index=matrix.columns, name=responses.name)
+    return pd.DataFrame(correlations, index=response_df.columns, columns=matrix.columns)
+
+
+def create_correlation_cube(
+    response_df: pd.DataFrame,
+    parameter_df: pd.DataFrame,
+    response: str,
+    parameters: List[str],
+    method: str = "pearson",
+    aggregation: str = "mean",
+) -> pd.DataFrame:
+    """Correlations of a response with parameters at all dates, computed at once.
+
+    `Input:`
+    * response_df: pd.DataFrame - response with columns "REAL", "DATE" and `response`
+    * parameter_df: pd.DataFrame - parameters with columns "REAL" and `parameters`
+    * response: str - name of response column
+    * parameters: List[str] - names of parameter columns
+    * method: str - "pearson", or "spearman" for Pearson correlation of the ranks
+    * aggregation: str - aggregation of the response values of a realization and date if
+    several, "sum" or "mean"
+
+    The responses of all dates are correlated with the parameters in one pass with
+    `correlate_against()`, with the realizations in both dataframes.
+
+    `Return:`
+    DataFrame of correlations with the dates as index and the parameters as columns.
+    """
+    response_matrix = (
+        response_df.groupby(["REAL", "DATE"])[response].agg(aggregation).unstack()
+    )
+    return correlate_against(
+        parameter_df.set_index("REAL")[parameters], response_matrix, method
+    )
+
+
+def sort_by_absolute_value(correlations: pd.Series) -> pd.Series:
+    """Sort correlations by absolute value in ascending order"""
+    return correlations.reindex(correlations.abs().sort_values().index)
+
+
+class CorrelationCubeCache:
+    """Thread safe least recently used cache of correlation cubes, e.g. keyed by
+    ensemble, response and correlation method.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self, key: Hashable, create_cube: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Cached cube of the key, or the cube created with `create_cube()` if not
+        cached. The returned cube must not be modified.
+        """
+        with self._lock:
+            cube = self._entries.get(key)
+            if cube is not None:
+                self._entries.move_to_end(key)
+                return cube
+        cube = create_cube()
+        with self._lock:
+            self._entries[key] = cube
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return cube
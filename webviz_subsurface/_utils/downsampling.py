@@ -0,0 +1,76 @@
+import numpy as np
+
+
+# pylint: disable=too-many-locals
+def lttb_downsample_indices(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> np.ndarray:
+    """Select points of one or more lines with the Largest-Triangle-Three-Buckets
+    algorithm, keeping the visual shape of the lines with at most `max_points` points.
+
+    `Input:`
+    * x: np.ndarray - x values of shape (n_points,), shared by all lines, sorted in
+    ascending order
+    * y: np.ndarray - y values of shape (n_lines, n_points), e.g. one line per realization
+    * max_points: int - max number of points to keep per line, at least 3
+
+    The first and last points are always kept. The interior points are split into
+    `max_points - 2` buckets, and from each bucket the point forming the largest triangle
+    with the previously selected point and the average of the next bucket is kept. The
+    selection is done for all lines at once, one bucket at a time. NaN values are only
+    selected if all values of a bucket are NaN.
+
+    `Return:`
+    Indices of the kept points of shape (n_lines, n_kept), sorted in ascending order per
+    line, where n_kept = min(n_points, max_points).
+    """
+    if max_points < 3:
+        raise ValueError(f"Expected max_points to be at least 3, got {max_points}")
+
+    n_lines, n_points = y.shape
+    if n_points <= max_points:
+        return np.tile(np.arange(n_points), (n_lines, 1))
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+
+    # Bucket edges of the interior points, i.e. excluding the first and last point
+    n_buckets = max_points - 2
+    edges = np.floor(np.linspace(1, n_points - 1, n_buckets + 1)).astype(int)
+
+    # Prefix sums for the average of each bucket, with NaN values excluded
+    is_valid = ~np.isnan(y)
+    y_cumsum = np.zeros((n_lines, n_points + 1))
+    y_cumsum[:, 1:] = np.cumsum(np.where(is_valid, y, 0.0), axis=1)
+    count_cumsum = np.zeros((n_lines, n_points + 1))
+    count_cumsum[:, 1:] = np.cumsum(is_valid, axis=1)
+
+    rows = np.arange(n_lines)
+    indices = np.empty((n_lines, max_points), dtype=int)
+    indices[:, 0] = 0
+    indices[:, -1] = n_points - 1
+    for bucket in range(n_buckets):
+        start, end = edges[bucket], edges[bucket + 1]
+
+        # Average of the next bucket, which is the last point for the last bucket
+        next_start = end
+        next_end = edges[bucket + 2] if bucket + 2 <= n_buckets else n_points
+        next_count = count_cumsum[:, next_end] - count_cumsum[:, next_start]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            next_y = (y_cumsum[:, next_end] - y_cumsum[:, next_start]) / next_count
+        next_x = x[next_start:next_end].mean()
+
+        prev_index = indices[:, bucket]
+        prev_x = x[prev_index][:, np.newaxis]
+        prev_y = y[rows, prev_index][:, np.newaxis]
+
+        # Twice the area of the triangles formed with each point in the bucket
+        areas = np.abs(
+            (prev_x - next_x) * (y[:, start:end] - prev_y)
+            - (prev_x - x[start:end]) * (next_y[:, np.newaxis] - prev_y)
+        )
+        indices[:, bucket + 1] = start + np.argmax(
+            np.where(np.isnan(areas), -1.0, areas), axis=1
+        )
+
+    return indices
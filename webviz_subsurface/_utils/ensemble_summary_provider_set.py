@@ -1,5 +1,18 @@
 import datetime
-from typing import Dict, ItemsView, List, Optional, Sequence, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    ItemsView,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
+
+import pandas as pd
 
 from webviz_subsurface._providers import (
     EnsembleSummaryProvider,
@@ -7,6 +20,44 @@ from webviz_subsurface._providers import (
     VectorMetadata,
 )
 
+T = TypeVar("T")
+
+# Max number of providers queried concurrently
+MAX_CONCURRENT_PROVIDER_QUERIES = 8
+
+# Thread pool shared by all provider queries, created on first use
+_PROVIDER_QUERY_THREAD_NAME_PREFIX = "provider_query"
+_PROVIDER_QUERY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PROVIDER_QUERY_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_provider_query_executor() -> ThreadPoolExecutor:
+    # pylint: disable=global-statement
+    global _PROVIDER_QUERY_EXECUTOR
+    with _PROVIDER_QUERY_EXECUTOR_LOCK:
+        if _PROVIDER_QUERY_EXECUTOR is None:
+            _PROVIDER_QUERY_EXECUTOR = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_PROVIDER_QUERIES,
+                thread_name_prefix=_PROVIDER_QUERY_THREAD_NAME_PREFIX,
+            )
+        return _PROVIDER_QUERY_EXECUTOR
+
+
+def map_concurrently(function: Callable[..., T], items: Sequence) -> List[T]:
+    """Call function for each item in a bounded thread pool, and return the results in
+    the order of the items. Intended for provider queries, where the reading and
+    resampling of data mostly releases the GIL.
+
+    A single item, or a call from within the thread pool, is handled in the calling
+    thread, so that nested calls never wait for a worker of the same pool.
+    """
+    if len(items) <= 1 or threading.current_thread().name.startswith(
+        _PROVIDER_QUERY_THREAD_NAME_PREFIX
+    ):
+        return [function(item) for item in items]
+
+    return list(_get_provider_query_executor().map(function, items))
+
 
 class EnsembleSummaryProviderSet:
     """
@@ -18,6 +69,8 @@ class EnsembleSummaryProviderSet:
         - Assuming same implementation of EnsembleSummaryProvider interface across
         all providers in set. There is no guarantee of functionality if various
         provider implementations are mixed in the same set.
+        - Queries across several providers are performed concurrently in a bounded
+        thread pool, as reading and resampling of provider data mostly releases the GIL.
     """
 
     def __init__(self, provider_dict: Dict[str, EnsembleSummaryProvider]) -> None:
@@ -49,7 +102,7 @@ class EnsembleSummaryProviderSet:
 
             # Retrieve vector metadata from providers
             for name, provider in self._provider_dict.items():
-                if vector_name in provider.vector_names():
+                if vector_name in provider.vector_catalog():
                     vector_provider_metadata_dict[name] = provider.vector_metadata(
                         vector_name
                     )
@@ -110,11 +163,65 @@ class EnsembleSummaryProviderSet:
     ) -> List[datetime.datetime]:
         """List with the union of dates among providers"""
         dates_union: Set[datetime.datetime] = set()
-        for provider in self.all_providers():
-            _dates = set(provider.dates(resampling_frequency, None))
+        for _dates in self.dates_per_provider(resampling_frequency).values():
             dates_union.update(_dates)
         return list(sorted(dates_union))
 
+    def map_providers(
+        self,
+        function: Callable[[EnsembleSummaryProvider], T],
+        provider_names: Optional[Sequence[str]] = None,
+    ) -> Dict[str, T]:
+        """Call function for each provider concurrently
+
+        `return:`
+        Dictionary with the result per provider name, in the order of `provider_names`.
+        All providers in set if `provider_names` is None.
+        """
+        names = self._names if provider_names is None else list(provider_names)
+        results = map_concurrently(function, [self.provider(name) for name in names])
+        return dict(zip(names, results))
+
+    def dates_per_provider(
+        self,
+        resampling_frequency: Optional[Frequency],
+        provider_names: Optional[Sequence[str]] = None,
+    ) -> Dict[str, List[datetime.datetime]]:
+        """Dates per provider, queried concurrently"""
+        return self.map_providers(
+            lambda provider: provider.dates(resampling_frequency, None),
+            provider_names,
+        )
+
+    def get_vectors_dfs(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+        provider_names: Optional[Sequence[str]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Vectors dataframe per provider, queried concurrently
+
+        Each provider is queried for the vectors among `vector_names` which exist in the
+        provider, and providers without any of the vectors are not included in the
+        returned dictionary.
+        """
+
+        def _get_provider_vectors_df(provider: EnsembleSummaryProvider) -> pd.DataFrame:
+            provider_vector_names = set(provider.vector_names())
+            return provider.get_vectors_df(
+                [vector for vector in vector_names if vector in provider_vector_names],
+                resampling_frequency,
+                realizations,
+            )
+
+        names = [
+            name
+            for name in (self._names if provider_names is None else provider_names)
+            if not set(vector_names).isdisjoint(self.provider(name).vector_names())
+        ]
+        return self.map_providers(_get_provider_vectors_df, names)
+
     def all_realizations(self) -> List[int]:
         """List with the union of realizations among providers"""
         return self._all_realizations
@@ -133,7 +240,7 @@ class EnsembleSummaryProviderSet:
             (
                 provider.vector_metadata(vector)
                 for provider in self._provider_dict.values()
-                if vector in provider.vector_names()
+                if vector in provider.vector_catalog()
                 and provider.vector_metadata(vector)
             ),
             None,
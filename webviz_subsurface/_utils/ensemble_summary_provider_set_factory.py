@@ -5,6 +5,7 @@ from webviz_subsurface._providers import (
     EnsembleSummaryProvider,
     EnsembleSummaryProviderFactory,
     Frequency,
+    StoragePrecision,
 )
 
 from .ensemble_summary_provider_set import EnsembleSummaryProviderSet
@@ -13,6 +14,7 @@ from .ensemble_summary_provider_set import EnsembleSummaryProviderSet
 def create_lazy_ensemble_summary_provider_set_from_paths(
     name_path_dict: Dict[str, Path],
     rel_file_pattern: str,
+    storage_precision: StoragePrecision = StoragePrecision.FLOAT64,
 ) -> EnsembleSummaryProviderSet:
     """Create set of ensemble summary providers with lazy (on-demand) resampling/interpolation,
     from dictionary of ensemble name and corresponding arrow file paths
@@ -21,6 +23,8 @@ def create_lazy_ensemble_summary_provider_set_from_paths(
     * name_path_dict: Dict[str, Path] - ensemble name as key and arrow file path as value
     * rel_file_pattern: str - specify a relative (per realization) file pattern to find the
     wanted .arrow files within each realization
+    * storage_precision: StoragePrecision - precision of the vector values in the backing
+    store of the providers
 
     `Return:`
     Provider set with ensemble summary providers with lazy (on-demand) resampling/interpolation
@@ -29,7 +33,7 @@ def create_lazy_ensemble_summary_provider_set_from_paths(
     provider_dict: Dict[str, EnsembleSummaryProvider] = {}
     for name, path in name_path_dict.items():
         provider_dict[name] = provider_factory.create_from_arrow_unsmry_lazy(
-            str(path), rel_file_pattern
+            str(path), rel_file_pattern, storage_precision
         )
     return EnsembleSummaryProviderSet(provider_dict)
 
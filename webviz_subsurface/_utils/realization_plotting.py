@@ -0,0 +1,43 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def concatenate_realization_lines(
+    samples: np.ndarray, values: np.ndarray, realizations: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenate the lines of all realizations into one line, with a NaN value
+    separating the realizations. Plotly does not connect points across NaN values, thus
+    all realizations can be rendered as one trace.
+
+    `Input:`
+    * samples: np.ndarray - x values, e.g. dates, of all realizations
+    * values: np.ndarray - y values of all realizations
+    * realizations: np.ndarray - realization number of each value
+
+    The samples of a realization are kept in the given order. The realizations are
+    ordered by realization number.
+
+    `Return:`
+    Tuple of (samples, values, realizations) with a separator point after each
+    realization except the last. A separator point has the sample and realization of the
+    preceding point and a NaN value, such that the samples stay sorted per realization
+    and of the same type.
+    """
+    if not len(samples) == len(values) == len(realizations):
+        raise ValueError(
+            "Expected equal number of samples, values and realizations, got "
+            f"{len(samples)}, {len(values)} and {len(realizations)}"
+        )
+
+    order = np.argsort(realizations, kind="stable")
+    samples = np.asarray(samples)[order]
+    values = np.asarray(values, dtype=np.float64)[order]
+    realizations = np.asarray(realizations)[order]
+
+    ends = np.flatnonzero(realizations[1:] != realizations[:-1]) + 1
+    return (
+        np.insert(samples, ends, samples[ends - 1]),
+        np.insert(values, ends, np.nan),
+        np.insert(realizations, ends, realizations[ends - 1]),
+    )
@@ -0,0 +1,154 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Sequence, Tuple, cast
+
+import numpy as np
+import pandas as pd
+import scipy.sparse
+
+
+def create_membership_matrix(
+    group_vectors: Dict[str, List[str]]
+) -> Tuple[List[str], scipy.sparse.csr_matrix]:
+    """Sparse membership matrix of region vectors in groups, e.g. of ROIP:1..N in the
+    zones or regions of a FIP array.
+
+    `Return:`
+    Tuple of the unique vectors of all groups, and a matrix of shape
+    (n_groups, n_vectors) with the number of times the vector is listed for the group,
+    i.e. normally 1, in the row of each group.
+    """
+    vector_columns: Dict[str, int] = {}
+    rows: List[int] = []
+    columns: List[int] = []
+    for row, vectors in enumerate(group_vectors.values()):
+        for vector in vectors:
+            rows.append(row)
+            columns.append(vector_columns.setdefault(vector, len(vector_columns)))
+    # Duplicate entries are summed when converted to csr
+    membership = scipy.sparse.coo_matrix(
+        (np.ones(len(rows)), (rows, columns)),
+        shape=(len(group_vectors), len(vector_columns)),
+    ).tocsr()
+    return list(vector_columns), membership
+
+
+def aggregate_region_values(
+    values: np.ndarray, membership: scipy.sparse.csr_matrix
+) -> np.ndarray:
+    """Sum of the values of the region vectors in each group, with one sparse matrix
+    product for all rows.
+
+    `Input:`
+    * values: np.ndarray - values of shape (n_rows, n_vectors), e.g. one row per
+    realization and date
+    * membership: scipy.sparse.csr_matrix - membership matrix of shape
+    (n_groups, n_vectors), see `create_membership_matrix()`
+
+    NaN values are skipped, as for `pd.DataFrame.sum()`, thus a group with only NaN
+    values, or without any vectors, is 0.
+
+    `Return:`
+    Aggregated values of shape (n_rows, n_groups)
+    """
+    values = np.where(np.isnan(values), 0.0, values)
+    return np.asarray(membership.dot(values.T)).T
+
+
+class RegionVectorAggregator:
+    """Aggregation of region vectors into groups of regions, e.g. of ROIP:1..N into the
+    zones of FIPNUM.
+
+    The membership matrix is cached per selection of groups, and the aggregated data per
+    selection of groups and ensemble. The summary data of an ensemble is assumed to not
+    change during the lifetime of the aggregator.
+    """
+
+    # Max number of membership matrices and of aggregated ensemble frames kept in memory
+    CACHE_SIZE = 32
+
+    def __init__(self) -> None:
+        self._membership_cache: OrderedDict = OrderedDict()
+        self._aggregated_cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_cached(self, cache: OrderedDict, key: Hashable) -> Any:
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _put_cached(self, cache: OrderedDict, key: Hashable, value: Any) -> None:
+        with self._lock:
+            cache[key] = value
+            if len(cache) > RegionVectorAggregator.CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _membership(
+        self, group_vectors: Dict[str, List[str]]
+    ) -> Tuple[List[str], scipy.sparse.csr_matrix]:
+        key = tuple((group, tuple(vectors)) for group, vectors in group_vectors.items())
+        membership = self._get_cached(self._membership_cache, key)
+        if membership is None:
+            membership = create_membership_matrix(group_vectors)
+            self._put_cached(self._membership_cache, key, membership)
+        return cast(Tuple[List[str], scipy.sparse.csr_matrix], membership)
+
+    def aggregate(
+        self,
+        smry: pd.DataFrame,
+        ensembles: Sequence[str],
+        group_vectors: Dict[str, List[str]],
+        group_columns: Dict[str, str],
+    ) -> pd.DataFrame:
+        """Aggregate the region vectors of each group for the ensembles.
+
+        `Input:`
+        * smry: pd.DataFrame - summary data with "ENSEMBLE", "REAL" and "DATE" columns
+        and the region vectors
+        * ensembles: Sequence[str] - ensembles to include
+        * group_vectors: Dict[str, List[str]] - region vectors per group
+        * group_columns: Dict[str, str] - column name of the aggregated data per group
+
+        A KeyError is raised if any of the region vectors are missing in `smry`.
+
+        `Return:`
+        DataFrame with the "ENSEMBLE", "REAL" and "DATE" columns and one column per group,
+        with the rows and index of the ensembles in `smry`.
+        """
+        vectors, membership = self._membership(group_vectors)
+        columns = [group_columns[group] for group in group_vectors]
+        group_key = tuple(
+            (group, tuple(group_vectors[group]), group_columns[group])
+            for group in group_vectors
+        )
+
+        ensemble_dfs = []
+        for ensemble in smry["ENSEMBLE"].unique():
+            if ensemble not in ensembles:
+                continue
+            key = (ensemble, group_key)
+            ensemble_df = self._get_cached(self._aggregated_cache, key)
+            if ensemble_df is None:
+                ensemble_smry = smry[smry["ENSEMBLE"] == ensemble]
+                ensemble_df = pd.concat(
+                    [
+                        ensemble_smry[["ENSEMBLE", "REAL", "DATE"]],
+                        pd.DataFrame(
+                            aggregate_region_values(
+                                ensemble_smry[vectors].to_numpy(dtype=np.float64),
+                                membership,
+                            ),
+                            index=ensemble_smry.index,
+                            columns=columns,
+                        ),
+                    ],
+                    axis=1,
+                )
+                self._put_cached(self._aggregated_cache, key, ensemble_df)
+            ensemble_dfs.append(ensemble_df)
+
+        if not ensemble_dfs:
+            return pd.DataFrame(columns=["ENSEMBLE", "REAL", "DATE"] + columns)
+        return pd.concat(ensemble_dfs)
@@ -3,11 +3,12 @@ import warnings
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import numpy as np
 import pandas as pd
 import yaml
 from webviz_config.utils import terminal_colors
 
+from webviz_subsurface._providers import VectorStatistic, compute_vectors_statistics_df
+
 
 def set_simulation_line_shape_fallback(line_shape_fallback: str) -> str:
     """
@@ -53,36 +54,37 @@ def calc_series_statistics(
     """Calculate statistics for given vectors over the ensembles
     refaxis is used if another column than DATE should be used to groupby.
     """
-
-    # Invert p10 and p90 due to oil industry convention.
-    def p10(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=90)
-
-    def p90(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=10)
-
-    def p50(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=50)
-
-    # Calculate statistics, ignoring NaNs.
-    stat_df = (
-        df[["ENSEMBLE", refaxis] + vectors]
-        .groupby(["ENSEMBLE", refaxis])
-        .agg([np.nanmean, np.nanmin, np.nanmax, p10, p90, p50])
-        .reset_index(level=["ENSEMBLE", refaxis], col_level=1)
-    )
-    # Rename nanmin, nanmax and nanmean to min, max and mean.
-    col_stat_label_map = {
-        "nanmin": "min",
-        "nanmax": "max",
-        "nanmean": "mean",
-        "p10": "high_p10",
-        "p90": "low_p90",
-        "p50": "p50",
+    # Statistics labels in the legacy format, with inverted p10 and p90 due to oil
+    # industry convention.
+    stat_label_map = {
+        VectorStatistic.MEAN: "mean",
+        VectorStatistic.MIN: "min",
+        VectorStatistic.MAX: "max",
+        VectorStatistic.P10: "high_p10",
+        VectorStatistic.P90: "low_p90",
+        VectorStatistic.P50: "p50",
     }
-    stat_df.rename(columns=col_stat_label_map, level=1, inplace=True)
 
-    return stat_df
+    # Calculate statistics per ensemble, ignoring NaNs.
+    ens_stat_dfs: List[pd.DataFrame] = []
+    for ensemble, ens_df in df.groupby("ENSEMBLE", sort=True):
+        ens_stat_df = compute_vectors_statistics_df(
+            ens_df[[refaxis, "REAL"] + vectors].rename(columns={refaxis: "DATE"})
+        )
+        ens_stat_df = pd.concat(
+            [
+                pd.DataFrame(
+                    {("", "ENSEMBLE"): ensemble, ("", refaxis): ens_stat_df["DATE"]}
+                ),
+                ens_stat_df[
+                    [(vector, stat) for vector in vectors for stat in stat_label_map]
+                ],
+            ],
+            axis=1,
+        )
+        ens_stat_dfs.append(ens_stat_df.rename(columns=stat_label_map, level=1))
+
+    return pd.concat(ens_stat_dfs, ignore_index=True)
 
 
 def add_statistics_traces(
@@ -0,0 +1,139 @@
+import dataclasses
+import datetime
+import fnmatch
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from webviz_subsurface._providers import Frequency
+
+from .ensemble_summary_provider_set import EnsembleSummaryProviderSet
+from .ensemble_summary_provider_set_factory import (
+    create_lazy_ensemble_summary_provider_set_from_paths,
+)
+
+
+class SmryProviderAdapter:
+    """Adapter giving summary data of an ensemble set in the layout of
+    `EnsembleSetModel.get_or_load_smry_cached()` and `EnsembleSetModel.load_smry_meta()`,
+    read through ensemble summary providers.
+
+    Instead of one DataFrame with all vectors of all ensembles, the DataFrame is created
+    per query for the requested vectors only, with the columns "ENSEMBLE", "REAL" and
+    "DATE" followed by the vectors. Thus the memory usage scales with the vectors in use,
+    and not with the number of vectors in the summary files.
+
+    The dates are resampled by the providers with `resampling_frequency`, or raw dates if
+    None. The vectors are limited to those matching any of the wildcard patterns in
+    `column_keys` if given, as for `column_keys` of `EnsembleSetModel`.
+    """
+
+    ENSEMBLE_COLUMNS = ["ENSEMBLE", "REAL", "DATE"]
+
+    def __init__(
+        self,
+        provider_set: EnsembleSummaryProviderSet,
+        resampling_frequency: Optional[Frequency],
+        column_keys: Optional[Sequence[str]] = None,
+    ) -> None:
+        self._provider_set = provider_set
+        self._resampling_frequency = resampling_frequency
+        self._vector_names = [
+            vector_name
+            for vector_name in provider_set.all_vector_names()
+            if column_keys is None
+            or any(fnmatch.fnmatch(vector_name, key) for key in column_keys)
+        ]
+
+    def ensemble_names(self) -> List[str]:
+        return self._provider_set.provider_names()
+
+    def vector_names(self) -> List[str]:
+        """Union of the vector names of the ensembles"""
+        return self._vector_names
+
+    def columns(self) -> List[str]:
+        """Columns of the legacy summary DataFrame, i.e. with all vectors"""
+        return SmryProviderAdapter.ENSEMBLE_COLUMNS + self.vector_names()
+
+    def dates(self, ensemble: Optional[str] = None) -> List[datetime.datetime]:
+        """Union of the dates of the ensembles, or the dates of one ensemble if given"""
+        if ensemble is not None:
+            return self._provider_set.provider(ensemble).dates(
+                self._resampling_frequency
+            )
+        return self._provider_set.all_dates(self._resampling_frequency)
+
+    def get_smry_df(
+        self,
+        vector_names: Sequence[str],
+        ensembles: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Summary DataFrame with the columns "ENSEMBLE", "REAL" and "DATE", and the
+        requested vectors which exist in any of the ensembles. A vector is NaN for
+        ensembles without the vector.
+
+        All ensembles if `ensembles` is None. Ensembles without any of the vectors are
+        not included.
+        """
+        all_vector_names = set(self.vector_names())
+        existing_vector_names = list(
+            dict.fromkeys(name for name in vector_names if name in all_vector_names)
+        )
+        vectors_dfs = self._provider_set.get_vectors_dfs(
+            existing_vector_names,
+            self._resampling_frequency,
+            provider_names=ensembles,
+        )
+        if not vectors_dfs:
+            return pd.DataFrame(
+                columns=SmryProviderAdapter.ENSEMBLE_COLUMNS + existing_vector_names
+            )
+        smry_df = pd.concat(
+            [
+                vectors_df.assign(ENSEMBLE=ensemble)
+                for ensemble, vectors_df in vectors_dfs.items()
+            ],
+            ignore_index=True,
+            sort=False,
+        )
+        return smry_df.reindex(
+            columns=SmryProviderAdapter.ENSEMBLE_COLUMNS + existing_vector_names
+        )
+
+    def load_smry_meta(self) -> pd.DataFrame:
+        """Vector metadata with one row per vector, and a column per metadata field,
+        e.g. "unit" and "is_total". Vectors without metadata are not included.
+        """
+        smry_meta: Dict[str, dict] = {}
+        for vector_name in self.vector_names():
+            metadata = self._provider_set.vector_metadata(vector_name)
+            if metadata is not None:
+                smry_meta[vector_name] = dataclasses.asdict(metadata)
+        return pd.DataFrame(smry_meta).transpose()
+
+
+def create_smry_provider_adapter_from_paths(
+    ensemble_paths: Dict[str, Path],
+    rel_file_pattern: str,
+    sampling: str,
+    column_keys: Optional[Sequence[str]] = None,
+) -> SmryProviderAdapter:
+    """Create adapter with lazy providers from the .arrow summary files of the ensembles,
+    resampled with `sampling` as given to the legacy timeseries plugins, i.e. a
+    `Frequency` value or "raw".
+    """
+    resampling_frequency = Frequency.from_string_value(sampling)
+    if resampling_frequency is None and sampling != "raw":
+        raise ValueError(
+            f'Sampling "{sampling}" is not supported with .arrow input, use one of '
+            f'{[frequency.value for frequency in Frequency]} or "raw".'
+        )
+    return SmryProviderAdapter(
+        create_lazy_ensemble_summary_provider_set_from_paths(
+            ensemble_paths, rel_file_pattern
+        ),
+        resampling_frequency,
+        column_keys,
+    )
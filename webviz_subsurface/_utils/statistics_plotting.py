@@ -2,6 +2,9 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+import pandas as pd
+
+from .typed_arrays import encode_dates_as_epoch_ms, encode_typed_array
 
 
 @dataclass
@@ -111,6 +114,7 @@ def create_statistics_traces(
     hovertemplate: Optional[str] = None,
     hovermode: Optional[str] = None,
     legendrank: Optional[int] = None,
+    use_typed_arrays: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Utility function for creating statistical plot traces
@@ -127,6 +131,10 @@ def create_statistics_traces(
     Note:
     If hovertemplate is proved it overrides the hovertext
 
+    If use_typed_arrays is True, the samples and values are encoded as plotly typed arrays.
+    Date samples are encoded as milliseconds since epoch, which requires an x-axis of
+    type "date".
+
     Returns:
     List of statistical line traces, one for each statistical feature in data input.
     [trace0, tract1, ..., traceN].
@@ -134,11 +142,20 @@ def create_statistics_traces(
 
     validate_statistics_data(data)
 
+    samples: Any = data.samples
+    if use_typed_arrays:
+        samples = (
+            encode_dates_as_epoch_ms(data.samples)
+            if pd.api.types.infer_dtype(data.samples)
+            in ("datetime64", "datetime", "date")
+            else encode_typed_array(data.samples)
+        )
+
     def get_default_trace(statistics_name: str, values: np.ndarray) -> Dict[str, Any]:
         trace = {
             "name": legend_name if legend_name else legend_group,
-            "x": data.samples,
-            "y": values,
+            "x": samples,
+            "y": encode_typed_array(values) if use_typed_arrays else values,
             "xaxis": xaxis,
             "yaxis": yaxis,
             "mode": "lines",
@@ -0,0 +1,63 @@
+import base64
+from typing import Dict, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# Numpy dtypes supported as typed arrays by plotly.js, with their plotly dtype codes
+_PLOTLY_DTYPES: Dict[np.dtype, str] = {
+    np.dtype("int8"): "i1",
+    np.dtype("uint8"): "u1",
+    np.dtype("int16"): "i2",
+    np.dtype("uint16"): "u2",
+    np.dtype("int32"): "i4",
+    np.dtype("uint32"): "u4",
+    np.dtype("float32"): "f4",
+    np.dtype("float64"): "f8",
+}
+_NUMPY_DTYPES: Dict[str, np.dtype] = {
+    code: dtype for dtype, code in _PLOTLY_DTYPES.items()
+}
+_NUMPY_DTYPES["u1c"] = np.dtype("uint8")
+
+
+def encode_typed_array(values: Union[np.ndarray, pd.Series]) -> Dict[str, str]:
+    """Encode numeric values as a plotly typed array, i.e. {"dtype": ..., "bdata": ...}
+    with the base64 encoded little endian bytes of the values.
+
+    Typed arrays are sent to the browser without conversion of each value to JSON, and
+    are decoded by plotly.js directly into a typed array.
+
+    Values with a dtype not supported by plotly.js, e.g. int64 and bool, are converted to
+    float64.
+    """
+    array = np.asarray(values)
+    dtype = array.dtype if array.dtype in _PLOTLY_DTYPES else np.dtype("float64")
+    array = np.ascontiguousarray(array, dtype=dtype.newbyteorder("<"))
+    return {
+        "dtype": _PLOTLY_DTYPES[dtype],
+        "bdata": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def encode_dates_as_epoch_ms(
+    dates: Union[Sequence, np.ndarray, pd.Series]
+) -> Dict[str, str]:
+    """Encode dates as a plotly typed array of milliseconds since epoch.
+
+    The dates are converted to int64 milliseconds since 1970-01-01, and sent as float64 as
+    plotly.js does not support 64 bit integer typed arrays. All dates within +-285 000
+    years are exact in float64. A plotly axis of type "date" interprets the numbers as
+    milliseconds since epoch, thus the x-axis type must be set to "date" explicitly for
+    traces with encoded dates.
+    """
+    epoch_ms = pd.DatetimeIndex(dates).to_numpy("datetime64[ms]").astype(np.int64)
+    return encode_typed_array(epoch_ms.astype(np.float64))
+
+
+def decode_typed_array(typed_array: Dict[str, str]) -> np.ndarray:
+    """Decode plotly typed array, i.e. {"dtype": ..., "bdata": ...}, to numpy array"""
+    return np.frombuffer(
+        base64.b64decode(typed_array["bdata"]),
+        dtype=_NUMPY_DTYPES[typed_array["dtype"]].newbyteorder("<"),
+    )
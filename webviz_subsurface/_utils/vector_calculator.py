@@ -1,5 +1,19 @@
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple, TypedDict, Union
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 from uuid import uuid4
 
 import numpy as np
@@ -12,6 +26,7 @@ from webviz_subsurface_components import (
     VectorCalculator,
     VectorDefinition,
 )
+from webviz_subsurface_components.py_expression_eval import ParserError
 
 from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
 
@@ -20,6 +35,14 @@ from .vector_selector import (
     is_vector_name_in_vector_selector_data,
 )
 
+# Max number of calculated vector dataframes kept in memory per provider
+CALCULATED_VECTORS_CACHE_SIZE = 64
+
+# Calculated vector dataframes per provider, keyed on expression, resampling frequency
+# and realizations. The entries are released together with the provider.
+_CALCULATED_VECTORS_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_CALCULATED_VECTORS_CACHE_LOCK = threading.Lock()
+
 # JSON Schema for predefined expressions configuration
 # Used as schema input for json_schema.validate()
 PREDEFINED_EXPRESSIONS_JSON_SCHEMA = {
@@ -246,6 +269,42 @@ def get_selected_expressions(
     return selected
 
 
+@lru_cache(maxsize=256)
+def compile_expression(expression: str) -> Optional[Any]:
+    """Parse a mathematical expression into a reusable expression object
+
+    The parsed expression holds the expression in postfix notation with NumPy
+    operators, and is evaluated with `evaluate_compiled_expression()` without parsing
+    the expression string again. Returns None if the expression is invalid.
+    """
+    try:
+        return VectorCalculator.parser.parse(expression)
+    except ParserError:
+        return None
+
+
+def evaluate_compiled_expression(
+    expression: str, values: Dict[str, np.ndarray]
+) -> Optional[np.ndarray]:
+    """Evaluate expression with the provided variable values
+
+    Equivalent to VectorCalculator.evaluate_expression(), but the expression is only
+    parsed the first time it is evaluated.
+
+    Returns None if the expression is invalid, or if the variables in values and the
+    variables in the expression do not match.
+    """
+    compiled_expression = compile_expression(expression)
+    if compiled_expression is None:
+        return None
+    if not set(values).issubset(compiled_expression.variables()):
+        return None
+    try:
+        return compiled_expression.evaluate(values)
+    except ParserError:
+        return None
+
+
 def get_calculated_vector_df(
     expression: ExpressionInfo, smry: pd.DataFrame, ensembles: List[str]
 ) -> pd.DataFrame:
@@ -260,14 +319,14 @@ def get_calculated_vector_df(
     vector_names = var_vec_dict.values()
 
     # Retreive vectors for calculating expression - filtered on ensembles
-    df = smry[columns + list(vector_names)].copy()
-    df = df[df["ENSEMBLE"].isin(ensembles)]
+    df = smry.loc[smry["ENSEMBLE"].isin(ensembles), columns + list(vector_names)]
 
     values: Dict[str, np.ndarray] = {}
     for variable, vector in var_vec_dict.items():
         values[variable] = df[vector].values
 
-    evaluated_expr = VectorCalculator.evaluate_expression(expr, values)
+    df = df[columns].copy()
+    evaluated_expr = evaluate_compiled_expression(expr, values)
     if evaluated_expr is not None:
         df[name] = evaluated_expr
 
@@ -284,6 +343,9 @@ def create_calculated_vector_df(
 
     If expression is not successfully evaluated, empty dataframe is returned
 
+    The expression is only parsed once, and the calculated vector is cached per
+    provider for the combination of expression, realizations and resampling frequency.
+
     `Return:`
     * Dataframe with calculated vector data made form expression - columns:\n
         ["DATE","REAL", calculated_vector]
@@ -297,6 +359,20 @@ def create_calculated_vector_df(
     )
     vector_names = list(variable_vector_dict.values())
 
+    cache_key: Hashable = (
+        name,
+        expr,
+        tuple(variable_vector_dict.items()),
+        resampling_frequency,
+        tuple(sorted(realizations)) if realizations is not None else None,
+    )
+    with _CALCULATED_VECTORS_CACHE_LOCK:
+        provider_cache = _CALCULATED_VECTORS_CACHE.setdefault(provider, OrderedDict())
+        calculated_vector_df = provider_cache.get(cache_key)
+        if calculated_vector_df is not None:
+            provider_cache.move_to_end(cache_key)
+            return calculated_vector_df.copy()
+
     # Retrieve data for vectors in expression
     vectors_df = provider.get_vectors_df(
         vector_names, resampling_frequency, realizations
@@ -306,12 +382,17 @@ def create_calculated_vector_df(
     for variable, vector in variable_vector_dict.items():
         values[variable] = vectors_df[vector].values
 
-    evaluated_expression = VectorCalculator.evaluate_expression(expr, values)
-    if evaluated_expression is not None:
-        vectors_df[name] = evaluated_expression
-        return vectors_df[["DATE", "REAL", name]]
-
-    return pd.DataFrame()
+    evaluated_expression = evaluate_compiled_expression(expr, values)
+    if evaluated_expression is None:
+        return pd.DataFrame()
+
+    calculated_vector_df = vectors_df[["DATE", "REAL"]].copy()
+    calculated_vector_df[name] = evaluated_expression
+    with _CALCULATED_VECTORS_CACHE_LOCK:
+        provider_cache[cache_key] = calculated_vector_df
+        if len(provider_cache) > CALCULATED_VECTORS_CACHE_SIZE:
+            provider_cache.popitem(last=False)
+    return calculated_vector_df.copy()
 
 
 def get_calculated_units(
@@ -181,9 +181,7 @@ def _get_wbhp_vectors(
     if wells is not None:
         return [f"WBHP:{well}" for well in wells]
 
-    wbhp_vectors = [
-        vector for vector in ens_provider.vector_names() if vector.startswith("WBHP:")
-    ]
+    wbhp_vectors = ens_provider.vector_catalog().names_with_prefix("WBHP:")
     if not wbhp_vectors:
         raise RuntimeError("No WBHP vectors found.")
 
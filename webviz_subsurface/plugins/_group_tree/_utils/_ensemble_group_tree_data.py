@@ -93,10 +93,9 @@ class EnsembleGroupTreeData:
         """  # noqa
 
         # Filter smry
+        vector_catalog = self._provider.vector_catalog()
         vectors = [
-            sumvec
-            for sumvec in self._sumvecs["SUMVEC"]
-            if sumvec in self._provider.vector_names()
+            sumvec for sumvec in self._sumvecs["SUMVEC"] if sumvec in vector_catalog
         ]
         smry = self._provider.get_vectors_df(vectors, None)
 
@@ -208,10 +207,9 @@ class EnsembleGroupTreeData:
         present in the summary dataset. If any are missing, a ValueError
         is raised with the list of all missing summary vectors.
         """
+        vector_catalog = self._provider.vector_catalog()
         missing_sumvecs = [
-            sumvec
-            for sumvec in check_sumvecs
-            if sumvec not in self._provider.vector_names()
+            sumvec for sumvec in check_sumvecs if sumvec not in vector_catalog
         ]
         if missing_sumvecs:
             str_missing_sumvecs = ", ".join(missing_sumvecs)
@@ -374,23 +372,36 @@ def create_dataset(
     the tree changes (f.ex if a new well is defined). The function loops
     through the trees and puts together all the summary data that is valid for
     the time span where the tree is valid, along with the tree structure itself.
+
+    The summary data is converted to one array with one row per date, and each tree
+    to arrays of node indices, so that the data of each node in the time span is
+    a column slice of the array.
     """
+    # pylint: disable=too-many-locals
+    # The first row of each date is used, i.e. the only row for a single
+    # realization or for statistics
+    smry_dates = smry.drop_duplicates(subset=["DATE"]).sort_values("DATE")
+    dates = pd.DatetimeIndex(smry_dates["DATE"])
+    columns = [col for col in smry_dates.columns if col != "DATE"]
+    values = np.round(smry_dates[columns].to_numpy(dtype=np.float64), 2)
+    node_vectors = get_node_vectors(sumvecs, columns)
+
     trees = []
+    gruptree_dates = gruptree.groupby("DATE")
+    next_dates = list(gruptree_dates.groups)[1:] + [smry["DATE"].max()]
     # loop trees
-    for date, gruptree_date in gruptree.groupby("DATE"):
-        next_date = gruptree[gruptree.DATE > date]["DATE"].min()
-        if pd.isna(next_date):
-            next_date = smry["DATE"].max()
-        smry_in_datespan = smry[
-            (smry["DATE"] >= date) & (smry["DATE"] < next_date)
-        ].groupby("DATE")
-        dates = list(smry_in_datespan.groups)
-        if dates:
+    for (date, gruptree_date), next_date in zip(gruptree_dates, next_dates):
+        start = dates.searchsorted(date)
+        stop = dates.searchsorted(next_date) if not pd.isna(next_date) else start
+        if stop > start:
             trees.append(
                 {
-                    "dates": [date.strftime("%Y-%m-%d") for date in dates],
+                    "dates": [date.strftime("%Y-%m-%d") for date in dates[start:stop]],
                     "tree": extract_tree(
-                        gruptree_date, terminal_node, smry_in_datespan, dates, sumvecs
+                        gruptree_date,
+                        terminal_node,
+                        values[start:stop].T.tolist(),
+                        node_vectors,
                     ),
                 }
             )
@@ -401,72 +412,95 @@ def create_dataset(
     return trees
 
 
+def get_node_vectors(
+    sumvecs: pd.DataFrame, columns: List[str]
+) -> Dict[str, Dict[EdgeOrNode, List[Tuple[str, str, int]]]]:
+    """Returns the datatype, summary vector and column index in the summary data of
+    the edge and node vectors of each node. The column index is -1 if the summary
+    vector is not in the summary data.
+    """
+    column_index = {col: index for index, col in enumerate(columns)}
+    node_vectors: Dict[str, Dict[EdgeOrNode, List[Tuple[str, str, int]]]] = {}
+    for item in sumvecs.to_dict("records"):
+        node_vectors.setdefault(
+            item["NODENAME"], {EdgeOrNode.EDGE: [], EdgeOrNode.NODE: []}
+        )[item["EDGE_NODE"]].append(
+            (item["DATATYPE"], item["SUMVEC"], column_index.get(item["SUMVEC"], -1))
+        )
+    return node_vectors
+
+
 def extract_tree(
     gruptree: pd.DataFrame,
-    nodename: str,
-    smry_in_datespan: Dict[Any, pd.DataFrame],
-    dates: list,
-    sumvecs: pd.DataFrame,
+    terminal_node: str,
+    column_values: List[List[float]],
+    node_vectors: Dict[str, Dict[EdgeOrNode, List[Tuple[str, str, int]]]],
 ) -> dict:
-    """Extract the tree part of the GroupTree component dataset. This functions
-    works recursively and is initially called with the terminal node of the tree
-    (usually FIELD)
+    """Extract the tree part of the GroupTree component dataset, starting with the
+    terminal node of the tree (usually FIELD).
+
+    The tree is encoded as the index of the parent of each node, and the children of
+    each node are found with one sort of the parent indices instead of filtering the
+    gruptree dataframe per node.
+
+    `Input:`
+    * gruptree: pd.DataFrame - gruptree at one date
+    * terminal_node: str - name of the terminal node
+    * column_values: List[List[float]] - values per column of the summary data, at
+    the dates of the tree
+    * node_vectors: see `get_node_vectors()`
     """
-    node_sumvecs = sumvecs[sumvecs["NODENAME"] == nodename]
-    nodedict = get_nodedict(gruptree, nodename)
-
-    result: dict = {
-        "node_label": nodename,
-        "node_type": "Well" if nodedict["KEYWORD"] == "WELSPECS" else "Group",
-        "edge_label": nodedict["EDGE_LABEL"],
-    }
-
-    edges = node_sumvecs[node_sumvecs["EDGE_NODE"] == EdgeOrNode.EDGE].to_dict(
-        "records"
-    )
-    nodes = node_sumvecs[node_sumvecs["EDGE_NODE"] == EdgeOrNode.NODE].to_dict(
-        "records"
+    # pylint: disable=too-many-locals
+    node_codes, node_names = pd.factorize(gruptree["CHILD"])
+    parent_codes = pd.Index(node_names).get_indexer(gruptree["PARENT"])
+    rows = gruptree[["KEYWORD", "EDGE_LABEL"]].to_dict("records")
+    node_row_counts = np.bincount(node_codes, minlength=len(node_names))
+    # The codes are in order of appearance, so the first row of each node is found
+    # where the code appears first
+    _, node_rows = np.unique(node_codes, return_index=True)
+
+    # Unique children of each node, in order of appearance
+    edges = pd.DataFrame({"PARENT": parent_codes, "CHILD": node_codes})
+    edges = edges[edges["PARENT"] >= 0].drop_duplicates()
+    edges = edges.sort_values("PARENT", kind="stable")
+    children = edges["CHILD"].to_numpy()
+    children_offsets = np.concatenate(
+        ([0], np.cumsum(np.bincount(edges["PARENT"], minlength=len(node_names))))
     )
-
-    edge_data: Dict[str, List[float]] = {item["DATATYPE"]: [] for item in edges}
-    node_data: Dict[str, List[float]] = {item["DATATYPE"]: [] for item in nodes}
-
-    # Looping the dates only once is very important for the speed of this function
-    for _, smry_at_date in smry_in_datespan:
-        for item in edges:
-            edge_data[item["DATATYPE"]].append(
-                round(smry_at_date[item["SUMVEC"]].values[0], 2)
-            )
-        for item in nodes:
-            try:
-                node_data[item["DATATYPE"]].append(
-                    round(smry_at_date[item["SUMVEC"]].values[0], 2)
-                )
-            except KeyError:
-                node_data[item["DATATYPE"]].append(np.nan)
-
-    result["edge_data"] = edge_data
-    result["node_data"] = node_data
-
-    children = list(gruptree[gruptree["PARENT"] == nodename]["CHILD"].unique())
-    if children:
-        result["children"] = [
-            extract_tree(gruptree, child, smry_in_datespan, dates, sumvecs)
-            for child in children
-        ]
-    return result
-
-
-def get_nodedict(gruptree: pd.DataFrame, nodename: str) -> Dict[str, Any]:
-    """Returns the node data from a row in the gruptree dataframe as a dictionary.
-    This function also checks that there is exactly one element with the given name.
-    """
-    df = gruptree[gruptree["CHILD"] == nodename]
-    if df.empty:
-        raise ValueError(f"No gruptree row found for node {nodename}")
-    if df.shape[0] > 1:
-        raise ValueError(f"Multiple gruptree rows found for node {nodename}. {df}")
-    return df.to_dict("records")[0]
+    n_dates = len(column_values[0]) if column_values else 0
+
+    def _vector_data(
+        vectors: List[Tuple[str, str, int]], raise_if_missing: bool
+    ) -> Dict[str, List[float]]:
+        data = {}
+        for datatype, sumvec, index in vectors:
+            if index < 0 and raise_if_missing:
+                raise KeyError(sumvec)
+            data[datatype] = column_values[index] if index >= 0 else [np.nan] * n_dates
+        return data
+
+    def _extract_node(code: int) -> dict:
+        nodename = node_names[code]
+        if node_row_counts[code] > 1:
+            raise ValueError(f"Multiple gruptree rows found for node {nodename}.")
+        row = rows[node_rows[code]]
+        vectors = node_vectors.get(nodename, {EdgeOrNode.EDGE: [], EdgeOrNode.NODE: []})
+        result: dict = {
+            "node_label": nodename,
+            "node_type": "Well" if row["KEYWORD"] == "WELSPECS" else "Group",
+            "edge_label": row["EDGE_LABEL"],
+            "edge_data": _vector_data(vectors[EdgeOrNode.EDGE], True),
+            "node_data": _vector_data(vectors[EdgeOrNode.NODE], False),
+        }
+        node_children = children[children_offsets[code] : children_offsets[code + 1]]
+        if len(node_children) > 0:
+            result["children"] = [_extract_node(child) for child in node_children]
+        return result
+
+    terminal_code = pd.Index(node_names).get_indexer([terminal_node])[0]
+    if terminal_code < 0:
+        raise ValueError(f"No gruptree row found for node {terminal_node}")
+    return _extract_node(terminal_code)
 
 
 def add_nodetype(
@@ -556,6 +590,7 @@ def create_leafnodetype_maps(
     # pylint: disable=too-many-locals
     is_prod_map, is_inj_map, is_other_map = {}, {}, {}
     wstat_df = provider.get_vectors_df([f"WSTAT:{well}" for well in all_wells], None)
+    vector_catalog = provider.vector_catalog()
 
     for _, leafnode in leafnodes.iterrows():
         nodename = leafnode["CHILD"]
@@ -586,7 +621,7 @@ def create_leafnodetype_maps(
                 [
                     sumvec
                     for sumvec in (prod_sumvecs + inj_sumvecs)
-                    if sumvec in provider.vector_names()
+                    if sumvec in vector_catalog
                 ],
                 None,
             )
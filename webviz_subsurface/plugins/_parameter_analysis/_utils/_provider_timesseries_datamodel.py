@@ -1,12 +1,15 @@
 import datetime
-import fnmatch
 import re
 from typing import Dict, List, Optional, Set
 
 import pandas as pd
 
 from webviz_subsurface._abbreviations.reservoir_simulation import historical_vector
-from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
+from webviz_subsurface._providers import (
+    EnsembleSummaryProvider,
+    Frequency,
+    VectorCatalog,
+)
 from webviz_subsurface._utils.simulation_timeseries import (
     set_simulation_line_shape_fallback,
 )
@@ -27,12 +30,13 @@ class ProviderTimeSeriesDataModel:
             list(provider_set.values())
         )
         self._vector_names = (
-            self.filter_vectorlist_on_column_keys(column_keys, all_vector_names)
+            VectorCatalog(all_vector_names).match(column_keys)
             if column_keys is not None
             else all_vector_names
         )
         if not self._vector_names:
             raise ValueError("No vectors match the selected 'column_keys' criteria")
+        self._vector_catalog = VectorCatalog(self._vector_names)
 
         # add vectors to vector selector
         self.vector_selector_data: list = []
@@ -89,25 +93,13 @@ class ProviderTimeSeriesDataModel:
     def filter_vectors(self, column_keys: str, ensemble: Optional[str] = None) -> list:
         """Filter vector list used for correlation"""
         column_key_list = "".join(column_keys.split()).split(",")
-
-        return self.filter_vectorlist_on_column_keys(
-            column_key_list,
-            self.vectors
+        vector_catalog = (
+            self._vector_catalog
             if ensemble is None
-            else self._provider_set[ensemble].vector_names(),
+            else self._provider_set[ensemble].vector_catalog()
         )
-
-    @staticmethod
-    def filter_vectorlist_on_column_keys(
-        column_key_list: list, vectorlist: list
-    ) -> list:
-        """Filter vectors using list of unix shell wildcards"""
         try:
-            regex = re.compile(
-                "|".join([fnmatch.translate(col) for col in column_key_list]),
-                flags=re.IGNORECASE,
-            )
-            return [v for v in vectorlist if regex.fullmatch(v)]
+            return vector_catalog.match(column_key_list)
         except re.error:
             return []
 
@@ -115,7 +107,7 @@ class ProviderTimeSeriesDataModel:
         self, vector: str, ensemble: str
     ) -> Optional[pd.DataFrame]:
         hist_vecname = historical_vector(vector, smry_meta=None)
-        ensemble_vectors = self._provider_set[ensemble].vector_names()
+        ensemble_vectors = self._provider_set[ensemble].vector_catalog()
         if hist_vecname and hist_vecname in ensemble_vectors:
             provider = self._provider_set[ensemble]
             return provider.get_vectors_df(
@@ -131,7 +123,8 @@ class ProviderTimeSeriesDataModel:
         resampling_frequency: Optional[Frequency],
     ) -> pd.DataFrame:
         provider = self._provider_set[ensemble]
-        ens_vectors = [vec for vec in vectors if vec in provider.vector_names()]
+        vector_catalog = provider.vector_catalog()
+        ens_vectors = [vec for vec in vectors if vec in vector_catalog]
         return provider.get_vectors_df(
             vector_names=ens_vectors,
             resampling_frequency=resampling_frequency,
@@ -1,6 +1,7 @@
 import datetime
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import pandas as pd
 import plotly.graph_objects as go
 from dash import Input, Output, State, callback, callback_context, no_update
 from dash.exceptions import PreventUpdate
@@ -11,10 +12,12 @@ from webviz_config.webviz_plugin_subclasses import ViewABC
 from ....._figures import BarChart, ScatterPlot, TimeSeriesFigure
 from ....._providers import Frequency
 from ....._utils.colors import hex_to_rgba_str, rgba_to_hex
-from ....._utils.dataframe_utils import (
-    correlate_response_with_dataframe,
-    merge_dataframes_on_realization,
+from ....._utils.correlation import (
+    CorrelationCubeCache,
+    create_correlation_cube,
+    sort_by_absolute_value,
 )
+from ....._utils.dataframe_utils import merge_dataframes_on_realization
 from ..._utils import ParametersModel, ProviderTimeSeriesDataModel
 from ..._utils import _datetime_utils as datetime_utils
 from ._settings import (
@@ -53,6 +56,7 @@ class ParameterResponseView(ViewABC):
         self._observations = observations
         self._disable_resampling_dropdown = disable_resampling_dropdown
         self._theme = theme
+        self._correlation_cubes = CorrelationCubeCache()
 
         self.add_settings_groups(
             {
@@ -85,6 +89,29 @@ class ParameterResponseView(ViewABC):
             ParamRespViewElement(), self.Ids.PARAM_CORR_GRAPH
         )
 
+    def _get_correlation_cube(
+        self,
+        ensemble: str,
+        vector: str,
+        vector_df: pd.DataFrame,
+        realizations: List[int],
+        resampling_frequency: Optional[Frequency],
+    ) -> pd.DataFrame:
+        """Correlations of the vector with the parameters at all dates, computed once per
+        ensemble, vector, realizations and resampling frequency
+        """
+        return self._correlation_cubes.get_or_create(
+            (ensemble, vector, tuple(realizations), resampling_frequency),
+            lambda: create_correlation_cube(
+                response_df=vector_df[["REAL", "DATE", vector]],
+                parameter_df=self._parametermodel.get_parameter_df_for_ensemble(
+                    ensemble, realizations
+                ),
+                response=vector,
+                parameters=list(self._parametermodel.parameters),
+            ),
+        )
+
     def set_callbacks(self) -> None:
         # pylint: disable=too-many-statements
         @callback(
@@ -226,17 +253,18 @@ class ParameterResponseView(ViewABC):
                 else []
             )
 
+            # If the resampling dropdown is disable it means the data is presampled,
+            # in which case we pass None as resampling frequency
+            vector_resampling_frequency = (
+                resampling_frequency if not self._disable_resampling_dropdown else None
+            )
             try:
                 # Get dataframe with vectors and dataframe with parameters and merge
-                # If the resampling dropdown is disable it means the data is presampled,
-                # in which case we pass None as resampling frequency
                 vector_df = self._vectormodel.get_vector_df(
                     ensemble=ensemble,
                     realizations=realizations,
                     vectors=list(set(vectors_for_param_corr + [selected_vector])),
-                    resampling_frequency=resampling_frequency
-                    if not self._disable_resampling_dropdown
-                    else None,
+                    resampling_frequency=vector_resampling_frequency,
                 )
             except ValueError:
                 # It could be that the selected vector does not exist in the
@@ -265,8 +293,19 @@ class ParameterResponseView(ViewABC):
                     "'Calculate Correlations' option not selected"
                 )
             else:
-                corrseries = correlate_response_with_dataframe(
-                    merged_df, selected_vector, self._parametermodel.parameters
+                # Correlations of non-constant parameters, looked up in the
+                # correlations of all dates
+                parameters = non_constant_columns(
+                    merged_df, self._parametermodel.parameters
+                )
+                corrseries = sort_by_absolute_value(
+                    self._get_correlation_cube(
+                        ensemble,
+                        selected_vector,
+                        vector_df,
+                        realizations,
+                        vector_resampling_frequency,
+                    ).loc[date, parameters]
                 )
                 if corrseries.isnull().values.any():
                     # If all response values are equal, correlations will be Nan
@@ -305,11 +344,27 @@ class ParameterResponseView(ViewABC):
                         # This can happen if vector correlations failed
                         corr_p_fig = empty_figure("Not able to calculate correlations")
                     else:
-                        corrseries = correlate_response_with_dataframe(
+                        # Correlations of the parameter with non-constant vectors,
+                        # looked up in the correlations of all dates per vector
+                        vectors = non_constant_columns(
                             merged_df,
-                            param,
                             list(set(vectors_for_param_corr + [selected_vector])),
                         )
+                        corrseries = sort_by_absolute_value(
+                            pd.Series(
+                                {
+                                    vec: self._get_correlation_cube(
+                                        ensemble,
+                                        vec,
+                                        vector_df,
+                                        realizations,
+                                        vector_resampling_frequency,
+                                    ).at[date, param]
+                                    for vec in vectors
+                                },
+                                dtype=float,
+                            )
+                        )
                         if corrseries.isnull().values.any():
                             corr_p_fig = empty_figure(
                                 "Not able to calculate correlations"
@@ -722,6 +777,13 @@ class ParameterResponseView(ViewABC):
             return [ensemble]
 
 
+def non_constant_columns(df: pd.DataFrame, columns: List[str]) -> List[str]:
+    """The columns with more than one unique value, which are the columns correlated by
+    `correlate_response_with_dataframe()`
+    """
+    return [col for col in columns if df[col].nunique() > 1]
+
+
 def color_corr_bars(
     figure: dict,
     selected_bar: str,
@@ -21,6 +21,12 @@ from webviz_subsurface._providers import (
     Frequency,
     get_matching_vector_names,
 )
+from webviz_subsurface._utils.correlation import (
+    CorrelationCubeCache,
+    correlate_against,
+    create_correlation_cube,
+    sort_by_absolute_value,
+)
 from webviz_subsurface._utils.ensemble_table_provider_set_factory import (
     create_parameter_providerset_from_paths,
 )
@@ -213,6 +219,7 @@ Responses are extracted automatically from the `.arrow` files in the individual
             filter_columns=self.response_filters.keys(),
         )
 
+        self.correlation_cubes = CorrelationCubeCache()
         self.theme = webviz_settings.theme
         self.set_callbacks(app)
 
@@ -483,6 +490,36 @@ Responses are extracted automatically from the `.arrow` files in the individual
                 callbacks.append(Input(self.uuid(f"filter-{col_name}"), "value"))
         return callbacks
 
+    def correlate_at_date(
+        self,
+        ensemble: str,
+        response: str,
+        parameters: List[str],
+        date: str,
+        correlation_method: str,
+        aggregation: str,
+    ) -> pd.Series:
+        """Correlations of the parameters with the response at the date, sorted by
+        absolute value. Looked up in the correlations of all dates, which are computed
+        once per ensemble, response, method and aggregation.
+        """
+        cube = self.correlation_cubes.get_or_create(
+            (ensemble, response, correlation_method, aggregation),
+            lambda: create_correlation_cube(
+                response_df=self.responsedf.loc[
+                    self.responsedf["ENSEMBLE"] == ensemble, ["REAL", "DATE", response]
+                ].astype({"DATE": str}),
+                parameter_df=self.parameterdf.loc[
+                    self.parameterdf["ENSEMBLE"] == ensemble
+                ],
+                response=response,
+                parameters=self.parameter_columns,
+                method=correlation_method,
+                aggregation=aggregation,
+            ),
+        )
+        return sort_by_absolute_value(cube.loc[date, parameters])
+
     def set_callbacks(self, app) -> None:
         @app.callback(
             [
@@ -515,26 +552,36 @@ Responses are extracted automatically from the `.arrow` files in the individual
                 response_filters=self.response_filters,
                 response_filter_values=filters,
             )
-            responsedf = parresp.filter_and_sum_responses(
-                self.responsedf,
-                ensemble,
-                response,
-                filteroptions=filteroptions,
-                aggregation=aggregation,
-            )
-            parameterdf = self.parameterdf[
-                ["ENSEMBLE", "REAL"] + selected_parameters
-            ].loc[self.parameterdf["ENSEMBLE"] == ensemble]
-
-            df = pd.merge(responsedf, parameterdf, on=["REAL"])
-            corrdf = correlate(df, response=response, method=correlation_method)
             try:
-                corr_response = (
-                    corrdf[response]
-                    .dropna()
-                    .drop(["REAL", response], axis=0)
-                    .tail(n=max_parameters)
-                )
+                if self.response_filters == {"DATE": "single"} and filteroptions:
+                    # Only filtered on date, e.g. for summary data
+                    corr_response = self.correlate_at_date(
+                        ensemble,
+                        response,
+                        selected_parameters,
+                        str(filteroptions[0]["values"]),
+                        correlation_method,
+                        aggregation,
+                    ).dropna()
+                else:
+                    responsedf = parresp.filter_and_sum_responses(
+                        self.responsedf,
+                        ensemble,
+                        response,
+                        filteroptions=filteroptions,
+                        aggregation=aggregation,
+                    )
+                    parameterdf = self.parameterdf[
+                        ["ENSEMBLE", "REAL"] + selected_parameters
+                    ].loc[self.parameterdf["ENSEMBLE"] == ensemble]
+
+                    df = pd.merge(responsedf, parameterdf, on=["REAL"])
+                    corr_response = (
+                        correlate(df, response=response, method=correlation_method)
+                        .dropna()
+                        .drop(["REAL", response], axis=0)
+                    )
+                corr_response = corr_response.tail(n=max_parameters)
                 corr_response = corr_response[corr_response.abs() >= correlation_cutoff]
                 return (
                     make_correlation_plot(
@@ -631,20 +678,13 @@ Responses are extracted automatically from the `.arrow` files in the individual
         return []
 
 
-def correlate(inputdf, response, method="pearson") -> pd.DataFrame:
-    """Returns the correlation matrix for a dataframe"""
-    if method == "pearson":
-        numeric_df = inputdf.select_dtypes(include=[np.number])
-        corrdf = numeric_df.corr(method=method)
-    elif method == "spearman":
-        numeric_df = inputdf.select_dtypes(include=[np.number])
-        corrdf = numeric_df.rank().corr(method="pearson")
-    else:
-        raise ValueError(
-            f"Correlation method {method} is invalid. "
-            "Available methods are 'pearson' and 'spearman'"
-        )
-    return corrdf.reindex(corrdf[response].abs().sort_values().index)
+def correlate(inputdf, response, method="pearson") -> pd.Series:
+    """Returns the correlations of the numeric columns of a dataframe with the response,
+    sorted by absolute value"""
+    numeric_df = inputdf.select_dtypes(include=[np.number])
+    return sort_by_absolute_value(
+        correlate_against(numeric_df, numeric_df[response], method=method)
+    )
 
 
 def make_correlation_plot(
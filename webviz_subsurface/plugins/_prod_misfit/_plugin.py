@@ -171,7 +171,9 @@ class ProdMisfit(WebvizPluginABC):
                 self.vectors[ens_name],
                 self.phases[ens_name],
             ) = _get_wells_vectors_phases(
-                ens_provider.vector_names(),
+                ens_provider.vector_catalog().names_for_keywords(
+                    ["WOPT", "WWPT", "WGPT"]
+                ),
                 excl_name_startswith,
                 excl_name_endswith,
                 excl_name_contains,
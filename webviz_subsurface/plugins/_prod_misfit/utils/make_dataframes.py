@@ -2,12 +2,22 @@ import logging
 import time
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
 from webviz_subsurface._utils.ensemble_summary_provider_set import (
     EnsembleSummaryProviderSet,
 )
 
+_DIFF_VECTOR_TYPES = [
+    "DIFF_WOPT",
+    "DIFF_WWPT",
+    "DIFF_WGPT",
+    "DIFF_GOPT",
+    "DIFF_GWPT",
+    "DIFF_GGPT",
+]
+
 
 # -------------------
 def get_df_smry(
@@ -83,57 +93,51 @@ def get_df_diff(
 
 
 # --------------------------------
-# pylint: disable = too-many-locals
 def get_df_diff_stat(df_diff: pd.DataFrame) -> pd.DataFrame:
     """Return dataframe with statistics of production difference
     across all realizations per ensemble, well and date.
-    Return empty dataframe if no realizations included in df."""
+    Return empty dataframe if no realizations included in df.
+
+    The statistics are calculated for all diff vectors at once, with one
+    grouped aggregation per statistic."""
 
     if df_diff.empty:
         return pd.DataFrame()
 
-    ensembles = []
-    dates = []
-    wells = []
-    diff_vectors = []
-    diff_mean_values = []
-    diff_std_values = []
-    diff_p10_values = []
-    diff_p90_values = []
-
-    for ens_name, dframe in df_diff.groupby("ENSEMBLE"):
-        for _date, ensdf in dframe.groupby("DATE"):
-            for col in ensdf.columns:
-                if ":" in col:
-                    vector = col.split(":")[0]
-                    if vector in [
-                        "DIFF_WOPT",
-                        "DIFF_WWPT",
-                        "DIFF_WGPT",
-                        "DIFF_GOPT",
-                        "DIFF_GWPT",
-                        "DIFF_GGPT",
-                    ]:
-                        well = col.split(":")[1]
-                        wells.append(well)
-                        dates.append(_date)
-                        ensembles.append(ens_name)
-                        diff_vectors.append(vector)
-                        diff_mean_values.append(ensdf[col].mean())
-                        diff_std_values.append(ensdf[col].std())
-                        diff_p10_values.append(ensdf[col].quantile(0.9))
-                        diff_p90_values.append(ensdf[col].quantile(0.1))
-
+    diff_columns = [
+        col
+        for col in df_diff.columns
+        if ":" in col and col.split(":")[0] in _DIFF_VECTOR_TYPES
+    ]
+    grouped = df_diff.groupby(["ENSEMBLE", "DATE"])[diff_columns]
+    stats = {
+        "DIFF_MEAN": grouped.mean(),
+        "DIFF_STD": grouped.std(),
+        "DIFF_P10": grouped.quantile(0.9),
+        "DIFF_P90": grouped.quantile(0.1),
+    }
+
+    # Long format with one row per ensemble, date and diff vector
+    group_index = stats["DIFF_MEAN"].index
+    num_columns = len(diff_columns)
     df_stat = pd.DataFrame(
         data={
-            "ENSEMBLE": ensembles,
-            "WELL": wells,
-            "VECTOR": diff_vectors,
-            "DATE": dates,
-            "DIFF_MEAN": diff_mean_values,
-            "DIFF_STD": diff_std_values,
-            "DIFF_P10": diff_p10_values,
-            "DIFF_P90": diff_p90_values,
+            "ENSEMBLE": np.repeat(
+                group_index.get_level_values("ENSEMBLE").to_numpy(), num_columns
+            ),
+            "WELL": np.tile(
+                [col.split(":")[1] for col in diff_columns], len(group_index)
+            ),
+            "VECTOR": np.tile(
+                [col.split(":")[0] for col in diff_columns], len(group_index)
+            ),
+            "DATE": np.repeat(
+                group_index.get_level_values("DATE").to_numpy(), num_columns
+            ),
+            **{
+                stat_name: stat_df[diff_columns].to_numpy().ravel()
+                for stat_name, stat_df in stats.items()
+            },
         }
     )
 
@@ -1,8 +1,10 @@
 from typing import Dict, List, Union
 
+import pandas as pd
 import webviz_core_components as wcc
 from dash import Input, Output, callback
 from dash.development.base_component import Component
+from webviz_config.common_cache import CACHE
 from webviz_config.webviz_plugin_subclasses import SettingsGroupABC, ViewABC
 
 from webviz_subsurface._utils.ensemble_summary_provider_set import (
@@ -136,7 +138,6 @@ class ProdHeatmapView(ViewABC):
         PLOT_SETTINGS = "plot-settings"
         MAIN_COLUMN = "main-column"
 
-    # pylint: disable=too-many-arguments
     def __init__(
         self,
         input_provider_set: EnsembleSummaryProviderSet,
@@ -156,6 +157,35 @@ class ProdHeatmapView(ViewABC):
         )
         self.main_column = self.add_column(ProdHeatmapView.Ids.MAIN_COLUMN)
 
+    # pylint: disable=too-many-arguments
+    @CACHE.memoize(timeout=CACHE.TIMEOUT)
+    def _get_df_diff_stat(
+        self,
+        ensemble_names: List[str],
+        selector_realizations: list,
+        well_names: list,
+        selector_phases: list,
+        selector_dates: list,
+        relative_diff: bool,
+    ) -> pd.DataFrame:
+        """Misfit statistics for the current selection. Cached on the selection
+        only, so that changing plot settings does not trigger a recalculation."""
+        return makedf.get_df_diff_stat(
+            makedf.get_df_diff(
+                makedf.get_df_smry(
+                    self.input_provider_set,
+                    ensemble_names,
+                    self.ens_vectors,
+                    self.ens_realizations,
+                    selector_realizations,
+                    well_names,
+                    selector_phases,
+                    selector_dates,
+                ),
+                relative_diff=relative_diff,
+            )
+        )
+
     def set_callbacks(self) -> None:
         @callback(
             Output(
@@ -234,21 +264,13 @@ class ProdHeatmapView(ViewABC):
                 selector_well_combine_type,
             )
 
-            relative_diff = selector_plot_type == "rel_diffplot"
-            dframe = makedf.get_df_diff_stat(
-                makedf.get_df_diff(
-                    makedf.get_df_smry(
-                        self.input_provider_set,
-                        ensemble_names,
-                        self.ens_vectors,
-                        self.ens_realizations,
-                        selector_realizations,
-                        well_names,
-                        selector_phases,
-                        selector_dates,
-                    ),
-                    relative_diff=relative_diff,
-                )
+            dframe = self._get_df_diff_stat(
+                ensemble_names,
+                selector_realizations,
+                well_names,
+                selector_phases,
+                selector_dates,
+                relative_diff=selector_plot_type == "rel_diffplot",
             )
 
             figures = makefigs.heatmap_plot(
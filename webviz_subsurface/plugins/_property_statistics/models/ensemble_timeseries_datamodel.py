@@ -1,12 +1,10 @@
 import datetime
-import fnmatch
-import re
 from typing import List, Optional, Set
 
 import pandas as pd
 
 from webviz_subsurface._abbreviations.reservoir_simulation import historical_vector
-from webviz_subsurface._providers import EnsembleSummaryProvider
+from webviz_subsurface._providers import EnsembleSummaryProvider, VectorCatalog
 from webviz_subsurface._utils.simulation_timeseries import (
     set_simulation_line_shape_fallback,
 )
@@ -23,7 +21,7 @@ class ProviderTimeSeriesDataModel:
             list(provider_set.values())
         )
         self._vector_names = (
-            self.filter_vectorlist_on_column_keys(column_keys, all_vector_names)
+            VectorCatalog(all_vector_names).match(column_keys)
             if column_keys is not None
             else all_vector_names
         )
@@ -76,20 +74,6 @@ class ProviderTimeSeriesDataModel:
         vector_names = list(sorted(set(vector_names)))
         return vector_names
 
-    @staticmethod
-    def filter_vectorlist_on_column_keys(
-        column_key_list: list, vectorlist: list
-    ) -> list:
-        """Filter vectors using list of unix shell wildcards"""
-        try:
-            regex = re.compile(
-                "|".join([fnmatch.translate(col) for col in column_key_list]),
-                flags=re.IGNORECASE,
-            )
-            return [v for v in vectorlist if regex.fullmatch(v)]
-        except re.error:
-            return []
-
     def get_historical_vector_df(
         self, vector: str, ensemble: str
     ) -> Optional[pd.DataFrame]:
@@ -109,7 +93,8 @@ class ProviderTimeSeriesDataModel:
         vectors: List[str],
     ) -> pd.DataFrame:
         provider = self._provider_set[ensemble]
-        ens_vectors = [vec for vec in vectors if vec in provider.vector_names()]
+        vector_catalog = provider.vector_catalog()
+        ens_vectors = [vec for vec in vectors if vec in vector_catalog]
         return provider.get_vectors_df(ens_vectors, None, realizations)
 
     def get_last_date(self, ensemble: str) -> str:
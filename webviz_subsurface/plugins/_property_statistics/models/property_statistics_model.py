@@ -1,4 +1,6 @@
-from typing import Any, List, Tuple
+import warnings
+from functools import reduce
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -28,17 +30,24 @@ class PropertyStatisticsModel:
     ]
     REQUIRED_SELECTORS = ["ZONE"]
     SKIPPED_COLUMNS = ["Count"]
+    STATISTICS = ["Avg", "Avg_Weighted", "Max", "Min", "P10", "P90", "Stddev"]
 
     def __init__(self, dataframe: pd.DataFrame, theme: WebvizConfigTheme) -> None:
         self._dataframe = dataframe
         self._dataframe["REAL"] = self._dataframe["REAL"].astype(int)
         self._prepare_and_validate_data()
-        self._dataframe["label"] = self._dataframe.agg(
-            lambda x: " | ".join(
-                [f"{x[sel]}" for sel in ["PROPERTY"] + self.selectors]
-            ),
-            axis=1,
+        self._label_codes, self._label_df = self._create_label_codes()
+        self._dataframe["label"] = self._label_df["label"].to_numpy()[self._label_codes]
+        self._label_index: Dict[str, int] = {
+            label: code for code, label in enumerate(self._label_df["label"])
+        }
+        self._ensemble_codes, ensembles = pd.factorize(
+            self._dataframe["ENSEMBLE"], use_na_sentinel=False
         )
+        self._ensemble_index: Dict[str, int] = {
+            ensemble: code for code, ensemble in enumerate(ensembles)
+        }
+        self._realizations, self._row_count, self._cube = self._create_cube()
         self.theme = theme
         self.colorway = self.theme.plotly_theme.get("layout", {}).get("colorway", None)
         self._statframe = self.aggregate_ensemble_data()
@@ -69,6 +78,67 @@ class PropertyStatisticsModel:
                 "Only one id is supported"
             )
 
+    def _create_label_codes(self) -> Tuple[np.ndarray, pd.DataFrame]:
+        """Integer code of the label of each row, and a dataframe with the property,
+        selector values, label and selector label of each code.
+
+        The property and selector columns are factorized one by one, and the codes
+        are combined into one code per row, such that each label string is only
+        created once.
+        """
+        columns = ["PROPERTY"] + self.selectors
+        combined = np.zeros(len(self.dataframe), dtype=np.int64)
+        for column in columns:
+            codes, uniques = pd.factorize(self.dataframe[column], use_na_sentinel=False)
+            combined, _ = pd.factorize(combined * len(uniques) + codes)
+        _, first_rows, label_codes = np.unique(
+            combined, return_index=True, return_inverse=True
+        )
+        label_df = self.dataframe.iloc[first_rows][columns].reset_index(drop=True)
+        values = [label_df[column].astype(str) for column in columns]
+        label_df["label"] = reduce(lambda x, y: x + " | " + y, values)
+        label_df["selector_label"] = reduce(lambda x, y: x + " | " + y, values[1:])
+        return label_codes.ravel(), label_df
+
+    def _create_cube(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Statistics as an array of shape (ensemble, label, realization, statistic),
+        NaN for missing values. Statistics of rows with the same ensemble, label and
+        realization are averaged.
+
+        Returns the realizations, the number of rows of each ensemble, label and
+        realization, and the array.
+        """
+        realizations, real_codes = np.unique(
+            self.dataframe["REAL"], return_inverse=True
+        )
+        shape = (len(self._ensemble_index), len(self._label_df), len(realizations))
+        index = np.ravel_multi_index(
+            (self._ensemble_codes, self._label_codes, real_codes.ravel()), shape
+        )
+        size = int(np.prod(shape))
+        values = self.dataframe[self.STATISTICS].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        cube = np.empty(shape + (len(self.STATISTICS),))
+        for stat_index in range(len(self.STATISTICS)):
+            count = np.bincount(
+                index, weights=valid[:, stat_index], minlength=size
+            ).reshape(shape)
+            total = np.bincount(
+                index,
+                weights=np.where(valid[:, stat_index], values[:, stat_index], 0.0),
+                minlength=size,
+            ).reshape(shape)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cube[..., stat_index] = total / count
+        row_count = np.bincount(index, minlength=size).reshape(shape)
+        return realizations, row_count, cube
+
+    def _label_rows(self, ensemble: str, label: str) -> np.ndarray:
+        """Mask of the rows of an ensemble and label"""
+        return (self._ensemble_codes == self._ensemble_index.get(ensemble, -1)) & (
+            self._label_codes == self._label_index.get(label, -1)
+        )
+
     @property
     def statframe(self) -> pd.DataFrame:
         return self._statframe
@@ -108,21 +178,37 @@ class PropertyStatisticsModel:
         return list(self.dataframe["ENSEMBLE"].unique())
 
     def aggregate_ensemble_data(self) -> pd.DataFrame:
-        return (
-            self.dataframe.drop(columns=["ID", "REAL"], errors="ignore")
-            .groupby(["ENSEMBLE", "label", "PROPERTY", "SOURCE"] + self.selectors)[
-                "Avg"
-            ]
-            .agg(
-                [
-                    ("Avg_Avg", "mean"),
-                    ("Avg_P10", lambda x: np.percentile(x, 10)),
-                    ("Avg_P90", lambda x: np.percentile(x, 90)),
-                    ("Avg_Stddev", "std"),
-                ]
-            )
-            .reset_index()
+        """Mean, P10, P90 and standard deviation of "Avg" over the realizations, for
+        each ensemble and label, computed from the statistics array"""
+        avg = self._cube[..., self.STATISTICS.index("Avg")]
+        has_rows = self._row_count > 0
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            stats = {
+                "Avg_Avg": np.nanmean(avg, axis=2),
+                "Avg_P10": np.nanpercentile(avg, 10, axis=2),
+                "Avg_P90": np.nanpercentile(avg, 90, axis=2),
+                "Avg_Stddev": np.nanstd(avg, axis=2, ddof=1),
+            }
+        # As np.percentile(), the percentiles are NaN if any value is NaN
+        has_nan = (has_rows & np.isnan(avg)).any(axis=2)
+        stats["Avg_P10"][has_nan] = np.nan
+        stats["Avg_P90"][has_nan] = np.nan
+
+        # Groups with missing ensemble or selector values are dropped, as by groupby()
+        ensembles = pd.Series(list(self._ensemble_index))
+        ensemble_indices, label_indices = np.nonzero(
+            has_rows.any(axis=2)
+            & ensembles.notna().to_numpy()[:, np.newaxis]
+            & self._label_df.notna().all(axis=1).to_numpy()[np.newaxis, :]
         )
+        columns = ["label", "PROPERTY"] + self.selectors
+        df = self._label_df.iloc[label_indices][columns].reset_index(drop=True)
+        df.insert(0, "ENSEMBLE", ensembles.iloc[ensemble_indices].to_numpy())
+        df.insert(3, "SOURCE", self.dataframe["SOURCE"].iloc[0])
+        for name, values in stats.items():
+            df[name] = values[ensemble_indices, label_indices]
+        return df.sort_values(["ENSEMBLE", "label"]).reset_index(drop=True)
 
     def get_labels(self, drop_constants: bool = True) -> List[str]:
         if drop_constants:
@@ -132,17 +218,13 @@ class PropertyStatisticsModel:
     def get_real_order(
         self, ensemble: str, series: str, statistic: str = "Avg"
     ) -> pd.DataFrame:
-        df = self.dataframe[self.dataframe["ENSEMBLE"] == ensemble]
-        df = df[df["label"] == series]
+        df = self.dataframe[self._label_rows(ensemble, series)]
         return df.sort_values(by=statistic)[[statistic, "REAL"]]
 
     def filter_on_label(
         self, ensemble: str, label: str, statistic: str = "Avg"
     ) -> pd.Series:
-        return self.dataframe[
-            (self.dataframe["ENSEMBLE"] == ensemble)
-            & (self.dataframe["label"] == label)
-        ][statistic]
+        return self.dataframe[self._label_rows(ensemble, label)][statistic]
 
     @staticmethod
     def filter_dataframe(
@@ -161,8 +243,7 @@ class PropertyStatisticsModel:
         self, ensemble: str, label: str, min_max: list, statistic: str = "Avg"
     ) -> pd.Series:
         return self.dataframe[
-            (self.dataframe["ENSEMBLE"] == ensemble)
-            & (self.dataframe["label"] == label)
+            self._label_rows(ensemble, label)
             & (self.dataframe[statistic].between(min_max[0], min_max[1]))
         ]["REAL"]
 
@@ -172,17 +253,34 @@ class PropertyStatisticsModel:
         selector_values: List[Any],
         statistic: str = "Avg",
     ) -> pd.DataFrame:
-        df = self.dataframe[self.dataframe["ENSEMBLE"] == ensemble]
-
+        """Statistic of the labels with the selector values in wide form, with one
+        column per label and one row per realization, taken from the statistics array
+        """
+        labels = self._label_df
         if selector_values is not None:
-            df = self.filter_dataframe(df, self.selectors, selector_values)
-        df = df[["REAL", statistic, "label"]]
-        if df.empty:
-            return df
-        return (
-            df.pivot_table(columns=["label"], values=statistic, index="REAL")
-            .rename_axis(None, axis=1)
-            .reset_index()
+            labels = self.filter_dataframe(labels, self.selectors, selector_values)
+        labels = labels.sort_values("label")
+        if ensemble not in self._ensemble_index or labels.empty:
+            return pd.DataFrame(columns=["REAL", statistic, "label"])
+
+        values = self._cube[
+            self._ensemble_index[ensemble],
+            labels.index.to_numpy(),
+            :,
+            self.STATISTICS.index(statistic),
+        ].T
+        valid = ~np.isnan(values)
+        rows = valid.any(axis=1)
+        columns = valid.any(axis=0)
+        return pd.concat(
+            [
+                pd.DataFrame({"REAL": self._realizations[rows]}),
+                pd.DataFrame(
+                    values[rows][:, columns],
+                    columns=labels["label"].to_numpy()[columns],
+                ),
+            ],
+            axis=1,
         )
 
     def delta_statistics(
@@ -199,8 +297,8 @@ class PropertyStatisticsModel:
         if selector_values is not None:
             df = self.filter_dataframe(df, self.selectors, selector_values)
         df = df[df["PROPERTY"] == prop]
-        df["label"] = df.agg(
-            lambda x: " | ".join([f"{x[sel]}" for sel in self.selectors]), axis=1
+        df["label"] = df["label"].map(
+            self._label_df.set_index("label")["selector_label"]
         )
 
         # Drop non-numerical columns before aggregations
@@ -334,12 +432,14 @@ class PropertyStatisticsModel:
         for selector in selector_values:
             sel_length *= len(selector)
 
-        df = self.dataframe.copy()
-        df = df[df["PROPERTY"] == prop]
+        # Filter the labels, and select the rows by the label codes
+        labels = self._label_df[self._label_df["PROPERTY"] == prop]
         if selector_values is not None:
-            df = self.filter_dataframe(df, self.selectors, selector_values)
-
-        df = df[df["ENSEMBLE"].isin(ensembles)]
+            labels = self.filter_dataframe(labels, self.selectors, selector_values)
+        df = self.dataframe[
+            np.isin(self._label_codes, labels.index)
+            & self.dataframe["ENSEMBLE"].isin(ensembles)
+        ]
 
         fig = create_figure(
             plot_type=plot_type if plot_type != "scatter_ensemble" else "scatter",
@@ -368,8 +468,7 @@ class PropertyStatisticsModel:
         Return dataframe with label and values for selected label for an ensemble.
         A column with normalized values can be added.
         """
-        df = self.dataframe[self.dataframe["ENSEMBLE"] == ensemble]
-        df = df[df["label"] == series]
+        df = self.dataframe[self._label_rows(ensemble, series)]
         if normalize:
             df["VALUE_NORM"] = (df[statistic] - df[statistic].min()) / (
                 df[statistic].max() - df[statistic].min()
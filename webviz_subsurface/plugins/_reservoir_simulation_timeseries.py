@@ -21,7 +21,11 @@ from webviz_config.common_cache import CACHE
 from webviz_config.deprecation_decorators import deprecated_plugin
 from webviz_config.webviz_assets import WEBVIZ_ASSETS
 from webviz_config.webviz_store import webvizstore
-from webviz_subsurface_components import ExpressionInfo, ExternalParseData
+from webviz_subsurface_components import (
+    ExpressionInfo,
+    ExternalParseData,
+    VectorCalculator,
+)
 
 import webviz_subsurface
 from webviz_subsurface._models import (
@@ -38,6 +42,7 @@ from .._datainput.from_timeseries_cumulatives import (
     calc_from_cumulatives,
     rename_vec_from_cum,
 )
+from .._utils.content_memoize import content_memoize, register_immutable
 from .._utils.fanchart_plotting import (
     FanchartData,
     FreeLineData,
@@ -45,6 +50,7 @@ from .._utils.fanchart_plotting import (
     MinMaxData,
     get_fanchart_traces,
 )
+from .._utils.realization_plotting import concatenate_realization_lines
 from .._utils.simulation_timeseries import (
     add_statistics_traces,
     calc_series_statistics,
@@ -54,6 +60,10 @@ from .._utils.simulation_timeseries import (
     render_hovertemplate,
     set_simulation_line_shape_fallback,
 )
+from .._utils.smry_provider_adapter import (
+    SmryProviderAdapter,
+    create_smry_provider_adapter_from_paths,
+)
 from .._utils.unique_theming import unique_colors
 from .._utils.vector_calculator import (
     expressions_from_config,
@@ -110,6 +120,11 @@ class ReservoirSimulationTimeSeries(WebvizPluginABC):
     from the simulations will be extracted. Wild card asterisk `*` can be used.
 * **`sampling`:** Time separation between extracted values. Can be e.g. `monthly` (default) or \
     `yearly`.
+* **`rel_file_pattern`:** Optional path to `.arrow` files with summary data, relative to each \
+    realization, e.g. `share/results/unsmry/*.arrow`. If given, the summary data is read from \
+    the `.arrow` files through the summary providers, only loading the vectors in use, instead \
+    of loading all vectors from `UNSMRY` into memory. `sampling` must then be `raw` or a \
+    frequency, i.e. `daily`, `weekly`, `monthly`, `quarterly` or `yearly`.
 
 **Common optional settings for both input options**
 * **`obsfile`**: File with observations to plot together with the relevant time series. \
@@ -127,6 +142,8 @@ class ReservoirSimulationTimeSeries(WebvizPluginABC):
     * `linear` (default)
     * `backfilled`
     * `hv`, `vh`, `hvh`, `vhv` and `spline` (regular Plotly options).
+* **`single_trace_realizations`:** Render all realizations of an ensemble as one trace, \
+    which is faster for large ensembles. Default is one trace per realization.
 
 **Calculated vector expressions**
 * **`predefined_expressions`:** yaml file with pre-defined expressions
@@ -178,7 +195,7 @@ folder, to avoid risk of not extracting the right data.
 
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-locals
-    # pylint: disable=too-many-statements
+    # pylint: disable=too-many-statements, too-many-branches
     def __init__(
         self,
         app: Dash,
@@ -191,6 +208,8 @@ folder, to avoid risk of not extracting the right data.
         options: dict = None,
         predefined_expressions: str = None,
         line_shape_fallback: str = "linear",
+        single_trace_realizations: bool = False,
+        rel_file_pattern: str = None,
     ):
         super().__init__()
 
@@ -219,7 +238,10 @@ folder, to avoid risk of not extracting the right data.
         if obsfile:
             self.observations = check_and_format_observations(get_path(self.obsfile))
 
-        self.smry: pd.DataFrame
+        # The summary data is either a DataFrame with all vectors, or read per query
+        # through the adapter
+        self.smry: Optional[pd.DataFrame] = None
+        self.smry_adapter: Optional[SmryProviderAdapter] = None
         self.smry_meta: Union[pd.DataFrame, None]
 
         if csvfile:
@@ -234,6 +256,17 @@ folder, to avoid risk of not extracting the right data.
             self.time_index = pd.infer_freq(
                 sorted(pd.to_datetime(self.smry["DATE"]).unique())
             )
+        elif ensembles and rel_file_pattern:
+            self.smry_adapter = create_smry_provider_adapter_from_paths(
+                ensemble_paths={
+                    ens: webviz_settings.shared_settings["scratch_ensembles"][ens]
+                    for ens in ensembles
+                },
+                rel_file_pattern=rel_file_pattern,
+                sampling=self.time_index,
+                column_keys=self.column_keys,
+            )
+            self.smry_meta = self.smry_adapter.load_smry_meta()
         elif ensembles:
             self.emodel: EnsembleSetModel = (
                 caching_ensemble_set_model_factory.get_or_create_model(
@@ -251,7 +284,20 @@ folder, to avoid risk of not extracting the right data.
             raise ValueError(
                 'Incorrent arguments. Either provide a "csvfile" or "ensembles"'
             )
-        if any(col.startswith(("AVG_", "INTVL_")) for col in self.smry.columns):
+        if self.smry is not None:
+            # The static summary frame is hashed once here, instead of in each call of
+            # the memoized functions of the callbacks
+            register_immutable(self.smry)
+        if self.smry_adapter is not None:
+            smry_columns = self.smry_adapter.columns()
+            self.ensembles = self.smry_adapter.ensemble_names()
+            last_date = max(self.smry_adapter.dates())
+        else:
+            smry = self._get_smry([], [])
+            smry_columns = list(smry.columns)
+            self.ensembles = list(smry["ENSEMBLE"].unique())
+            last_date = max(smry["DATE"])
+        if any(col.startswith(("AVG_", "INTVL_")) for col in smry_columns):
             raise ValueError(
                 "Your data set includes time series vectors which have names starting with"
                 "'AVG_' and/or 'INTVL_'. These prefixes are not allowed, as they are used"
@@ -259,9 +305,9 @@ folder, to avoid risk of not extracting the right data.
             )
         self.smry_cols: List[str] = [
             c
-            for c in self.smry.columns
+            for c in smry_columns
             if c not in ReservoirSimulationTimeSeries.ENSEMBLE_COLUMNS
-            and historical_vector(c, self.smry_meta, False) not in self.smry.columns
+            and historical_vector(c, self.smry_meta, False) not in smry_columns
         ]
 
         self.vector_data: list = []
@@ -295,7 +341,6 @@ folder, to avoid risk of not extracting the right data.
                     f"{simulation_vector_description(interval_split[0])} ({interval_vec})",
                 )
 
-        self.ensembles = list(self.smry["ENSEMBLE"].unique())
         self.theme = webviz_settings.theme
 
         self.plot_options = options if options else {}
@@ -312,11 +357,12 @@ folder, to avoid risk of not extracting the right data.
         self.plot_options["date"] = (
             str(self.plot_options.get("date"))
             if self.plot_options.get("date")
-            else str(max(self.smry["DATE"]))
+            else str(last_date)
         )
         self.line_shape_fallback = set_simulation_line_shape_fallback(
             line_shape_fallback
         )
+        self.single_trace_realizations = single_trace_realizations
 
         # Retreive predefined expressions from configuration and validate
         self.predefined_expressions_path = (
@@ -800,6 +846,20 @@ folder, to avoid risk of not extracting the right data.
 
             self._add_expression(vector_data, name, description)
 
+    def _get_smry(
+        self, vectors: List[str], selected_expressions: List[ExpressionInfo]
+    ) -> pd.DataFrame:
+        """Summary data with the columns needed for the vectors. When read through the
+        providers, only the needed vectors are loaded.
+        """
+        if self.smry is not None:
+            return self.smry
+        if self.smry_adapter is None:
+            raise ValueError("No summary data")
+        return self.smry_adapter.get_smry_df(
+            required_smry_columns(vectors, selected_expressions, self.smry_meta)
+        )
+
     # pylint: disable=too-many-statements
     def set_callbacks(self, app: Dash) -> None:
         @app.callback(
@@ -906,7 +966,7 @@ folder, to avoid risk of not extracting the right data.
             # Loop through each vector and calculate relevant plot
             legends = []
             dfs = calculate_vector_dataframes(
-                smry=self.smry,
+                smry=self._get_smry(vectors, selected_expressions),
                 smry_meta=self.smry_meta,
                 ensembles=ensembles,
                 vectors=vectors,
@@ -949,6 +1009,7 @@ folder, to avoid risk of not extracting the right data.
                         colors=self.ens_colors,
                         line_shape=line_shape,
                         interval=cum_interval,
+                        single_trace=self.single_trace_realizations,
                     )
                 else:
                     raise PreventUpdate
@@ -972,19 +1033,20 @@ folder, to avoid risk of not extracting the right data.
                         and historical_vector_name in dfs[vector]["data"].columns
                         and not calc_mode == "delta_ensembles"
                     ):
-                        traces.append(
+                        traces = traces + [
                             add_history_trace(
                                 dfs[vector]["data"],
                                 historical_vector_name,
                                 line_shape,
                             )
-                        )
+                        ]
 
-                # Remove unwanted legends(only keep one for each ensemble)
+                # Remove unwanted legends(only keep one for each ensemble). The traces
+                # are cached, and are copied before modification.
                 for trace in traces:
                     if trace.get("showlegend"):
                         if trace.get("legendgroup") in legends:
-                            trace["showlegend"] = False
+                            trace = {**trace, "showlegend": False}
                         else:
                             legends.append(trace.get("legendgroup"))
                     fig.add_trace(trace, i + 1, 1)
@@ -1064,17 +1126,21 @@ folder, to avoid risk of not extracting the right data.
             # Calculate selected expressions:
             selected_expressions = get_selected_expressions(expressions, vectors)
 
-            dfs = calculate_vector_dataframes(
-                smry=self.smry,
-                smry_meta=self.smry_meta,
-                ensembles=ensembles,
-                vectors=vectors,
-                selected_expressions=selected_expressions,
-                calc_mode=calc_mode,
-                visualization=visualization,
-                time_index=self.time_index,
-                cum_interval=cum_interval,
-            )
+            # Copy of the cached dictionaries, as the dataframes are replaced below
+            dfs: Dict[str, Dict[str, pd.DataFrame]] = {
+                vector: dict(df)
+                for vector, df in calculate_vector_dataframes(
+                    smry=self._get_smry(vectors, selected_expressions),
+                    smry_meta=self.smry_meta,
+                    ensembles=ensembles,
+                    vectors=vectors,
+                    selected_expressions=selected_expressions,
+                    calc_mode=calc_mode,
+                    visualization=visualization,
+                    time_index=self.time_index,
+                    cum_interval=cum_interval,
+                ).items()
+            }
             for vector, df in dfs.items():
                 if visualization in ["fanchart", "statistics"]:
                     df["stat"] = df["stat"].sort_values(
@@ -1272,7 +1338,7 @@ folder, to avoid risk of not extracting the right data.
         functions: List[Tuple[Callable, list]] = []
         if self.csvfile:
             functions.append((read_csv, [{"csv_file": self.csvfile}]))
-        else:
+        elif self.smry is not None:
             functions.extend(self.emodel.webvizstore)
         if self.obsfile:
             functions.append((get_path, [{"path": self.obsfile}]))
@@ -1282,7 +1348,7 @@ folder, to avoid risk of not extracting the right data.
 
 
 # pylint: disable = too-many-arguments
-@CACHE.memoize()
+@content_memoize
 def calculate_vector_dataframes(
     smry: pd.DataFrame,
     smry_meta: Union[pd.DataFrame, None],
@@ -1312,7 +1378,7 @@ def calculate_vector_dataframes(
 
 
 # pylint: disable = too-many-arguments
-@CACHE.memoize()
+@content_memoize
 def calculate_vector_dataframe(
     smry: pd.DataFrame,
     smry_meta: Union[pd.DataFrame, None],
@@ -1328,7 +1394,7 @@ def calculate_vector_dataframe(
     if expression:
         data = get_calculated_vector_df(expression, smry, ensembles)
     elif vector.startswith("AVG_"):
-        total_vector = f"{vector[4:7] + vector[7:].replace('R', 'T', 1)}"
+        total_vector = _total_vector_name(vector)
         data = filter_df(smry, ensembles, total_vector, smry_meta, calc_mode)
         data = calc_from_cumulatives(
             data=data,
@@ -1339,7 +1405,7 @@ def calculate_vector_dataframe(
         )
         vector = rename_vec_from_cum(vector=vector[4:], as_rate=True)
     elif vector.startswith("INTVL_"):
-        total_vector = vector.lstrip("INTVL_")
+        total_vector = _total_vector_name(vector)
         data = filter_df(smry, ensembles, total_vector, smry_meta, calc_mode)
         data = calc_from_cumulatives(
             data=data,
@@ -1365,6 +1431,44 @@ def calculate_vector_dataframe(
     return output
 
 
+def _total_vector_name(vector: str) -> str:
+    """Name of the cumulative vector of an AVG_ or INTVL_ vector"""
+    if vector.startswith("AVG_"):
+        return f"{vector[4:7] + vector[7:].replace('R', 'T', 1)}"
+    if vector.startswith("INTVL_"):
+        return vector.lstrip("INTVL_")
+    return vector
+
+
+def required_smry_columns(
+    vectors: List[str],
+    selected_expressions: List[ExpressionInfo],
+    smry_meta: Union[pd.DataFrame, None],
+) -> List[str]:
+    """Summary vectors needed by `calculate_vector_dataframe()` for the vectors, i.e. the
+    vectors of calculated expressions, the cumulative vectors of AVG_ and INTVL_ vectors,
+    and the historical vectors.
+    """
+    columns: List[str] = []
+    for vector in vectors:
+        expression = get_expression_from_name(vector, selected_expressions)
+        if expression:
+            columns.extend(
+                VectorCalculator.variable_vector_dict(
+                    expression["variableVectorMap"]
+                ).values()
+            )
+            continue
+        total_vector = _total_vector_name(vector)
+        columns.append(total_vector)
+        historical_vector_name = historical_vector(
+            vector=total_vector, smry_meta=smry_meta
+        )
+        if historical_vector_name:
+            columns.append(historical_vector_name)
+    return columns
+
+
 def filter_df(
     df: pd.DataFrame,
     ensembles: List[str],
@@ -1408,7 +1512,7 @@ def calculate_delta(df: pd.DataFrame, base_ens: str, delta_ens: str) -> pd.DataF
     return dframe.dropna(axis=0, how="any")
 
 
-@CACHE.memoize()
+@content_memoize
 def add_histogram_traces(
     dframe: pd.DataFrame,
     vector: str,
@@ -1459,12 +1563,25 @@ def add_observation_trace(obs: dict) -> List[dict]:
     ]
 
 
-@CACHE.memoize()
+@content_memoize
 def add_realization_traces(
-    dframe: pd.DataFrame, vector: str, colors: dict, line_shape: str, interval: str
+    dframe: pd.DataFrame,
+    vector: str,
+    colors: dict,
+    line_shape: str,
+    interval: str,
+    single_trace: bool = False,
 ) -> List[dict]:
-    """Renders line trace for each realization, includes history line if present"""
+    """Renders line trace for each realization, includes history line if present.
+    With single_trace, the realizations of each ensemble are rendered as one trace."""
     hovertemplate = render_hovertemplate(vector, interval)
+    if single_trace:
+        return [
+            _add_ensemble_realizations_trace(
+                ens_df, vector, ensemble, colors, line_shape, hovertemplate
+            )
+            for ensemble, ens_df in dframe.groupby("ENSEMBLE")
+        ]
     return [
         {
             "line": {"shape": line_shape},
@@ -1481,6 +1598,35 @@ def add_realization_traces(
     ]
 
 
+def _add_ensemble_realizations_trace(
+    ens_df: pd.DataFrame,
+    vector: str,
+    ensemble: str,
+    colors: dict,
+    line_shape: str,
+    hovertemplate: str,
+) -> dict:
+    """Renders all realizations of an ensemble as one line trace, separated by NaN values.
+    scattergl does not support spline lines, which are rendered with scatter."""
+    dates, values, realizations = concatenate_realization_lines(
+        ens_df["DATE"].to_numpy(), ens_df[vector].to_numpy(), ens_df["REAL"].to_numpy()
+    )
+    return {
+        "type": "scatter" if line_shape == "spline" else "scattergl",
+        "line": {"shape": line_shape},
+        "x": list(dates),
+        "y": list(values),
+        "customdata": list(realizations),
+        "hovertemplate": (
+            f"{hovertemplate}Realization: %{{customdata}}, Ensemble: {ensemble}"
+        ),
+        "name": ensemble,
+        "legendgroup": ensemble,
+        "marker": {"color": colors.get(ensemble, colors[list(colors.keys())[0]])},
+        "showlegend": True,
+    }
+
+
 def add_history_trace(dframe: pd.DataFrame, vector: str, line_shape: str) -> dict:
     """Renders the history line"""
     df = dframe.loc[
@@ -1500,7 +1646,7 @@ def add_history_trace(dframe: pd.DataFrame, vector: str, line_shape: str) -> dic
     }
 
 
-@CACHE.memoize()
+@content_memoize
 def _get_fanchart_traces(
     stat_df: pd.DataFrame, vector: str, colors: dict, line_shape: str, interval: str
 ) -> list:
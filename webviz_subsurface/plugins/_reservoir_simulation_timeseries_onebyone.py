@@ -1,7 +1,7 @@
 import datetime
 import json
 from pathlib import Path
-from typing import Callable, List, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 import numpy as np
@@ -31,6 +31,10 @@ from .._utils.simulation_timeseries import (
     get_simulation_line_shape,
     set_simulation_line_shape_fallback,
 )
+from .._utils.smry_provider_adapter import (
+    SmryProviderAdapter,
+    create_smry_provider_adapter_from_paths,
+)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -60,6 +64,11 @@ run with that sensitivity.
     from the simulations will be extracted. Wild card asterisk `*` can be used.
 * **`sampling`:** Time separation between extracted values. Can be e.g. `monthly` (default) or \
     `yearly`.
+* **`rel_file_pattern`:** Optional path to `.arrow` files with summary data, relative to each \
+    realization, e.g. `share/results/unsmry/*.arrow`. If given, the summary data is read from \
+    the `.arrow` files through the summary providers, only loading the vectors in use, instead \
+    of loading all vectors from `UNSMRY` into memory. `sampling` must then be `raw` or a \
+    frequency, i.e. `daily`, `weekly`, `monthly`, `quarterly` or `yearly`.
 
 **Common optional settings for both input options**
 * **`initial_vector`:** Initial vector to display
@@ -133,6 +142,7 @@ folder, to avoid risk of not extracting the right data.
         initial_vector: str = None,
         sampling: str = "monthly",
         line_shape_fallback: str = "linear",
+        rel_file_pattern: str = None,
     ) -> None:
         super().__init__()
 
@@ -146,6 +156,10 @@ folder, to avoid risk of not extracting the right data.
                 'Incorrent arguments. Either provide a "csvfile_smry" and "csvfile_parameters" or '
                 '"ensembles"'
             )
+        # The summary data is either a DataFrame with all vectors, or read per query
+        # through the adapter
+        self.smry: Optional[pd.DataFrame] = None
+        self.smry_adapter: Optional[SmryProviderAdapter] = None
         if csvfile_smry and csvfile_parameters:
             self.smry = read_csv(csvfile_smry)
             self.parameters = read_csv(csvfile_parameters)
@@ -159,15 +173,24 @@ folder, to avoid risk of not extracting the right data.
                 ensemble: webviz_settings.shared_settings["scratch_ensembles"][ensemble]
                 for ensemble in ensembles
             }
-            self.emodel: EnsembleSetModel = (
-                caching_ensemble_set_model_factory.get_or_create_model(
+            if rel_file_pattern is not None:
+                self.smry_adapter = create_smry_provider_adapter_from_paths(
                     ensemble_paths=self.ens_paths,
-                    time_index=self.time_index,
+                    rel_file_pattern=rel_file_pattern,
+                    sampling=self.time_index,
                     column_keys=self.column_keys,
                 )
-            )
-            self.smry = self.emodel.get_or_load_smry_cached()
-            self.smry_meta = self.emodel.load_smry_meta()
+                self.smry_meta = self.smry_adapter.load_smry_meta()
+            else:
+                self.emodel: EnsembleSetModel = (
+                    caching_ensemble_set_model_factory.get_or_create_model(
+                        ensemble_paths=self.ens_paths,
+                        time_index=self.time_index,
+                        column_keys=self.column_keys,
+                    )
+                )
+                self.smry = self.emodel.get_or_load_smry_cached()
+                self.smry_meta = self.emodel.load_smry_meta()
 
             # Extract realizations and sensitivity information
             self.parameters = get_realizations(
@@ -178,11 +201,16 @@ folder, to avoid risk of not extracting the right data.
                 'Incorrent arguments. Either provide a "csvfile_smry" and "csvfile_parameters" or '
                 '"ensembles"'
             )
+        self.smry_columns: List[str] = []
+        if self.smry is not None:
+            self.smry_columns = list(self.smry.columns)
+        elif self.smry_adapter is not None:
+            self.smry_columns = self.smry_adapter.columns()
         self.smry_cols = [
             c
-            for c in self.smry.columns
+            for c in self.smry_columns
             if c not in ReservoirSimulationTimeSeriesOneByOne.ENSEMBLE_COLUMNS
-            and historical_vector(c, self.smry_meta, False) not in self.smry.columns
+            and historical_vector(c, self.smry_meta, False) not in self.smry_columns
         ]
         self.initial_vector = (
             initial_vector
@@ -263,9 +291,21 @@ folder, to avoid risk of not extracting the right data.
 
     @property
     def initial_date(self) -> datetime.date:
-        df = self.smry[["ENSEMBLE", "DATE"]]
+        if self.smry_adapter is not None:
+            return max(self.smry_adapter.dates(self.ensembles[0]))
+        df = self._get_smry([], self.ensembles[0])[["ENSEMBLE", "DATE"]]
         return df.loc[df["ENSEMBLE"] == df["ENSEMBLE"].unique()[0]]["DATE"].max()
 
+    def _get_smry(self, vectors: List[str], ensemble: str) -> pd.DataFrame:
+        """Summary data with the columns needed for the vectors of the ensemble. When read
+        through the providers, only the given vectors are loaded.
+        """
+        if self.smry is not None:
+            return self.smry
+        if self.smry_adapter is None:
+            raise ValueError("No summary data")
+        return self.smry_adapter.get_smry_df(vectors, [ensemble])
+
     def add_webvizstore(self) -> List[Tuple[Callable, list]]:
         return (
             [
@@ -278,7 +318,7 @@ folder, to avoid risk of not extracting the right data.
                 )
             ]
             if self.csvfile_smry and self.csvfile_parameters
-            else self.emodel.webvizstore
+            else (self.emodel.webvizstore if self.smry is not None else [])
             + [
                 (
                     get_realizations,
@@ -388,7 +428,9 @@ folder, to avoid risk of not extracting the right data.
                 date = clickdata["points"][0]["x"]
             except TypeError as exc:
                 raise PreventUpdate from exc
-            data = filter_ensemble(self.smry, self.parameters, ensemble, [vector])
+            data = filter_ensemble(
+                self._get_smry([vector], ensemble), self.parameters, ensemble, [vector]
+            )
             data = data.loc[data["DATE"].astype(str) == date]
             table_rows, table_columns = calculate_table(data, vector)
             return (
@@ -458,11 +500,11 @@ folder, to avoid risk of not extracting the right data.
 
                 if (
                     historical_vector_name is not None
-                    and historical_vector_name in self.smry.columns
+                    and historical_vector_name in self.smry_columns
                 ):
                     vectors.append(historical_vector_name)
                 data = filter_ensemble(
-                    self.smry,
+                    self._get_smry(vectors, ensemble),
                     self.parameters,
                     ensemble,
                     vectors,
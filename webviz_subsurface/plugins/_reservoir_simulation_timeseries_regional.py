@@ -47,13 +47,19 @@ from .._utils.fanchart_plotting import (
     MinMaxData,
     get_fanchart_traces,
 )
+from .._utils.region_aggregation import RegionVectorAggregator
 from .._utils.simulation_timeseries import (
     get_simulation_line_shape,
     set_simulation_line_shape_fallback,
 )
+from .._utils.smry_provider_adapter import (
+    SmryProviderAdapter,
+    create_smry_provider_adapter_from_paths,
+)
 from .._utils.unique_theming import unique_colors
 
 
+# pylint: disable=too-many-instance-attributes
 class ReservoirSimulationTimeSeriesRegional(WebvizPluginABC):
     """Aggregates and visualizes regional time series data from simulation ensembles. That
 is: cumulatives, rates and inplace volumes. Allows human friendly filter names, e.g. regions,
@@ -89,6 +95,10 @@ Vectors that don't match the following patterns will be filtered out for this pl
     * `daily`
     * `monthly` (default)
     * `yearly`
+* **`rel_file_pattern`:** Optional path to `.arrow` files with summary data, relative to each \
+    realization, e.g. `share/results/unsmry/*.arrow`. If given, the summary data is read from \
+    the `.arrow` files through the summary providers, only loading the vectors in use, instead \
+    of loading all vectors from `UNSMRY` into memory.
 * **`line_shape_fallback`:** Fallback interpolation method between points. Vectors identified as \
     rates or phase ratios are always backfilled, vectors identified as cumulative (totals) are \
     always linearly interpolated. The rest use the fallback.
@@ -140,6 +150,7 @@ folder, to avoid risk of not extracting the right data.
         column_keys: Optional[list] = None,
         sampling: str = "monthly",
         line_shape_fallback: str = "linear",
+        rel_file_pattern: str = None,
     ):
         super().__init__()
 
@@ -151,28 +162,49 @@ folder, to avoid risk of not extracting the right data.
                 "'monthly' or 'yearly', as the statistics require the same dates throughout an"
                 "ensemble."
             )
-        self.emodel: EnsembleSetModel = (
-            caching_ensemble_set_model_factory.get_or_create_model(
-                ensemble_paths={
-                    ens: webviz_settings.shared_settings["scratch_ensembles"][ens]
-                    for ens in ensembles
-                },
-                time_index=self.time_index,
+        ensemble_paths = {
+            ens: webviz_settings.shared_settings["scratch_ensembles"][ens]
+            for ens in ensembles
+        }
+        # The summary data is either a DataFrame with all vectors, or read per query
+        # through the adapter
+        self.smry: Optional[pd.DataFrame] = None
+        self.smry_adapter: Optional[SmryProviderAdapter] = None
+        smry_columns: List[str] = []
+        if rel_file_pattern is not None:
+            self.smry_adapter = create_smry_provider_adapter_from_paths(
+                ensemble_paths=ensemble_paths,
+                rel_file_pattern=rel_file_pattern,
+                sampling=self.time_index,
                 column_keys=self.column_keys,
             )
-        )
-        self.smry = self.emodel.get_or_load_smry_cached()
-        self.smry_meta = self.emodel.load_smry_meta()
+            self.smry_meta = self.smry_adapter.load_smry_meta()
+            smry_columns = self.smry_adapter.columns()
+            self._ensembles = self.smry_adapter.ensemble_names()
+            self.first_date = min(self.smry_adapter.dates())
+        else:
+            self.emodel: EnsembleSetModel = (
+                caching_ensemble_set_model_factory.get_or_create_model(
+                    ensemble_paths=ensemble_paths,
+                    time_index=self.time_index,
+                    column_keys=self.column_keys,
+                )
+            )
+            self.smry = self.emodel.get_or_load_smry_cached()
+            self.smry_meta = self.emodel.load_smry_meta()
+            smry_columns = list(self.smry.columns)
+            self._ensembles = list(self.smry["ENSEMBLE"].unique())
+            self.first_date = self.smry["DATE"].min()
 
         self.field_totals = [
-            col for col in self.smry.columns if fnmatch.fnmatch(col, "F[OWG]PT")
+            col for col in smry_columns if fnmatch.fnmatch(col, "F[OWG]PT")
         ]
         self.rec_ensembles = set()
         if self.field_totals:
             smry_init_prod = pd.concat(
                 [
                     df[df["DATE"] == min(df["DATE"])]
-                    for _, df in self.smry[
+                    for _, df in self._get_smry(self.field_totals)[
                         ["ENSEMBLE", "DATE"] + self.field_totals
                     ].groupby("ENSEMBLE")
                 ]
@@ -203,7 +235,7 @@ folder, to avoid risk of not extracting the right data.
             )
 
         self.smry_cols: List[str] = []
-        for col in self.smry.columns:
+        for col in smry_columns:
             if (
                 col in ReservoirSimulationTimeSeriesRegional.ENSEMBLE_COLUMNS
                 or historical_vector(col, False) in self.smry_cols
@@ -239,6 +271,7 @@ folder, to avoid risk of not extracting the right data.
         self.fip_arrays = list(
             {simulation_region_vector_breakdown(col)[1] for col in self.smry_cols}
         )
+        self.region_aggregator = RegionVectorAggregator()
         self.set_callbacks(app)
 
     @property
@@ -323,7 +356,27 @@ folder, to avoid risk of not extracting the right data.
 
     @property
     def ensembles(self) -> List[str]:
-        return list(self.smry["ENSEMBLE"].unique())
+        return self._ensembles
+
+    def _get_smry(self, vector_names: List[str]) -> pd.DataFrame:
+        """Summary data with the columns needed for the vectors. When read through the
+        providers, only the given vectors are loaded.
+        """
+        if self.smry is not None:
+            return self.smry
+        if self.smry_adapter is None:
+            raise ValueError("No summary data")
+        return self.smry_adapter.get_smry_df(vector_names)
+
+    def _region_vectors(self, vector_base: str, fip: str) -> List[str]:
+        """Regional vectors of the base vector name and fip array, e.g. all ROIP vectors
+        of FIPNUM
+        """
+        return [
+            col
+            for col in self.smry_cols
+            if simulation_region_vector_breakdown(col)[:2] == (vector_base, fip)
+        ]
 
     @property
     def all_nodes(self) -> List[str]:
@@ -355,7 +408,7 @@ folder, to avoid risk of not extracting the right data.
         return color_dict
 
     def add_webvizstore(self) -> List[Tuple[Callable, list]]:
-        functions = self.emodel.webvizstore
+        functions = self.emodel.webvizstore if self.smry is not None else []
         if self.fipfile is not None:
             functions.append(
                 (
@@ -476,9 +529,7 @@ folder, to avoid risk of not extracting the right data.
                             highlight=False,
                             children=wcc.Graph(
                                 id=self.uuid("graph"),
-                                clickData={
-                                    "points": [{"x": str(self.smry["DATE"].min())}]
-                                },
+                                clickData={"points": [{"x": str(self.first_date)}]},
                                 style={"height": "40vh"},
                             ),
                         ),
@@ -502,7 +553,7 @@ folder, to avoid risk of not extracting the right data.
                 dcc.Store(
                     id=self.uuid("date"),
                     storage_type="session",
-                    data=json.dumps(str(self.smry["DATE"].min())),
+                    data=json.dumps(str(self.first_date)),
                 ),
                 dcc.Store(
                     id=self.uuid("ref_vec"), storage_type="session", data=json.dumps("")
@@ -662,13 +713,14 @@ folder, to avoid risk of not extracting the right data.
                 vector_base = vector
             try:
                 df, ref_vector = filter_and_aggregate_vectors(
-                    smry=self.smry,
+                    smry=self._get_smry(self._region_vectors(vector_base, fip_array)),
                     ensembles=ensembles,
                     groupby=groupby,
                     vector=vector_base,
                     filters=filters,
                     fipdesc=self.fipdesc,
                     fip=fip_array,
+                    region_aggregator=self.region_aggregator,
                 )
             except KeyError as exception:
                 return [
@@ -1061,7 +1113,6 @@ def render_table(
     )
 
 
-@CACHE.memoize()
 def filter_and_aggregate_vectors(
     smry: pd.DataFrame,
     ensembles: list,
@@ -1070,15 +1121,17 @@ def filter_and_aggregate_vectors(
     filters: dict,
     fipdesc: pd.DataFrame,
     fip: str,
+    region_aggregator: RegionVectorAggregator,
 ) -> Tuple[pd.DataFrame, str]:
     """Aggregate inplace vectors based on filters
-    Note: ensemble is only in the list of inputs to reduce risk with caching
-          See: https://github.com/equinor/webviz-config/issues/211
     Creating Eclipse format summary vectors from selection
+
+    The vectors are summed per subgroup with a sparse membership matrix of the nodes,
+    and the aggregated data is cached per subgroup selection and ensemble by
+    `region_aggregator`.
     """
     if groupby != "ENSEMBLE" and len(ensembles) > 1:  # This should never happen
         raise ValueError("Cannot have multiple ensembles unless you group by ensemble")
-    df = smry[smry["ENSEMBLE"].isin(ensembles)]
     if fipdesc is None or fip not in fipdesc["FIP"].values:
         if groupby == "ENSEMBLE":
             nodes = filters
@@ -1113,13 +1166,14 @@ def filter_and_aggregate_vectors(
 
     # Aggregate, concatenate and return.
     return (
-        pd.concat(
-            [df[["ENSEMBLE", "REAL", "DATE"]]]
-            + [
-                df[vectors].sum(axis=1).to_frame(f"AGG_{vector}_filtered_on_{subgroup}")
-                for subgroup, vectors in subgroup_vectors.items()
-            ],
-            axis=1,
+        region_aggregator.aggregate(
+            smry=smry,
+            ensembles=ensembles,
+            group_vectors=subgroup_vectors,
+            group_columns={
+                subgroup: f"AGG_{vector}_filtered_on_{subgroup}"
+                for subgroup in subgroup_vectors
+            },
         ),
         ref_vector,
     )
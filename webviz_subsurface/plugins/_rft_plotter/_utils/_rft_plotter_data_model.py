@@ -9,12 +9,19 @@ from webviz_config.common_cache import CACHE
 from webviz_config.webviz_store import webvizstore
 
 from webviz_subsurface._models.parameter_model import ParametersModel
+from webviz_subsurface._utils.correlation import (
+    CorrelationCubeCache,
+    correlate_against,
+    sort_by_absolute_value,
+)
 from webviz_subsurface._utils.ensemble_table_provider_set_factory import (
     create_csvfile_providerset_from_paths,
     create_parameter_providerset_from_paths,
 )
 from webviz_subsurface._utils.unique_theming import unique_colors
 
+from ._rft_response_tensor import RftResponseTensor, non_constant_columns
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -126,6 +133,31 @@ class RftPlotterDataModel:
             ["WELL", "DATE", "ZONE", "ENSEMBLE", "TVD"]
         )["SIMULATED"].transform("std")
 
+        self._rft_tensors = self._create_rft_tensors()
+        self._rft_correlations = CorrelationCubeCache()
+
+    def _create_rft_tensors(self) -> Dict[str, RftResponseTensor]:
+        """Simulated RFTs and parameters of each ensemble as arrays, see
+        `RftResponseTensor`"""
+        rft_df = self.ertdatadf[
+            ["ENSEMBLE", "REAL", "SIMULATED", "OBSERVED", "OBSERVED_ERR"]
+        ].assign(
+            RFT_KEY=self.ertdatadf["WELL"]
+            + " "
+            + self.ertdatadf["DATE"]
+            + " "
+            + self.ertdatadf["ZONE"]
+        )
+        parameterdf = self.param_model.dataframe
+        return {
+            ensemble: RftResponseTensor(
+                rft_df[rft_df["ENSEMBLE"] == ensemble],
+                parameterdf[parameterdf["ENSEMBLE"] == ensemble],
+                self.param_model.parameters,
+            )
+            for ensemble in self.ensembles
+        }
+
     @property
     def well_names(self) -> List[str]:
         return sorted(list(self.ertdatadf["WELL"].unique()))
@@ -216,14 +248,14 @@ class RftPlotterDataModel:
     ) -> Tuple[Optional[pd.DataFrame], float, float, List[str], List[str],]:
         """This method merges rft observations and parameters.
 
-        The RFT observations are converted from long form (all simulated values
-        in one column: SIMULATED) to wide form (on column for each well/date/zone).
-        This is needed for calculating correlations between RFTs. It is an option
+        The RFT observations are in wide form (one column for each well/date/zone),
+        which is needed for calculating correlations between RFTs. It is an option
         whether to keep one or all RFT columns. If there are multiple observations
         with the same well/date/zone, they are averaged (depth could be added as a
         fourth parameter here, f.ex optional).
 
-        This RFT wide form table is then merged on REAL with the ensemble parameters.
+        The RFTs and parameters of the ensemble are pivoted once, at init, so this
+        only selects the realizations and RFTs from the arrays of the ensemble.
 
         Returns:
         * merged dataframe with RFTs and parameters
@@ -232,46 +264,49 @@ class RftPlotterDataModel:
         * list with ensemble parameters
         * list with rft names
         """
-        # pylint: disable = too-many-locals
-        rft_filter = {"ENSEMBLE": ensemble, "REAL": reals}
-        if not keep_all_rfts:
-            rft_filter.update({"WELL": well, "DATE": date, "ZONE": zone})
-
-        rft_df = filter_frame(self.ertdatadf, rft_filter)[
-            ["REAL", "DATE", "WELL", "ZONE", "SIMULATED", "OBSERVED", "OBSERVED_ERR"]
-        ]
-
-        if rft_df.empty:
+        current_key = f"{well} {date} {zone}"
+        if ensemble not in self._rft_tensors:
+            return None, 0, 0, [], []
+        tensor = self._rft_tensors[ensemble]
+        pivot = tensor.pivot_table(
+            reals, rft_key=None if keep_all_rfts else current_key
+        )
+        if pivot is None:
             return None, 0, 0, [], []
 
-        rft_df["RFT_KEY"] = rft_df["WELL"] + " " + rft_df["DATE"] + " " + rft_df["ZONE"]
-
-        # Get observation and error
-        # In case there are multiple observations in the same well/date/zone
-        # they are averaged (as in the pivot table)
-        df_current_obs = rft_df[rft_df["RFT_KEY"] == f"{well} {date} {zone}"]
-        obs = df_current_obs["OBSERVED"].mean()
-        obs_err = df_current_obs["OBSERVED_ERR"].mean()
+        df, ens_params, ens_rfts = pivot
+        obs, obs_err = tensor.observation(current_key, reals)
+        return df, obs, obs_err, ens_params, ens_rfts
 
-        pivot_df = rft_df.pivot_table(
-            index="REAL", columns="RFT_KEY", values="SIMULATED", aggfunc="mean"
-        ).reset_index()
+    def correlate_with_pivot_table(
+        self,
+        df: pd.DataFrame,
+        ensemble: str,
+        reals: List[int],
+        response: str,
+        columns: List[str],
+    ) -> pd.Series:
+        """Correlations of an RFT or parameter column of a table from
+        `create_rft_and_param_pivot_table` with parameter or RFT columns, as `correlate`.
+
+        The correlations are looked up from the correlations of all RFTs with all
+        parameters of the ensemble, which are computed at once and cached per
+        selection of realizations.
+        """
+        columns = non_constant_columns(df, columns)
+        if not non_constant_columns(df, [response]):
+            return pd.Series(0.0, index=columns)
 
-        param_df = (
-            filter_frame(
-                self.param_model.dataframe, {"ENSEMBLE": ensemble, "REAL": reals}
-            )
-            .drop("ENSEMBLE", axis=1)
-            .dropna(axis=1)  # Removes parameters not used in this ensemble
+        corrdf = self._rft_correlations.get_or_create(
+            (ensemble, tuple(sorted(reals))),
+            lambda: self._rft_tensors[ensemble].correlations(reals),
         )
-        ens_params = [
-            param
-            for param in param_df.columns
-            if param not in self.param_model.selectors
-        ]
-        ens_rfts = [rft for rft in pivot_df.columns if rft != "REAL"]
-
-        return pivot_df.merge(param_df, on="REAL"), obs, obs_err, ens_params, ens_rfts
+        corrseries = (
+            corrdf.loc[response, columns]
+            if response in corrdf.index
+            else corrdf.loc[columns, response]
+        )
+        return sort_by_absolute_value(corrseries.fillna(0))
 
     @property
     def webviz_store(self) -> List[Tuple[Callable, List[Dict[str, Any]]]]:
@@ -324,15 +359,12 @@ def filter_frame(
 
 
 def correlate(df: pd.DataFrame, response: str) -> pd.Series:
-    """Returns the correlation matrix for a dataframe
-
-    This function is the same as in ParameterAnalysis and could be generalized
+    """Returns the correlations of the non-constant columns of a dataframe with the
+    response, sorted by absolute value. 0 if the response is constant.
     """
     df = df[df.columns[df.nunique() > 1]].copy()
     if response not in df.columns:
         df[response] = np.nan
-    series = df[response]
-    df = df.drop(columns=[response])
-    corrdf = df.corrwith(series)
+    corrdf = correlate_against(df.drop(columns=[response]), df[response])
     corrdf.fillna(0, inplace=True)
-    return corrdf.reindex(corrdf.abs().sort_values().index)
+    return sort_by_absolute_value(corrdf)
@@ -0,0 +1,156 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface._utils.correlation import correlate_against
+
+
+class RftResponseTensor:
+    """Simulated RFTs and parameters of one ensemble as arrays on the same
+    realizations, for selecting and correlating RFTs and parameters without filtering
+    and pivoting the RFT dataframe in each callback.
+
+    The RFTs are keyed by well, date and zone as "WELL DATE ZONE". If there are several
+    RFT points with the same key in a realization, they are averaged.
+
+    Input:
+    * rft_df: dataframe with columns "REAL", "RFT_KEY", "SIMULATED", "OBSERVED" and
+    "OBSERVED_ERR" for the ensemble
+    * parameter_df: dataframe with columns "REAL" and the parameters for the ensemble,
+    one row per realization
+    * parameters: names of parameter columns
+    """
+
+    def __init__(
+        self, rft_df: pd.DataFrame, parameter_df: pd.DataFrame, parameters: List[str]
+    ) -> None:
+        grouped = rft_df.groupby(["RFT_KEY", "REAL"])
+        self.rft_keys: List[str] = sorted(rft_df["RFT_KEY"].unique())
+        self.parameters = parameters
+        self.realizations = np.union1d(rft_df["REAL"].unique(), parameter_df["REAL"])
+        self._key_index = {key: index for index, key in enumerate(self.rft_keys)}
+
+        def _to_array(series: pd.Series, fill_value: float) -> np.ndarray:
+            return (
+                series.unstack()
+                .reindex(index=self.rft_keys, columns=self.realizations)
+                .fillna(fill_value)
+                .to_numpy(dtype=np.float64)
+            )
+
+        # Arrays of shape (n_rfts, n_reals)
+        self.simulated = _to_array(grouped["SIMULATED"].mean(), np.nan)
+        self._point_count = _to_array(grouped.size(), 0)
+        self._observed_sum = _to_array(grouped["OBSERVED"].sum(), 0)
+        self._observed_count = _to_array(grouped["OBSERVED"].count(), 0)
+        self._observed_err_sum = _to_array(grouped["OBSERVED_ERR"].sum(), 0)
+        self._observed_err_count = _to_array(grouped["OBSERVED_ERR"].count(), 0)
+
+        # Array of shape (n_reals, n_parameters)
+        self.parameter_values = (
+            parameter_df.set_index("REAL")[parameters]
+            .reindex(self.realizations)
+            .to_numpy(dtype=np.float64)
+        )
+        self._has_parameters = np.isin(self.realizations, parameter_df["REAL"])
+
+    def _selected(self, reals: Sequence[int]) -> np.ndarray:
+        return np.isin(self.realizations, reals)
+
+    def _ensemble_parameters(self, selected: np.ndarray) -> np.ndarray:
+        """Mask of the parameters without missing values in the selected realizations,
+        i.e. the parameters used in the ensemble"""
+        return ~np.isnan(self.parameter_values[selected & self._has_parameters]).any(
+            axis=0
+        )
+
+    def _parameter_names(self, parameter_mask: np.ndarray) -> List[str]:
+        return [param for param, used in zip(self.parameters, parameter_mask) if used]
+
+    def observation(self, rft_key: str, reals: Sequence[int]) -> Tuple[float, float]:
+        """Observation and observation error of an RFT, averaged over the RFT points of
+        the realizations. NaN if there are no RFT points."""
+        if rft_key not in self._key_index:
+            return np.nan, np.nan
+        index = self._key_index[rft_key]
+        selected = self._selected(reals)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (
+                self._observed_sum[index, selected].sum()
+                / self._observed_count[index, selected].sum(),
+                self._observed_err_sum[index, selected].sum()
+                / self._observed_err_count[index, selected].sum(),
+            )
+
+    def pivot_table(
+        self, reals: Sequence[int], rft_key: Optional[str] = None
+    ) -> Optional[Tuple[pd.DataFrame, List[str], List[str]]]:
+        """Simulated RFTs, all or only `rft_key`, and parameters of the realizations in
+        wide form, with one row per realization with both RFTs and parameters.
+
+        Returns None if there are no RFT points for the realizations. Otherwise:
+        * dataframe with "REAL", RFT and parameter columns
+        * list with ensemble parameters
+        * list with rft names
+        """
+        if rft_key is None:
+            rft_indices = np.arange(len(self.rft_keys))
+        elif rft_key in self._key_index:
+            rft_indices = np.array([self._key_index[rft_key]])
+        else:
+            return None
+        selected = self._selected(reals)
+        if not self._point_count[rft_indices][:, selected].any():
+            return None
+
+        simulated = self.simulated[rft_indices]
+        rft_valid = ~np.isnan(simulated) & selected
+        rows = rft_valid.any(axis=0) & self._has_parameters
+        rft_indices = rft_indices[rft_valid.any(axis=1)]
+        parameter_mask = self._ensemble_parameters(selected)
+
+        rfts = [self.rft_keys[index] for index in rft_indices]
+        ens_params = self._parameter_names(parameter_mask)
+        df = pd.concat(
+            [
+                pd.DataFrame({"REAL": self.realizations[rows]}),
+                pd.DataFrame(self.simulated[rft_indices][:, rows].T, columns=rfts),
+                pd.DataFrame(
+                    self.parameter_values[rows][:, parameter_mask], columns=ens_params
+                ),
+            ],
+            axis=1,
+        )
+        return df, ens_params, rfts
+
+    def correlations(self, reals: Sequence[int]) -> pd.DataFrame:
+        """Correlations of all RFTs with all ensemble parameters in the realizations,
+        computed at once. Missing RFT values are excluded per RFT and parameter.
+
+        Returns a dataframe with the RFTs as index and the parameters as columns.
+        """
+        selected = self._selected(reals)
+        parameter_mask = self._ensemble_parameters(selected)
+        rows = selected & self._has_parameters
+        return correlate_against(
+            pd.DataFrame(
+                self.parameter_values[rows][:, parameter_mask],
+                columns=self._parameter_names(parameter_mask),
+            ),
+            pd.DataFrame(self.simulated[:, rows].T, columns=self.rft_keys),
+        )
+
+
+def non_constant_columns(df: pd.DataFrame, columns: List[str]) -> List[str]:
+    """Columns with more than one unique value, ignoring missing values"""
+    values = df[columns].to_numpy(dtype=np.float64)
+    if values.shape[0] == 0:
+        return []
+    return [
+        column
+        for column, non_constant in zip(
+            columns, np.fmax.reduce(values, axis=0) > np.fmin.reduce(values, axis=0)
+        )
+        if non_constant
+    ]
@@ -9,7 +9,7 @@ from webviz_config.webviz_plugin_subclasses import ViewABC
 from ....._figures import BarChart, ScatterPlot
 from ..._reusable_view_element import GeneralViewElement
 from ..._types import CorrType, DepthType, LineType
-from ..._utils import FormationFigure, RftPlotterDataModel, correlate
+from ..._utils import FormationFigure, RftPlotterDataModel
 from ._settings import Options, ParameterFilterSettings, Selections
 
 
@@ -226,13 +226,17 @@ class ParameterResponseView(ViewABC):
                 return ["Too few realizations to calculate correlations"] * 3
 
             if corrtype == CorrType.SIM_VS_PARAM or param is None:
-                corrseries = correlate(df[ens_params + [current_key]], current_key)
+                corrseries = self._datamodel.correlate_with_pivot_table(
+                    df, ensemble, real_filter[ensemble], current_key, ens_params
+                )
                 param = param if param is not None else corrseries.abs().idxmax()
                 corr_title = f"{current_key} vs parameters"
                 scatter_x, scatter_y, highlight_bar = param, current_key, param
 
             if corrtype == CorrType.PARAM_VS_SIM:
-                corrseries = correlate(df[ens_rfts + [param]], param)
+                corrseries = self._datamodel.correlate_with_pivot_table(
+                    df, ensemble, real_filter[ensemble], param, ens_rfts
+                )
                 corr_title = f"{param} vs simulated RFTs"
                 scatter_x, scatter_y, highlight_bar = param, current_key, current_key
 
@@ -1,15 +1,41 @@
+import glob
+import hashlib
 import json
-from typing import Callable, List, Optional, Tuple, Union
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
 import webviz_core_components as wcc
 from dash import Dash, Input, Output, html
+from fmu.ensemble.util import parse_number
 from webviz_config import WebvizPluginABC, WebvizSettings
 from webviz_config.common_cache import CACHE
+from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO, WebvizRunMode
 from webviz_config.webviz_store import webvizstore
 
-from .._datainput.fmu_input import load_ensemble_set, load_parameters
+T = TypeVar("T")
+
+# Max number of files read concurrently
+MAX_CONCURRENT_FILE_READS = 16
+
+# Realization index in a realization path, as in fmu-ensemble
+REALIZATION_INDEX_PATTERN = re.compile(r"realization-(\d+)")
+
+# Condensed content of the status files, with one row per job of each realization
+STATUS_TABLE_COLUMNS = [
+    "ENSEMBLE",
+    "REAL",
+    "JOB",
+    "STATUS",
+    "START_TIME",
+    "END_TIME",
+    "REAL_START_TIME",
+    "REAL_END_TIME",
+]
 
 
 class RunningTimeAnalysisFMU(WebvizPluginABC):
@@ -76,11 +102,7 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
         self.plotly_theme = webviz_settings.theme.plotly_theme
         self.ensembles = ensembles
         self.status_file = status_file
-        self.parameter_df = load_parameters(
-            ensemble_paths=self.ens_paths,
-            ensemble_set_name="EnsembleSet",
-            filter_file=None,
-        )
+        self.parameter_df = load_realization_parameters(self.ens_paths)
         all_data_df = make_status_df(
             self.ens_paths, self.status_file
         )  # Has to be stored in one df due to webvizstore, see issue #206 in webviz-config
@@ -382,15 +404,7 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
                     }
                 ],
             ),
-            (
-                load_parameters,
-                [
-                    {
-                        "ensemble_paths": self.ens_paths,
-                        "filter_file": None,
-                    },
-                ],
-            ),
+            (load_realization_parameters, [{"ens_paths": self.ens_paths}]),
         ]
 
 
@@ -527,147 +541,230 @@ def render_parcoord(
     return {"data": [data], "layout": layout}
 
 
+def map_concurrently(function: Callable[[str], T], paths: Iterable[str]) -> List[T]:
+    """Returns the results of `function` for each path, in the order of the paths.
+
+    The files are read concurrently, as reading many small files, e.g. on a networked
+    file system, is mostly waiting for I/O.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FILE_READS) as executor:
+        return list(executor.map(function, paths))
+
+
+def load_status_files(paths: Iterable[str]) -> List[dict]:
+    """Returns the content of the json status files, in the order of the paths"""
+
+    def _load_status_file(path: str) -> dict:
+        with open(path) as fjson:
+            return json.load(fjson)
+
+    return map_concurrently(_load_status_file, paths)
+
+
+def _load_parameters_file(path: str) -> dict:
+    """Parameters in a parameters.txt file with a key and a value on each line, with
+    the values converted to numbers where possible, as in fmu-ensemble"""
+    try:
+        keyvalues = pd.read_csv(
+            path, sep=r"\s+", index_col=0, dtype=str, usecols=[0, 1], header=None
+        )[1].to_dict()
+    except pd.errors.EmptyDataError:
+        return {}
+    return {key: parse_number(value) for key, value in keyvalues.items()}
+
+
+def _realization_index(runpath: str) -> Optional[int]:
+    """Index of the last "realization-<index>" component of the path, as in
+    fmu-ensemble"""
+    for path_component in reversed(os.path.abspath(runpath).split(os.path.sep)):
+        match = REALIZATION_INDEX_PATTERN.match(path_component)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def find_realization_files(ens_paths: dict, filename: str) -> pd.DataFrame:
+    """Returns a DataFrame with the columns ENSEMBLE, REAL and FULLPATH of the files
+    matching `filename` in the realizations of the ensembles, sorted on REAL within each
+    ensemble. The realizations are found by globbing the ensemble paths.
+    """
+    rows = []
+    for ens, ens_path in ens_paths.items():
+        runpaths = {}
+        for runpath in sorted(glob.glob(ens_path)):
+            real = _realization_index(runpath)
+            if real is not None:
+                runpaths[real] = runpath
+        for real in sorted(runpaths):
+            for path in sorted(glob.glob(os.path.join(runpaths[real], filename))):
+                rows.append((ens, real, os.path.abspath(path)))
+    return pd.DataFrame(rows, columns=["ENSEMBLE", "REAL", "FULLPATH"])
+
+
+@CACHE.memoize()
+@webvizstore
+def load_realization_parameters(ens_paths: dict) -> pd.DataFrame:
+    """Return DataFrame with ENSEMBLE, REAL and the parameters of the realizations from
+    their parameters.txt files, which are read concurrently"""
+    parameter_files = find_realization_files(ens_paths, "parameters.txt")
+    parameters = map_concurrently(_load_parameters_file, parameter_files["FULLPATH"])
+    return pd.concat(
+        [parameter_files[["ENSEMBLE", "REAL"]], pd.DataFrame(parameters)], axis=1
+    )
+
+
+def _status_table_cache_dir() -> Optional[Path]:
+    """Folder for the status tables in the storage folder of the app, None if storage
+    writes are not allowed"""
+    if WEBVIZ_INSTANCE_INFO.run_mode == WebvizRunMode.PORTABLE:
+        return None
+    return WEBVIZ_INSTANCE_INFO.storage_folder / __name__
+
+
+def _create_status_table(status_files: pd.DataFrame) -> pd.DataFrame:
+    """Condensed status table, see STATUS_TABLE_COLUMNS, from the status files"""
+    columns: dict = {column: [] for column in STATUS_TABLE_COLUMNS}
+    for row, status_dict in zip(
+        status_files.itertuples(index=False),
+        load_status_files(status_files["FULLPATH"]),
+    ):
+        if "steps" in status_dict:
+            jobs = status_dict["steps"]
+        elif "jobs" in status_dict:
+            jobs = status_dict["jobs"]
+        else:
+            raise KeyError(f"Neither 'steps' nor 'jobs' found in {row.FULLPATH}")
+        for job in jobs:
+            columns["ENSEMBLE"].append(row.ENSEMBLE)
+            columns["REAL"].append(row.REAL)
+            columns["JOB"].append(job["name"])
+            columns["STATUS"].append(job["status"])
+            columns["START_TIME"].append(job.get("start_time"))
+            columns["END_TIME"].append(job.get("end_time"))
+            columns["REAL_START_TIME"].append(status_dict.get("start_time"))
+            columns["REAL_END_TIME"].append(status_dict.get("end_time"))
+    table = pd.DataFrame(columns)
+    for column in ["START_TIME", "END_TIME", "REAL_START_TIME", "REAL_END_TIME"]:
+        table[column] = np.array(table[column], dtype=float)
+    table["REAL"] = table["REAL"].astype(int)
+    return table
+
+
+def load_status_table(
+    status_files: pd.DataFrame, cache_dir: Optional[Path] = None
+) -> pd.DataFrame:
+    """Condensed status table, see STATUS_TABLE_COLUMNS, of the status files in the
+    DataFrame with the columns ENSEMBLE, REAL and FULLPATH.
+
+    If `cache_dir` is given, the table is stored there as an .arrow file keyed by the
+    paths and modification times of the status files, and is read from there as long as
+    none of the status files have changed.
+    """
+    if cache_dir is None:
+        return _create_status_table(status_files)
+
+    modification_times = map_concurrently(
+        lambda path: os.stat(path).st_mtime_ns, status_files["FULLPATH"]
+    )
+    key = json.dumps(
+        [
+            status_files["ENSEMBLE"].tolist(),
+            status_files["REAL"].tolist(),
+            status_files["FULLPATH"].tolist(),
+            modification_times,
+        ]
+    )
+    # There is no security risk here and chances of collision should be very slim
+    key_hash = hashlib.md5(key.encode()).hexdigest()  # nosec
+    cache_file = cache_dir / f"status_table__{key_hash}.arrow"
+    if cache_file.exists():
+        return pd.read_feather(cache_file)
+
+    table = _create_status_table(status_files)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first, such that other processes never read a partly
+    # written file
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    table.to_feather(temp_file, compression="uncompressed")
+    os.replace(temp_file, cache_file)
+    return table
+
+
+def _add_missing_realizations(job_status_df: pd.DataFrame) -> pd.DataFrame:
+    """Add the jobs of the first realization as "Realization not started" for missing
+    realizations between the first and last realization of each ensemble, to get
+    whitespace in the heatmap matrix"""
+    ens_dfs = []
+    for _ens, ens_df in job_status_df.groupby("ENSEMBLE", sort=False):
+        ens_dfs.append(ens_df)
+        reals = ens_df["REAL"].unique()
+        first_real_df = ens_df[ens_df["REAL"] == reals[0]]
+        for missing_real in sorted(
+            set(range(reals.min(), reals.max() + 1)).difference(reals)
+        ):
+            ens_dfs.append(
+                first_real_df.assign(
+                    REAL=missing_real,
+                    STATUS="Realization not started",
+                    RUNTIME=np.nan,
+                    REAL_SCALED_RUNTIME=np.nan,
+                )
+            )
+    return pd.concat(ens_dfs)
+
+
 @CACHE.memoize()
 @webvizstore
-# pylint: disable=too-many-locals
-# pylint: disable=too-many-statements
 def make_status_df(
     ens_paths: dict,
     status_file: str,
 ) -> pd.DataFrame:
     """Return DataFrame of information from status.json files.
     *Finds status.json filepaths.
+    *Loads the condensed status table, from the storage folder if the status files have
+    not changed since it was stored.
     For jobs:
-    *Loads data into pandas DataFrames.
     *Calculates runtimes and normalized runtimes.
     *Creates hoverinfo column to be used in visualization.
     For realizations:
     *Creates DataFrame of success/failure and total running time.
     """
-
-    parameter_df = load_parameters(
-        ensemble_paths=ens_paths,
-        ensemble_set_name="EnsembleSet",
-        filter_file=None,
+    status_table = load_status_table(
+        find_realization_files(ens_paths, status_file), _status_table_cache_dir()
     )
+    realizations = status_table.groupby(["ENSEMBLE", "REAL"], sort=False)
 
-    # sub-method to process ensemble data when all realizations in ensemble have been processed
-    def ensemble_post_processing() -> list:
-        # add missing realizations to get whitespace in heatmap matrix
-        if len(set(range(min(reals), max(reals) + 1))) > len(set(reals)):
-            missing_df = ens_dfs[0].copy()
-            missing_df["STATUS"] = "Realization not started"
-            missing_df["RUNTIME"] = np.nan
-            missing_df["JOB_SCALED_RUNTIME"] = np.nan
-            missing_df["ENS_SCALED_RUNTIME"] = np.nan
-            for missing_real in set(range(min(reals), max(reals) + 1)).difference(
-                set(reals)
-            ):
-                ens_dfs.append(missing_df.copy())
-                ens_dfs[-1]["REAL"] = missing_real
-                ens_dfs[-1]["ENSEMBLE"] = ens
-        # Concatenate realization DataFrames to an Ensemble DataFrame and store in list
-        job_status_dfs.append(pd.concat(ens_dfs))
-        # Find max running time of job in ensemble and create scaled columns
-        job_status_dfs[-1]["JOB_MAX_RUNTIME"] = pd.concat(
-            [ens_max_job_runtime] * (len(ens_dfs))
-        )
-        job_status_dfs[-1]["JOB_SCALED_RUNTIME"] = (
-            job_status_dfs[-1]["RUNTIME"] / job_status_dfs[-1]["JOB_MAX_RUNTIME"]
-        )
-        job_status_dfs[-1]["ENS_SCALED_RUNTIME"] = job_status_dfs[-1][
-            "RUNTIME"
-        ] / np.amax(ens_max_job_runtime)
-        # Return ensemble DataFrame list updated with the latest ensemble
-        return job_status_dfs
-
-    # find status filepaths
-    ens_set = load_ensemble_set(ens_paths, filter_file=None)
-    df = pd.concat(
-        [
-            ens_set[ens].find_files(status_file).assign(ENSEMBLE=ens)
-            for ens in ens_set.ensemblenames
-        ]
+    job_status_df = pd.DataFrame(
+        {
+            "ENSEMBLE": status_table["ENSEMBLE"],
+            "REAL": status_table["REAL"],
+            "RUNTIME": status_table["END_TIME"] - status_table["START_TIME"],
+        }
     )
-    # Initial values for local variables
-    job_status_dfs: list = []
-    ens_dfs: list = []
-    real_status: list = []
-    ens_max_job_runtime = 1
-    ens = ""
-    reals: list = []
-
-    # Loop through identified filepaths and get realization data
-    for row in df.itertuples(index=False):
-        # Load each json-file to a DataFrame for the realization
-        with open(row.FULLPATH) as fjson:
-            status_dict = json.load(fjson)
-        if "steps" in status_dict:
-            real_df = pd.DataFrame(status_dict["steps"])
-        elif "jobs" in status_dict:
-            real_df = pd.DataFrame(status_dict["jobs"])
-        else:
-            raise KeyError(f"Neither 'steps' nor 'jobs' found in {status_file}")
-
-        # If new ensemble, calculate ensemble scaled runtimes
-        # for previous ensemble and reset temporary ensemble data
-        if ens != row.ENSEMBLE:
-            if ens == "":  # First ensemble
-                ens = row.ENSEMBLE
-            else:  # Store last ensemble and reset temporary ensemble data
-                job_status_dfs = ensemble_post_processing()
-                ens_max_job_runtime = 1
-                ens_dfs = []
-                ens = row.ENSEMBLE
-                reals = []
-
-        # Additional realization data into realization DataFrame
-        real_df["RUNTIME"] = real_df["end_time"] - real_df["start_time"]
-        real_df["REAL"] = row.REAL
-        real_df["ENSEMBLE"] = row.ENSEMBLE
-        real_df["REAL_SCALED_RUNTIME"] = real_df["RUNTIME"] / max(
-            real_df["RUNTIME"].dropna()
-        )
-        real_df = real_df[
-            ["ENSEMBLE", "REAL", "RUNTIME", "REAL_SCALED_RUNTIME", "name", "status"]
-        ].rename(columns={"name": "JOB", "status": "STATUS"})
-        # Status DataFrame to be used with parallel coordinates
-        # pylint: disable=unsubscriptable-object
-        if all(real_df["STATUS"] == "Success"):
-            real_status.append(
-                {
-                    "ENSEMBLE": row.ENSEMBLE,
-                    "REAL": row.REAL,
-                    "STATUS": "Success",
-                    "STATUS_BOOL": 1,
-                    "RUNTIME": status_dict["end_time"] - status_dict["start_time"],
-                }
-            )
-        else:
-            real_status.append(
-                {
-                    "ENSEMBLE": row.ENSEMBLE,
-                    "REAL": row.REAL,
-                    "STATUS": "Failure",
-                    "STATUS_BOOL": 0,
-                    "RUNTIME": None,
-                }
-            )
-
-        # Need unique job ids names to separate jobs in same realization with same name in json file
-        # pylint: disable=unsupported-assignment-operation
-        real_df["JOB_ID"] = range(0, len(real_df["JOB"]))
-
-        # Update max runtime for jobs in ensemble
-        ens_max_job_runtime = np.fmax(real_df["RUNTIME"], ens_max_job_runtime)
-
-        # Append realization to ensemble data
-        reals.append(row.REAL)
-        ens_dfs.append(real_df)
-
-    # Add last ensemble
-    job_status_dfs = ensemble_post_processing()
-    job_status_df = pd.concat(job_status_dfs, sort=False)
+    job_status_df["REAL_SCALED_RUNTIME"] = job_status_df[
+        "RUNTIME"
+    ] / job_status_df.groupby(["ENSEMBLE", "REAL"], sort=False)["RUNTIME"].transform(
+        "max"
+    )
+    job_status_df["JOB"] = status_table["JOB"]
+    job_status_df["STATUS"] = status_table["STATUS"]
+    # Need unique job ids names to separate jobs in same realization with same name in json file
+    job_status_df["JOB_ID"] = realizations.cumcount()
+    job_status_df = _add_missing_realizations(job_status_df)
+
+    # Max running time of each job in the ensemble, used to create scaled columns
+    job_max_runtime = (
+        job_status_df.groupby(["ENSEMBLE", "JOB_ID"], sort=False)["RUNTIME"]
+        .transform("max")
+        .fillna(1)
+        .clip(lower=1)
+    )
+    job_status_df["JOB_SCALED_RUNTIME"] = job_status_df["RUNTIME"] / job_max_runtime
+    job_status_df["ENS_SCALED_RUNTIME"] = job_status_df[
+        "RUNTIME"
+    ] / job_max_runtime.groupby(job_status_df["ENSEMBLE"], sort=False).transform("max")
+    job_status_df["JOB_MAX_RUNTIME"] = job_max_runtime
+    job_status_df.index = job_status_df["JOB_ID"].to_numpy()
 
     # Create hoverinfo
     job_status_df["HOVERINFO"] = (
@@ -686,10 +783,28 @@ def make_status_df(
         + "Status: "
         + job_status_df["STATUS"]
     )
-    # Create dataframe of realization status and merge with realization parameters for parameter
-    # parallel coordinates
-    real_status_df = pd.DataFrame(real_status).merge(
-        parameter_df, on=["ENSEMBLE", "REAL"]
+
+    # Status DataFrame to be used with parallel coordinates
+    real_df = realizations.agg(
+        SUCCESS=("STATUS", lambda status: (status == "Success").all()),
+        REAL_START_TIME=("REAL_START_TIME", "first"),
+        REAL_END_TIME=("REAL_END_TIME", "first"),
+    ).reset_index()
+    success = real_df["SUCCESS"].astype(bool)
+    real_status_df = pd.DataFrame(
+        {
+            "ENSEMBLE": real_df["ENSEMBLE"],
+            "REAL": real_df["REAL"],
+            "STATUS": np.where(success, "Success", "Failure"),
+            "STATUS_BOOL": success.astype(int),
+            "RUNTIME": (real_df["REAL_END_TIME"] - real_df["REAL_START_TIME"]).where(
+                success
+            ),
+        }
+    )
+    # Merge with realization parameters for parameter parallel coordinates
+    real_status_df = real_status_df.merge(
+        load_realization_parameters(ens_paths), on=["ENSEMBLE", "REAL"]
     )
     # Has to be stored in one df due to webvizstore, see issue #206 in webviz-config
     return pd.concat([job_status_df, real_status_df], keys=["job", "real"], sort=False)
@@ -12,7 +12,7 @@ from webviz_subsurface._abbreviations.reservoir_simulation import (
     historical_vector,
     simulation_vector_description,
 )
-from webviz_subsurface._providers import Frequency
+from webviz_subsurface._providers import Frequency, StoragePrecision
 from webviz_subsurface._utils.ensemble_summary_provider_set_factory import (
     create_lazy_ensemble_summary_provider_set_from_paths,
     create_presampled_ensemble_summary_provider_set_from_paths,
@@ -87,6 +87,10 @@ class SimulationTimeSeries(WebvizPluginABC):
         predefined_expressions: str = None,
         user_defined_vector_definitions: str = None,
         line_shape_fallback: str = "linear",
+        storage_precision: str = StoragePrecision.FLOAT64.value,
+        max_points_per_realization_trace: Optional[int] = None,
+        use_typed_arrays: bool = False,
+        single_trace_realizations: bool = False,
     ) -> None:
         super().__init__(stretch=True)
 
@@ -143,9 +147,13 @@ class SimulationTimeSeries(WebvizPluginABC):
                     )
                 )
             else:
+                # Float32 storage halves the size of the lazy providers' backing
+                # store, at the cost of float32 precision in the vector values
                 self._input_provider_set = (
                     create_lazy_ensemble_summary_provider_set_from_paths(
-                        ensemble_paths, rel_file_pattern
+                        ensemble_paths,
+                        rel_file_pattern,
+                        StoragePrecision(storage_precision),
                     )
                 )
         else:
@@ -338,6 +346,9 @@ class SimulationTimeSeries(WebvizPluginABC):
                 user_defined_vector_definitions=self._user_defined_vector_definitions,
                 observations=self._observations,
                 line_shape_fallback=self._line_shape_fallback,
+                max_points_per_realization_trace=max_points_per_realization_trace,
+                use_typed_arrays=use_typed_arrays,
+                single_trace_realizations=single_trace_realizations,
             ),
             SimulationTimeSeries.Ids.SUBPLOT_VIEW,
         )
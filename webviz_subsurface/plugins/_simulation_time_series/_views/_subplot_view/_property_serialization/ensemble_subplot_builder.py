@@ -36,8 +36,15 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
     * vector_line_shapes: Dict[str,str] - Dictionary of vector names and line shapes
     * theme: Optional[WebvizConfigTheme] = None - Theme for plugin, given to graph figure
     * line_shape_fallback: str = "linear" - Lineshape fallback
+    * max_points_per_realization_trace: Optional[int] = None - Max number of points per
+    realization trace, realizations with more points are downsampled. No limit if None.
+    * use_typed_arrays: bool = False - Send realization and statistics data as plotly typed
+    arrays, with dates as milliseconds since epoch on a "date" x-axis.
+    * single_trace_realizations: bool = False - Render all realizations of an ensemble and
+    vector as one trace, with the realizations separated by NaN values.
     """
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         selected_vectors: List[str],
@@ -47,6 +54,9 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
         vector_line_shapes: Dict[str, str],
         theme: Optional[WebvizConfigTheme] = None,
         line_shape_fallback: str = "linear",
+        max_points_per_realization_trace: Optional[int] = None,
+        use_typed_arrays: bool = False,
+        single_trace_realizations: bool = False,
     ) -> None:
         # Init for base class
         super().__init__()
@@ -56,6 +66,9 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
         self._vector_colors = vector_colors
         self._sampling_frequency = sampling_frequency
         self._line_shape_fallback = line_shape_fallback
+        self._max_points_per_realization_trace = max_points_per_realization_trace
+        self._use_typed_arrays = use_typed_arrays
+        self._single_trace_realizations = single_trace_realizations
         self._vector_line_shapes = vector_line_shapes
         self._history_vector_color = "black"
 
@@ -73,6 +86,11 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
             )
         self._set_keep_uirevision()
 
+        if self._use_typed_arrays:
+            # Typed array dates are milliseconds since epoch, which is only interpreted
+            # as dates on an axis of type "date"
+            self._figure.update_xaxes(type="date")
+
         # Set for storing added vectors
         self._added_vector_traces: Set[str] = set()
 
@@ -164,6 +182,9 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
                 color=color,
                 line_shape=line_shape,
                 hovertemplate=render_hovertemplate(vector, self._sampling_frequency),
+                max_points_per_trace=self._max_points_per_realization_trace,
+                use_typed_arrays=self._use_typed_arrays,
+                single_trace=self._single_trace_realizations,
             )
 
         # Add traces to figure
@@ -209,6 +230,7 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
                 line_width=line_width if line_width else 2,
                 statistics_options=statistics_options,
                 hovertemplate=render_hovertemplate(vector, self._sampling_frequency),
+                use_typed_arrays=self._use_typed_arrays,
             )
 
         # Add traces to figure
@@ -1,9 +1,10 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from webviz_subsurface._providers import Frequency
+from webviz_subsurface._utils.downsampling import lttb_downsample_indices
 from webviz_subsurface._utils.fanchart_plotting import (
     FanchartData,
     FreeLineData,
@@ -11,11 +12,16 @@ from webviz_subsurface._utils.fanchart_plotting import (
     MinMaxData,
     get_fanchart_traces,
 )
+from webviz_subsurface._utils.realization_plotting import concatenate_realization_lines
 from webviz_subsurface._utils.statistics_plotting import (
     LineData,
     StatisticsData,
     create_statistics_traces,
 )
+from webviz_subsurface._utils.typed_arrays import (
+    encode_dates_as_epoch_ms,
+    encode_typed_array,
+)
 
 from .._types import FanchartOptions, StatisticsOptions
 from .._utils.from_timeseries_cumulatives import is_per_interval_or_per_day_vector
@@ -69,6 +75,7 @@ def create_vector_observation_traces(
     return observation_traces
 
 
+# pylint: disable=too-many-arguments
 def create_vector_realization_traces(
     vector_df: pd.DataFrame,
     ensemble: str,
@@ -78,6 +85,9 @@ def create_vector_realization_traces(
     hovertemplate: str,
     show_legend: bool = False,
     legendrank: Optional[int] = None,
+    max_points_per_trace: Optional[int] = None,
+    use_typed_arrays: bool = False,
+    single_trace: bool = False,
 ) -> List[dict]:
     """Renders line trace for each realization, includes history line if present
 
@@ -92,7 +102,29 @@ def create_vector_realization_traces(
     * show_legend: bool - show legend when true, otherwise do not show
     * hovertemplate: str - template for hovering of data points in trace lines
     * legendrank: int - rank value for legend in figure
+    * max_points_per_trace: int - downsample realizations with more points than this,
+    with the Largest-Triangle-Three-Buckets algorithm. No downsampling if None.
+    * use_typed_arrays: bool - encode dates and values as plotly typed arrays, with dates
+    as milliseconds since epoch. Requires an x-axis of type "date".
+    * single_trace: bool - render all realizations as one trace, see
+    `create_vector_realizations_single_trace()`
     """
+    if single_trace:
+        return [
+            create_vector_realizations_single_trace(
+                vector_df=vector_df,
+                ensemble=ensemble,
+                color=color,
+                legend_group=legend_group,
+                line_shape=line_shape,
+                hovertemplate=hovertemplate,
+                show_legend=show_legend,
+                legendrank=legendrank,
+                max_points_per_trace=max_points_per_trace,
+                use_typed_arrays=use_typed_arrays,
+            )
+        ]
+
     vector_names = list(set(vector_df.columns) ^ set(["DATE", "REAL"]))
     if len(vector_names) != 1:
         raise ValueError(
@@ -100,22 +132,143 @@ def create_vector_realization_traces(
         )
 
     vector_name = vector_names[0]
+    real_data = [
+        (real, real_df["DATE"], real_df[vector_name])
+        for real, real_df in vector_df.groupby("REAL")
+    ]
+    if max_points_per_trace is not None:
+        real_data = _downsample_realizations(real_data, max_points_per_trace)
+
     return [
         {
             "line": {"width": 1, "shape": line_shape, "color": color},
             "mode": "lines",
-            "x": list(real_df["DATE"]),
-            "y": list(real_df[vector_name]),
+            "x": encode_dates_as_epoch_ms(dates) if use_typed_arrays else list(dates),
+            "y": encode_typed_array(values) if use_typed_arrays else list(values),
             "hovertemplate": f"{hovertemplate}Realization: {real}, Ensemble: {ensemble}",
             "name": legend_group,
             "legendgroup": legend_group,
             "legendrank": legendrank,
             "showlegend": real_no == 0 and show_legend,
         }
-        for real_no, (real, real_df) in enumerate(vector_df.groupby("REAL"))
+        for real_no, (real, dates, values) in enumerate(real_data)
     ]
 
 
+# pylint: disable=too-many-arguments, too-many-locals
+def create_vector_realizations_single_trace(
+    vector_df: pd.DataFrame,
+    ensemble: str,
+    color: str,
+    legend_group: str,
+    line_shape: str,
+    hovertemplate: str,
+    show_legend: bool = False,
+    legendrank: Optional[int] = None,
+    max_points_per_trace: Optional[int] = None,
+    use_typed_arrays: bool = False,
+) -> dict:
+    """Renders all realizations as one line trace, with the realizations separated by
+    NaN values. The realization of each point is given as customdata for hovering.
+
+    A scattergl trace is used, except for line shape "spline" which is not supported by
+    scattergl.
+
+    `Input:`
+    * vector_df: pd.DataFrame - Dataframe with vector data with following columns:\n
+    ["DATE", "REAL", vector]
+
+    * ensemble: str - Name of ensemble
+    * color: str - color for trace
+    * legend_group: str - legend group owner
+    * line_shape: str - specified line shape for trace
+    * hovertemplate: str - template for hovering of data points in trace line
+    * show_legend: bool - show legend when true, otherwise do not show
+    * legendrank: int - rank value for legend in figure
+    * max_points_per_trace: int - downsample realizations with more points than this,
+    with the Largest-Triangle-Three-Buckets algorithm. No downsampling if None.
+    * use_typed_arrays: bool - encode dates, values and realizations as plotly typed
+    arrays, with dates as milliseconds since epoch. Requires an x-axis of type "date".
+    """
+    vector_names = list(set(vector_df.columns) ^ set(["DATE", "REAL"]))
+    if len(vector_names) != 1:
+        raise ValueError(
+            f"Expected one vector column present in dataframe, got {len(vector_names)}!"
+        )
+
+    vector_name = vector_names[0]
+    if max_points_per_trace is not None:
+        real_data = _downsample_realizations(
+            [
+                (real, real_df["DATE"], real_df[vector_name])
+                for real, real_df in vector_df.groupby("REAL")
+            ],
+            max_points_per_trace,
+        )
+        vector_df = pd.DataFrame(
+            {
+                "DATE": pd.concat([dates for _, dates, _ in real_data]),
+                "REAL": np.repeat(
+                    [real for real, _, _ in real_data],
+                    [len(dates) for _, dates, _ in real_data],
+                ),
+                vector_name: pd.concat([values for _, _, values in real_data]),
+            }
+        )
+
+    dates, values, realizations = concatenate_realization_lines(
+        vector_df["DATE"].to_numpy(),
+        vector_df[vector_name].to_numpy(),
+        vector_df["REAL"].to_numpy(),
+    )
+    return {
+        "type": "scatter" if line_shape == "spline" else "scattergl",
+        "line": {"width": 1, "shape": line_shape, "color": color},
+        "mode": "lines",
+        "x": encode_dates_as_epoch_ms(dates) if use_typed_arrays else list(dates),
+        "y": encode_typed_array(values) if use_typed_arrays else list(values),
+        "customdata": (
+            encode_typed_array(realizations) if use_typed_arrays else list(realizations)
+        ),
+        "hovertemplate": (
+            f"{hovertemplate}Realization: %{{customdata}}, Ensemble: {ensemble}"
+        ),
+        "name": legend_group,
+        "legendgroup": legend_group,
+        "legendrank": legendrank,
+        "showlegend": show_legend,
+    }
+
+
+def _downsample_realizations(
+    real_data: List[Tuple[Any, pd.Series, pd.Series]], max_points: int
+) -> List[Tuple[Any, pd.Series, pd.Series]]:
+    """Downsample (realization, dates, values) with LTTB to at most max_points points per
+    realization. Realizations with equal dates are downsampled together.
+    """
+    reals_per_dates: Dict[bytes, List[int]] = {}
+    for index, (_, dates, _) in enumerate(real_data):
+        if len(dates) > max_points:
+            dates_key = pd.DatetimeIndex(dates).asi8.tobytes()
+            reals_per_dates.setdefault(dates_key, []).append(index)
+
+    downsampled_real_data = list(real_data)
+    for indices in reals_per_dates.values():
+        kept = lttb_downsample_indices(
+            pd.DatetimeIndex(real_data[indices[0]][1]).asi8,
+            np.vstack([real_data[index][2].to_numpy(float) for index in indices]),
+            max_points,
+        )
+        for row, index in enumerate(indices):
+            real, dates, values = real_data[index]
+            downsampled_real_data[index] = (
+                real,
+                dates.iloc[kept[row]],
+                values.iloc[kept[row]],
+            )
+    return downsampled_real_data
+
+
 def validate_vector_statistics_df_columns(
     vector_statistics_df: pd.DataFrame,
 ) -> None:
@@ -155,6 +308,7 @@ def create_vector_statistics_traces(
     hovertemplate: str = "(%{x}, %{y})<br>",
     show_legend: bool = False,
     legendrank: Optional[int] = None,
+    use_typed_arrays: bool = False,
 ) -> List[Dict[str, Any]]:
     """Get statistical lines for provided vector statistics DataFrame.
 
@@ -171,6 +325,8 @@ def create_vector_statistics_traces(
     * hovertemplate: str - template for hovering of data points in trace lines
     * show_legend: bool - show legend when true, otherwise do not show
     * legendrank: int - rank value for legend in figure
+    * use_typed_arrays: bool - encode dates and values as plotly typed arrays, with dates
+    as milliseconds since epoch. Requires an x-axis of type "date".
     """
     # Validate columns format
     validate_vector_statistics_df_columns(vector_statistics_df)
@@ -236,6 +392,7 @@ def create_vector_statistics_traces(
         show_legend=show_legend,
         hovertemplate=hovertemplate,
         legendrank=legendrank,
+        use_typed_arrays=use_typed_arrays,
     )
 
 
@@ -1,6 +1,7 @@
 import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import pandas as pd
 from webviz_subsurface_components import ExpressionInfo
 
 from webviz_subsurface._providers import Frequency
@@ -19,6 +20,7 @@ from .derived_vectors_accessor import (
     DerivedEnsembleVectorsAccessorImpl,
     DerivedVectorsAccessor,
 )
+from .vector_statistics import format_vectors_statistics_df
 
 
 def create_derived_vectors_accessor_dict(
@@ -91,3 +93,45 @@ def create_derived_vectors_accessor_dict(
             )
 
     return ensemble_data_accessor_dict
+
+
+def get_derived_vectors_dfs(
+    accessor: DerivedVectorsAccessor,
+    realizations: Optional[Sequence[int]],
+    use_provider_statistics: bool,
+) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
+    """Retrieve vectors data from derived vectors accessor
+
+    If `use_provider_statistics` is True, statistics for the provider vectors are retrieved
+    from the provider when possible, instead of the provider vectors data.
+
+    `Returns:`
+    * List of vectors dataframes with columns ["DATE", "REAL", vector1, ..., vectorN]
+    * List of vectors statistics dataframes, on the format of `create_vectors_statistics_df()`
+    """
+    # TODO: Consider to remove list vectors_df_list and use pd.concat to obtain
+    # one single dataframe with vector columns. NB: Assumes equal sampling rate
+    # for each vector type - i.e equal number of rows in dataframes
+    vectors_df_list: List[pd.DataFrame] = []
+    vectors_statistics_df_list: List[pd.DataFrame] = []
+    if use_provider_statistics and accessor.has_provider_vectors_statistics():
+        vectors_statistics_df_list.append(
+            format_vectors_statistics_df(
+                accessor.get_provider_vectors_statistics_df(realizations=realizations)
+            )
+        )
+    elif accessor.has_provider_vectors():
+        vectors_df_list.append(
+            accessor.get_provider_vectors_df(realizations=realizations)
+        )
+    if accessor.has_per_interval_and_per_day_vectors():
+        vectors_df_list.append(
+            accessor.create_per_interval_and_per_day_vectors_df(
+                realizations=realizations
+            )
+        )
+    if accessor.has_vector_calculator_expressions():
+        vectors_df_list.append(
+            accessor.create_calculated_vectors_df(realizations=realizations)
+        )
+    return vectors_df_list, vectors_statistics_df_list
@@ -4,7 +4,13 @@ from typing import List, Optional, Sequence, Tuple
 import pandas as pd
 from webviz_subsurface_components import ExpressionInfo
 
-from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
+from webviz_subsurface._providers import (
+    EnsembleSummaryProvider,
+    Frequency,
+    create_delta_vectors_df,
+    get_cumulative_vector_name,
+    get_delta_ensemble_vectors_df,
+)
 from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
 from webviz_subsurface._utils.vector_calculator import (
     create_calculated_vector_df,
@@ -14,7 +20,6 @@ from webviz_subsurface._utils.vector_calculator import (
 from .. import dataframe_utils
 from ..from_timeseries_cumulatives import (
     calculate_from_resampled_cumulative_vectors_df,
-    get_cumulative_vector_name,
     is_per_interval_or_per_day_vector,
 )
 from .derived_vectors_accessor import DerivedVectorsAccessor
@@ -73,10 +78,9 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
             )
 
         # Intersection of vectors in providers
+        vector_catalog_b = self._provider_b.vector_catalog()
         _accessor_vectors = [
-            elm
-            for elm in self._provider_a.vector_names()
-            if elm in self._provider_b.vector_names()
+            elm for elm in self._provider_a.vector_names() if elm in vector_catalog_b
         ]
 
         # Categorize vector types among the vectors in argument
@@ -130,27 +134,19 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         - Performs "inner join". Only obtain matching index ["DATE", "REAL"] - i.e "DATE"-"REAL"
         combination present in only one vector -> neglected
         - Ensures equal dates samples and realizations by dropping nan-values
+        - Rows of ensemble A and B are aligned on integer index arrays, and the alignment is
+        cached per provider pair, resampling frequency and realizations
         """
 
         if not vector_names:
             raise ValueError("List of requested vector names is empty")
 
-        # NOTE: index order ["DATE","REAL"] to obtain column order when
-        # performing reset_index() later
-        ensemble_a_vectors_df = self._provider_a.get_vectors_df(
-            vector_names, resampling_frequency, realizations
-        ).set_index(["DATE", "REAL"])
-        ensemble_b_vectors_df = self._provider_b.get_vectors_df(
-            vector_names, resampling_frequency, realizations
-        ).set_index(["DATE", "REAL"])
-
-        # Reset index, sort values by "REAL" and thereafter by "DATE" to
-        # group realizations and order by date
-        ensembles_delta_vectors_df = (
-            ensemble_a_vectors_df.sub(ensemble_b_vectors_df)
-            .dropna(axis=0, how="any")
-            .reset_index()
-            .sort_values(["REAL", "DATE"], ignore_index=True)
+        ensembles_delta_vectors_df = get_delta_ensemble_vectors_df(
+            self._provider_a,
+            self._provider_b,
+            vector_names,
+            resampling_frequency,
+            realizations,
         )
 
         make_date_column_datetime_object(ensembles_delta_vectors_df)
@@ -166,6 +162,11 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
     def has_vector_calculator_expressions(self) -> bool:
         return len(self._vector_calculator_expressions) > 0
 
+    def has_provider_vectors_statistics(self) -> bool:
+        # Delta ensemble vectors are computed from two providers, statistics of these have
+        # to be computed from the realizations
+        return False
+
     def get_provider_vectors_df(
         self, realizations: Optional[Sequence[int]] = None
     ) -> pd.DataFrame:
@@ -195,6 +196,14 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
             self._provider_vectors, self._resampling_frequency, realizations
         )
 
+    def get_provider_vectors_statistics_df(
+        self, realizations: Optional[Sequence[int]] = None
+    ) -> pd.DataFrame:
+        raise ValueError(
+            f'Vector data handler for provider "{self._name}" has no provider vectors '
+            "statistics"
+        )
+
     def create_per_interval_and_per_day_vectors_df(
         self,
         realizations: Optional[Sequence[int]] = None,
@@ -324,18 +333,8 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                 provider_b_calculated_vectors_df, provider_b_calculated_vector_df
             )
 
-        # NOTE: index order ["DATE","REAL"] to obtain column order when
-        # performing reset_index() later
-        provider_a_calculated_vectors_df.set_index(["DATE", "REAL"], inplace=True)
-        provider_b_calculated_vectors_df.set_index(["DATE", "REAL"], inplace=True)
-
-        # Reset index, sort values by "REAL" and thereafter by "DATE" to
-        # group realizations and order by date
-        delta_ensemble_calculated_vectors_df = (
-            provider_a_calculated_vectors_df.sub(provider_b_calculated_vectors_df)
-            .dropna(axis=0, how="any")
-            .reset_index()
-            .sort_values(["REAL", "DATE"], ignore_index=True)
+        delta_ensemble_calculated_vectors_df = create_delta_vectors_df(
+            provider_a_calculated_vectors_df, provider_b_calculated_vectors_df
         )
 
         make_date_column_datetime_object(delta_ensemble_calculated_vectors_df)
@@ -4,7 +4,11 @@ from typing import List, Optional, Sequence
 import pandas as pd
 from webviz_subsurface_components import ExpressionInfo
 
-from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
+from webviz_subsurface._providers import (
+    EnsembleSummaryProvider,
+    Frequency,
+    get_cumulative_vector_name,
+)
 from webviz_subsurface._utils.vector_calculator import (
     create_calculated_vector_df,
     get_selected_expressions,
@@ -13,7 +17,6 @@ from webviz_subsurface._utils.vector_calculator import (
 from .. import dataframe_utils
 from ..from_timeseries_cumulatives import (
     calculate_from_resampled_cumulative_vectors_df,
-    get_cumulative_vector_name,
     is_per_interval_or_per_day_vector,
 )
 from .derived_vectors_accessor import DerivedVectorsAccessor
@@ -49,14 +52,15 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
 
         self._name = name
         self._provider = provider
+        vector_catalog = self._provider.vector_catalog()
         self._provider_vectors = [
-            vector for vector in vectors if vector in self._provider.vector_names()
+            vector for vector in vectors if vector in vector_catalog
         ]
         self._per_interval_and_per_day_vectors = [
             vector
             for vector in vectors
             if is_per_interval_or_per_day_vector(vector)
-            and get_cumulative_vector_name(vector) in provider.vector_names()
+            and get_cumulative_vector_name(vector) in vector_catalog
         ]
         self._vector_calculator_expressions = (
             get_selected_expressions(expressions, vectors)
@@ -77,6 +81,11 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
     def has_vector_calculator_expressions(self) -> bool:
         return len(self._vector_calculator_expressions) > 0
 
+    def has_provider_vectors_statistics(self) -> bool:
+        # Vectors relative to a date are not provider data, statistics of these have
+        # to be computed from the realizations
+        return self.has_provider_vectors() and self._relative_date is None
+
     def get_provider_vectors_df(
         self, realizations: Optional[Sequence[int]] = None
     ) -> pd.DataFrame:
@@ -97,6 +106,24 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
             self._provider_vectors, self._resampling_frequency, realizations
         )
 
+    def get_provider_vectors_statistics_df(
+        self, realizations: Optional[Sequence[int]] = None
+    ) -> pd.DataFrame:
+        """Get statistics dataframe for the selected provider vectors from the provider.
+
+        `Output:`
+        * dataframe with double column level: [("DATE", ""), (vector, statistic), ...]
+        """
+        if not self.has_provider_vectors_statistics():
+            raise ValueError(
+                f'Vector data handler for provider "{self._name}" has no provider '
+                "vectors statistics"
+            )
+
+        return self._provider.get_vectors_statistics_df(
+            self._provider_vectors, self._resampling_frequency, realizations
+        )
+
     def create_per_interval_and_per_day_vectors_df(
         self,
         realizations: Optional[Sequence[int]] = None,
@@ -128,6 +155,31 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                 "or per day vector names"
             )
 
+        if self._provider.supports_per_interval_and_per_day_vectors():
+            per_interval_and_per_day_vectors_df = self._provider.get_vectors_df(
+                self._per_interval_and_per_day_vectors,
+                self._resampling_frequency,
+                realizations,
+            )
+        else:
+            per_interval_and_per_day_vectors_df = (
+                self._calculate_per_interval_and_per_day_vectors_df(realizations)
+            )
+
+        if self._relative_date:
+            return dataframe_utils.create_relative_to_date_df(
+                per_interval_and_per_day_vectors_df,
+                self._relative_date,
+            )
+        return per_interval_and_per_day_vectors_df
+
+    def _calculate_per_interval_and_per_day_vectors_df(
+        self,
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Calculate interval delta and per day delta vectors from the cumulative
+        vectors retrieved from a provider without native support for these vectors
+        """
         cumulative_vector_names = [
             get_cumulative_vector_name(elm)
             for elm in self._per_interval_and_per_day_vectors
@@ -156,12 +208,6 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                     per_interval_or_per_day_vector_df,
                     how="inner",
                 )
-
-        if self._relative_date:
-            return dataframe_utils.create_relative_to_date_df(
-                per_interval_and_per_day_vectors_df,
-                self._relative_date,
-            )
         return per_interval_and_per_day_vectors_df
 
     def create_calculated_vectors_df(
@@ -20,12 +20,22 @@ class DerivedVectorsAccessor:
     def has_vector_calculator_expressions(self) -> bool:
         ...
 
+    @abc.abstractmethod
+    def has_provider_vectors_statistics(self) -> bool:
+        ...
+
     @abc.abstractmethod
     def get_provider_vectors_df(
         self, realizations: Optional[Sequence[int]] = None
     ) -> pd.DataFrame:
         ...
 
+    @abc.abstractmethod
+    def get_provider_vectors_statistics_df(
+        self, realizations: Optional[Sequence[int]] = None
+    ) -> pd.DataFrame:
+        ...
+
     @abc.abstractmethod
     def create_per_interval_and_per_day_vectors_df(
         self,
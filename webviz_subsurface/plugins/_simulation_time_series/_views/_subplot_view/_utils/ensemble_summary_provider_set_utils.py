@@ -7,7 +7,7 @@ from webviz_subsurface._abbreviations.reservoir_simulation import (
     simulation_unit_reformat,
     simulation_vector_description,
 )
-from webviz_subsurface._providers import Frequency
+from webviz_subsurface._providers import Frequency, get_cumulative_vector_name
 from webviz_subsurface._utils.ensemble_summary_provider_set import (
     EnsembleSummaryProviderSet,
 )
@@ -18,7 +18,6 @@ from webviz_subsurface._utils.vector_calculator import (
 )
 
 from .from_timeseries_cumulatives import (
-    get_cumulative_vector_name,
     is_per_interval_or_per_day_vector,
 )
 
@@ -25,19 +25,6 @@ def is_per_interval_or_per_day_vector(vector: str) -> bool:
     return vector.startswith("PER_DAY_") or vector.startswith("PER_INTVL_")
 
 
-def get_cumulative_vector_name(vector: str) -> str:
-    if not is_per_interval_or_per_day_vector(vector):
-        raise ValueError(
-            f'Expected "{vector}" to be a vector calculated from cumulative!'
-        )
-
-    if vector.startswith("PER_DAY_"):
-        return vector.lstrip("PER_DAY_")
-    if vector.startswith("PER_INTVL_"):
-        return vector.lstrip("PER_INTVL_")
-    raise ValueError(f"Expected {vector} to be a cumulative vector!")
-
-
 def create_per_day_vector_name(vector: str) -> str:
     return f"PER_DAY_{vector}"
 
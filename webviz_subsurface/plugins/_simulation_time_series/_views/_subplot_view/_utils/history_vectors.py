@@ -36,7 +36,7 @@ def create_history_vectors_df(
     if len(vector_names) < 1:
         raise ValueError("Empty list of vector names!")
 
-    provider_vectors = provider.vector_names()
+    provider_vectors = provider.vector_catalog()
     resampling_frequency = (
         resampling_frequency if provider.supports_resampling() else None
     )
@@ -51,7 +51,7 @@ def create_history_vectors_df(
     for vector in vector_names:
         # TODO: Create new historical_vector according to new provider metadata?
         historical_vector_name = historical_vector(vector=vector, smry_meta=None)
-        if historical_vector_name and historical_vector_name in provider.vector_names():
+        if historical_vector_name and historical_vector_name in provider_vectors:
             historical_vector_and_vector_name_dict[historical_vector_name] = vector
 
     # Get lowest valid realization number
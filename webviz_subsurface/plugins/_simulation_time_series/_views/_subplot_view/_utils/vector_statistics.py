@@ -1,8 +1,6 @@
-from typing import List
-
-import numpy as np
 import pandas as pd
 
+from webviz_subsurface._providers import compute_vectors_statistics_df
 from webviz_subsurface._utils.dataframe_utils import (
     assert_date_column_is_datetime_object,
     make_date_column_datetime_object,
@@ -21,6 +19,9 @@ def create_vectors_statistics_df(vectors_df: pd.DataFrame) -> pd.DataFrame:
     * vectors_df: pd.DataFrame - Dataframe with vectors dataframe and columns:
         ["DATE", "REAL", vector1, ... , vectorN]
 
+    `Note:` The statistics are computed by the shared, vectorized
+    `compute_vectors_statistics_df()` of the ensemble summary provider.
+
     `Returns:`
     * Dataframe with double column level:\n
       [ "DATE",     vector1,                        ... vectorN
@@ -28,56 +29,24 @@ def create_vectors_statistics_df(vectors_df: pd.DataFrame) -> pd.DataFrame:
     """
     assert_date_column_is_datetime_object(vectors_df)
 
-    # Get vectors names, keep order
-    columns_list = list(vectors_df.columns)
-    vector_names = sorted(
-        (set(columns_list) ^ set(["DATE", "REAL"])), key=columns_list.index
-    )
-
-    # If no rows of data:
-    if not vectors_df.shape[0]:
-        columns_tuples = [("DATE", "")]
-        for vector in vector_names:
-            columns_tuples.extend(
-                [
-                    (vector, StatisticsOptions.MEAN),
-                    (vector, StatisticsOptions.MIN),
-                    (vector, StatisticsOptions.MAX),
-                    (vector, StatisticsOptions.P10),
-                    (vector, StatisticsOptions.P90),
-                    (vector, StatisticsOptions.P50),
-                ]
-            )
-        return pd.DataFrame(columns=pd.MultiIndex.from_tuples(columns_tuples))
-
-    # Invert p10 and p90 due to oil industry convention.
-    def p10(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=90)
-
-    def p90(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=10)
+    return format_vectors_statistics_df(compute_vectors_statistics_df(vectors_df))
 
-    def p50(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=50)
-
-    statistics_df: pd.DataFrame = (
-        vectors_df[["DATE"] + vector_names]
-        .groupby(["DATE"])
-        .agg(["mean", "min", "max", p10, p90, p50])
-        .reset_index(level=["DATE"], col_level=0)
-    )
 
+def format_vectors_statistics_df(statistics_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Format vectors statistics dataframe from the ensemble summary provider, with columns
+    [("DATE", ""), (vector, statistic), ...], to the format of
+    `create_vectors_statistics_df()`. The dataframe is modified in place and returned.
+    """
     # Rename columns to StatisticsOptions enum types for strongly typed format
-    col_stat_label_map = {
-        "mean": StatisticsOptions.MEAN,
-        "min": StatisticsOptions.MIN,
-        "max": StatisticsOptions.MAX,
-        "p10": StatisticsOptions.P10,
-        "p90": StatisticsOptions.P90,
-        "p50": StatisticsOptions.P50,
-    }
-    statistics_df.rename(columns=col_stat_label_map, level=1, inplace=True)
+    statistics_df.columns = pd.MultiIndex.from_tuples(
+        [
+            (vector, StatisticsOptions(statistic) if statistic else statistic)
+            for vector, statistic in statistics_df.columns
+        ]
+    )
 
-    make_date_column_datetime_object(statistics_df)
+    if not statistics_df.empty:
+        make_date_column_datetime_object(statistics_df)
 
     return statistics_df
@@ -14,6 +14,7 @@ from webviz_subsurface_components import ExpressionInfo, VectorDefinition
 from webviz_subsurface._providers import Frequency
 from webviz_subsurface._utils.ensemble_summary_provider_set import (
     EnsembleSummaryProviderSet,
+    map_concurrently,
 )
 from webviz_subsurface._utils.unique_theming import unique_colors
 from webviz_subsurface._utils.vector_calculator import get_selected_expressions
@@ -41,6 +42,7 @@ from ._types import (
 from ._utils import DerivedVectorsAccessor, datetime_utils
 from ._utils.derived_ensemble_vectors_accessor_utils import (
     create_derived_vectors_accessor_dict,
+    get_derived_vectors_dfs,
 )
 from ._utils.ensemble_summary_provider_set_utils import (
     create_vector_plot_titles_from_provider_set,
@@ -84,6 +86,9 @@ class SubplotView(ViewABC):
         user_defined_vector_definitions: Dict[str, VectorDefinition],
         observations: dict,  # TODO: Improve typehint?
         line_shape_fallback: str = "linear",
+        max_points_per_realization_trace: Optional[int] = None,
+        use_typed_arrays: bool = False,
+        single_trace_realizations: bool = False,
     ) -> None:
         super().__init__("Subplot View")
 
@@ -132,6 +137,9 @@ class SubplotView(ViewABC):
         self._input_provider_set = input_provider_set
         self._theme = theme
         self._line_shape_fallback = line_shape_fallback
+        self._max_points_per_realization_trace = max_points_per_realization_trace
+        self._use_typed_arrays = use_typed_arrays
+        self._single_trace_realizations = single_trace_realizations
         self._user_defined_vector_definitions = user_defined_vector_definitions
         self._observations = observations
         self._has_presampled_providers = has_presampled_providers
@@ -376,6 +384,9 @@ class SubplotView(ViewABC):
                     resampling_frequency,
                     vector_line_shapes,
                     self._theme,
+                    max_points_per_realization_trace=self._max_points_per_realization_trace,
+                    use_typed_arrays=self._use_typed_arrays,
+                    single_trace_realizations=self._single_trace_realizations,
                 )
             elif subplot_group_by is SubplotGroupByOptions.ENSEMBLE:
                 vector_colors = unique_colors(vectors, self._theme)
@@ -386,6 +397,9 @@ class SubplotView(ViewABC):
                     resampling_frequency,
                     vector_line_shapes,
                     self._theme,
+                    max_points_per_realization_trace=self._max_points_per_realization_trace,
+                    use_typed_arrays=self._use_typed_arrays,
+                    single_trace_realizations=self._single_trace_realizations,
                 )
             else:
                 raise PreventUpdate
@@ -401,47 +415,70 @@ class SubplotView(ViewABC):
                 ]
             )
 
-            # Plotting per derived vectors accessor
-            for ensemble, accessor in derived_vectors_accessors.items():
-                # Realization query - realizations query for accessor
-                # - Get non-filter query, None, if statistics from all realizations is needed
-                # - Create valid realizations query for accessor otherwise:
-                #   * List[int]: Filtered valid realizations, empty list if none are valid
-                #   * None: Get all realizations, i.e. non-filtered query
-                realizations_query = (
-                    None
-                    if is_statistics_from_all_realizations
-                    else accessor.create_valid_realizations_query(selected_realizations)
-                )
+            # Realization query per derived vectors accessor
+            # - Get non-filter query, None, if statistics from all realizations is needed
+            # - Create valid realizations query for accessor otherwise:
+            #   * List[int]: Filtered valid realizations, empty list if none are valid
+            #   * None: Get all realizations, i.e. non-filtered query
+            realizations_queries: Dict[str, Optional[List[int]]] = {
+                ensemble: None
+                if is_statistics_from_all_realizations
+                else accessor.create_valid_realizations_query(selected_realizations)
+                for ensemble, accessor in derived_vectors_accessors.items()
+            }
 
-                # If all selected realizations are invalid for accessor - empty list
-                if realizations_query == []:
-                    continue
+            # If all selected realizations are invalid for accessor - empty list
+            queried_ensembles = [
+                ensemble
+                for ensemble, realizations_query in realizations_queries.items()
+                if realizations_query != []
+            ]
 
-                # TODO: Consider to remove list vectors_df_list and use pd.concat to obtain
-                # one single dataframe with vector columns. NB: Assumes equal sampling rate
-                # for each vector type - i.e equal number of rows in dataframes
+            # Statistics of provider vectors are retrieved from the provider, which caches
+            # them, when no realizations are plotted
+            is_provider_statistics_visualization = visualization in [
+                VisualizationOptions.STATISTICS,
+                VisualizationOptions.FANCHART,
+            ]
 
-                # Retrive vectors data from accessor
-                vectors_df_list: List[pd.DataFrame] = []
-                if accessor.has_provider_vectors():
-                    vectors_df_list.append(
-                        accessor.get_provider_vectors_df(
-                            realizations=realizations_query
-                        )
-                    )
-                if accessor.has_per_interval_and_per_day_vectors():
-                    vectors_df_list.append(
-                        accessor.create_per_interval_and_per_day_vectors_df(
-                            realizations=realizations_query
+            # Retrieve data for all ensembles concurrently, before plotting per ensemble
+            accessor_vectors_dfs = map_concurrently(
+                lambda ensemble: get_derived_vectors_dfs(
+                    derived_vectors_accessors[ensemble],
+                    realizations_queries[ensemble],
+                    use_provider_statistics=is_provider_statistics_visualization,
+                ),
+                queried_ensembles,
+            )
+
+            # Plotting per derived vectors accessor
+            for ensemble, (vectors_df_list, vectors_statistics_df_list) in zip(
+                queried_ensembles, accessor_vectors_dfs
+            ):
+                realizations_query = realizations_queries[ensemble]
+
+                vectors_statistics_df_list.extend(
+                    create_vectors_statistics_df(vectors_df)
+                    for vectors_df in vectors_df_list
+                    if is_provider_statistics_visualization and vectors_df.shape[0]
+                )
+                for vectors_statistics_df in vectors_statistics_df_list:
+                    # Ensure rows of data
+                    if not vectors_statistics_df.shape[0]:
+                        continue
+
+                    if visualization == VisualizationOptions.STATISTICS:
+                        figure_builder.add_statistics_traces(
+                            vectors_statistics_df,
+                            ensemble,
+                            statistics_options,
                         )
-                    )
-                if accessor.has_vector_calculator_expressions():
-                    vectors_df_list.append(
-                        accessor.create_calculated_vectors_df(
-                            realizations=realizations_query
+                    if visualization == VisualizationOptions.FANCHART:
+                        figure_builder.add_fanchart_traces(
+                            vectors_statistics_df,
+                            ensemble,
+                            fanchart_options,
                         )
-                    )
 
                 for vectors_df in vectors_df_list:
                     # Ensure rows of data
@@ -459,20 +496,6 @@ class SubplotView(ViewABC):
                             ],
                             ensemble,
                         )
-                    if visualization == VisualizationOptions.STATISTICS:
-                        vectors_statistics_df = create_vectors_statistics_df(vectors_df)
-                        figure_builder.add_statistics_traces(
-                            vectors_statistics_df,
-                            ensemble,
-                            statistics_options,
-                        )
-                    if visualization == VisualizationOptions.FANCHART:
-                        vectors_statistics_df = create_vectors_statistics_df(vectors_df)
-                        figure_builder.add_fanchart_traces(
-                            vectors_statistics_df,
-                            ensemble,
-                            fanchart_options,
-                        )
                     if (
                         visualization
                         == VisualizationOptions.STATISTICS_AND_REALIZATIONS
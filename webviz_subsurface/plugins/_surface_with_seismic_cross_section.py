@@ -14,7 +14,7 @@ from webviz_subsurface_components import LeafletMap
 
 from webviz_subsurface._models import SurfaceLeafletModel
 
-from .._datainput.seismic import load_cube_data
+from .._datainput.seismic import load_cube_data, load_lazy_cube
 from .._datainput.surface import get_surface_fence
 
 
@@ -313,7 +313,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         def _render_fence(coords, cubepath, surfacepath, color_values):
             if not coords:
                 raise PreventUpdate
-            cube = load_cube_data(get_path(cubepath))
+            cube = load_lazy_cube(get_path(cubepath))
             fence = get_fencespec(coords)
             hmin, hmax, vmin, vmax, values = cube.get_randomline(fence)
 
@@ -346,9 +346,9 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             [State(self.ids("cube"), "value")],
         )
         def _update_color_slider(_clicks, cubepath):
-            cube = load_cube_data(get_path(cubepath))
-            minv = float(f"{cube.values.min():2f}")
-            maxv = float(f"{cube.values.max():2f}")
+            minv, maxv = load_lazy_cube(get_path(cubepath)).value_range
+            minv = float(f"{minv:2f}")
+            maxv = float(f"{maxv:2f}")
             value = [minv, maxv]
             step = calculate_slider_step(minv, maxv, steps=100)
             return minv, maxv, value, step
@@ -84,42 +84,48 @@ def tornado_controllers(
 
             if not dframe.empty:
                 dframe.rename(columns={response: "VALUE"}, inplace=True)
-                df_groups = (
-                    dframe.groupby(selections["Subplots"])
-                    if subplots
-                    else [(None, dframe)]
-                )
-                for group, df in df_groups:
-                    if selections["Reference"] in df["SENSNAME"].unique():
-                        tornado_data = TornadoData(
-                            dframe=df,
-                            reference=selections["Reference"],
-                            response_name=response,
-                            scale=selections["Scale"],
-                            cutbyref=bool(selections["Remove no impact"]),
+                tornado_kwargs = {
+                    "reference": selections["Reference"],
+                    "response_name": response,
+                    "scale": selections["Scale"],
+                    "cutbyref": bool(selections["Remove no impact"]),
+                }
+                n_groups = dframe[selections["Subplots"]].nunique() if subplots else 1
+                tornado_data_per_group: dict = {}
+                if selections["Reference"] in dframe["SENSNAME"].unique():
+                    # All subplot tornados are computed in one grouped pass
+                    tornado_data_per_group = (
+                        TornadoData.from_groups(
+                            dframe=dframe,
+                            group_by=[selections["Subplots"]],
+                            **tornado_kwargs,
                         )
-                        figure, table_data, columns = tornado_figure_and_table(
-                            tornado_data=tornado_data,
-                            response=response,
-                            selections=selections,
-                            theme=theme,
+                        if subplots
+                        else {None: TornadoData(dframe=dframe, **tornado_kwargs)}
+                    )
+                for group, tornado_data in tornado_data_per_group.items():
+                    figure, table_data, columns = tornado_figure_and_table(
+                        tornado_data=tornado_data,
+                        response=response,
+                        selections=selections,
+                        theme=theme,
+                        sensitivity_colors=sens_colors(),
+                        font_size=max((20 - (0.4 * n_groups)), 10),
+                        group=group,
+                        use_si_format=response in volumemodel.volume_columns,
+                    )
+                    figures.append(figure)
+                    tables.append(table_data)
+
+                    if (
+                        response == selections["Response"]
+                        and selections["bottom_viz"] == "realplot"
+                        and not subplots
+                    ):
+                        realplot = create_realplot(
+                            df=tornado_data.real_df,
                             sensitivity_colors=sens_colors(),
-                            font_size=max((20 - (0.4 * len(df_groups))), 10),
-                            group=group,
-                            use_si_format=response in volumemodel.volume_columns,
                         )
-                        figures.append(figure)
-                        tables.append(table_data)
-
-                        if (
-                            response == selections["Response"]
-                            and selections["bottom_viz"] == "realplot"
-                            and not subplots
-                        ):
-                            realplot = create_realplot(
-                                df=tornado_data.real_df,
-                                sensitivity_colors=sens_colors(),
-                            )
 
         if selections["Shared axis"] and selections["Scale"] != "True":
             update_tornado_figures_xaxis(figures)
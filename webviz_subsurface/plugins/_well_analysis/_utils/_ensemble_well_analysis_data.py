@@ -1,4 +1,6 @@
 import datetime
+import threading
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
@@ -11,7 +13,15 @@ from .._types import NodeType, PressurePlotMode
 
 
 class EnsembleWellAnalysisData:
-    """This class holds the summary data provider."""
+    """This class holds the summary data provider.
+
+    The summary vectors are loaded from the provider when first needed, and kept in
+    a least recently used cache bounded by its size in bytes, so that the number of
+    wells and vectors does not affect the startup time.
+    """
+
+    # Max size in bytes of the summary data kept in memory per ensemble
+    CACHE_SIZE_BYTES = 256 * 1024**2
 
     def __init__(
         self,
@@ -25,11 +35,9 @@ class EnsembleWellAnalysisData:
         self._gruptree_model = gruptree_model
         self._well_attributes_model = well_attributes_model
         self._provider = provider
-        self._vector_names = self._provider.vector_names()
+        vector_catalog = self._provider.vector_catalog()
         self._realizations = self._provider.realizations()
-        self._wells: List[str] = [
-            vec.split(":")[1] for vec in self._vector_names if vec.startswith("WOPT:")
-        ]
+        self._wells: List[str] = vector_catalog.wgnames("WOPT")
         if filter_out_startswith is not None:
             self._wells = [
                 well
@@ -37,9 +45,14 @@ class EnsembleWellAnalysisData:
                 if not well.startswith(filter_out_startswith)
             ]
 
-        well_sumvecs = [vec for vec in self._vector_names if vec.startswith("W")]
-        group_sumvecs = [vec for vec in self._vector_names if vec.startswith("GPR:")]
-        self._smry = provider.get_vectors_df(well_sumvecs + group_sumvecs, None)
+        self._sumvecs = set(
+            vector_catalog.names_with_prefix("W")
+            + vector_catalog.names_with_prefix("GPR:")
+        )
+        self._index_df: Optional[pd.DataFrame] = None
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_size_bytes = 0
+        self._lock = threading.Lock()
 
     @property
     def webviz_store(self) -> List[Tuple[Callable, List[Dict]]]:
@@ -48,13 +61,90 @@ class EnsembleWellAnalysisData:
             self._well_attributes_model.webviz_store,
         ]
 
-    @property
-    def summary_data(self) -> pd.DataFrame:
-        return self._smry
+    def _get_index_df(self) -> pd.DataFrame:
+        """Returns the REAL and DATE columns of the summary data, loaded with one
+        summary vector"""
+        if self._index_df is None:
+            self._index_df = self._provider.get_vectors_df(
+                sorted(self._sumvecs)[:1], None
+            )[["REAL", "DATE"]]
+        return self._index_df
+
+    def _get_cached(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+            return entry[0]
+
+    def _put_cached(self, key: Any, value: Any, size_bytes: int) -> None:
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = (value, size_bytes)
+                self._cache_size_bytes += size_bytes
+            while (
+                self._cache_size_bytes > EnsembleWellAnalysisData.CACHE_SIZE_BYTES
+                and len(self._cache) > 1
+            ):
+                _, (_, evicted_bytes) = self._cache.popitem(last=False)
+                self._cache_size_bytes -= evicted_bytes
+
+    def _get_vectors_df(self, vectors: List[str]) -> pd.DataFrame:
+        """Returns a dataframe with REAL, DATE and the summary vectors. Vectors not in
+        the cache are loaded from the provider in one call.
+        """
+        index_df = self._get_index_df()
+        values = {vector: self._get_cached(("vector", vector)) for vector in vectors}
+        missing = [vector for vector, value in values.items() if value is None]
+        if missing:
+            df = self._provider.get_vectors_df(missing, None)
+            if not (
+                df["REAL"].equals(index_df["REAL"])
+                and df["DATE"].equals(index_df["DATE"])
+            ):
+                df = index_df.merge(df, on=["REAL", "DATE"], how="left")
+            for vector in missing:
+                values[vector] = df[vector].to_numpy()
+                self._put_cached(
+                    ("vector", vector), values[vector], values[vector].nbytes
+                )
+        return pd.concat(
+            [
+                index_df.reset_index(drop=True),
+                pd.DataFrame({vector: values[vector] for vector in vectors}),
+            ],
+            axis=1,
+        )
+
+    def _get_cumulative_cube(
+        self, well_sumvec: str
+    ) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+        """Returns the values of the well_sumvec of all wells as an array of shape
+        (n_dates, n_reals, n_wells) with sorted dates and realizations, for looking up
+        the cumulatives at any date without filtering and merging dataframes.
+
+        Returns the dates, a mask of shape (n_dates, n_reals) of the realizations with
+        data at each date, and the values.
+        """
+        cube = self._get_cached(("cube", well_sumvec))
+        if cube is None:
+            df = self._get_vectors_df([f"{well_sumvec}:{well}" for well in self._wells])
+            dates = pd.DatetimeIndex(np.sort(df["DATE"].unique()))
+            reals = np.sort(df["REAL"].unique())
+            date_index = dates.get_indexer(df["DATE"])
+            real_index = np.searchsorted(reals, df["REAL"])
+            has_data = np.zeros((len(dates), len(reals)), dtype=bool)
+            has_data[date_index, real_index] = True
+            values = np.full((len(dates), len(reals), len(self._wells)), np.nan)
+            values[date_index, real_index] = df.iloc[:, 2:].to_numpy(dtype=np.float64)
+            cube = (dates, has_data, values)
+            self._put_cached(("cube", well_sumvec), cube, values.nbytes)
+        return cube
 
     @property
     def dates(self) -> List[datetime.datetime]:
-        return list(self._smry["DATE"].unique())
+        return list(self._get_index_df()["DATE"].unique())
 
     @property
     def realizations(self) -> List[int]:
@@ -106,7 +196,7 @@ class EnsembleWellAnalysisData:
         dates after that date.
         """
         sumvecs = [f"{well_sumvec}:{well}" for well in self._wells]
-        df = self._smry[["REAL", "DATE"] + sumvecs]
+        df = self._get_vectors_df(sumvecs)
         max_date = df["DATE"].max()
         min_date = df["DATE"].min()
 
@@ -139,44 +229,60 @@ class EnsembleWellAnalysisData:
         * WELL
         * well_sumvec (f.ex WOPT)
         * ENSEMBLE
+
+        The values are looked up in the cached array of the well_sumvec of all wells,
+        see `_get_cumulative_cube`.
         """
-        sumvecs = [f"{well_sumvec}:{well}" for well in self._wells]
-        df = self._smry[["REAL", "DATE"] + sumvecs]
-        max_date = df["DATE"].max()
-        min_date = df["DATE"].min()
+        dates, has_data, values = self._get_cumulative_cube(well_sumvec)
 
         if prod_until_date is None:
-            prod_until_date = max_date
+            prod_until_date = dates[-1]
         else:
             # Set prod_until_date to min_date or max_date if it is outside the
             # ensemble date range
-            prod_until_date = max(min(prod_until_date, max_date), min_date)
+            prod_until_date = max(min(prod_until_date, dates[-1]), dates[0])
 
-        df = df[df["DATE"] == prod_until_date]
+        if prod_until_date in dates:
+            until_index = dates.get_loc(prod_until_date)
+            reals_mask = has_data[until_index].copy()
+            well_values = values[until_index]
+        else:
+            reals_mask = np.zeros(has_data.shape[1], dtype=bool)
+            well_values = values[0]
 
         # If prod_from_date is None, do nothing
         if prod_from_date is not None:
             # Set prod_from_date to min_date or max_date if it is outside the
             # ensemble date range
-            prod_from_date = max(min(prod_from_date, max_date), min_date)
-
-            # Subtract the production at the prod_from_date
-            df_date = self._smry[["REAL", "DATE"] + sumvecs]
-            df_date = df_date[df_date["DATE"] >= prod_from_date]
-            df_date = df_date[df_date["DATE"] == df_date["DATE"].min()]
-            df_merged = df.merge(df_date, on=["REAL"], how="inner")
-            for vec in sumvecs:
-                df_merged[vec] = df_merged[f"{vec}_x"] - df_merged[f"{vec}_y"]
-            df = df_merged[["REAL"] + sumvecs]
-
-        df_melted = pd.melt(
-            df, value_vars=sumvecs, var_name="WELL", value_name=well_sumvec
+            prod_from_date = max(min(prod_from_date, dates[-1]), dates[0])
+
+            # Subtract the production at the first date from prod_from_date
+            from_index = dates.searchsorted(prod_from_date)
+            reals_mask &= has_data[from_index]
+            well_values = well_values - values[from_index]
+
+        well_values = well_values[reals_mask]
+        return pd.DataFrame(
+            {
+                "WELL": np.repeat(self._wells, well_values.shape[0]),
+                well_sumvec: well_values.T.ravel(),
+                "ENSEMBLE": self._ensemble_name,
+            }
         )
-        df_melted["WELL"] = df_melted.agg(
-            lambda x: f"{x['WELL'].split(':')[1]}", axis=1
+
+    def get_node_summary_data(self, node_info: Dict[str, Any]) -> pd.DataFrame:
+        """Returns the summary data needed for the node info from `get_node_info`:
+        the control mode and pressures of the nodes in the networks, for the vectors
+        that exist in the summary data.
+        """
+        vectors = [node_info["ctrlmode_sumvec"]] + [
+            node["pressure"]
+            for network in node_info["networks"]
+            for node in network["nodes"]
+        ]
+        return self._get_vectors_df(
+            [vector for vector in dict.fromkeys(vectors) if vector in self._sumvecs]
         )
-        df_melted["ENSEMBLE"] = self._ensemble_name
-        return df_melted
 
     def get_node_info(
         self,
@@ -232,7 +338,7 @@ class EnsembleWellAnalysisData:
                 "ctrlmode_sumvec": _get_ctrlmode_sumvec(node_type, node),
                 "networks": [
                     {
-                        "start_date": self._smry["DATE"].min(),
+                        "start_date": self._get_index_df()["DATE"].min(),
                         "end_date": None,
                         "nodes": nodes,
                     }
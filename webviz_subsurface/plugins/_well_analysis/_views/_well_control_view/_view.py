@@ -277,11 +277,12 @@ class WellControlView(ViewABC):
             shared_xaxes: List[str],
         ) -> Component:
             """Updates the well control figure"""
+            node_info = self.data_models[ensemble].get_node_info(
+                well, pressure_plot_mode, real
+            )
             fig = create_well_control_figure(
-                self.data_models[ensemble].get_node_info(
-                    well, pressure_plot_mode, real
-                ),
-                self.data_models[ensemble].summary_data,
+                node_info,
+                self.data_models[ensemble].get_node_summary_data(node_info),
                 pressure_plot_mode,
                 real,
                 "ctrlmode_bar" in display_ctrlmode_bar,
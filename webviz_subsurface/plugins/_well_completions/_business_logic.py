@@ -96,13 +96,13 @@ WellCompletionsDataModel {self.ensemble_name} {self.ensemble_path} {self.compdat
 
         if df_zone_layer.empty:
             if stratigraphy is None:
-                df["ZONE"] = df.agg(lambda x: f"Layer {x['K1']}", axis=1)
+                df["ZONE"] = "Layer " + df["K1"].astype(str)
                 df["COLOR"] = np.nan
             else:
                 raise ValueError(
                     "It is not permitted to define the stratigraphy, but not the "
                     "zone ➔ layer mapping. If neither input is provided then layers "
-                    "will be used as zones (NB! this can be slow with many wells and realizations)"
+                    "will be used as zones"
                 )
         else:
             reals_without_mapping = set(df["REAL"].unique()) - set(
@@ -209,59 +209,66 @@ def get_kh_unit(ensemble_path: str) -> Tuple[str, int]:
     return ("", 2)
 
 
-def get_time_series(df: pd.DataFrame, time_steps: list) -> tuple:
-    """Create two lists with values for each time step
-    * the first one is on the form [0,0,0,1,1,1,1,-1,-1,-1] where '0' means no event,\
-    '1' is open, '-1' is shut.
-    * the second is with sum of kh values for the open compdats in each zone
-
-    The input data frame is assumed to contain data for single well,
-    single zone and single realization.
-    """
-    if df.empty:
-        return [0] * len(time_steps), [0] * len(time_steps)
-
-    events, kh_values = [], []
-    event_value, kh_value = 0, 0
-    unique_dates = df.DATE.unique()
-
-    for timestep in time_steps:
-        if timestep in unique_dates:
-            df_timestep = df[df.DATE == timestep]
-            df_timestep_open = df_timestep[df_timestep["OP/SH"] == "OPEN"]
-
-            # if minimum one of the compdats for the zone is OPEN then the zone is considered open
-            event_value = 1 if not df_timestep_open.empty else -1
-            kh_value = df_timestep_open.KH.sum()
-
-        events.append(event_value)
-        kh_values.append(kh_value)
-    return events, kh_values
-
-
 def get_completion_events_and_kh(
     df: pd.DataFrame, zone_names: list, time_steps: list
-) -> tuple:
-    """Extracts completion events ad kh values into two lists of lists of lists,
-    one with completions events and one with kh values
-    * Axis 0 is realization
-    * Axis 1 is zone
-    * Axis 2 is time step
+) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]:
+    """Builds completion event and kh tensors for all realizations, wells and zones
+    in one pass. Only the (well, zone) pairs present in the data are included.
+
+    Returns the (well, zone) pairs as a dataframe with WELL and ZONE columns, a
+    mask with shape (realization, pair) telling which realizations have data for
+    the well, and two arrays with shape (realization, pair, time step):
+    * completion events, where '0' means no event, '1' is open and '-1' is shut
+    * sum of kh values for the open compdats in each zone
+
+    If minimum one of the compdats for a zone is OPEN at a time step, the zone is
+    considered open. Time steps without data for a zone keep the values of the
+    previous time step with data (forward fill).
     """
-    compl_events, kh_values = [], []
-    for _, realdata in df.groupby("REAL"):
-        compl_events_real, kh_real = [], []
-        for zone_name in zone_names:
-            zone_data = realdata[realdata.ZONE == zone_name]
-            compl_events_real_zone, kh_real_zone = get_time_series(
-                zone_data, time_steps
-            )
-            compl_events_real.append(compl_events_real_zone)
-            kh_real.append(kh_real_zone)
+    zone_index = pd.Index(zone_names)
+    df = df[df["ZONE"].isin(zone_index)]
+    real_idx, realizations = pd.factorize(df["REAL"], sort=True)
+    pairs_df = (
+        df[["WELL", "ZONE"]]
+        .assign(ZONE_IDX=zone_index.get_indexer(df["ZONE"]))
+        .drop_duplicates()
+        .sort_values(["WELL", "ZONE_IDX"])
+        .reset_index(drop=True)
+    )
+    pair_idx = pd.MultiIndex.from_frame(pairs_df[["WELL", "ZONE"]]).get_indexer(
+        pd.MultiIndex.from_frame(df[["WELL", "ZONE"]])
+    )
+    time_idx = pd.Index(time_steps).get_indexer(df["DATE"])
+    shape = (len(realizations), len(pairs_df), len(time_steps))
+    flat_idx = np.ravel_multi_index((real_idx, pair_idx, time_idx), shape)
+
+    is_open = (df["OP/SH"] == "OPEN").to_numpy()
+    has_data = np.zeros(shape, dtype=bool).ravel()
+    has_data[flat_idx] = True
+    any_open = np.zeros(shape, dtype=bool).ravel()
+    any_open[flat_idx[is_open]] = True
+    kh_open = np.bincount(
+        flat_idx[is_open],
+        weights=np.nan_to_num(df["KH"].to_numpy(dtype=np.float64))[is_open],
+        minlength=has_data.size,
+    )
+    events = np.where(any_open, 1, -1).astype(np.int8)
+    events[~has_data] = 0
+
+    # Forward fill along the time axis from the last time step with data
+    has_data = has_data.reshape(shape)
+    last_idx = np.where(has_data, np.arange(shape[2]), 0)
+    np.maximum.accumulate(last_idx, axis=2, out=last_idx)
+    events = np.take_along_axis(events.reshape(shape), last_idx, axis=2)
+    kh_values = np.take_along_axis(kh_open.reshape(shape), last_idx, axis=2)
 
-        compl_events.append(compl_events_real)
-        kh_values.append(kh_real)
-    return compl_events, kh_values
+    # The zone is considered unaffected in realizations without data for the well
+    well_idx, wells = pd.factorize(pairs_df["WELL"])
+    well_in_real = np.zeros((len(realizations), len(wells)), dtype=bool)
+    well_in_real[real_idx, well_idx[pair_idx]] = True
+    real_has_well = well_in_real[:, well_idx]
+
+    return pairs_df[["WELL", "ZONE"]], real_has_well, events, kh_values
 
 
 def format_time_series(
@@ -314,68 +321,31 @@ def format_time_series(
 
 
 def calc_over_realizations(
-    compl_events: list, kh_values: list, realizations: list
+    events: np.ndarray,
+    kh_values: np.ndarray,
+    real_has_well: np.ndarray,
+    realizations: list,
 ) -> tuple:
-    """Takes in two three dimensional lists where the levels are: 1. realization \
-    2. zones and 3. timesteps
+    """Takes in two arrays with shape (realization, pair, time step), and a mask
+    with shape (realization, pair) telling which realizations have data for the well.
 
-    Returns two dimensional lists where calculations have been done over the \
-    realization level.
+    Returns arrays with shape (pair, time step) where calculations have been done
+    over the realization axis. Min and max kh are taken over the realizations
+    where the well is present.
     """
-    # calculate fraction of open realizations
-    open_count = np.maximum(np.asarray(compl_events), 0)  # remove -1
-    open_count_reduced = open_count.sum(axis=0)  # sum over realizations
-    open_frac = (
-        np.asarray(open_count_reduced, dtype=np.float64) / float(len(realizations))
-    ).round(decimals=3)
-
-    # calculate fraction of shut realizations
-    shut_count = (
-        np.minimum(np.asarray(compl_events), 0) * -1
-    )  # remove +1 and convert -1 to 1
-    shut_count_reduced = shut_count.sum(axis=0)  # sum over realizations
-    shut_frac = (
-        np.asarray(shut_count_reduced, dtype=np.float64) / float(len(realizations))
-    ).round(decimals=3)
+    # calculate fraction of open and shut realizations
+    open_frac = ((events == 1).sum(axis=0) / float(len(realizations))).round(3)
+    shut_frac = ((events == -1).sum(axis=0) / float(len(realizations))).round(3)
 
     # calculate khMean, khMin and khMax
-    np_kh_values = np.asarray(kh_values)
-    kh_mean = (np_kh_values.sum(axis=0) / float(len(realizations))).round(decimals=2)
-    kh_min = np_kh_values.min(axis=0).round(decimals=2)
-    kh_max = np_kh_values.max(axis=0).round(decimals=2)
+    present = real_has_well[:, :, np.newaxis]
+    kh_mean = (kh_values.sum(axis=0) / float(len(realizations))).round(decimals=2)
+    kh_min = np.where(present, kh_values, np.inf).min(axis=0).round(decimals=2)
+    kh_max = np.where(present, kh_values, -np.inf).max(axis=0).round(decimals=2)
 
     return open_frac, shut_frac, kh_mean, kh_min, kh_max
 
 
-def extract_well(
-    df: pd.DataFrame, well: str, zone_names: list, time_steps: list, realizations: list
-) -> Dict[str, Any]:
-    # pylint: disable=too-many-locals
-    """Extract completion events and kh values for a single well"""
-    well_dict: Dict[str, Any] = {}
-    well_dict["name"] = well
-
-    compl_events, kh_values = get_completion_events_and_kh(df, zone_names, time_steps)
-    open_frac, shut_frac, kh_mean, kh_min, kh_max = calc_over_realizations(
-        compl_events, kh_values, realizations
-    )
-    result = {}
-    for (
-        zone_name,
-        open_frac_zone,
-        shut_frac_zone,
-        kh_mean_zone,
-        kh_min_zone,
-        kh_max_zone,
-    ) in zip(zone_names, open_frac, shut_frac, kh_mean, kh_min, kh_max):
-        if sum(open_frac_zone) != 0.0 or sum(shut_frac_zone) != 0.0:
-            result[zone_name] = format_time_series(
-                open_frac_zone, shut_frac_zone, kh_mean_zone, kh_min_zone, kh_max_zone
-            )
-    well_dict["completions"] = result
-    return well_dict
-
-
 def extract_wells(
     df: pd.DataFrame,
     zone_names: list,
@@ -384,17 +354,38 @@ def extract_wells(
     well_attributes: Optional[dict],
 ) -> List[Dict]:
     """Generates the wells part of the input dictionary to the WellCompletions component"""
+    # pylint: disable=too-many-locals
+    pairs_df, real_has_well, events, kh_values = get_completion_events_and_kh(
+        df, zone_names, time_steps
+    )
+    open_frac, shut_frac, kh_mean, kh_min, kh_max = calc_over_realizations(
+        events, kh_values, real_has_well, realizations
+    )
+    has_events = (open_frac.sum(axis=1) != 0.0) | (shut_frac.sum(axis=1) != 0.0)
+
     well_list = []
-    for well_name, well_group in df.groupby("WELL"):
-        well_data = extract_well(
-            well_group, well_name, zone_names, time_steps, realizations
-        )
-        well_data["attributes"] = (
-            well_attributes[well_name]
-            if (well_attributes is not None and well_name in well_attributes)
-            else {}
+    for well_name, well_pairs in pairs_df.groupby("WELL", sort=True):
+        result = {}
+        for pair, zone_name in zip(well_pairs.index, well_pairs["ZONE"]):
+            if has_events[pair]:
+                result[zone_name] = format_time_series(
+                    open_frac[pair],
+                    shut_frac[pair],
+                    kh_mean[pair],
+                    kh_min[pair],
+                    kh_max[pair],
+                )
+        well_list.append(
+            {
+                "name": well_name,
+                "completions": result,
+                "attributes": (
+                    well_attributes[well_name]
+                    if (well_attributes is not None and well_name in well_attributes)
+                    else {}
+                ),
+            }
         )
-        well_list.append(well_data)
     return well_list
 
 
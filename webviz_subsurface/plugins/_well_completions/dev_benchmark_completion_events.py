@@ -0,0 +1,86 @@
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+
+from ._business_logic import extract_wells
+
+# Benchmark of the completion event engine on a synthetic compdat data set.
+# Every well is completed in a couple of zones, and the connections are
+# opened and shut at random time steps in each realization.
+
+
+def _create_synthetic_compdat_df(
+    num_wells: int,
+    num_reals: int,
+    num_zones: int,
+    num_events_per_connection: int,
+    seed: int = 0,
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = [
+        datetime.date(2020, 1, 1) + datetime.timedelta(days=30 * i) for i in range(100)
+    ]
+    zones_per_well = min(3, num_zones)
+
+    well = np.repeat(np.arange(num_wells), zones_per_well)
+    zone = np.concatenate(
+        [
+            rng.choice(num_zones, size=zones_per_well, replace=False)
+            for _ in range(num_wells)
+        ]
+    )
+    num_connections = len(well)
+    num_rows = num_connections * num_reals * num_events_per_connection
+
+    conn_idx = np.tile(
+        np.repeat(np.arange(num_connections), num_events_per_connection), num_reals
+    )
+    return pd.DataFrame(
+        {
+            "REAL": np.repeat(
+                np.arange(num_reals), num_connections * num_events_per_connection
+            ),
+            "DATE": np.asarray(dates, dtype=object)[
+                rng.integers(0, len(dates), num_rows)
+            ],
+            "WELL": np.char.add("W", well[conn_idx].astype(str)),
+            "ZONE": np.char.add("Zone", zone[conn_idx].astype(str)),
+            "OP/SH": np.where(rng.random(num_rows) < 0.7, "OPEN", "SHUT"),
+            "KH": rng.random(num_rows) * 1000,
+        }
+    )
+
+
+def main() -> None:
+    num_wells = 300
+    num_reals = 100
+    num_zones = 15
+
+    df = _create_synthetic_compdat_df(
+        num_wells, num_reals, num_zones, num_events_per_connection=4
+    )
+    zone_names = [f"Zone{i}" for i in range(num_zones)]
+    time_steps = sorted(df["DATE"].unique())
+    realizations = sorted(df["REAL"].unique())
+
+    print("## ------------------")
+    print(
+        f"## {num_wells} wells, {num_reals} realizations, {num_zones} zones, "
+        f"{len(time_steps)} time steps, {len(df)} compdat rows"
+    )
+
+    start_tim = time.perf_counter()
+    wells = extract_wells(df, zone_names, time_steps, realizations, None)
+    elapsed_time_ms = 1000 * (time.perf_counter() - start_tim)
+
+    print("## num wells in data set:", len(wells))
+    print("## extract_wells() total time (ms):", elapsed_time_ms)
+    print("## ------------------")
+
+
+# Running:
+# python -m webviz_subsurface.plugins._well_completions.dev_benchmark_completion_events
+if __name__ == "__main__":
+    main()